@@ -8,6 +8,7 @@ from .gateway_command import GatewayCommand
 from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .import_command import ImportCommand
+from .latency_command import LatencyCommand
 from .order_book_command import OrderBookCommand
 from .pmm_script_command import PMMScriptCommand
 from .previous_strategy_command import PreviousCommand
@@ -34,6 +35,7 @@ __all__ = [
     SillyCommands,
     OrderBookCommand,
     TickerCommand,
+    LatencyCommand,
     GatewayCommand,
     PMMScriptCommand,
     RateCommand,
@@ -0,0 +1,58 @@
+import threading
+from typing import TYPE_CHECKING, List
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.data_type.market_data_latency import MarketDataLatencyTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class LatencyCommand:
+    def latency(self,  # type: HummingbotApplication
+                exchange: str = None,
+                market: str = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.latency, exchange, market)
+            return
+        safe_ensure_future(self.show_latency(exchange, market))
+
+    async def show_latency(self,  # type: HummingbotApplication
+                           exchange: str = None,
+                           market: str = None):
+        if len(self.markets.keys()) == 0:
+            self.notify("\n This command can only be used while a strategy is running")
+            return
+        if exchange is not None and exchange not in self.markets:
+            self.notify("\n Please select a valid exchange from the running strategy")
+            return
+        market = market.upper() if market is not None else None
+        lines: List[str] = []
+        for name, market_connector in self.markets.items():
+            if exchange is not None and name != exchange:
+                continue
+            order_book_tracker = getattr(market_connector, "order_book_tracker", None)
+            latency_tracker: MarketDataLatencyTracker = getattr(order_book_tracker, "latency_tracker", None)
+            if latency_tracker is None:
+                continue
+            rows = [
+                [trading_pair, hop.value, stats.count] + [round(value * 1e3, 1) for value in stats[1:]]
+                for trading_pair, hops_stats in sorted(latency_tracker.latency_stats().items())
+                if market is None or trading_pair == market
+                for hop, stats in hops_stats.items()
+                if stats is not None
+            ]
+            if len(rows) == 0:
+                continue
+            df = pd.DataFrame(data=rows,
+                              columns=["Market", "Hop", "Messages", "Mean (ms)", "p50 (ms)", "p90 (ms)", "p99 (ms)",
+                                       "Max (ms)"])
+            lines.append(f"   Exchange: {name}, last {latency_tracker.window:.0f} seconds")
+            lines.append(format_df_for_printout(df))
+        if len(lines) == 0:
+            self.notify("\n No market data latency was recorded by the running exchanges")
+            return
+        self.notify("\n".join(lines))
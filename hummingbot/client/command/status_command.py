@@ -74,7 +74,10 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status + "\n" + app_warning
+        connectors_status = "".join(f"{connector_status}\n" for connector_status in
+                                    (market.format_status() for market in self.markets.values())
+                                    if connector_status)
+        status = paper_trade + "\n" + st_status + "\n" + connectors_status + app_warning
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
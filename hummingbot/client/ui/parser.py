@@ -133,6 +133,11 @@ def load_parser(hummingbot, command_tabs) -> [ThrowingArgumentParser, Any]:
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    latency_parser = subparsers.add_parser("latency", help="Show the market data latency of the order books per hop")
+    latency_parser.add_argument("--exchange", type=str, dest="exchange", help="The exchange of the markets")
+    latency_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
+    latency_parser.set_defaults(func=hummingbot.latency)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
@@ -2,7 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Set
 
 from cachetools import TTLCache
 
@@ -55,6 +55,10 @@ class ClientOrderTracker:
         self._connector = connector
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        # Maps exchange order ids to client order ids for both active and cached orders
+        self._exchange_order_id_index: Dict[str, str] = {}
+        # Client order ids of active orders that had no exchange order id the last time they were indexed
+        self._unindexed_order_ids: Set[str] = set()
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
@@ -90,11 +94,17 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_exchange_order_id(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
+            self._index_exchange_order_id(order)
+            self._cached_orders[client_order_id] = order
             del self._in_flight_orders[client_order_id]
+            self._unindexed_order_ids.discard(client_order_id)
+            if len(self._exchange_order_id_index) > len(self._in_flight_orders) + 2 * self.MAX_CACHE_SIZE:
+                self._prune_exchange_order_id_index()
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -117,15 +127,53 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if client_order_id is not None:
+            found_order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id)
 
         return found_order
 
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._unindexed_order_ids.add(order.client_order_id)
+        else:
+            self._exchange_order_id_index[order.exchange_order_id] = order.client_order_id
+            self._unindexed_order_ids.discard(order.client_order_id)
+
+    def _fetch_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Looks up an active or cached order by its exchange order id in constant time.
+        Orders that got their exchange order id assigned outside of the tracker (i.e. directly through
+        `InFlightOrder.update_exchange_order_id`) are indexed lazily on the first lookup that misses the index.
+        """
+        client_order_id = self._exchange_order_id_index.get(exchange_order_id)
+        if client_order_id is None and self._unindexed_order_ids:
+            for pending_client_order_id in list(self._unindexed_order_ids):
+                pending_order = self._in_flight_orders.get(pending_client_order_id)
+                if pending_order is None:
+                    self._unindexed_order_ids.discard(pending_client_order_id)
+                elif pending_order.exchange_order_id is not None:
+                    self._index_exchange_order_id(pending_order)
+            client_order_id = self._exchange_order_id_index.get(exchange_order_id)
+
+        if client_order_id is None:
+            return None
+
+        order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
+        if order is None or order.exchange_order_id != exchange_order_id:
+            # The order expired from the cache or its exchange order id changed since it was indexed
+            del self._exchange_order_id_index[exchange_order_id]
+            order = None
+        return order
+
+    def _prune_exchange_order_id_index(self):
+        self._exchange_order_id_index = {
+            exchange_order_id: client_order_id
+            for exchange_order_id, client_order_id in self._exchange_order_id_index.items()
+            if client_order_id in self._in_flight_orders or client_order_id in self._cached_orders
+        }
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -278,6 +326,8 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                if tracked_order.client_order_id in self._unindexed_order_ids:
+                    self._index_exchange_order_id(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
 
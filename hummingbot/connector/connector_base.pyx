@@ -11,6 +11,7 @@ from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -173,6 +174,12 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def format_status(self) -> str:
+        """
+        Connector specific diagnostics displayed by the status command below the strategy status. Empty by default.
+        """
+        return ""
+
     @property
     def display_name(self) -> str:
         return self.name
@@ -276,6 +283,40 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def batch_order_create(self,
+                           orders_to_create: List[LimitOrder],
+                           order_type: OrderType = OrderType.LIMIT) -> List[LimitOrder]:
+        """
+        Issues a batch of limit orders, e.g. all the orders of a strategy proposal.
+        Connectors able to create several orders with one request override it, by default every order is created
+        on its own.
+        :param orders_to_create: The orders to create, their client order ids are ignored
+        :param order_type: The limit order type of the orders (LIMIT or LIMIT_MAKER)
+        :returns The orders with the client order ids assigned to them
+        """
+        created_orders = []
+        for order in orders_to_create:
+            create_method = self.buy if order.is_buy else self.sell
+            client_order_id = create_method(order.trading_pair, order.quantity, order_type, order.price)
+            created_orders.append(LimitOrder(client_order_id,
+                                             order.trading_pair,
+                                             order.is_buy,
+                                             order.base_currency,
+                                             order.quote_currency,
+                                             order.price,
+                                             order.quantity))
+        return created_orders
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels a batch of orders.
+        Connectors able to cancel several orders with one request override it, by default every order is cancelled
+        on its own.
+        :param orders_to_cancel: The orders to cancel
+        """
+        for order in orders_to_cancel:
+            self.cancel(order.trading_pair, order.client_order_id)
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
@@ -1,22 +1,73 @@
 import asyncio
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import math
+from collections import deque
+from functools import partial
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, NamedTuple, Optional, Tuple
 
-import socketio
+import numpy as np
 
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_latency import RECEIVED_AT_KEY
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
 from . import coindcx_constants as CONSTANTS, coindcx_web_utils as web_utils
+from .coindcx_stream_hub import CoindcxStreamHub
 
 if TYPE_CHECKING:
     from .coindcx_exchange import CoindcxExchange
 
 
+class StreamShardStats(NamedTuple):
+    shard: int
+    trading_pairs: int
+    connected: bool
+    reconnects: int
+    message_rate: float
+    lag: Optional[float]
+
+
+class CoindcxStreamShard:
+    """
+    One of the SocketIO connections the order book channels are spread over, with the trading pairs it carries and
+    the statistics of the messages it received during the last CONSTANTS.STREAM_SHARD_STATS_WINDOW seconds.
+    """
+
+    def __init__(self, index: int, stream_hub: CoindcxStreamHub, trading_pairs: List[str]):
+        self.index = index
+        self.stream_hub = stream_hub
+        self.trading_pairs = trading_pairs
+        self.joined = False
+        self.reconnects = 0
+        # (reception timestamp, lag behind the exchange timestamp) of the recent messages
+        self._messages: Deque[Tuple[float, float]] = deque()
+
+    def record_message(self, received_timestamp: float, exchange_timestamp: float):
+        self._messages.append((received_timestamp, received_timestamp - exchange_timestamp))
+        self._evict(received_timestamp)
+
+    def stats(self, now: float) -> StreamShardStats:
+        self._evict(now)
+        return StreamShardStats(
+            shard=self.index,
+            trading_pairs=len(self.trading_pairs),
+            connected=self.stream_hub.is_connected,
+            reconnects=self.reconnects,
+            message_rate=len(self._messages) / CONSTANTS.STREAM_SHARD_STATS_WINDOW,
+            lag=sum(lag for _, lag in self._messages) / len(self._messages) if self._messages else None,
+        )
+
+    def _evict(self, now: float):
+        while self._messages and self._messages[0][0] < now - CONSTANTS.STREAM_SHARD_STATS_WINDOW:
+            self._messages.popleft()
+
+
 class CoindcxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     _logger: Optional[HummingbotLogger] = None
@@ -26,29 +77,94 @@ class CoindcxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         trading_pairs: List[str],
         connector: "CoindcxExchange",
         api_factory: Optional[WebAssistantsFactory] = None,
+        stream_hub: Optional[CoindcxStreamHub] = None,
+        stream_shards: Optional[int] = None,
     ):
+        """
+        :param stream_hub: the connection shared with the user stream, carrying the channels of the first shard
+        :param stream_shards: number of SocketIO connections the trading pair channels are spread over. By default
+            one connection per CONSTANTS.MAX_PAIRS_PER_STREAM_SHARD trading pairs
+        """
         super().__init__(trading_pairs)
         self._connector = connector
         self._api_factory = api_factory or web_utils.build_api_factory()
-        self._ws_assistant: Optional[socketio.AsyncClient] = None
+        self._stream_hub = stream_hub or CoindcxStreamHub()
+        # Trading pair of each channel, resolved when joining it so that stream messages are parsed without awaiting
+        self._trading_pairs_by_channel: Dict[str, str] = {}
+        shards_count = stream_shards or math.ceil(len(trading_pairs) / CONSTANTS.MAX_PAIRS_PER_STREAM_SHARD)
+        shards_count = max(1, min(shards_count, len(trading_pairs)))
+        self._shards: List[CoindcxStreamShard] = [
+            CoindcxStreamShard(
+                index=index,
+                stream_hub=self._stream_hub if index == 0 else CoindcxStreamHub(),
+                trading_pairs=trading_pairs[index::shards_count],
+            )
+            for index in range(shards_count)
+        ]
+        # Trading pairs whose channels were joined again after a reconnection, and need a new snapshot
+        self._snapshot_requests: asyncio.Queue = asyncio.Queue()
+
+    @property
+    def shards(self) -> List[CoindcxStreamShard]:
+        return self._shards
 
     @classmethod
     def _default_domain(cls):
         return CONSTANTS.DEFAULT_DOMAIN
 
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return await self._connector.get_last_traded_prices(trading_pairs=trading_pairs)
+
+    def shard_stats(self) -> List[StreamShardStats]:
+        now = self._time()
+        return [shard.stats(now) for shard in self._shards]
+
+    def format_status(self) -> str:
+        lines = ["  CoinDCX order book streams:",
+                 f"    {'Shard':<7}{'Pairs':>6}{'Connected':>11}{'Reconnects':>12}{'Msg/s':>9}{'Lag (ms)':>10}"]
+        for stats in self.shard_stats():
+            lag = f"{stats.lag * 1e3:.0f}" if stats.lag is not None else "-"
+            lines.append(f"    {stats.shard:<7}{stats.trading_pairs:>6}{'yes' if stats.connected else 'no':>11}"
+                         f"{stats.reconnects:>12}{stats.message_rate:>9.1f}{lag:>10}")
+        return "\n".join(lines)
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        """
+        Besides the periodic snapshots of every trading pair, requests a snapshot of the trading pairs of a shard
+        each time its connection is re-established.
+        """
+        await safe_gather(
+            super().listen_for_order_book_snapshots(ev_loop, output),
+            self._listen_for_snapshot_requests(output),
+        )
+
+    async def _listen_for_snapshot_requests(self, output: asyncio.Queue):
+        while True:
+            trading_pair = await self._snapshot_requests.get()
+            try:
+                output.put_nowait(await self._order_book_snapshot(trading_pair=trading_pair))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Unexpected error fetching order book snapshot for {trading_pair}.",
+                                    exc_info=True)
+
     async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
         snapshot_response: Dict[str, Any] = await self._request_order_book_snapshot(trading_pair)
-        snapshot_timestamp: float = int(self._time()) * 1e3
+        received_at: float = self._time()
+        snapshot_timestamp: float = int(received_at) * 1e3
         update_id: int = int(snapshot_timestamp)
 
         order_book_message_content = {
             "trading_pair": trading_pair,
             "update_id": update_id,
-            "bids": [(price, amt) for price, amt in snapshot_response["bids"].items()],
-            "asks": [(price, amt) for price, amt in snapshot_response["asks"].items()],
+            "bids": self._levels_array(list(snapshot_response["bids"].items()), update_id),
+            "asks": self._levels_array(list(snapshot_response["asks"].items()), update_id),
+            RECEIVED_AT_KEY: received_at,
         }
+        # The REST snapshot has no exchange time, it is stamped with the local time in seconds as the other messages
         snapshot_msg: OrderBookMessage = OrderBookMessage(
-            OrderBookMessageType.SNAPSHOT, order_book_message_content, snapshot_timestamp
+            OrderBookMessageType.SNAPSHOT, order_book_message_content, snapshot_timestamp * 1e-3
         )
 
         return snapshot_msg
@@ -71,21 +187,40 @@ class CoindcxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             params=params,
             method=RESTMethod.GET,
             throttler_limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+            priority=RequestPriority.BACKGROUND,
         )
 
         return data
 
+    @staticmethod
+    def _levels_array(levels: List[Any], update_id: int) -> np.ndarray:
+        """
+        Converts the [price, amount] string pairs of a depth payload, in a single NumPy conversion, into the float64
+        array of 3 columns, [price, amount, update_id], that the order book applies directly.
+        """
+        levels_array = np.empty((len(levels), 3), dtype=np.float64)
+        if len(levels) > 0:
+            levels_array[:, :2] = levels
+        levels_array[:, 2] = update_id
+        return levels_array
+
+    async def _trading_pair_of_channel(self, channel: str) -> str:
+        trading_pair = await self._connector.trading_pair_associated_to_exchange_ecode_symbol(symbol=channel)
+        self._trading_pairs_by_channel[channel] = trading_pair
+        return trading_pair
+
     async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         timestamp: float = float(raw_message["T"])
-        trading_pair: str = await self._connector.trading_pair_associated_to_exchange_ecode_symbol(
-            symbol=raw_message["channel"]
-        )
+        trading_pair: Optional[str] = self._trading_pairs_by_channel.get(raw_message["channel"])
+        if trading_pair is None:
+            trading_pair = await self._trading_pair_of_channel(raw_message["channel"])
         message_content = {
             "trade_id": int(timestamp),
             "trading_pair": trading_pair,
             "trade_type": float(TradeType.SELL.value) if raw_message["m"] else float(TradeType.BUY.value),
             "amount": float(raw_message["q"]),
             "price": float(raw_message["p"]),
+            RECEIVED_AT_KEY: raw_message.get(RECEIVED_AT_KEY),
         }
         trade_message: OrderBookMessage = OrderBookMessage(
             message_type=OrderBookMessageType.TRADE, content=message_content, timestamp=timestamp * 1e-3
@@ -94,33 +229,38 @@ class CoindcxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         timestamp: float = float(raw_message["E"])
-        trading_pair: str = await self._connector.trading_pair_associated_to_exchange_ecode_symbol(
-            symbol=raw_message["channel"]
-        )
+        update_id: int = int(timestamp)
+        trading_pair: Optional[str] = self._trading_pairs_by_channel.get(raw_message["channel"])
+        if trading_pair is None:
+            trading_pair = await self._trading_pair_of_channel(raw_message["channel"])
         message_content = {
             "trading_pair": trading_pair,
-            "update_id": int(timestamp),
-            "bids": [(price, amt) for price, amt in raw_message["b"]],
-            "asks": [(price, amt) for price, amt in raw_message["a"]],
+            "update_id": update_id,
+            "bids": self._levels_array(raw_message["b"], update_id),
+            "asks": self._levels_array(raw_message["a"], update_id),
+            RECEIVED_AT_KEY: raw_message.get(RECEIVED_AT_KEY),
         }
         # NOTE: CoinDCX does not use delta updates, and instead use depth updates.
-        #       Hence we use OrderBookMessageType.SNAPSHOT here.
+        #       Hence we use OrderBookMessageType.SNAPSHOT here. The exchange tracker applies them as deltas
+        #       against the current book (see CoindcxExchange.APPLY_DEPTH_UPDATES_AS_DELTAS).
         depth_message: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
             message_content,
             timestamp * 1e-3)
         message_queue.put_nowait(depth_message)
 
-    async def _subscribe_channels(self):
+    async def _subscribe_channels(self, shard: CoindcxStreamShard):
         """
-        Subscribes to the trade events and diff orders events through the provided websocket connection.
+        Subscribes to the trade events and diff orders events of the trading pairs of a shard, through the connection
+        of the shard.
         """
         try:
-            for trading_pair in self._trading_pairs:
+            for trading_pair in shard.trading_pairs:
                 exchange_symbol: str = await self._connector.exchange_ecode_symbol_associated_to_pair(
                     trading_pair=trading_pair
                 )
-                await self._ws_assistant.emit("join", {"channelName": exchange_symbol})
+                self._trading_pairs_by_channel[exchange_symbol] = trading_pair
+                await shard.stream_hub.emit("join", {"channelName": exchange_symbol})
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -129,26 +269,47 @@ class CoindcxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             )
             raise
 
-    async def _on_new_trade(self, response: Dict[str, Any]):
+    async def _join_shard(self, shard: CoindcxStreamShard):
+        if shard.joined:
+            # Messages were missed while the shard was disconnected, its books are refreshed from new snapshots
+            shard.reconnects += 1
+            for trading_pair in shard.trading_pairs:
+                self._snapshot_requests.put_nowait(trading_pair)
+        shard.joined = True
+        await self._subscribe_channels(shard)
+
+    async def _on_new_trade(self, response: Dict[str, Any], shard: Optional[CoindcxStreamShard] = None):
         data: Dict[str, Any] = json.loads(response["data"])
+        data[RECEIVED_AT_KEY] = self._time()
+        if shard is not None:
+            shard.record_message(data[RECEIVED_AT_KEY], float(data["T"]) * 1e-3)
         self._message_queue[self._trade_messages_queue_key].put_nowait(data)
 
-    async def _on_depth_update(self, response: Dict[str, Any]):
+    async def _on_depth_update(self, response: Dict[str, Any], shard: Optional[CoindcxStreamShard] = None):
         data: Dict[str, Any] = json.loads(response["data"])
+        data[RECEIVED_AT_KEY] = self._time()
+        if shard is not None:
+            shard.record_message(data[RECEIVED_AT_KEY], float(data["E"]) * 1e-3)
         self._message_queue[self._diff_messages_queue_key].put_nowait(data)
 
-    async def _handle_error(self, error):
-        raise ValueError(str(error))
-
     async def listen_for_subscriptions(self):
         """
-        Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
-        exchange. Each message is stored in its own queue.
+        Listens to the trade events and order diffs sent by the exchange, through the connection of every shard.
+        The first shard uses the connection shared with the user stream. Each shard reconnects on its own.
+        Each message is stored in its own queue.
         """
+        await safe_gather(*[self._listen_for_shard_subscriptions(shard) for shard in self._shards])
+
+    async def _listen_for_shard_subscriptions(self, shard: CoindcxStreamShard):
         while True:
             try:
-                await self._connected_websocket_assistant()
-                await self._ws_assistant.wait()
+                await shard.stream_hub.listen(
+                    join=partial(self._join_shard, shard),
+                    event_handlers={
+                        CONSTANTS.ORDER_BOOK_TRADE_EVENT_TYPE: partial(self._on_new_trade, shard=shard),
+                        CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE: partial(self._on_depth_update, shard=shard),
+                    },
+                )
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -157,31 +318,8 @@ class CoindcxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     exc_info=True,
                 )
                 await self._sleep(5.0)
-            finally:
-                self._ws_assistant and await self._ws_assistant.disconnect()
-                self._ws_assistant = None
 
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         # SocketIO client uses event handlers to determine the various channels.
         # See `_on_new_trade` and `_on_depth_update`.
         pass
-
-    async def _connected_websocket_assistant(self) -> socketio.AsyncClient:
-        try:
-            self._ws_assistant = self._create_async_client()
-
-            # Initialise SocketIO client with appropriate event handlers
-            self._ws_assistant.on("connect", self._subscribe_channels)
-            self._ws_assistant.on(CONSTANTS.ORDER_BOOK_TRADE_EVENT_TYPE, self._on_new_trade)
-            self._ws_assistant.on(CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE, self._on_depth_update)
-            self._ws_assistant.on("connect_error", self._handle_error)
-
-            await self._ws_assistant.connect(CONSTANTS.WSS_URL, transports="websocket")
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            self.logger().error(f"Unexpected error occurred connecting to CoinDCX Websocket API. ({e})")
-            raise
-
-    def _create_async_client(self):
-        return socketio.AsyncClient()
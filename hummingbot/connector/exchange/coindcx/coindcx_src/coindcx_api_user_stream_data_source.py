@@ -2,14 +2,13 @@ import asyncio
 import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import socketio
-
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
 from . import coindcx_constants as CONSTANTS
 from .coindcx_auth import CoindcxAuth
+from .coindcx_stream_hub import CoindcxStreamHub
 
 if TYPE_CHECKING:
     from .coindcx_exchange import CoindcxExchange
@@ -22,12 +21,13 @@ class CoindcxAPIUserStreamDataSource(UserStreamTrackerDataSource):
     def __init__(self,
                  auth: CoindcxAuth,
                  connector: "CoindcxExchange",
-                 api_factory: WebAssistantsFactory):
+                 api_factory: WebAssistantsFactory,
+                 stream_hub: Optional[CoindcxStreamHub] = None):
         super().__init__()
         self._auth: CoindcxAuth = auth
         self._connector = connector
         self._api_factory = api_factory
-        self._ws_assistant: Optional[socketio.AsyncClient] = None
+        self._stream_hub = stream_hub or CoindcxStreamHub()
 
         self._last_recv_time: float = -1.0
 
@@ -39,28 +39,6 @@ class CoindcxAPIUserStreamDataSource(UserStreamTrackerDataSource):
     def last_recv_time(self, value: float) -> float:
         self._last_recv_time = value
 
-    async def _connected_websocket_assistant(self):
-        """
-        Creates an instance of SocketIO.AsyncClient. Connects to the exchange SocketIO server
-        and initialize the appropriate event handler functions for specific channels.
-        """
-        try:
-            self._ws_assistant: socketio.AsyncClient = self._create_async_client()
-
-            # Initialise SocketIO client with appropriate event handlers
-            self._ws_assistant.on("connect", self._subscribe_channels)
-            self._ws_assistant.on(CONSTANTS.USER_BALANCE_EVENT_TYPE, self._process_balance_update)
-            self._ws_assistant.on(CONSTANTS.USER_TRADE_EVENT_TYPE, self._process_trade_update)
-            self._ws_assistant.on(CONSTANTS.USER_ORDER_EVENT_TYPE, self._process_order_update)
-            self._ws_assistant.on("connect_error", self._handle_error)
-
-            await self._ws_assistant.connect(CONSTANTS.WSS_URL, transports="websocket")
-
-        except Exception as e:
-            self.logger().error(
-                f"Unexpected error occurred connecting to CoinDCX Websocket API. ({e})"
-            )
-
     async def _process_event_message(self, event_message: Dict[str, Any]):
         """
         Event handler function for balance, trades and order update messages.
@@ -91,9 +69,8 @@ class CoindcxAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def listen_for_user_stream(self, output: asyncio.Queue):
         """
-        Connects to the user private channel in the exchange using a websocket connection. With the established
-        connection listens to all balance events and order updates provided by the exchange, and stores them in the
-        output queue
+        Joins the user private channel through the connection shared with the order book data source. Listens to all
+        balance events and order updates provided by the exchange, and stores them in the output queue
 
         :param output: the queue to use to store the received messages
         """
@@ -101,16 +78,21 @@ class CoindcxAPIUserStreamDataSource(UserStreamTrackerDataSource):
             try:
                 self._queue: asyncio.Queue = output
 
-                await self._connected_websocket_assistant()
-                await self._ws_assistant.wait()
+                await self._stream_hub.listen(
+                    join=self._subscribe_channels,
+                    event_handlers={
+                        CONSTANTS.USER_BALANCE_EVENT_TYPE: self._process_balance_update,
+                        CONSTANTS.USER_TRADE_EVENT_TYPE: self._process_trade_update,
+                        CONSTANTS.USER_ORDER_EVENT_TYPE: self._process_order_update,
+                        "disconnect": self._on_disconnect,
+                    },
+                )
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().exception("Unexpected error while listening to user stream. Retrying after 5 seconds...")
                 await self._sleep(5.0)
             finally:
-                self._ws_assistant and await self._ws_assistant.disconnect()
-                self._ws_assistant = None
                 self._last_recv_time = -1.0
 
     async def _subscribe_channels(self):
@@ -119,7 +101,7 @@ class CoindcxAPIUserStreamDataSource(UserStreamTrackerDataSource):
         """
         try:
             auth_payload: Dict[str, Any] = await self._auth.ws_authenticate()
-            await self._ws_assistant.emit("join", auth_payload)
+            await self._stream_hub.emit("join", auth_payload)
             self.last_recv_time = self._time()
         except asyncio.CancelledError:
             raise
@@ -129,8 +111,5 @@ class CoindcxAPIUserStreamDataSource(UserStreamTrackerDataSource):
             )
             raise
 
-    async def _handle_error(self, error):
-        raise ValueError(str(error))
-
-    def _create_async_client(self):
-        return socketio.AsyncClient()
+    async def _on_disconnect(self):
+        self._last_recv_time = -1.0
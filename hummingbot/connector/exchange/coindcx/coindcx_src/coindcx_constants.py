@@ -21,6 +21,8 @@ TRADE_HISTORY_PATH_URL = "/market_data/trade_history"
 # Private URL endpoints
 PLACE_ORDER_PATH_URL = "/exchange/v1/orders/create"
 CANCEL_ORDER_PATH_URL = "/exchange/v1/orders/cancel"
+CREATE_MULTIPLE_ORDERS_PATH_URL = "/exchange/v1/orders/create_multiple"
+CANCEL_ORDERS_BY_IDS_PATH_URL = "/exchange/v1/orders/cancel_by_ids"
 BALANCE_PATH_URL = "/exchange/v1/users/balances"
 ORDER_STATUS_PATH_URL = "/exchange/v1/orders/status"
 MULTIPLE_ORDER_STATUS_PATH_URL = "/exchange/v1/orders/status_multiple"
@@ -33,6 +35,10 @@ USER_TRADE_EVENT_TYPE = "trade-update"
 USER_ORDER_EVENT_TYPE = "order-update"
 USER_BALANCE_EVENT_TYPE = "balance-update"
 
+# Order book channels are spread over several SocketIO connections (shards) when many trading pairs are tracked
+MAX_PAIRS_PER_STREAM_SHARD = 50
+STREAM_SHARD_STATS_WINDOW = 10  # seconds of messages the message rate and lag of a shard are computed over
+
 # Order States
 ORDER_STATE = {
     "init": OrderState.PENDING_CREATE,
@@ -52,9 +58,49 @@ ORDER_TYPE_MAPPING = {
 # Misc Exchange Information
 MAX_CLIENT_ID_LEN = 36
 CLIENT_ID_PREFIX = "HBOT-"
+MAX_ORDERS_PER_STATUS_REQUEST = 25
+MAX_ORDERS_PER_BATCH_REQUEST = 10  # orders created or cancelled by one create_multiple or cancel_by_ids request
+MAX_TRADE_HISTORY_RESULTS = 5000
+
+# Trade history reconciliation
+TRADE_HISTORY_CURSOR_STATE_KEY = "coindcx_trade_history_cursor"
+TRADE_HISTORY_CURSOR_OVERLAP_MS = 1000  # re-fetch window covering fills published late with an older timestamp
+MAX_SEEN_TRADE_IDS = 5000
+SEEN_TRADE_IDS_TTL = 60 * 60  # seconds the id of an applied fill is kept to drop its copies
+
+# Warm-start cache of the parsed markets details (symbol maps and trading rules), stored in the data folder
+MARKETS_CACHE_FILE_NAME = "coindcx_markets.json"
+MARKETS_CACHE_VERSION = 1
+MARKETS_CACHE_TTL = 24 * 60 * 60
+
+# Seconds the tickers of all markets are reused by every last traded price lookup of the process
+TICKER_CACHE_TTL = 3
+
+# Routing of order requests between the api and hft-api domains
+ROUTED_DOMAINS = (DEFAULT_DOMAIN, HFT_DOMAIN)
+ORDER_CREATE_ENDPOINT_CLASS = "order_create"
+ORDER_CANCEL_ENDPOINT_CLASS = "order_cancel"
+PROBE_ENDPOINT_CLASS = "probe"
+ROUTED_ENDPOINT_CLASSES = {
+    PLACE_ORDER_PATH_URL: ORDER_CREATE_ENDPOINT_CLASS,
+    CANCEL_ORDER_PATH_URL: ORDER_CANCEL_ENDPOINT_CLASS,
+    CREATE_MULTIPLE_ORDERS_PATH_URL: ORDER_CREATE_ENDPOINT_CLASS,
+    CANCEL_ORDERS_BY_IDS_PATH_URL: ORDER_CANCEL_ENDPOINT_CLASS,
+}
+DOMAIN_LATENCY_WINDOW = 50  # round trips kept per domain and endpoint class
+DOMAIN_MIN_SAMPLES = 3  # round trips of an endpoint class needed before they are preferred to the probe round trips
+DOMAIN_SAMPLE_MAX_AGE = 60  # seconds a round trip is used to rank the domains
+DOMAIN_HEALTH_WINDOW = 20  # outcomes of the last requests sent to a domain used to evaluate its health
+DOMAIN_MIN_FAILURES = 3
+DOMAIN_MAX_FAILURE_RATE = 0.5
+DOMAIN_FAILOVER_COOLDOWN = 30  # seconds a failing domain is skipped before it is used again
+DOMAIN_PROBE_INTERVAL = 15
+ROUTED_REQUEST_TIMEOUT = 10
 
 
 COINDCX_GLOBAL_RATE_LIMIT = 15  # 15 request/second
+# Share of the rate limits kept for background requests (status polling, balances, snapshots) while they are waiting
+BACKGROUND_REQUESTS_RESERVED_PCT = 0.2
 
 # Arbitrary Max request
 MAX_REQUEST = 5000
@@ -78,6 +124,10 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(COINDCX_GLOBAL_RATE_LIMIT)]),
     RateLimit(limit_id=CANCEL_ORDER_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_SECOND,
               linked_limits=[LinkedLimitWeightPair(COINDCX_GLOBAL_RATE_LIMIT)]),
+    RateLimit(limit_id=CREATE_MULTIPLE_ORDERS_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_SECOND,
+              linked_limits=[LinkedLimitWeightPair(COINDCX_GLOBAL_RATE_LIMIT)]),
+    RateLimit(limit_id=CANCEL_ORDERS_BY_IDS_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_SECOND,
+              linked_limits=[LinkedLimitWeightPair(COINDCX_GLOBAL_RATE_LIMIT)]),
     RateLimit(limit_id=BALANCE_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_SECOND,
               linked_limits=[LinkedLimitWeightPair(COINDCX_GLOBAL_RATE_LIMIT)]),
     RateLimit(limit_id=ORDER_STATUS_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_SECOND,
@@ -1,19 +1,25 @@
 import asyncio
+import os
 from decimal import Decimal
 from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from bidict import bidict
 
+from hummingbot import data_path
 from hummingbot.connector.constants import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book_recording import OrderBookRecorder
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
-from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -22,23 +28,50 @@ from . import coindcx_constants as CONSTANTS, coindcx_web_utils as web_utils
 from .coindcx_api_order_book_data_source import CoindcxAPIOrderBookDataSource
 from .coindcx_api_user_stream_data_source import CoindcxAPIUserStreamDataSource
 from .coindcx_auth import CoindcxAuth
+from .coindcx_markets_cache import CoindcxMarkets, CoindcxMarketsCache
+from .coindcx_stream_hub import CoindcxStreamHub
+from .coindcx_trade_id_index import CoindcxTradeIdIndex
 
 
 class CoindcxExchange(ExchangePyBase):
     web_utils = web_utils
 
+    # When enabled, in-flight order statuses are polled in chunks through the status_multiple endpoint
+    BATCH_ORDER_STATUS_UPDATES = True
+    # When enabled, depth-update messages are applied as the delta against the current book instead of rebuilding it
+    APPLY_DEPTH_UPDATES_AS_DELTAS = True
+
     def __init__(
             self,
             coindcx_api_key: str,
             coindcx_secret_key: str,
             trading_pairs: Optional[List[str]] = None,
             trading_required: bool = True,
+            markets_cache_path: Optional[str] = None,
+            order_book_stream_shards: Optional[int] = None,
+            order_book_recording_path: Optional[str] = None,
+            order_book_depth_cap: int = 0,
     ):
         self.coindcx_api_key = coindcx_api_key
         self.coindcx_secret_key = coindcx_secret_key
         self._trading_pairs = trading_pairs
         self._trading_required = trading_required
         self._trading_pair_ecode_symbol_map: Optional[Mapping[str, str]] = None
+        self._last_trade_history_timestamp: Optional[float] = None
+        self._last_trade_history_id: Optional[str] = None
+        # Fills applied from either the user stream or the trade history, their copies are skipped
+        self._applied_trade_ids = CoindcxTradeIdIndex()
+        self._order_book_stream_shards = order_book_stream_shards
+        # When set, the order book messages are recorded in this directory to be replayed offline
+        self._order_book_recording_path = order_book_recording_path
+        # When set, the order books only keep this number of levels per side, plus a safety margin
+        self._order_book_depth_cap = order_book_depth_cap
+        self._markets_cache = CoindcxMarketsCache(
+            file_path=markets_cache_path or os.path.join(data_path(), CONSTANTS.MARKETS_CACHE_FILE_NAME))
+        # Single SocketIO connection shared by the order book and user stream data sources
+        self._stream_hub = CoindcxStreamHub()
+        self._domain_router = web_utils.CoindcxDomainRouter()
+        self._domain_probe_task: Optional[asyncio.Task] = None
         super().__init__()
 
     @property
@@ -89,19 +122,123 @@ class CoindcxExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def tracking_states(self) -> Dict[str, Any]:
+        """
+        Returns the active orders JSON representation, along with the trade history cursor used to reconcile fills
+        """
+        tracking_states = super().tracking_states
+        if self._last_trade_history_timestamp is not None:
+            tracking_states[CONSTANTS.TRADE_HISTORY_CURSOR_STATE_KEY] = {
+                "timestamp": self._last_trade_history_timestamp,
+                "trade_id": self._last_trade_history_id,
+            }
+        return tracking_states
+
+    def restore_tracking_states(self, saved_states: Dict[str, Any]):
+        """
+        Restores the in-flight orders and the trade history cursor from saved tracking states.
+
+        :param saved_states: The saved tracking_states.
+        """
+        saved_states = dict(saved_states)
+        cursor_state = saved_states.pop(CONSTANTS.TRADE_HISTORY_CURSOR_STATE_KEY, None)
+        if cursor_state is not None:
+            self._last_trade_history_timestamp = float(cursor_state["timestamp"])
+            self._last_trade_history_id = cursor_state.get("trade_id")
+
+        super().restore_tracking_states(saved_states)
+
+        # Fills already applied to the restored orders do not need to be processed again
+        for order in self.in_flight_orders.values():
+            for trade_id in order.order_fills:
+                self._applied_trade_ids.add(trade_id)
+
+    @property
+    def domain_router(self) -> web_utils.CoindcxDomainRouter:
+        return self._domain_router
+
+    @property
+    def applied_trade_ids(self) -> CoindcxTradeIdIndex:
+        return self._applied_trade_ids
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.MARKET]
 
+    def format_status(self) -> str:
+        statuses = [
+            self._orderbook_ds.format_status(),
+            self._domain_router.format_status(),
+            self._applied_trade_ids.format_status(),
+            self._format_order_book_queue_status(),
+            self._format_order_book_memory_status(),
+            self.order_book_tracker.latency_tracker.format_status(),
+        ]
+        return "\n".join(status for status in statuses if status)
+
+    def _format_order_book_queue_status(self) -> str:
+        queue_stats = {trading_pair: stats
+                       for trading_pair, stats in self.order_book_tracker.message_queue_stats.items()
+                       if any(stats)}
+        if not queue_stats:
+            return ""
+        lines = ["  CoinDCX order book queues:",
+                 f"    {'Pair':<16}{'Pending':>9}{'Dropped':>9}{'Merged':>9}"]
+        for trading_pair, stats in sorted(queue_stats.items()):
+            lines.append(f"    {trading_pair:<16}{stats.depth:>9}{stats.dropped:>9}{stats.merged:>9}")
+        return "\n".join(lines)
+
+    def _format_order_book_memory_status(self) -> str:
+        memory_usage = self.order_book_tracker.memory_usage
+        if not memory_usage:
+            return ""
+        depth_resyncs = self.order_book_tracker.depth_resyncs
+        depth_cap = self.order_book_tracker.depth_cap
+        lines = [f"  CoinDCX order book memory (depth cap: {depth_cap if depth_cap > 0 else 'none'}):",
+                 f"    {'Pair':<16}{'Book KB':>9}{'Msgs KB':>9}{'Resyncs':>9}"]
+        for trading_pair, usage in sorted(memory_usage.items()):
+            lines.append(f"    {trading_pair:<16}{usage.order_book / 1024:>9.1f}{usage.messages / 1024:>9.1f}"
+                         f"{depth_resyncs.get(trading_pair, 0):>9}")
+        lines.append(f"    {'Total':<16}{sum(usage.order_book for usage in memory_usage.values()) / 1024:>9.1f}"
+                     f"{sum(usage.messages for usage in memory_usage.values()) / 1024:>9.1f}"
+                     f"{sum(depth_resyncs.values()):>9}")
+        return "\n".join(lines)
+
+    def _create_throttler(self) -> AsyncThrottler:
+        return web_utils.create_throttler()
+
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         return web_utils.build_api_factory(throttler=self._throttler, auth=self._auth)
 
+    def _create_order_book_tracker(self) -> OrderBookTracker:
+        return OrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain,
+            apply_snapshots_as_deltas=self.APPLY_DEPTH_UPDATES_AS_DELTAS,
+            concurrent_init=True,
+            coalesce_messages=True,
+            track_latency=True,
+            depth_cap=self._order_book_depth_cap,
+            recorder=(OrderBookRecorder(self._order_book_recording_path)
+                      if self._order_book_recording_path is not None else None))
+
     def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
         return CoindcxAPIOrderBookDataSource(
-            trading_pairs=self.trading_pairs, connector=self, api_factory=self._web_assistants_factory
+            trading_pairs=self.trading_pairs,
+            connector=self,
+            api_factory=self._web_assistants_factory,
+            stream_hub=self._stream_hub,
+            stream_shards=self._order_book_stream_shards,
         )
 
     def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
-        return CoindcxAPIUserStreamDataSource(auth=self._auth, connector=self, api_factory=self._web_assistants_factory)
+        return CoindcxAPIUserStreamDataSource(
+            auth=self._auth,
+            connector=self,
+            api_factory=self._web_assistants_factory,
+            stream_hub=self._stream_hub,
+        )
 
     def _get_fee(self,
                  base_currency: str,
@@ -135,8 +272,54 @@ class CoindcxExchange(ExchangePyBase):
             limit_id: Optional[str] = None,
             domain: str = CONSTANTS.DEFAULT_DOMAIN,
             return_error: bool = False,
+            priority: RequestPriority = RequestPriority.TRADING,
     ) -> Dict[str, Any]:
 
+        endpoint_class = CONSTANTS.ROUTED_ENDPOINT_CLASSES.get(path_url)
+        if endpoint_class is not None:
+            # Order requests go to the fastest healthy domain, only cancellations are safe to retry on another one
+            return await self._domain_router.execute(
+                endpoint_class=endpoint_class,
+                request=lambda routed_domain: self._execute_api_request(
+                    path_url=path_url,
+                    method=method,
+                    params=params,
+                    data=data,
+                    is_auth_required=is_auth_required,
+                    limit_id=limit_id,
+                    domain=routed_domain,
+                    return_error=return_error,
+                    priority=priority,
+                    timeout=CONSTANTS.ROUTED_REQUEST_TIMEOUT,
+                ),
+                failover=endpoint_class == CONSTANTS.ORDER_CANCEL_ENDPOINT_CLASS,
+            )
+
+        return await self._execute_api_request(
+            path_url=path_url,
+            method=method,
+            params=params,
+            data=data,
+            is_auth_required=is_auth_required,
+            limit_id=limit_id,
+            domain=domain,
+            return_error=return_error,
+            priority=priority,
+        )
+
+    async def _execute_api_request(
+            self,
+            path_url,
+            method: RESTMethod,
+            params: Optional[Dict[str, Any]],
+            data: Optional[Dict[str, Any]],
+            is_auth_required: bool,
+            limit_id: Optional[str],
+            domain: str,
+            return_error: bool,
+            priority: RequestPriority,
+            timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
         if is_auth_required:
             url = self.web_utils.private_rest_url(path_url, domain=domain)
@@ -150,9 +333,42 @@ class CoindcxExchange(ExchangePyBase):
             method=method,
             is_auth_required=is_auth_required,
             throttler_limit_id=limit_id if limit_id else path_url,
-            return_err=return_error
+            return_err=return_error,
+            timeout=timeout,
+            priority=priority,
         )
 
+    async def _domain_probe_loop(self):
+        """
+        Periodically measures the round trip to every routed domain, so that the order requests can be sent to the
+        fastest one before enough orders have been sent to each of them.
+        """
+        while True:
+            try:
+                await safe_gather(*[
+                    self._domain_router.measure(
+                        domain=domain,
+                        endpoint_class=CONSTANTS.PROBE_ENDPOINT_CLASS,
+                        request=lambda probed_domain: self._execute_api_request(
+                            path_url=CONSTANTS.CHECK_NETWORK_REQUEST_PATH_URL,
+                            method=RESTMethod.GET,
+                            params=None,
+                            data=None,
+                            is_auth_required=False,
+                            limit_id=None,
+                            domain=probed_domain,
+                            return_error=False,
+                            priority=RequestPriority.BACKGROUND,
+                            timeout=CONSTANTS.ROUTED_REQUEST_TIMEOUT,
+                        ))
+                    for domain in self._domain_router.domains
+                ], return_exceptions=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Unexpected error while probing the CoinDCX domains.", exc_info=True)
+            await self._sleep(CONSTANTS.DOMAIN_PROBE_INTERVAL)
+
     def trading_pair_symbol_map_ready(self):
         """
         Checks if the mapping from exchange symbols to client trading pairs has been initialized
@@ -171,12 +387,64 @@ class CoindcxExchange(ExchangePyBase):
     def _set_trading_pair_ecode_symbol_map(self, trading_pair_ecode_symbol_mapping: Mapping[str, str]):
         self._trading_pair_ecode_symbol_map = trading_pair_ecode_symbol_mapping
 
+    async def start_network(self):
+        """
+        Starts with the cached markets, if any, while the trading rules polling loop refreshes them in the background.
+        """
+        self._load_markets_cache()
+        await super().start_network()
+        if self.is_trading_required:
+            self._domain_probe_task = safe_ensure_future(self._domain_probe_loop())
+
+    def _stop_network(self):
+        super()._stop_network()
+        if self._domain_probe_task is not None:
+            self._domain_probe_task.cancel()
+            self._domain_probe_task = None
+
+    def _load_markets_cache(self) -> bool:
+        """
+        Initializes the symbol maps and trading rules from the markets cache.
+
+        :return: True if valid cached markets were applied
+        """
+        markets: Optional[CoindcxMarkets] = self._markets_cache.load(now=self._time())
+        if markets is None or not markets.is_consistent(self._trading_pairs or []):
+            return False
+        self._set_trading_pair_ecode_symbol_map(bidict(markets.ecode_symbol_map))
+        self._set_trading_pair_symbol_map(bidict(markets.symbol_map))
+        self._trading_rules.clear()
+        for trading_rule in markets.trading_rules:
+            self._trading_rules[trading_rule.trading_pair] = trading_rule
+        self.logger().info(f"Loaded {len(markets.symbol_map)} markets from {self._markets_cache.file_path}.")
+        return True
+
+    async def _save_markets_cache(self):
+        if not self.trading_pair_symbol_map_ready():
+            return
+        markets = CoindcxMarkets(
+            symbol_map=dict(await self.trading_pair_symbol_map()),
+            ecode_symbol_map=dict(await self.trading_pair_ecode_symbol_map()),
+            trading_rules=list(self._trading_rules.values()),
+        )
+        try:
+            await asyncio.get_event_loop().run_in_executor(None, self._markets_cache.save, markets, self._time())
+        except Exception:
+            self.logger().warning("Could not write the CoinDCX markets cache.", exc_info=True)
+
+    async def _update_trading_rules(self):
+        await super()._update_trading_rules()
+        await self._save_markets_cache()
+
     async def _initialize_trading_pair_symbol_map(self):
+        if self._load_markets_cache():
+            return
         try:
             exchange_info = await self._api_request(
                 path_url=self.trading_pairs_request_path,
                 method=RESTMethod.GET,
                 limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+                priority=RequestPriority.BACKGROUND,
             )
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         except Exception:
@@ -253,16 +521,14 @@ class CoindcxExchange(ExchangePyBase):
             price: Decimal,
     ) -> Tuple[str, float]:
         try:
-            data = {
-                "market": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-                "total_quantity": float(amount),
-                "side": "buy" if trade_type is TradeType.BUY else "sell",
-                "client_order_id": order_id,
-                "order_type": "limit_order" if order_type is OrderType.LIMIT else "market_order",
-            }
-
-            if order_type is OrderType.LIMIT:
-                data.update({"price_per_unit": float(price)})
+            data = await self._order_request_data(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=price,
+            )
 
             response = await self._api_request(
                 path_url=CONSTANTS.PLACE_ORDER_PATH_URL,
@@ -282,6 +548,83 @@ class CoindcxExchange(ExchangePyBase):
 
         return str(order_data["id"]), self.current_timestamp
 
+    async def _order_request_data(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+    ) -> Dict[str, Any]:
+        data = {
+            "market": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "total_quantity": float(amount),
+            "side": "buy" if trade_type is TradeType.BUY else "sell",
+            "client_order_id": order_id,
+            "order_type": "limit_order" if order_type is OrderType.LIMIT else "market_order",
+        }
+
+        if order_type is OrderType.LIMIT:
+            data.update({"price_per_unit": float(price)})
+
+        return data
+
+    async def _place_orders(self, orders_to_create: List[InFlightOrder]) -> List[Any]:
+        """
+        Sends the orders in chunks of MAX_ORDERS_PER_BATCH_REQUEST with the create_multiple endpoint. The orders of a
+        chunk the exchange did not create (missing from the response or rejected) fail on their own, the other orders
+        of the chunk are kept.
+        """
+        chunk_size = CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+        chunk_results = await safe_gather(
+            *[
+                self._place_orders_chunk(orders_to_create[i:i + chunk_size])
+                for i in range(0, len(orders_to_create), chunk_size)
+            ],
+            return_exceptions=True,
+        )
+
+        placement_results = []
+        for i, chunk_result in zip(range(0, len(orders_to_create), chunk_size), chunk_results):
+            placement_results.extend(self._results_per_order(orders_to_create[i:i + chunk_size], chunk_result))
+        return placement_results
+
+    async def _place_orders_chunk(self, orders_to_create: List[InFlightOrder]) -> List[Any]:
+        orders_data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders_to_create
+        ]
+
+        response = await self._api_request(
+            path_url=CONSTANTS.CREATE_MULTIPLE_ORDERS_PATH_URL,
+            method=RESTMethod.POST,
+            data={"orders": orders_data},
+            is_auth_required=True,
+            limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+        )
+        created_orders = {str(order_data.get("client_order_id")): order_data for order_data in response["orders"]}
+
+        placement_results = []
+        for order in orders_to_create:
+            order_data = created_orders.get(order.client_order_id)
+            if order_data is None:
+                placement_results.append(IOError(f"The order {order.client_order_id} was not created. "
+                                                 f"Response: {response}"))
+            elif CONSTANTS.ORDER_STATE.get(order_data.get("status")) == OrderState.FAILED:
+                placement_results.append(IOError(f"The order {order.client_order_id} was rejected. "
+                                                 f"Order: {order_data}"))
+            else:
+                placement_results.append((str(order_data["id"]), self.current_timestamp))
+        return placement_results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         data = {"client_order_id": order_id}
 
@@ -292,6 +635,7 @@ class CoindcxExchange(ExchangePyBase):
                 data=data,
                 is_auth_required=True,
                 limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+                priority=RequestPriority.CRITICAL,
             )
         except IOError as error:
             error_message = str(error)
@@ -302,6 +646,82 @@ class CoindcxExchange(ExchangePyBase):
 
         return True
 
+    async def _place_cancels(self, orders_to_cancel: List[InFlightOrder]) -> List[Any]:
+        """
+        Cancels the orders already acknowledged by the exchange in chunks of MAX_ORDERS_PER_BATCH_REQUEST with the
+        cancel_by_ids endpoint. The orders without an exchange order id yet are cancelled by client id on their own.
+        """
+        orders_with_exchange_id = [order for order in orders_to_cancel if order.exchange_order_id is not None]
+        orders_without_exchange_id = [order for order in orders_to_cancel if order.exchange_order_id is None]
+        chunk_size = CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+        chunks = [orders_with_exchange_id[i:i + chunk_size] for i in range(0, len(orders_with_exchange_id), chunk_size)]
+
+        results = await safe_gather(
+            *[self._place_cancels_chunk(chunk) for chunk in chunks],
+            *[self._place_cancel(order.client_order_id, order) for order in orders_without_exchange_id],
+            return_exceptions=True,
+        )
+
+        cancel_results = {}
+        for chunk, chunk_result in zip(chunks, results):
+            for order, cancel_result in zip(chunk, self._results_per_order(chunk, chunk_result)):
+                cancel_results[order.client_order_id] = cancel_result
+        for order, cancel_result in zip(orders_without_exchange_id, results[len(chunks):]):
+            cancel_results[order.client_order_id] = cancel_result
+        return [cancel_results[order.client_order_id] for order in orders_to_cancel]
+
+    async def _place_cancels_chunk(self, orders_to_cancel: List[InFlightOrder]) -> List[Any]:
+        try:
+            await self._api_request(
+                path_url=CONSTANTS.CANCEL_ORDERS_BY_IDS_PATH_URL,
+                method=RESTMethod.POST,
+                data={"ids": [order.exchange_order_id for order in orders_to_cancel]},
+                is_auth_required=True,
+                limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+                priority=RequestPriority.CRITICAL,
+            )
+        except IOError as error:
+            if web_utils.CoindcxDomainRouter.is_domain_failure(error):
+                raise
+            # The whole batch is rejected when one of its orders can't be cancelled, each order is then cancelled on
+            # its own to know which ones are still open
+            return await safe_gather(
+                *[self._place_cancel(order.client_order_id, order) for order in orders_to_cancel],
+                return_exceptions=True,
+            )
+        return [True] * len(orders_to_cancel)
+
+    @staticmethod
+    def _results_per_order(orders: List[InFlightOrder], chunk_result: Any) -> List[Any]:
+        if isinstance(chunk_result, Exception):
+            return [chunk_result] * len(orders)
+        return chunk_result
+
+    async def get_last_traded_prices(self, trading_pairs: List[str]) -> Dict[str, float]:
+        """
+        Serves the last traded prices of all the requested pairs from the ticker of all markets, which is shared for a
+        few seconds by every lookup of the process (order book tracker fallback loop, balance valuations).
+        Pairs missing from the ticker are looked up in their public trade history.
+
+        :param trading_pairs: list of trading pairs to get the prices for
+
+        :return: Dictionary of associations between token pair and its latest price
+        """
+        requested_pairs: Set[str] = set(trading_pairs)
+        symbol_map = await self.trading_pair_symbol_map()
+        last_prices: Dict[str, float] = {}
+        for ticker in await web_utils.get_ticker(api_factory=self._web_assistants_factory):
+            trading_pair = symbol_map.get(ticker.get("market"))
+            if trading_pair in requested_pairs and ticker.get("last_price") is not None:
+                last_prices[trading_pair] = float(ticker["last_price"])
+
+        missing_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in last_prices]
+        if len(missing_pairs) > 0:
+            results = await safe_gather(*[self._get_last_traded_price(trading_pair) for trading_pair in missing_pairs])
+            last_prices.update(zip(missing_pairs, results))
+
+        return {trading_pair: last_prices[trading_pair] for trading_pair in trading_pairs}
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         param = {
             "pair": await self.exchange_ecode_symbol_associated_to_pair(trading_pair=trading_pair),
@@ -309,7 +729,8 @@ class CoindcxExchange(ExchangePyBase):
         resp_json = await self._api_request(
             path_url=CONSTANTS.TRADE_HISTORY_PATH_URL,
             params=param,
-            domain=CONSTANTS.PUBLIC_DOMAIN
+            domain=CONSTANTS.PUBLIC_DOMAIN,
+            priority=RequestPriority.BACKGROUND,
         )
 
         last_traded_data: Dict[str, Any] = resp_json[0]
@@ -322,6 +743,7 @@ class CoindcxExchange(ExchangePyBase):
             method=RESTMethod.POST,
             is_auth_required=True,
             limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+            priority=RequestPriority.BACKGROUND,
         )
 
         self._account_available_balances.clear()
@@ -355,17 +777,50 @@ class CoindcxExchange(ExchangePyBase):
     async def _update_trading_fees(self):
         pass
 
-    async def _request_trade_history(self) -> List[Dict[str, Any]]:
-        task_start_ts = int(round(self.current_timestamp))
-
-        earliest_creation_ts = (
-            int(min([order.creation_timestamp for order in list(self.in_flight_orders.values())])) * 1e3
-            if len(self.in_flight_orders) > 0
-            else int(round(self.current_timestamp))
+    def _trade_history_start_timestamp(self) -> int:
+        """
+        Calculates the timestamp (in milliseconds) from which the trade history has to be requested. Fills older
+        than the earliest in-flight order or already covered by the trade history cursor are not requested again.
+        """
+        in_flight_orders = list(self.in_flight_orders.values())
+        start_ts = (
+            min([order.creation_timestamp for order in in_flight_orders]) * 1e3
+            if len(in_flight_orders) > 0
+            else self.current_timestamp * 1e3
         )
+        if self._last_trade_history_timestamp is not None:
+            start_ts = max(start_ts, self._last_trade_history_timestamp - CONSTANTS.TRADE_HISTORY_CURSOR_OVERLAP_MS)
+        return int(start_ts)
+
+    def _advance_trade_history_cursor(self, trades: List[Dict[str, Any]]):
+        """
+        Moves the trade history cursor to the most recent fill received. The cursor is never moved past the creation
+        of an in-flight order still waiting for its exchange order id, since its fills can not be matched yet.
+
+        :param trades: the fills returned by the trade history endpoint
+        """
+        if len(trades) == 0:
+            return
+
+        latest_trade = max(trades, key=lambda trade: float(trade["timestamp"]))
+        cursor_ts = float(latest_trade["timestamp"])
+        unmatched_orders_creation_ts = [
+            order.creation_timestamp * 1e3
+            for order in self.in_flight_orders.values()
+            if order.exchange_order_id is None
+        ]
+        if len(unmatched_orders_creation_ts) > 0:
+            cursor_ts = min(cursor_ts, min(unmatched_orders_creation_ts))
+
+        if self._last_trade_history_timestamp is None or cursor_ts > self._last_trade_history_timestamp:
+            self._last_trade_history_timestamp = cursor_ts
+            self._last_trade_history_id = str(latest_trade["id"])
+
+    async def _request_trade_history(self) -> List[Dict[str, Any]]:
+        task_start_ts = int(self.current_timestamp * 1e3)
 
         trade_updates = []
-        request_param_ts = earliest_creation_ts
+        request_param_ts = self._trade_history_start_timestamp()
         try:
             while True:
                 response = await self._api_request(
@@ -374,14 +829,17 @@ class CoindcxExchange(ExchangePyBase):
                     data={
                         "from_timestamp": request_param_ts,
                         "to_timestamp": task_start_ts,
-                        "limit": 5000
+                        "limit": CONSTANTS.MAX_TRADE_HISTORY_RESULTS
                     },
                     is_auth_required=True,
                     limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
-                    return_error=True
+                    return_error=True,
+                    priority=RequestPriority.BACKGROUND,
                 )
+                if not isinstance(response, list):
+                    raise IOError(f"Unexpected trade history response: {response}")
                 trade_updates.extend(response)
-                if len(response) < 5000:
+                if len(response) < CONSTANTS.MAX_TRADE_HISTORY_RESULTS:
                     break
                 request_param_ts = response[-1]["timestamp"]
         except asyncio.CancelledError:
@@ -390,7 +848,8 @@ class CoindcxExchange(ExchangePyBase):
             self.logger().error(f"Error occurred fetching trade history. {str(e)}",
                                 exc_info=True)
 
-        return trade_updates
+        self._advance_trade_history_cursor(trade_updates)
+        return [trade for trade in trade_updates if not self._applied_trade_ids.is_applied(str(trade["id"]))]
 
     async def _request_order_status(self, order: InFlightOrder) -> Tuple[str, Any]:
         response = await self._api_request(
@@ -398,16 +857,67 @@ class CoindcxExchange(ExchangePyBase):
             path_url=CONSTANTS.ORDER_STATUS_PATH_URL,
             data={"client_order_id": order.client_order_id},
             is_auth_required=True,
-            return_error=True
+            return_error=True,
+            priority=RequestPriority.BACKGROUND,
         )
         return order.client_order_id, response
 
-    async def _update_order_status(self):
-        order_update_requests = []
-        for order in list(self.in_flight_orders.values()):
-            order_update_requests.append(asyncio.create_task(self._request_order_status(order)))
+    async def _request_multiple_order_status(self, orders: List[InFlightOrder]) -> List[Tuple[str, Any]]:
+        """
+        Requests the status of several orders with a single call to the status_multiple endpoint.
+
+        :param orders: the orders to request, at most MAX_ORDERS_PER_STATUS_REQUEST of them
+        :return: a list of (client_order_id, status response) tuples. Orders missing from the exchange response are
+            mapped to None
+        """
+        response = await self._api_request(
+            method=RESTMethod.POST,
+            path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL,
+            data={"client_order_ids": [order.client_order_id for order in orders]},
+            is_auth_required=True,
+            return_error=True,
+            priority=RequestPriority.BACKGROUND,
+        )
+        if not isinstance(response, list):
+            if "Order not found" not in str(response):
+                raise IOError(f"Error fetching the status of multiple orders. Response: {response}")
+            return [(order.client_order_id, response) for order in orders]
+
+        order_status_by_client_order_id = {str(data["client_order_id"]): data for data in response}
+        return [
+            (order.client_order_id, order_status_by_client_order_id.get(order.client_order_id))
+            for order in orders
+        ]
+
+    async def _request_order_status_updates(self) -> List[Tuple[str, Any]]:
+        in_flight_orders = list(self.in_flight_orders.values())
+
+        if not self.BATCH_ORDER_STATUS_UPDATES:
+            return await safe_gather(
+                *[self._request_order_status(order) for order in in_flight_orders], return_exceptions=True
+            )
+
+        chunk_size = CONSTANTS.MAX_ORDERS_PER_STATUS_REQUEST
+        batch_results = await safe_gather(
+            *[
+                self._request_multiple_order_status(in_flight_orders[i:i + chunk_size])
+                for i in range(0, len(in_flight_orders), chunk_size)
+            ],
+            return_exceptions=True,
+        )
+        order_updates = []
+        for batch_result in batch_results:
+            if isinstance(batch_result, Exception):
+                self.logger().network(
+                    f"Error fetching status update for a batch of orders. {batch_result}",
+                    app_warning_msg="Failed to fetch status update for a batch of orders."
+                )
+                continue
+            order_updates.extend(batch_result)
+        return order_updates
 
-        order_updates: List[Tuple[str, Any]] = await safe_gather(*order_update_requests, return_exceptions=True)
+    async def _update_order_status(self):
+        order_updates: List[Tuple[str, Any]] = await self._request_order_status_updates()
         trade_updates: List[Dict[str, Any]] = await self._request_trade_history()
 
         if len(trade_updates) > 0:
@@ -440,10 +950,11 @@ class CoindcxExchange(ExchangePyBase):
                         fill_timestamp=float(data["timestamp"]) * 1e-3,
                     )
                     self._order_tracker.process_trade_update(trade_update)
+                    self._applied_trade_ids.add(trade_update.trade_id)
 
         if len(order_updates) > 0:
             for client_order_id, data in order_updates:
-                if "Order not found" in str(data):
+                if data is None or "Order not found" in str(data):
                     self.logger().network(
                         f"Error fetching status update for order {client_order_id}.",
                         app_warning_msg=f"Failed to fetch status update for an order {client_order_id}."
@@ -478,6 +989,9 @@ class CoindcxExchange(ExchangePyBase):
                         self._account_available_balances.update({asset_name: available_balance})
                 elif channel == CONSTANTS.USER_TRADE_EVENT_TYPE:
                     for trade_update in data:
+                        trade_id = str(trade_update["t"])
+                        if self._applied_trade_ids.is_applied(trade_id):
+                            continue
                         client_order_id = trade_update["c"]
                         tracked_order: InFlightOrder = self._order_tracker.fetch_order(client_order_id=client_order_id)
 
@@ -490,7 +1004,7 @@ class CoindcxExchange(ExchangePyBase):
                                 flat_fees=[TokenAmount(amount=Decimal(trade_update["f"]), token=fee_token)],
                             )
                             trade_update = TradeUpdate(
-                                trade_id=str(trade_update["t"]),
+                                trade_id=trade_id,
                                 client_order_id=tracked_order.client_order_id,
                                 exchange_order_id=str(trade_update["o"]),
                                 trading_pair=tracked_order.trading_pair,
@@ -501,6 +1015,7 @@ class CoindcxExchange(ExchangePyBase):
                                 fill_timestamp=float(trade_update["T"]) * 1e-3,
                             )
                             self._order_tracker.process_trade_update(trade_update)
+                            self._applied_trade_ids.add(trade_id)
                 elif channel == CONSTANTS.USER_ORDER_EVENT_TYPE:
                     for order_update in data:
                         client_order_id = order_update["client_order_id"]
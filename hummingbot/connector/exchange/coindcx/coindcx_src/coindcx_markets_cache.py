@@ -0,0 +1,137 @@
+import json
+import logging
+import os
+import tempfile
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.logger import HummingbotLogger
+
+from . import coindcx_constants as CONSTANTS
+
+TRADING_RULE_FIELDS = (
+    "min_order_size",
+    "max_order_size",
+    "min_price_increment",
+    "min_base_amount_increment",
+    "min_notional_size",
+)
+
+
+class CoindcxMarkets(NamedTuple):
+    """
+    The parsed content of the CoinDCX markets details: both symbol maps and the trading rules.
+    """
+    symbol_map: Dict[str, str]
+    ecode_symbol_map: Dict[str, str]
+    trading_rules: List[TradingRule]
+
+    def is_consistent(self, trading_pairs: Iterable[str]) -> bool:
+        """
+        Checks that both symbol maps cover the same trading pairs, that every trading rule belongs to one of them and
+        that all the given trading pairs are known.
+
+        :param trading_pairs: the trading pairs the connector is configured with
+        """
+        mapped_pairs = set(self.symbol_map.values())
+        return (
+            len(mapped_pairs) > 0
+            and mapped_pairs == set(self.ecode_symbol_map.values())
+            and all(trading_rule.trading_pair in mapped_pairs for trading_rule in self.trading_rules)
+            and all(trading_pair in mapped_pairs for trading_pair in trading_pairs)
+        )
+
+
+class CoindcxMarketsCache:
+    """
+    Versioned file keeping the last CoinDCX markets parsed by the connector, so that a restart can use them right
+    away instead of waiting for (and parsing) the full markets details response.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, file_path: str, ttl: float = CONSTANTS.MARKETS_CACHE_TTL):
+        """
+        :param file_path: path of the cache file
+        :param ttl: seconds after which the cached markets are considered outdated
+        """
+        self._file_path = file_path
+        self._ttl = ttl
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def load(self, now: float) -> Optional[CoindcxMarkets]:
+        """
+        Reads the cached markets.
+
+        :param now: current timestamp in seconds
+        :return: the cached markets, or None if there are none, they are outdated or were written by another version
+        """
+        try:
+            with open(self._file_path, "r") as cache_file:
+                content: Dict[str, Any] = json.load(cache_file)
+            if content.get("version") != CONSTANTS.MARKETS_CACHE_VERSION:
+                return None
+            if now - float(content["timestamp"]) > self._ttl:
+                return None
+            return CoindcxMarkets(
+                symbol_map=content["symbol_map"],
+                ecode_symbol_map=content["ecode_symbol_map"],
+                trading_rules=[
+                    TradingRule(
+                        trading_pair=rule["trading_pair"],
+                        **{field: Decimal(rule[field]) for field in TRADING_RULE_FIELDS},
+                    )
+                    for rule in content["trading_rules"]
+                ],
+            )
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.logger().warning(f"Ignoring unreadable CoinDCX markets cache {self._file_path}.", exc_info=True)
+            return None
+
+    def save(self, markets: CoindcxMarkets, now: float):
+        """
+        Writes the markets to the cache file. The file is replaced atomically, a concurrent reader never sees a
+        partially written cache.
+
+        :param markets: the markets to cache
+        :param now: current timestamp in seconds
+        """
+        content = {
+            "version": CONSTANTS.MARKETS_CACHE_VERSION,
+            "timestamp": now,
+            "symbol_map": dict(markets.symbol_map),
+            "ecode_symbol_map": dict(markets.ecode_symbol_map),
+            "trading_rules": [
+                {
+                    "trading_pair": trading_rule.trading_pair,
+                    **{field: str(getattr(trading_rule, field)) for field in TRADING_RULE_FIELDS},
+                }
+                for trading_rule in markets.trading_rules
+            ],
+        }
+        # Each save writes its own temporary file, connectors sharing the data folder can not overwrite each other's
+        with tempfile.NamedTemporaryFile(mode="w",
+                                         dir=os.path.dirname(os.path.abspath(self._file_path)),
+                                         prefix=f"{os.path.basename(self._file_path)}.",
+                                         suffix=".tmp",
+                                         delete=False) as cache_file:
+            temporary_path = cache_file.name
+            try:
+                json.dump(content, cache_file)
+            except Exception:
+                cache_file.close()
+                os.remove(temporary_path)
+                raise
+        os.replace(temporary_path, self._file_path)
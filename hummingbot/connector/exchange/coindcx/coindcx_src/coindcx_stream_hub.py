@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import socketio
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+from . import coindcx_constants as CONSTANTS
+
+EventHandler = Callable[..., Awaitable[None]]
+
+# Events handled by the hub itself. Subscribers can still provide a "disconnect" handler.
+CONNECTION_EVENTS = ("connect", "disconnect", "connect_error")
+
+
+class _StreamSubscriber:
+    __slots__ = ("join", "event_handlers")
+
+    def __init__(self, join: Callable[[], Awaitable[None]], event_handlers: Dict[str, EventHandler]):
+        self.join = join
+        self.event_handlers = event_handlers
+
+
+class CoindcxStreamHub:
+    """
+    Owns the single SocketIO connection a CoindcxExchange keeps with the CoinDCX stream server.
+
+    The public (order book) and private (user stream) data sources listen through the hub instead of opening their own
+    connections. Each of them provides the coroutine that joins its channels, which is run every time the connection
+    is (re)established, and the handlers for the events it consumes. The connection is opened when the first data
+    source starts listening and closed when the last one stops.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._client: Optional[socketio.AsyncClient] = None
+        self._connected: bool = False
+        self._subscribers: List[_StreamSubscriber] = []
+        self._registered_events: Set[str] = set()
+        self._connection_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def subscribers_count(self) -> int:
+        return len(self._subscribers)
+
+    async def listen(self, join: Callable[[], Awaitable[None]], event_handlers: Dict[str, EventHandler]):
+        """
+        Keeps the shared connection open while the caller is listening. The call only returns by raising, either
+        because the caller was cancelled or because the connection loop failed.
+
+        :param join: coroutine function joining the channels of the caller, run on every (re)connection
+        :param event_handlers: coroutine functions associated with the SocketIO events the caller consumes
+        """
+        subscriber = _StreamSubscriber(join=join, event_handlers=event_handlers)
+        self._subscribers.append(subscriber)
+        for event in event_handlers:
+            self._register_event(event)
+
+        try:
+            if self._connected:
+                await self._join(subscriber)
+            if self._connection_task is None or self._connection_task.done():
+                self._connection_task = safe_ensure_future(self._connection_loop())
+            await asyncio.shield(self._connection_task)
+        finally:
+            self._subscribers.remove(subscriber)
+            if len(self._subscribers) == 0 and self._connection_task is not None:
+                self._connection_task.cancel()
+                self._connection_task = None
+
+    async def emit(self, event: str, data: Dict[str, Any]):
+        if self._client is None:
+            raise ConnectionError("The CoinDCX stream connection is not established.")
+        await self._client.emit(event, data)
+
+    async def _connection_loop(self):
+        while True:
+            try:
+                self._client = self._create_async_client()
+                self._client.on("connect", self._on_connect)
+                self._client.on("disconnect", self._on_disconnect)
+                self._client.on("connect_error", self._handle_error)
+                for event in self._registered_events:
+                    self._client.on(event, self._event_dispatcher(event))
+
+                await self._client.connect(CONSTANTS.WSS_URL, transports="websocket")
+                await self._client.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().error(
+                    f"Unexpected error occurred on the CoinDCX stream connection. Retrying in 5 seconds... Error: {e}",
+                    exc_info=True,
+                )
+                await self._sleep(5.0)
+            finally:
+                self._client and await self._client.disconnect()
+                self._client = None
+                self._connected = False
+
+    def _register_event(self, event: str):
+        if event not in self._registered_events and event not in CONNECTION_EVENTS:
+            self._registered_events.add(event)
+            if self._client is not None:
+                self._client.on(event, self._event_dispatcher(event))
+
+    def _event_dispatcher(self, event: str) -> EventHandler:
+        async def dispatch(*args):
+            for subscriber in list(self._subscribers):
+                handler = subscriber.event_handlers.get(event)
+                if handler is None:
+                    continue
+                try:
+                    await handler(*args)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    # A failing subscriber does not keep the event from the other ones
+                    self.logger().error(f"Unexpected error handling the CoinDCX stream {event} event.", exc_info=True)
+        return dispatch
+
+    async def _on_connect(self):
+        self._connected = True
+        for subscriber in list(self._subscribers):
+            await self._join(subscriber)
+
+    async def _on_disconnect(self):
+        self._connected = False
+        await self._event_dispatcher("disconnect")()
+
+    async def _join(self, subscriber: _StreamSubscriber):
+        try:
+            await subscriber.join()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The other subscribers still have to join their channels
+            self.logger().error("Unexpected error joining the CoinDCX stream channels.", exc_info=True)
+
+    async def _handle_error(self, error):
+        raise ValueError(str(error))
+
+    def _create_async_client(self) -> socketio.AsyncClient:
+        return socketio.AsyncClient()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
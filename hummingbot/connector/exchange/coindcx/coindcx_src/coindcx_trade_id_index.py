@@ -0,0 +1,83 @@
+import time
+from typing import Callable, NamedTuple
+
+from cachetools import TTLCache
+
+from . import coindcx_constants as CONSTANTS
+
+
+class TradeIdIndexStats(NamedTuple):
+    size: int
+    hits: int
+    misses: int
+
+
+class CoindcxTradeIdIndex:
+    """
+    Ids of the fills already applied to the in-flight orders. A fill can be received both from the trade-update
+    channel and from the trade history reconciliation, the index lets the second copy be dropped before its fee and
+    amounts are built. The index is bounded and its ids are evicted after a while, a fill received again after its
+    eviction is still dropped by the in-flight order it belongs to.
+    """
+
+    def __init__(self,
+                 maxsize: int = CONSTANTS.MAX_SEEN_TRADE_IDS,
+                 ttl: float = CONSTANTS.SEEN_TRADE_IDS_TTL,
+                 timer: Callable[[], float] = time.monotonic):
+        """
+        :param maxsize: maximum number of trade ids kept, the least recently added ones are evicted first
+        :param ttl: seconds a trade id is kept after being added
+        :param timer: clock used to evict the outdated trade ids
+        """
+        self._trade_ids: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, trade_id: str) -> bool:
+        return trade_id in self._trade_ids
+
+    def __len__(self) -> int:
+        return len(self._trade_ids)
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of fills found in the index, i.e. duplicates that were not processed again
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of fills not found in the index
+        """
+        return self._misses
+
+    def is_applied(self, trade_id: str) -> bool:
+        """
+        Checks if a fill was already applied, and counts the lookup as a hit or a miss.
+
+        :param trade_id: the exchange id of the fill
+        """
+        if trade_id in self._trade_ids:
+            self._hits += 1
+            return True
+        self._misses += 1
+        return False
+
+    def add(self, trade_id: str):
+        """
+        Records a fill as applied.
+
+        :param trade_id: the exchange id of the fill
+        """
+        self._trade_ids[trade_id] = True
+
+    def stats(self) -> TradeIdIndexStats:
+        return TradeIdIndexStats(size=len(self._trade_ids), hits=self._hits, misses=self._misses)
+
+    def format_status(self) -> str:
+        if self._hits == 0 and self._misses == 0:
+            return ""
+        return (f"  CoinDCX fills: {self._misses} new, {self._hits} duplicates skipped "
+                f"({len(self._trade_ids)} trade ids indexed)")
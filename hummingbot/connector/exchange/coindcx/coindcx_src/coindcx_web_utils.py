@@ -1,12 +1,35 @@
-from typing import Any, Dict, Optional
+import asyncio
+import logging
+import re
+import statistics
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+
+import aiohttp
+from cachetools import TTLCache
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
+from hummingbot.logger import HummingbotLogger
+
 from . import coindcx_constants as CONSTANTS
 
+T = TypeVar("T")
+
+# The ticker of all markets is shared by every CoinDCX connector of the process (the trading one and the non trading
+# instances used for balance valuations)
+_ticker_cache: TTLCache = TTLCache(maxsize=1, ttl=CONSTANTS.TICKER_CACHE_TTL)
+_ticker_request: Optional[asyncio.Task] = None
+# Start time of the round trip of the request CoindcxDomainRouter is measuring in the current task
+_measured_request_start: ContextVar[Optional[List[float]]] = ContextVar("coindcx_measured_request_start", default=None)
+
 
 def public_rest_url(path_url: str, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> str:
     """
@@ -29,7 +52,20 @@ def private_rest_url(path_url: str, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> s
 
 
 def create_throttler() -> AsyncThrottler:
-    return AsyncThrottler(CONSTANTS.RATE_LIMITS)
+    return AsyncThrottler(CONSTANTS.RATE_LIMITS, background_reserved_pct=CONSTANTS.BACKGROUND_REQUESTS_RESERVED_PCT)
+
+
+class CoindcxRESTPreProcessor(RESTPreProcessorBase):
+    """
+    Starts the round trip of the request measured by CoindcxDomainRouter once the request is through the throttler,
+    so that the wait for rate limit capacity is not counted as domain latency.
+    """
+
+    async def pre_process(self, request: RESTRequest) -> RESTRequest:
+        start = _measured_request_start.get()
+        if start is not None:
+            start[0] = time.perf_counter()
+        return request
 
 
 def build_api_factory(
@@ -38,10 +74,44 @@ def build_api_factory(
 ) -> WebAssistantsFactory:
     throttler = throttler or create_throttler()
     api_factory = WebAssistantsFactory(auth=auth,
-                                       throttler=throttler)
+                                       throttler=throttler,
+                                       rest_pre_processors=[CoindcxRESTPreProcessor()])
     return api_factory
 
 
+async def get_ticker(api_factory: Optional[WebAssistantsFactory] = None) -> List[Dict[str, Any]]:
+    """
+    Returns the ticker of all markets, served from a cache for CONSTANTS.TICKER_CACHE_TTL seconds.
+    Concurrent calls made while the cache is empty wait for the same request.
+
+    :param api_factory: the factory used to request the ticker when the cache is empty
+    :return: the ticker entries, one per market
+    """
+    global _ticker_request
+    tickers = _ticker_cache.get(CONSTANTS.TICKER_PRICE_PATH_URL)
+    if tickers is None:
+        if _ticker_request is None or _ticker_request.done():
+            _ticker_request = asyncio.ensure_future(_request_ticker(api_factory or build_api_factory()))
+        tickers = await asyncio.shield(_ticker_request)
+    return tickers
+
+
+async def _request_ticker(api_factory: WebAssistantsFactory) -> List[Dict[str, Any]]:
+    rest_assistant = await api_factory.get_rest_assistant()
+    tickers = await rest_assistant.execute_request(
+        url=public_rest_url(path_url=CONSTANTS.TICKER_PRICE_PATH_URL),
+        method=RESTMethod.GET,
+        throttler_limit_id=CONSTANTS.TICKER_PRICE_PATH_URL,
+        priority=RequestPriority.BACKGROUND,
+    )
+    _ticker_cache[CONSTANTS.TICKER_PRICE_PATH_URL] = tickers
+    return tickers
+
+
+def clear_ticker_cache():
+    _ticker_cache.clear()
+
+
 async def api_request(
     path: str,
     api_factory: Optional[WebAssistantsFactory] = None,
@@ -86,3 +156,222 @@ async def api_request(
                 raise IOError(f"Error executing request {method.name} {path}. " f"HTTP status is {response.status}.")
 
     return await response.json()
+
+
+class DomainLatencyStats(NamedTuple):
+    domain: str
+    endpoint_class: str
+    samples: int
+    median: Optional[float]
+    p90: Optional[float]
+    failures: int
+    healthy: bool
+
+
+class CoindcxDomainRouter:
+    """
+    Sends each request of an endpoint class to the fastest healthy CoinDCX domain (api or hft-api).
+
+    The router keeps the round trips of the last requests per domain and endpoint class. The domains are ranked on the
+    recent round trips of the endpoint class itself when every healthy domain has enough of them, and on the probe
+    round trips, measured periodically on every domain, otherwise, so that all the domains are always compared on the
+    same requests. A domain whose recent requests fail or time out too often is skipped for a cooldown period.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(
+            self,
+            domains: Iterable[str] = CONSTANTS.ROUTED_DOMAINS,
+            latency_window: int = CONSTANTS.DOMAIN_LATENCY_WINDOW,
+            min_samples: int = CONSTANTS.DOMAIN_MIN_SAMPLES,
+            sample_max_age: float = CONSTANTS.DOMAIN_SAMPLE_MAX_AGE,
+            health_window: int = CONSTANTS.DOMAIN_HEALTH_WINDOW,
+            min_failures: int = CONSTANTS.DOMAIN_MIN_FAILURES,
+            max_failure_rate: float = CONSTANTS.DOMAIN_MAX_FAILURE_RATE,
+            failover_cooldown: float = CONSTANTS.DOMAIN_FAILOVER_COOLDOWN,
+    ):
+        """
+        :param domains: the domains requests can be sent to, by order of preference when none has been measured
+        :param latency_window: number of round trips kept per domain and endpoint class
+        :param min_samples: recent round trips of an endpoint class required on every healthy domain before they are
+            used instead of the probes
+        :param sample_max_age: seconds a round trip is used to rank the domains
+        :param health_window: number of request outcomes kept per domain to evaluate its health
+        :param min_failures: failures in the health window required before a domain is skipped
+        :param max_failure_rate: failure rate in the health window from which a domain is skipped
+        :param failover_cooldown: seconds a failing domain is skipped
+        """
+        self._domains: Tuple[str, ...] = tuple(domains)
+        self._latency_window = latency_window
+        self._min_samples = min_samples
+        self._sample_max_age = sample_max_age
+        self._min_failures = min_failures
+        self._max_failure_rate = max_failure_rate
+        self._failover_cooldown = failover_cooldown
+        self._round_trips: Dict[Tuple[str, str], Deque[Tuple[float, float]]] = {}  # (timestamp, round trip)
+        self._failures: Dict[Tuple[str, str], int] = {}
+        self._outcomes: Dict[str, Deque[bool]] = {domain: deque(maxlen=health_window) for domain in self._domains}
+        self._unhealthy_until: Dict[str, float] = {}
+
+    @property
+    def domains(self) -> Tuple[str, ...]:
+        return self._domains
+
+    @staticmethod
+    def is_domain_failure(error: Exception) -> bool:
+        """
+        Tells if a request error is caused by the domain (timeout, connection error, server error) rather than by the
+        request itself (rejected order, unknown order, rate limit).
+        """
+        if isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError)):
+            return True
+        if isinstance(error, IOError):
+            status = re.search(r"HTTP status is (\d+)", str(error))
+            return status is None or int(status.group(1)) >= 500
+        return False
+
+    def is_healthy(self, domain: str) -> bool:
+        return self._time() >= self._unhealthy_until.get(domain, 0)
+
+    def ranked_domains(self, endpoint_class: str) -> List[str]:
+        """
+        Returns the domains sorted from the best to the worst for an endpoint class: healthy domains first, then by
+        median recent round trip. Domains without any recent measurement come after the measured ones.
+        """
+        latencies = self._estimated_latencies(endpoint_class)
+
+        def rank(domain: str):
+            latency = latencies.get(domain)
+            return not self.is_healthy(domain), latency is None, latency or 0, self._domains.index(domain)
+
+        return sorted(self._domains, key=rank)
+
+    def domain_for(self, endpoint_class: str) -> str:
+        return self.ranked_domains(endpoint_class)[0]
+
+    async def execute(self, endpoint_class: str, request: Callable[[str], Awaitable[T]], failover: bool = False) -> T:
+        """
+        Sends a request to the best domain for its endpoint class and measures it.
+
+        :param endpoint_class: the class of the endpoint requested
+        :param request: sends the request to the domain it receives
+        :param failover: if True, a request failing because of the domain is sent again to the next best domain.
+            Only idempotent requests should be retried.
+        :return: the request result
+        """
+        domains = self.ranked_domains(endpoint_class)
+        try:
+            return await self.measure(domains[0], endpoint_class, request)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            if not failover or len(domains) < 2 or not self.is_domain_failure(error):
+                raise
+            self.logger().warning(f"Request to the CoinDCX {domains[0]} domain failed ({error!r}). "
+                                  f"Retrying with the {domains[1]} domain.")
+            return await self.measure(domains[1], endpoint_class, request)
+
+    async def measure(self, domain: str, endpoint_class: str, request: Callable[[str], Awaitable[T]]) -> T:
+        """
+        Sends a request to a domain, recording its round trip or its failure.
+        The round trip of a request sent through a rest assistant of build_api_factory starts once the request is
+        through the throttler (see CoindcxRESTPreProcessor).
+        """
+        start = [self._time()]
+        token = _measured_request_start.set(start)
+        try:
+            result = await request(domain)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            if self.is_domain_failure(error):
+                self.record_failure(domain, endpoint_class)
+            else:
+                self.record_round_trip(domain, endpoint_class, self._time() - start[0])
+            raise
+        finally:
+            _measured_request_start.reset(token)
+        self.record_round_trip(domain, endpoint_class, self._time() - start[0])
+        return result
+
+    def record_round_trip(self, domain: str, endpoint_class: str, round_trip: float):
+        key = (domain, endpoint_class)
+        if key not in self._round_trips:
+            self._round_trips[key] = deque(maxlen=self._latency_window)
+        self._round_trips[key].append((self._time(), round_trip))
+        self._outcomes[domain].append(True)
+
+    def record_failure(self, domain: str, endpoint_class: str):
+        key = (domain, endpoint_class)
+        self._failures[key] = self._failures.get(key, 0) + 1
+        outcomes = self._outcomes[domain]
+        outcomes.append(False)
+        failures = outcomes.count(False)
+        if failures >= self._min_failures and failures / len(outcomes) >= self._max_failure_rate:
+            self._unhealthy_until[domain] = self._time() + self._failover_cooldown
+            # The domain gets a fresh evaluation once the cooldown is over
+            outcomes.clear()
+            self.logger().warning(f"The CoinDCX {domain} domain is failing ({failures} failed requests). "
+                                  f"It will not be used for {self._failover_cooldown} seconds.")
+
+    def stats(self) -> List[DomainLatencyStats]:
+        """
+        Returns the round trip statistics (in seconds) of every domain and endpoint class measured so far.
+        """
+        stats = []
+        for domain, endpoint_class in sorted(set(self._round_trips) | set(self._failures)):
+            round_trips = sorted(round_trip for _, round_trip in self._round_trips.get((domain, endpoint_class), ()))
+            stats.append(DomainLatencyStats(
+                domain=domain,
+                endpoint_class=endpoint_class,
+                samples=len(round_trips),
+                median=statistics.median(round_trips) if round_trips else None,
+                p90=round_trips[int(0.9 * (len(round_trips) - 1))] if round_trips else None,
+                failures=self._failures.get((domain, endpoint_class), 0),
+                healthy=self.is_healthy(domain),
+            ))
+        return stats
+
+    def format_status(self) -> str:
+        stats = self.stats()
+        if len(stats) == 0:
+            return ""
+        lines = ["  CoinDCX domains:",
+                 f"    {'Domain':<10}{'Endpoint':<15}{'Samples':>8}{'Median (ms)':>13}{'P90 (ms)':>10}"
+                 f"{'Failures':>10}  Healthy"]
+        for stat in stats:
+            median = f"{stat.median * 1e3:.1f}" if stat.median is not None else "-"
+            p90 = f"{stat.p90 * 1e3:.1f}" if stat.p90 is not None else "-"
+            lines.append(f"    {stat.domain:<10}{stat.endpoint_class:<15}{stat.samples:>8}{median:>13}{p90:>10}"
+                         f"{stat.failures:>10}  {'yes' if stat.healthy else 'no'}")
+        return "\n".join(lines)
+
+    def _estimated_latencies(self, endpoint_class: str) -> Dict[str, float]:
+        """
+        Returns the median recent round trip of the measured domains. The round trips of the endpoint class are only
+        used when every healthy domain has enough of them, the round trips of a domain are not compared with the probe
+        round trips of another one.
+        """
+        min_timestamp = self._time() - self._sample_max_age
+        healthy_domains = [domain for domain in self._domains if self.is_healthy(domain)] or self._domains
+        round_trips = {domain: self._recent_round_trips(domain, endpoint_class, min_timestamp)
+                       for domain in self._domains}
+        if any(len(round_trips[domain]) < self._min_samples for domain in healthy_domains):
+            round_trips = {domain: self._recent_round_trips(domain, CONSTANTS.PROBE_ENDPOINT_CLASS, min_timestamp)
+                           for domain in self._domains}
+        return {domain: statistics.median(domain_round_trips)
+                for domain, domain_round_trips in round_trips.items() if domain_round_trips}
+
+    def _recent_round_trips(self, domain: str, endpoint_class: str, min_timestamp: float) -> List[float]:
+        return [round_trip for timestamp, round_trip in self._round_trips.get((domain, endpoint_class), ())
+                if timestamp >= min_timestamp]
+
+    def _time(self) -> float:
+        return time.perf_counter()
@@ -0,0 +1,707 @@
+#!/usr/bin/env python
+"""
+Local, stateful stand-in for the CoinDCX REST API and SocketIO stream, used to load test and benchmark the connector
+without reaching the exchange.
+
+The simulator serves the REST endpoints of coindcx_constants (markets, ticker, order books, public and user trade
+histories, balances, order creation, cancellation and status) and matches the orders it receives against a synthetic
+order book. Its SocketIO server emits depth-update and new-trade events at configurable rates, and the order-update,
+trade-update and balance-update events of the user orders. Latency and errors can be injected on every request.
+
+The domain of a request is the first segment of its path (e.g. http://127.0.0.1:<port>/hft-api/exchange/v1/orders/create),
+so that the latency of each domain can be configured on its own. patch_urls() points the connector to the simulator.
+
+Usage (from the hummingbot root): PYTHONPATH=. python <path>/coindcx_simulator.py [--port 8080] [--depth-update-rate 10]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from unittest.mock import patch
+
+import socketio
+from aiohttp import web
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../"))  # isort: skip
+
+from coindcx_src import coindcx_constants as CONSTANTS  # isort: skip
+
+USER_ROOM = "coindcx"
+MAX_PUBLIC_TRADES = 50
+
+
+class SimulatedMarket(NamedTuple):
+    base: str
+    quote: str
+    mid_price: float
+    price_precision: int = 2
+    quantity_precision: int = 5
+    min_quantity: float = 1e-05
+    max_quantity: float = 9000.0
+    min_notional: float = 1.0
+
+    @property
+    def symbol(self) -> str:
+        return f"{self.base}{self.quote}"
+
+    @property
+    def pair(self) -> str:
+        return f"B-{self.base}_{self.quote}"
+
+    @property
+    def tick(self) -> float:
+        return 10 ** -self.price_precision
+
+
+class SimulatorError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _SimulatedOrder:
+    __slots__ = ("id", "client_order_id", "market", "order_type", "side", "price", "quantity", "remaining",
+                 "filled_quote", "fee_amount", "status", "created_at", "updated_at", "locked")
+
+    def __init__(self, id: str, client_order_id: str, market: SimulatedMarket, order_type: str, side: str,
+                 price: Decimal, quantity: Decimal, timestamp: int):
+        self.id = id
+        self.client_order_id = client_order_id
+        self.market = market
+        self.order_type = order_type
+        self.side = side
+        self.price = price
+        self.quantity = quantity
+        self.remaining = quantity
+        self.filled_quote = Decimal("0")
+        self.fee_amount = Decimal("0")
+        self.status = "init"
+        self.created_at = timestamp
+        self.updated_at = timestamp
+        # amount of the balance locked by the order (quote asset for buy orders, base asset for sell orders)
+        self.locked = Decimal("0")
+
+    @property
+    def is_open(self) -> bool:
+        return self.status in ("init", "open", "partially_filled")
+
+    def to_json(self) -> Dict[str, Any]:
+        executed = self.quantity - self.remaining
+        return {
+            "id": self.id,
+            "client_order_id": self.client_order_id,
+            "market": self.market.symbol,
+            "order_type": self.order_type,
+            "side": self.side,
+            "status": self.status,
+            "fee_amount": float(self.fee_amount),
+            "fee": float(CoindcxSimulator.FEE_RATE * 100),
+            "total_quantity": float(self.quantity),
+            "remaining_quantity": float(self.remaining),
+            "avg_price": float(self.filled_quote / executed) if executed > 0 else 0.0,
+            "price_per_unit": float(self.price),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class CoindcxSimulator:
+    """
+    CoinDCX stand-in served on a local port. The synthetic book of each market has `depth` levels per side around a
+    mid price following a random walk. The user orders are matched against it when they are created, and the
+    resting ones are filled by the simulated market trades crossing their price. The user orders are not shown in the
+    public depth.
+    """
+
+    FEE_RATE = Decimal("0.002")
+
+    def __init__(self,
+                 markets: List[SimulatedMarket],
+                 balances: Dict[str, float],
+                 depth: int = 50,
+                 depth_update_rate: float = 1.0,
+                 trade_rate: float = 1.0,
+                 balance_update_rate: float = 0.0,
+                 latency: float = 0.0,
+                 latency_jitter: float = 0.0,
+                 domain_latency: Optional[Dict[str, float]] = None,
+                 stream_latency: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_status: int = 500,
+                 seed: Optional[int] = None,
+                 host: str = "127.0.0.1",
+                 port: int = 0):
+        """
+        :param markets: the markets listed by the simulator
+        :param balances: initial available balance of each asset
+        :param depth: number of levels of each side of the synthetic books
+        :param depth_update_rate: depth-update events emitted per second and per market (0 disables them)
+        :param trade_rate: market trades per second and per market, emitted as new-trade events (0 disables them)
+        :param balance_update_rate: balance-update events of all assets emitted per second (0 disables them)
+        :param latency: seconds every REST request waits before being answered
+        :param latency_jitter: maximum random seconds added to the latency of each request
+        :param domain_latency: latency replacing the default one for some domains
+        :param stream_latency: seconds every SocketIO event waits before being emitted
+        :param error_rate: probability of answering a REST request with error_status
+        :param error_status: HTTP status of the random errors
+        :param seed: seed of the random generator, for reproducible runs
+        """
+        self._markets: Dict[str, SimulatedMarket] = {market.symbol: market for market in markets}
+        self._markets_by_pair: Dict[str, SimulatedMarket] = {market.pair: market for market in markets}
+        self._depth = depth
+        self._depth_update_rate = depth_update_rate
+        self._trade_rate = trade_rate
+        self._balance_update_rate = balance_update_rate
+        self._latency = latency
+        self._latency_jitter = latency_jitter
+        self._domain_latency = dict(domain_latency or {})
+        self._stream_latency = stream_latency
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._rng = random.Random(seed)
+        self._host = host
+        self._port = port
+
+        self._mid_prices: Dict[str, float] = {market.symbol: market.mid_price for market in markets}
+        self._books: Dict[str, Dict[str, Dict[float, float]]] = {}
+        for market in markets:
+            self._refresh_book(market)
+        self._public_trades: Dict[str, Deque[Dict[str, Any]]] = {
+            market.symbol: deque(maxlen=MAX_PUBLIC_TRADES) for market in markets}
+        self._available: Dict[str, Decimal] = defaultdict(Decimal, {
+            asset: Decimal(str(amount)) for asset, amount in balances.items()})
+        self._locked: Dict[str, Decimal] = defaultdict(Decimal)
+        self._orders: Dict[str, _SimulatedOrder] = {}
+        self._orders_by_client_id: Dict[str, _SimulatedOrder] = {}
+        self._user_trades: List[Dict[str, Any]] = []
+        self._order_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+        self._injected_errors: Dict[str, Deque[int]] = defaultdict(deque)
+
+        self.requests: Counter = Counter()
+        self.emitted_events: Counter = Counter()
+
+        self._sio = socketio.AsyncServer(async_mode="aiohttp", cors_allowed_origins="*")
+        self._sio.on("join", self._on_join)
+        self._runner: Optional[web.AppRunner] = None
+        self._tasks: List[asyncio.Task] = []
+        self._routes = {
+            CONSTANTS.CHECK_NETWORK_REQUEST_PATH_URL: self._check_network,
+            CONSTANTS.TICKER_PRICE_PATH_URL: self._ticker,
+            CONSTANTS.MARKETS_PATH_URL: self._markets_details,
+            CONSTANTS.ORDER_BOOK_PATH_URL: self._order_book,
+            CONSTANTS.TRADE_HISTORY_PATH_URL: self._trade_history,
+        }
+        self._private_routes = {
+            CONSTANTS.PLACE_ORDER_PATH_URL: self._create_order,
+            CONSTANTS.CREATE_MULTIPLE_ORDERS_PATH_URL: self._create_multiple_orders,
+            CONSTANTS.CANCEL_ORDER_PATH_URL: self._cancel_order,
+            CONSTANTS.CANCEL_ORDERS_BY_IDS_PATH_URL: self._cancel_orders_by_ids,
+            CONSTANTS.BALANCE_PATH_URL: self._balances,
+            CONSTANTS.ORDER_STATUS_PATH_URL: self._order_status,
+            CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL: self._multiple_order_status,
+            CONSTANTS.USER_TRADE_HISTORY_PATH_URL: self._user_trade_history,
+        }
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    @property
+    def rest_url(self) -> str:
+        """
+        Template of the REST URL of a domain, replacing CONSTANTS.REST_URL
+        """
+        return self.url + "/{}"
+
+    @property
+    def orders(self) -> List[Dict[str, Any]]:
+        return [order.to_json() for order in self._orders.values()]
+
+    @property
+    def user_trades(self) -> List[Dict[str, Any]]:
+        return list(self._user_trades)
+
+    def balance(self, asset: str) -> Tuple[Decimal, Decimal]:
+        """
+        :return: the available and locked balances of the asset
+        """
+        return self._available[asset], self._locked[asset]
+
+    def set_latency(self, latency: float, domain: Optional[str] = None):
+        if domain is None:
+            self._latency = latency
+        else:
+            self._domain_latency[domain] = latency
+
+    def inject_errors(self, path_url: str, status: int, count: int = 1):
+        """
+        Answers the next `count` requests to the endpoint with the HTTP status.
+        """
+        self._injected_errors[path_url].extend([status] * count)
+
+    @contextmanager
+    def patch_urls(self) -> Iterator[None]:
+        """
+        Sends the REST requests and the SocketIO connections of the connector to the simulator.
+        """
+        with patch.object(CONSTANTS, "REST_URL", self.rest_url), patch.object(CONSTANTS, "WSS_URL", self.url):
+            yield
+
+    async def start(self):
+        app = web.Application()
+        self._sio.attach(app)
+        app.router.add_route("*", "/{domain}", self._handle_request)
+        app.router.add_route("*", "/{domain}/{path:.*}", self._handle_request)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        # the open SocketIO connections are closed after shutdown_timeout instead of being waited for
+        site = web.TCPSite(self._runner, self._host, self._port, shutdown_timeout=0.5)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+        for market in self._markets.values():
+            if self._depth_update_rate > 0:
+                self._tasks.append(asyncio.ensure_future(
+                    self._periodic(self._depth_update_rate, self._emit_depth_update, market)))
+            if self._trade_rate > 0:
+                self._tasks.append(asyncio.ensure_future(
+                    self._periodic(self._trade_rate, self._simulate_market_trade, market)))
+        if self._balance_update_rate > 0:
+            self._tasks.append(asyncio.ensure_future(
+                self._periodic(self._balance_update_rate, self._emit_balance_update, None)))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # === REST ===
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        domain = request.match_info["domain"]
+        path = request.match_info.get("path")
+        path_url = f"/{path}" if path is not None else ""
+        self.requests[path_url] += 1
+
+        latency = self._domain_latency.get(domain, self._latency)
+        if self._latency_jitter > 0:
+            latency += self._rng.uniform(0, self._latency_jitter)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        injected_errors = self._injected_errors.get(path_url)
+        if injected_errors:
+            return self._error_response(injected_errors.popleft(), "Simulated error")
+        if self._error_rate > 0 and self._rng.random() < self._error_rate:
+            return self._error_response(self._error_status, "Simulated error")
+
+        handler = self._private_routes.get(path_url)
+        if handler is not None:
+            if "X-AUTH-APIKEY" not in request.headers or "X-AUTH-SIGNATURE" not in request.headers:
+                return self._error_response(401, "Invalid credentials")
+        else:
+            handler = self._routes.get(path_url)
+        if handler is None:
+            return self._error_response(404, "Not found")
+
+        data = await request.json() if request.can_read_body else {}
+        try:
+            return web.json_response(handler(data, request.query))
+        except SimulatorError as error:
+            return self._error_response(error.status, error.message)
+
+    @staticmethod
+    def _error_response(status: int, message: str) -> web.Response:
+        return web.json_response({"code": status, "message": message, "status": "error"}, status=status)
+
+    def _check_network(self, data: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        return {}
+
+    def _ticker(self, data: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        tickers = []
+        for market in self._markets.values():
+            book = self._books[market.symbol]
+            last_trades = self._public_trades[market.symbol]
+            tickers.append({
+                "market": market.symbol,
+                "last_price": str(last_trades[-1]["p"] if last_trades else self._mid_prices[market.symbol]),
+                "bid": str(max(book["bids"])),
+                "ask": str(min(book["asks"])),
+                "timestamp": int(self._now_ms() * 1e-3),
+            })
+        return tickers
+
+    def _markets_details(self, data: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "coindcx_name": market.symbol,
+                "base_currency_short_name": market.quote,
+                "target_currency_short_name": market.base,
+                "min_quantity": market.min_quantity,
+                "max_quantity": market.max_quantity,
+                "min_notional": market.min_notional,
+                "base_currency_precision": market.price_precision,
+                "target_currency_precision": market.quantity_precision,
+                "step": 10 ** -market.quantity_precision,
+                "order_types": ["market_order", "limit_order"],
+                "symbol": market.symbol,
+                "ecode": "B",
+                "pair": market.pair,
+                "status": "active",
+            }
+            for market in self._markets.values()
+        ]
+
+    def _order_book(self, data: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        market = self._market_of_pair(query.get("pair"))
+        bids, asks = self._depth_levels(market)
+        return {"bids": dict(bids), "asks": dict(asks)}
+
+    def _trade_history(self, data: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        market = self._market_of_pair(query.get("pair"))
+        return list(reversed(self._public_trades[market.symbol]))
+
+    def _create_order(self, data: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        return {"orders": [self._new_order(data).to_json()]}
+
+    def _create_multiple_orders(self, data: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        created_orders = []
+        for order_data in data.get("orders", []):
+            try:
+                created_orders.append(self._new_order(order_data).to_json())
+            except SimulatorError as error:
+                created_orders.append({"client_order_id": order_data.get("client_order_id"),
+                                       "status": "rejected",
+                                       "message": error.message})
+        return {"orders": created_orders}
+
+    def _cancel_order(self, data: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        order = (self._orders_by_client_id.get(data.get("client_order_id"))
+                 if "client_order_id" in data
+                 else self._orders.get(str(data.get("id"))))
+        if order is None or not order.is_open:
+            raise SimulatorError(422, "Invalid Request")
+        self._cancel(order)
+        return {"message": "success", "status": 200, "code": 200}
+
+    def _cancel_orders_by_ids(self, data: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        orders = [self._orders.get(str(order_id)) for order_id in data.get("ids", [])]
+        if any(order is None or not order.is_open for order in orders):
+            raise SimulatorError(422, "Invalid Request")
+        for order in orders:
+            self._cancel(order)
+        return {"message": "success", "status": 200, "code": 200}
+
+    def _balances(self, data: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        return [
+            {"currency": asset, "balance": str(self._available[asset]), "locked_balance": str(self._locked[asset])}
+            for asset in sorted(set(self._available) | set(self._locked))
+        ]
+
+    def _order_status(self, data: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        order = self._orders_by_client_id.get(data.get("client_order_id"))
+        if order is None:
+            raise SimulatorError(404, "Order not found")
+        return order.to_json()
+
+    def _multiple_order_status(self, data: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        orders = [self._orders_by_client_id.get(client_order_id) for client_order_id in data.get("client_order_ids", [])]
+        if all(order is None for order in orders):
+            raise SimulatorError(404, "Order not found")
+        return [order.to_json() for order in orders if order is not None]
+
+    def _user_trade_history(self, data: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        from_timestamp = float(data.get("from_timestamp", 0))
+        to_timestamp = float(data.get("to_timestamp", float("inf")))
+        trades = [trade for trade in self._user_trades if from_timestamp <= trade["timestamp"] <= to_timestamp]
+        return trades[:int(data.get("limit", CONSTANTS.MAX_TRADE_HISTORY_RESULTS))]
+
+    # === Matching ===
+
+    def _market_of_pair(self, pair: Optional[str]) -> SimulatedMarket:
+        market = self._markets_by_pair.get(pair)
+        if market is None:
+            raise SimulatorError(422, "Invalid Request")
+        return market
+
+    def _new_order(self, data: Dict[str, Any]) -> _SimulatedOrder:
+        market = self._markets.get(data.get("market"))
+        if market is None:
+            raise SimulatorError(422, "Invalid Request")
+        client_order_id = data.get("client_order_id")
+        if client_order_id in self._orders_by_client_id:
+            raise SimulatorError(422, "Duplicate client order id")
+        side = data.get("side")
+        order_type = data.get("order_type")
+        quantity = Decimal(str(data.get("total_quantity", 0)))
+        if side not in ("buy", "sell") or order_type not in ("limit_order", "market_order"):
+            raise SimulatorError(422, "Invalid Request")
+        if quantity < Decimal(str(market.min_quantity)) or quantity > Decimal(str(market.max_quantity)):
+            raise SimulatorError(422, "Invalid quantity")
+
+        book = self._books[market.symbol]
+        if order_type == "limit_order":
+            price = Decimal(str(data.get("price_per_unit", 0)))
+            if price <= 0 or price * quantity < Decimal(str(market.min_notional)):
+                raise SimulatorError(422, "Invalid price")
+        else:
+            # market orders lock the cost of sweeping the book
+            levels = sorted(book["asks"].items()) if side == "buy" else sorted(book["bids"].items(), reverse=True)
+            price = Decimal(str(levels[-1][0])) if levels else Decimal("0")
+
+        order = _SimulatedOrder(id=str(next(self._order_ids)), client_order_id=client_order_id, market=market,
+                                order_type=order_type, side=side, price=price, quantity=quantity,
+                                timestamp=self._now_ms())
+        locked_asset, locked_amount = (market.quote, price * quantity) if side == "buy" else (market.base, quantity)
+        if self._available[locked_asset] < locked_amount:
+            raise SimulatorError(422, "Insufficient balance")
+        self._available[locked_asset] -= locked_amount
+        self._locked[locked_asset] += locked_amount
+        order.locked = locked_amount
+        order.status = "open"
+        self._orders[order.id] = order
+        if client_order_id is not None:
+            self._orders_by_client_id[client_order_id] = order
+
+        self._match_against_book(order)
+        if order.order_type == "market_order" and order.is_open:
+            self._cancel(order, notify=False)
+        self._notify_order(order)
+        return order
+
+    def _match_against_book(self, order: _SimulatedOrder):
+        book = self._books[order.market.symbol]
+        if order.side == "buy":
+            levels = sorted(book["asks"].items())
+            crosses = (lambda level_price: Decimal(str(level_price)) <= order.price)
+            side = book["asks"]
+        else:
+            levels = sorted(book["bids"].items(), reverse=True)
+            crosses = (lambda level_price: Decimal(str(level_price)) >= order.price)
+            side = book["bids"]
+        for level_price, level_amount in levels:
+            if order.remaining <= 0 or not crosses(level_price):
+                break
+            amount = min(order.remaining, Decimal(str(level_amount)))
+            self._fill(order, Decimal(str(level_price)), amount, is_maker=False)
+            remaining_liquidity = level_amount - float(amount)
+            if remaining_liquidity > 0:
+                side[level_price] = remaining_liquidity
+            else:
+                del side[level_price]
+
+    def _fill(self, order: _SimulatedOrder, price: Decimal, amount: Decimal, is_maker: bool):
+        market = order.market
+        quote_amount = price * amount
+        fee = quote_amount * self.FEE_RATE
+        order.remaining -= amount
+        order.filled_quote += quote_amount
+        order.fee_amount += fee
+        order.updated_at = self._now_ms()
+        order.status = "filled" if order.remaining <= 0 else "partially_filled"
+
+        if order.side == "buy":
+            released = order.price * amount
+            self._locked[market.quote] -= released
+            order.locked -= released
+            self._available[market.quote] += released - quote_amount - fee
+            self._available[market.base] += amount
+        else:
+            self._locked[market.base] -= amount
+            order.locked -= amount
+            self._available[market.quote] += quote_amount - fee
+
+        trade = {
+            "id": str(next(self._trade_ids)),
+            "order_id": order.id,
+            "side": order.side,
+            "fee_amount": str(fee),
+            "ecode": "B",
+            "quantity": str(amount),
+            "price": str(price),
+            "symbol": market.symbol,
+            "timestamp": order.updated_at,
+        }
+        self._user_trades.append(trade)
+        self._emit(CONSTANTS.USER_TRADE_EVENT_TYPE, [{
+            "o": order.id,
+            "c": order.client_order_id,
+            "t": trade["id"],
+            "s": market.symbol,
+            "p": str(price),
+            "q": str(amount),
+            "T": order.updated_at,
+            "m": is_maker,
+            "f": str(fee),
+            "e": "B",
+            "x": order.status,
+        }], room=USER_ROOM)
+        self._notify_balances(market.base, market.quote)
+
+    def _cancel(self, order: _SimulatedOrder, notify: bool = True):
+        market = order.market
+        locked_asset = market.quote if order.side == "buy" else market.base
+        self._locked[locked_asset] -= order.locked
+        self._available[locked_asset] += order.locked
+        order.locked = Decimal("0")
+        order.status = "partially_cancelled" if order.remaining < order.quantity else "cancelled"
+        order.updated_at = self._now_ms()
+        if notify:
+            self._notify_order(order)
+            self._notify_balances(locked_asset)
+
+    def _simulate_market_trade(self, market: SimulatedMarket):
+        book = self._books[market.symbol]
+        taker_buys = self._rng.random() < 0.5
+        side = book["asks"] if taker_buys else book["bids"]
+        price = min(side) if taker_buys else max(side)
+        amount = round(self._rng.uniform(0.1, 1.0) * side[price], market.quantity_precision)
+        timestamp = self._now_ms()
+        trade = {"p": str(price), "q": str(amount), "s": market.symbol, "T": timestamp, "m": not taker_buys}
+        self._public_trades[market.symbol].append(trade)
+        self._emit(CONSTANTS.ORDER_BOOK_TRADE_EVENT_TYPE, {**trade, "channel": market.pair}, room=market.pair)
+
+        # resting user orders crossed by the trade are filled as makers
+        remaining = Decimal(str(amount))
+        for order in sorted(self._resting_orders(market, "sell" if taker_buys else "buy"),
+                            key=lambda o: (o.price if taker_buys else -o.price, o.created_at)):
+            crossed = order.price <= Decimal(str(price)) if taker_buys else order.price >= Decimal(str(price))
+            if remaining <= 0 or not crossed:
+                break
+            fill_amount = min(remaining, order.remaining)
+            self._fill(order, order.price, fill_amount, is_maker=True)
+            self._notify_order(order)
+            remaining -= fill_amount
+
+    def _resting_orders(self, market: SimulatedMarket, side: str) -> List[_SimulatedOrder]:
+        return [order for order in self._orders.values()
+                if order.market is market and order.side == side and order.is_open]
+
+    # === Synthetic book ===
+
+    def _refresh_book(self, market: SimulatedMarket):
+        mid_price = self._mid_prices[market.symbol]
+        self._books[market.symbol] = {
+            "bids": {round(mid_price - market.tick * (level + 1), market.price_precision):
+                     round(self._rng.uniform(0.1, 10), market.quantity_precision)
+                     for level in range(self._depth)},
+            "asks": {round(mid_price + market.tick * (level + 1), market.price_precision):
+                     round(self._rng.uniform(0.1, 10), market.quantity_precision)
+                     for level in range(self._depth)},
+        }
+
+    def _depth_levels(self, market: SimulatedMarket) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        book = self._books[market.symbol]
+        bids = sorted(book["bids"].items(), reverse=True)[:self._depth]
+        asks = sorted(book["asks"].items())[:self._depth]
+        return ([(f"{price:.{market.price_precision}f}", str(amount)) for price, amount in bids],
+                [(f"{price:.{market.price_precision}f}", str(amount)) for price, amount in asks])
+
+    def _emit_depth_update(self, market: SimulatedMarket):
+        self._mid_prices[market.symbol] += market.tick * self._rng.choice((-1, 0, 1))
+        self._refresh_book(market)
+        bids, asks = self._depth_levels(market)
+        self._emit(CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE, {
+            "E": self._now_ms(),
+            "channel": market.pair,
+            "b": [list(level) for level in bids],
+            "a": [list(level) for level in asks],
+        }, room=market.pair)
+
+    # === Stream ===
+
+    async def _on_join(self, sid: str, data: Dict[str, Any]):
+        channel = data.get("channelName")
+        if channel == USER_ROOM:
+            if not data.get("apiKey") or not data.get("authSignature"):
+                return
+        elif channel not in self._markets_by_pair:
+            return
+        self._sio.enter_room(sid, channel)
+
+    def _notify_order(self, order: _SimulatedOrder):
+        self._emit(CONSTANTS.USER_ORDER_EVENT_TYPE, [order.to_json()], room=USER_ROOM)
+
+    def _notify_balances(self, *assets: str):
+        self._emit(CONSTANTS.USER_BALANCE_EVENT_TYPE, [
+            {"balance": str(self._available[asset]),
+             "locked_balance": str(self._locked[asset]),
+             "currency": {"short_name": asset}}
+            for asset in assets
+        ], room=USER_ROOM)
+
+    def _emit_balance_update(self, _):
+        self._notify_balances(*sorted(set(self._available) | set(self._locked)))
+
+    def _emit(self, event: str, payload: Any, room: str):
+        self.emitted_events[event] += 1
+        asyncio.ensure_future(self._delayed_emit(event, {"data": json.dumps(payload)}, room))
+
+    async def _delayed_emit(self, event: str, message: Dict[str, Any], room: str):
+        if self._stream_latency > 0:
+            await asyncio.sleep(self._stream_latency)
+        await self._sio.emit(event, message, room=room)
+
+    async def _periodic(self, rate: float, action, argument):
+        interval = 1.0 / rate
+        next_run = time.perf_counter()
+        while True:
+            action(argument)
+            next_run += interval
+            await asyncio.sleep(max(0.0, next_run - time.perf_counter()))
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1e3)
+
+
+async def run_forever(simulator: CoindcxSimulator):
+    await simulator.start()
+    print(f"CoinDCX simulator listening on {simulator.url} (REST URL template {simulator.rest_url})")
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await simulator.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local CoinDCX simulator")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--markets", default="BTC-USDT:30000,ETH-USDT:2000")
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--depth-update-rate", type=float, default=1.0)
+    parser.add_argument("--trade-rate", type=float, default=1.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    markets = []
+    for market in args.markets.split(","):
+        trading_pair, mid_price = market.split(":")
+        base, quote = trading_pair.split("-")
+        markets.append(SimulatedMarket(base=base, quote=quote, mid_price=float(mid_price)))
+    balances = {asset: 1e6 for market in markets for asset in (market.base, market.quote)}
+    simulator = CoindcxSimulator(markets=markets, balances=balances, depth=args.depth,
+                                 depth_update_rate=args.depth_update_rate, trade_rate=args.trade_rate,
+                                 latency=args.latency, error_rate=args.error_rate, port=args.port)
+    try:
+        asyncio.get_event_loop().run_until_complete(run_forever(simulator))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,13 @@ import unittest
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 from aioresponses.core import aioresponses
 from bidict import bidict
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_latency import RECEIVED_AT_KEY
 from hummingbot.core.data_type.order_book import OrderBook, OrderBookMessage, OrderBookRow
 from hummingbot.core.data_type.order_book_message import OrderBookMessageType
 
@@ -76,10 +78,6 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
 
-    def mock_sio_client_connected(self):
-        self.data_source._ws_assistant.connected = True
-        self.data_source._ws_assistant.eio.state = "connected"
-
     def simulate_receiving_updates(self, orderbook_depth_message, orderbook_trade_message):
         self.ev_loop.run_until_complete(self.data_source._on_depth_update(orderbook_depth_message))
         self.ev_loop.run_until_complete(self.data_source._on_new_trade(orderbook_trade_message))
@@ -129,6 +127,23 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(11570.67, bids[0].price)
         self.assertEqual(11950.00, asks[0].price)
 
+    @aioresponses()
+    @patch(
+        "coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource._time"
+    )
+    def test_snapshot_message_is_stamped_in_seconds(self, mock_api, mock_time):
+        mock_time.return_value = 1654746989.5
+        url = web_utils.public_rest_url(path_url=CONSTANTS.ORDER_BOOK_PATH_URL, domain=CONSTANTS.PUBLIC_DOMAIN)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps({"bids": {"11570.67": "0.1"}, "asks": {"11950.00": "0.2"}}))
+
+        snapshot: OrderBookMessage = self.async_run_with_timeout(
+            self.data_source._order_book_snapshot(self.trading_pair))
+
+        self.assertEqual(1654746989000, snapshot.update_id)
+        self.assertEqual(1654746989, snapshot.timestamp)
+        self.assertEqual(1654746989.5, snapshot.content[RECEIVED_AT_KEY])
+
     @aioresponses()
     def test_get_new_order_book_raises_exception(self, mock_api):
         url = web_utils.public_rest_url(path_url=CONSTANTS.ORDER_BOOK_PATH_URL, domain=CONSTANTS.PUBLIC_DOMAIN)
@@ -138,8 +153,17 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         with self.assertRaises(IOError):
             self.async_run_with_timeout(self.data_source.get_new_order_book(self.trading_pair))
 
-    @patch("coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource"
-           "._create_async_client")
+    @aioresponses()
+    def test_get_last_traded_prices_uses_the_ticker_of_all_markets(self, mock_api):
+        web_utils.clear_ticker_cache()
+        url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_PATH_URL)
+        mock_api.get(url, body=json.dumps([{"market": self.ex_trading_pair, "last_price": "10.5"}]))
+
+        prices = self.async_run_with_timeout(self.data_source.get_last_traded_prices(trading_pairs=[self.trading_pair]))
+
+        self.assertEqual({self.trading_pair: 10.5}, prices)
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
     def test_listen_for_subscriptions_configures_event_listeners(self, mock_client_creation):
         configured_events = {}
         connection_url = []
@@ -160,19 +184,17 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         except asyncio.CancelledError:
             pass
 
+        stream_hub = self.data_source._stream_hub
         self.assertIn("connect", configured_events)
-        self.assertEqual(configured_events["connect"], self.data_source._subscribe_channels)
+        self.assertEqual(configured_events["connect"], stream_hub._on_connect)
         self.assertIn(CONSTANTS.ORDER_BOOK_TRADE_EVENT_TYPE, configured_events)
-        self.assertEqual(configured_events[CONSTANTS.ORDER_BOOK_TRADE_EVENT_TYPE], self.data_source._on_new_trade)
         self.assertIn(CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE, configured_events)
-        self.assertEqual(configured_events[CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE], self.data_source._on_depth_update)
         self.assertIn("connect_error", configured_events)
-        self.assertEqual(configured_events["connect_error"], self.data_source._handle_error)
+        self.assertEqual(configured_events["connect_error"], stream_hub._handle_error)
 
         self.assertEqual(CONSTANTS.WSS_URL, connection_url[0])
 
-    @patch("coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource"
-           "._create_async_client")
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_client_creation):
         mock_client_creation.side_effect = asyncio.CancelledError
 
@@ -181,12 +203,11 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(self.listening_task)
 
-    @patch("coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource"
-           "._create_async_client")
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub.listen")
     @patch("coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource"
            "._sleep")
-    def test_listen_for_subscriptions_raises_and_logs_exceptions(self, _, mock_client_creation):
-        mock_client_creation.side_effect = [Exception("Test Error"), asyncio.CancelledError]
+    def test_listen_for_subscriptions_raises_and_logs_exceptions(self, _, mock_listen):
+        mock_listen.side_effect = [Exception("Test Error"), asyncio.CancelledError]
 
         self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
 
@@ -195,9 +216,6 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         except asyncio.CancelledError:
             pass
 
-        self.assertTrue(
-            self._is_logged("ERROR", "Unexpected error occurred connecting to CoinDCX Websocket API. (Test Error)")
-        )
         self.assertTrue(
             self._is_logged(
                 "ERROR",
@@ -210,31 +228,32 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         mock_ws = AsyncMock()
         mock_ws.emit.side_effect = lambda event, payload: all_subscriptions.append((event, payload))
 
-        self.data_source._ws_assistant = mock_ws
+        self.data_source._stream_hub._client = mock_ws
 
-        self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels())
+        self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels(self.data_source.shards[0]))
         self.async_run_with_timeout(self.listening_task)
 
         self.assertEqual(("join", {"channelName": self.ecode_ex_trading_pair}), all_subscriptions[0])
+        self.assertEqual({self.ecode_ex_trading_pair: self.trading_pair}, self.data_source._trading_pairs_by_channel)
 
     def test_subscribe_channels_raises_cancel_exception(self):
         mock_ws = AsyncMock()
         mock_ws.emit.side_effect = asyncio.CancelledError
 
-        self.data_source._ws_assistant = mock_ws
+        self.data_source._stream_hub._client = mock_ws
 
         with self.assertRaises(asyncio.CancelledError):
-            self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels())
+            self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels(self.data_source.shards[0]))
             self.async_run_with_timeout(self.listening_task)
 
     def test_subscribe_channels_raises_and_logs_exceptions(self):
         mock_ws = AsyncMock()
         mock_ws.emit.side_effect = Exception("Test Error")
 
-        self.data_source._ws_assistant = mock_ws
+        self.data_source._stream_hub._client = mock_ws
 
         with self.assertRaises(Exception) as context:
-            self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels())
+            self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels(self.data_source.shards[0]))
             self.async_run_with_timeout(self.listening_task)
 
         self.assertEqual("Test Error", str(context.exception))
@@ -312,7 +331,9 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(float(trade_event["q"]), trade_message.content["amount"])
         self.assertEqual(float(trade_event["p"]), trade_message.content["price"])
 
-    def test_on_new_trade(self):
+    @patch("coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource._time")
+    def test_on_new_trade(self, mock_time):
+        mock_time.return_value = 1654745605.6
         event_data = {
             "e": "trade",
             "E": 1654745605544,
@@ -337,7 +358,7 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         trade_message = self.async_run_with_timeout(
             self.data_source._message_queue[self.data_source._trade_messages_queue_key].get())
 
-        self.assertEqual(event_data, trade_message)
+        self.assertEqual(dict(event_data, **{RECEIVED_AT_KEY: 1654745605.6}), trade_message)
 
     def test_listen_for_order_book_diffs_cancelled(self):
         mock_queue = AsyncMock()
@@ -411,7 +432,131 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(float(diff_event["a"][0][0]), ask.price)
         self.assertEqual(float(diff_event["a"][0][1]), ask.amount)
 
-    def test_on_depth_update(self):
+    def test_depth_update_levels_are_parsed_into_arrays_without_awaiting_the_connector(self):
+        self.data_source._trading_pairs_by_channel[self.ecode_ex_trading_pair] = self.trading_pair
+        diff_event = {
+            "E": 1654746988919,
+            "b": [["30281.55000000", "5.49561000"], ["30281.50000000", "1.5"]],
+            "a": [],
+            "channel": self.ecode_ex_trading_pair
+        }
+        diff_event[RECEIVED_AT_KEY] = 1654746989.0
+        msg_queue: asyncio.Queue = asyncio.Queue()
+
+        with patch.object(self.connector, "trading_pair_associated_to_exchange_ecode_symbol") as symbol_lookup:
+            self.async_run_with_timeout(self.data_source._parse_order_book_diff_message(diff_event, msg_queue))
+
+        symbol_lookup.assert_not_called()
+        msg: OrderBookMessage = msg_queue.get_nowait()
+        self.assertTrue(msg.has_numpy_levels)
+        np.testing.assert_array_equal(
+            np.array([[30281.55, 5.49561, 1654746988919], [30281.5, 1.5, 1654746988919]]), msg.content["bids"])
+        self.assertEqual((0, 3), msg.content["asks"].shape)
+        self.assertEqual(1654746989.0, msg.content[RECEIVED_AT_KEY])
+
+    def _sharded_data_source(self, trading_pairs_count: int, stream_shards: int) -> CoindcxAPIOrderBookDataSource:
+        trading_pairs = [f"COIN{i}-HBOT" for i in range(trading_pairs_count)]
+        self.connector._set_trading_pair_ecode_symbol_map(bidict({
+            f"B-COIN{i}_HBOT": trading_pair for i, trading_pair in enumerate(trading_pairs)}))
+        return CoindcxAPIOrderBookDataSource(trading_pairs=trading_pairs, connector=self.connector,
+                                             stream_shards=stream_shards)
+
+    def test_trading_pairs_are_spread_over_the_shards(self):
+        data_source = self._sharded_data_source(trading_pairs_count=5, stream_shards=2)
+
+        self.assertEqual([["COIN0-HBOT", "COIN2-HBOT", "COIN4-HBOT"], ["COIN1-HBOT", "COIN3-HBOT"]],
+                         [shard.trading_pairs for shard in data_source.shards])
+        # The first shard uses the connection shared with the user stream
+        self.assertIs(data_source._stream_hub, data_source.shards[0].stream_hub)
+        self.assertIsNot(data_source._stream_hub, data_source.shards[1].stream_hub)
+
+    def test_default_shards_count_depends_on_the_trading_pairs_count(self):
+        self.assertEqual(1, len(self.data_source.shards))
+        data_source = self._sharded_data_source(
+            trading_pairs_count=2 * CONSTANTS.MAX_PAIRS_PER_STREAM_SHARD + 1, stream_shards=None)
+        self.assertEqual(3, len(data_source.shards))
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
+    def test_each_shard_joins_its_own_channels_on_its_own_connection(self, mock_client_creation):
+        data_source = self._sharded_data_source(trading_pairs_count=3, stream_shards=2)
+        clients = []
+
+        def create_client():
+            handlers = {}
+            client = MagicMock()
+            client.on.side_effect = lambda event, handler: handlers.update({event: handler})
+
+            async def connect(url, **kwargs):
+                await handlers["connect"]()
+
+            client.connect = AsyncMock(side_effect=connect)
+            client.wait = AsyncMock(side_effect=asyncio.Event().wait)
+            client.disconnect = AsyncMock()
+            client.emit = AsyncMock()
+            clients.append(client)
+            return client
+
+        mock_client_creation.side_effect = create_client
+        self.listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(2, len(clients))
+        joined_channels = [[call.args[1]["channelName"] for call in client.emit.call_args_list] for client in clients]
+        self.assertEqual([["B-COIN0_HBOT", "B-COIN2_HBOT"], ["B-COIN1_HBOT"]],
+                         sorted(joined_channels, key=len, reverse=True))
+        self.assertTrue(all(stats.connected for stats in data_source.shard_stats()))
+
+    def test_reconnected_shard_requests_snapshots_of_its_own_trading_pairs(self):
+        data_source = self._sharded_data_source(trading_pairs_count=3, stream_shards=2)
+        for shard in data_source.shards:
+            shard.stream_hub._client = AsyncMock()
+            self.async_run_with_timeout(data_source._join_shard(shard))
+        self.assertTrue(data_source._snapshot_requests.empty())
+
+        self.async_run_with_timeout(data_source._join_shard(data_source.shards[0]))
+
+        self.assertEqual(1, data_source.shards[0].reconnects)
+        self.assertEqual(0, data_source.shards[1].reconnects)
+        requested = [data_source._snapshot_requests.get_nowait() for _ in range(data_source._snapshot_requests.qsize())]
+        self.assertEqual(["COIN0-HBOT", "COIN2-HBOT"], requested)
+
+    def test_snapshot_requests_are_served_to_the_snapshots_queue(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                    {"trading_pair": self.trading_pair, "update_id": 1, "bids": [], "asks": []}, 1)
+        self.data_source._order_book_snapshot = AsyncMock(return_value=snapshot)
+        self.data_source._snapshot_requests.put_nowait(self.trading_pair)
+        output = asyncio.Queue()
+
+        self.listening_task = self.ev_loop.create_task(self.data_source._listen_for_snapshot_requests(output))
+
+        self.assertEqual(snapshot, self.async_run_with_timeout(output.get()))
+        self.data_source._order_book_snapshot.assert_awaited_once_with(trading_pair=self.trading_pair)
+
+    @patch("coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource._time")
+    def test_shard_stats_report_message_rate_and_lag(self, mock_time):
+        shard = self.data_source.shards[0]
+        depth_event = {"data": json.dumps({"E": 1654746988000, "b": [], "a": [],
+                                           "channel": self.ecode_ex_trading_pair})}
+        trade_event = {"data": json.dumps({"T": 1654746988100, "p": "1", "q": "1", "m": True,
+                                           "channel": self.ecode_ex_trading_pair})}
+        mock_time.return_value = 1654746988.2
+        self.async_run_with_timeout(self.data_source._on_depth_update(depth_event, shard=shard))
+        self.async_run_with_timeout(self.data_source._on_new_trade(trade_event, shard=shard))
+
+        stats = self.data_source.shard_stats()[0]
+
+        self.assertEqual(2 / CONSTANTS.STREAM_SHARD_STATS_WINDOW, stats.message_rate)
+        self.assertAlmostEqual(0.15, stats.lag, places=3)
+        self.assertIn("CoinDCX order book streams:", self.data_source.format_status())
+
+        mock_time.return_value += CONSTANTS.STREAM_SHARD_STATS_WINDOW + 1
+        stats = self.data_source.shard_stats()[0]
+        self.assertEqual(0, stats.message_rate)
+        self.assertIsNone(stats.lag)
+
+    @patch("coindcx_src.coindcx_api_order_book_data_source.CoindcxAPIOrderBookDataSource._time")
+    def test_on_depth_update(self, mock_time):
+        mock_time.return_value = 1654746989.0
         event_data = {
             "E": 1654746988919,
             "s": "BTCUSDT",
@@ -430,4 +575,4 @@ class CoinDCXAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         snapshot_message = self.async_run_with_timeout(
             self.data_source._message_queue[self.data_source._diff_messages_queue_key].get())
 
-        self.assertEqual(event_data, snapshot_message)
+        self.assertEqual(dict(event_data, **{RECEIVED_AT_KEY: 1654746989.0}), snapshot_message)
@@ -94,8 +94,7 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
         ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
 
-    @patch("coindcx_src.coindcx_api_user_stream_data_source.CoindcxAPIUserStreamDataSource"
-           "._create_async_client")
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
     def test_listen_for_user_stream_configures_event_listeners(self, mock_client_creation):
         configured_events = {}
         connection_url = []
@@ -116,19 +115,18 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
         except asyncio.CancelledError:
             pass
 
+        stream_hub = self.data_source._stream_hub
         self.assertIn("connect", configured_events)
-        self.assertEqual(configured_events["connect"], self.data_source._subscribe_channels)
+        self.assertEqual(configured_events["connect"], stream_hub._on_connect)
         self.assertIn(CONSTANTS.USER_ORDER_EVENT_TYPE, configured_events)
-        self.assertEqual(configured_events[CONSTANTS.USER_ORDER_EVENT_TYPE], self.data_source._process_order_update)
         self.assertIn(CONSTANTS.USER_BALANCE_EVENT_TYPE, configured_events)
-        self.assertEqual(configured_events[CONSTANTS.USER_BALANCE_EVENT_TYPE], self.data_source._process_balance_update)
+        self.assertIn(CONSTANTS.USER_TRADE_EVENT_TYPE, configured_events)
         self.assertIn("connect_error", configured_events)
-        self.assertEqual(configured_events["connect_error"], self.data_source._handle_error)
+        self.assertEqual(configured_events["connect_error"], stream_hub._handle_error)
 
         self.assertEqual(CONSTANTS.WSS_URL, connection_url[0])
 
-    @patch("coindcx_src.coindcx_api_user_stream_data_source.CoindcxAPIUserStreamDataSource"
-           "._create_async_client")
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
     def test_listen_for_user_stream_raises_cancel_exception(self, mock_client_creation):
         mock_client_creation.side_effect = asyncio.CancelledError
 
@@ -136,14 +134,11 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(self.listening_task)
 
-    @patch("coindcx_src.coindcx_api_user_stream_data_source.CoindcxAPIUserStreamDataSource"
-           "._create_async_client")
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub.listen")
     @patch("coindcx_src.coindcx_api_user_stream_data_source.CoindcxAPIUserStreamDataSource"
            "._sleep")
-    def test_listen_for_user_stream_raises_and_logs_exception(self, _, mock_client_creation):
-        mock_socketio_client = MagicMock()
-        mock_client_creation.return_value = mock_socketio_client
-        mock_client_creation.side_effect = [Exception("Test Error"), asyncio.CancelledError]
+    def test_listen_for_user_stream_raises_and_logs_exception(self, _, mock_listen):
+        mock_listen.side_effect = [Exception("Test Error"), asyncio.CancelledError]
         self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_user_stream(output=asyncio.Queue()))
 
         try:
@@ -151,9 +146,6 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
         except asyncio.CancelledError:
             pass
 
-        self.assertTrue(
-            self._is_logged("ERROR", "Unexpected error occurred connecting to CoinDCX Websocket API. (Test Error)")
-        )
         self.assertTrue(
             self._is_logged(
                 "ERROR",
@@ -165,7 +157,7 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
         mock_ws = AsyncMock()
         mock_ws.emit.side_effect = lambda event, payload: all_subscriptions.append((event, payload))
 
-        self.data_source._ws_assistant = mock_ws
+        self.data_source._stream_hub._client = mock_ws
 
         self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels())
         self.async_run_with_timeout(self.listening_task)
@@ -178,7 +170,7 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
         mock_ws = AsyncMock()
         mock_ws.emit.side_effect = asyncio.CancelledError
 
-        self.data_source._ws_assistant = mock_ws
+        self.data_source._stream_hub._client = mock_ws
 
         with self.assertRaises(asyncio.CancelledError):
             self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels())
@@ -188,7 +180,7 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
         mock_ws = AsyncMock()
         mock_ws.emit.side_effect = Exception("Test Error")
 
-        self.data_source._ws_assistant = mock_ws
+        self.data_source._stream_hub._client = mock_ws
 
         with self.assertRaises(Exception) as context:
             self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels())
@@ -199,6 +191,13 @@ class CoindcxUserStreamDataSourceUnitTests(unittest.TestCase):
             self._is_logged("ERROR", "Unexpected error occurred subscribing to CoinDCX Websocket API. (Test Error)")
         )
 
+    def test_disconnection_resets_last_recv_time(self):
+        self.data_source.last_recv_time = 1000
+
+        self.async_run_with_timeout(self.data_source._on_disconnect())
+
+        self.assertEqual(-1, self.data_source.last_recv_time)
+
     def test_process_balance_update(self):
         event_data = {
             "event": CONSTANTS.USER_BALANCE_EVENT_TYPE,
@@ -0,0 +1,218 @@
+import asyncio
+import os
+import unittest
+from typing import Awaitable, Dict, Optional
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../"))  # isort: skip
+
+from coindcx_src import coindcx_constants as CONSTANTS  # isort: skip
+from coindcx_src.coindcx_web_utils import CoindcxDomainRouter  # isort: skip
+
+
+class MockDomainServer:
+    """
+    Local HTTP server standing for a CoinDCX domain, answering every request after an injected delay or with an
+    injected HTTP status.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.status = 200
+        self.requests_count = 0
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self.server = TestServer(app)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests_count += 1
+        await asyncio.sleep(self.delay)
+        return web.json_response({"status": self.status}, status=self.status)
+
+
+class CoindcxDomainRouterTests(unittest.TestCase):
+    # the level is required to receive logs from the router logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.servers: Dict[str, MockDomainServer] = {
+            CONSTANTS.DEFAULT_DOMAIN: MockDomainServer(delay=0.05),
+            CONSTANTS.HFT_DOMAIN: MockDomainServer(delay=0.005),
+        }
+        for server in self.servers.values():
+            self.async_run_with_timeout(server.server.start_server())
+        self.session = self.async_run_with_timeout(self._create_session())
+        self.router = CoindcxDomainRouter(min_samples=3, health_window=10, min_failures=3, max_failure_rate=0.5,
+                                          failover_cooldown=30)
+        self.router.logger().setLevel(1)
+        self.router.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.session.close())
+        for server in self.servers.values():
+            self.async_run_with_timeout(server.server.close())
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession()
+
+    async def _request(self, domain: str, timeout: Optional[float] = None):
+        url = str(self.servers[domain].server.make_url(CONSTANTS.PLACE_ORDER_PATH_URL))
+        async with self.session.post(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status >= 400:
+                raise IOError(f"Error executing request POST {url}. HTTP status is {response.status}. "
+                              f"Error: {await response.text()}")
+            return await response.json()
+
+    def _probe_domains(self):
+        for domain in self.router.domains:
+            self.async_run_with_timeout(self.router.measure(domain, CONSTANTS.PROBE_ENDPOINT_CLASS, self._request))
+
+    def test_default_domain_is_used_until_domains_are_measured(self):
+        self.assertEqual(CONSTANTS.DEFAULT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+    def test_orders_are_sent_to_the_fastest_domain(self):
+        self._probe_domains()
+
+        for _ in range(5):
+            self.async_run_with_timeout(self.router.execute(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS, self._request))
+
+        self.assertEqual(5, self.servers[CONSTANTS.HFT_DOMAIN].requests_count - 1)
+        self.assertEqual(1, self.servers[CONSTANTS.DEFAULT_DOMAIN].requests_count)
+
+        stats = {(stat.domain, stat.endpoint_class): stat for stat in self.router.stats()}
+        order_stats = stats[(CONSTANTS.HFT_DOMAIN, CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS)]
+        self.assertEqual(5, order_stats.samples)
+        self.assertTrue(0.005 <= order_stats.median <= order_stats.p90)
+        self.assertTrue(stats[(CONSTANTS.DEFAULT_DOMAIN, CONSTANTS.PROBE_ENDPOINT_CLASS)].median >= 0.05)
+
+    def test_order_measurements_replace_the_probes_once_every_domain_has_enough(self):
+        self._probe_domains()
+        # The hft-api domain becomes slower than the api domain for orders
+        self.servers[CONSTANTS.HFT_DOMAIN].delay = 0.1
+
+        for _ in range(3):
+            self.async_run_with_timeout(self.router.execute(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS, self._request))
+
+        # The hft-api order round trips are not compared with the api probe round trips
+        self.assertEqual(CONSTANTS.HFT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+        for _ in range(3):
+            self.async_run_with_timeout(self.router.measure(
+                CONSTANTS.DEFAULT_DOMAIN, CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS, self._request))
+
+        self.assertEqual(CONSTANTS.DEFAULT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+    def test_unused_domain_is_used_again_once_its_probes_get_faster(self):
+        self._probe_domains()
+        for domain in CONSTANTS.ROUTED_DOMAINS:
+            for _ in range(3):
+                self.async_run_with_timeout(
+                    self.router.measure(domain, CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS, self._request))
+        self.assertEqual(CONSTANTS.HFT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+        # The api domain gets faster than the hft-api domain, while its order round trips are not refreshed
+        self.servers[CONSTANTS.DEFAULT_DOMAIN].delay = 0.001
+        self.servers[CONSTANTS.HFT_DOMAIN].delay = 0.05
+        with patch.object(self.router, "_time", return_value=self.router._time() + 61):
+            self._probe_domains()
+            self.async_run_with_timeout(self.router.execute(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS, self._request))
+
+            self.assertEqual(CONSTANTS.DEFAULT_DOMAIN,
+                             self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+        self.assertEqual(6, self.servers[CONSTANTS.DEFAULT_DOMAIN].requests_count)
+
+    def test_old_round_trips_are_not_used_to_rank_the_domains(self):
+        self._probe_domains()
+
+        with patch.object(self.router, "_time", return_value=self.router._time() + 61):
+            self.assertEqual(CONSTANTS.DEFAULT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+    def test_failing_domain_is_skipped_until_the_cooldown_is_over(self):
+        self._probe_domains()
+        self.servers[CONSTANTS.HFT_DOMAIN].status = 503
+
+        for _ in range(3):
+            with self.assertRaises(IOError):
+                self.async_run_with_timeout(self.router.execute(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS, self._request))
+
+        self.assertFalse(self.router.is_healthy(CONSTANTS.HFT_DOMAIN))
+        self.assertEqual(CONSTANTS.DEFAULT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+        self.assertTrue(any(record.levelname == "WARNING" and "hft-api domain is failing" in record.getMessage()
+                            for record in self.log_records))
+
+        with patch.object(self.router, "_time", return_value=self.router._time() + 31):
+            self.assertTrue(self.router.is_healthy(CONSTANTS.HFT_DOMAIN))
+            self.assertEqual(CONSTANTS.HFT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+    def test_timeouts_count_as_domain_failures(self):
+        self._probe_domains()
+        self.servers[CONSTANTS.HFT_DOMAIN].delay = 1
+
+        for _ in range(3):
+            with self.assertRaises(asyncio.TimeoutError):
+                self.async_run_with_timeout(self.router.execute(
+                    CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS,
+                    lambda domain: self._request(domain, timeout=0.1)))
+
+        self.assertFalse(self.router.is_healthy(CONSTANTS.HFT_DOMAIN))
+
+    def test_rejected_requests_do_not_affect_the_domain_health(self):
+        self._probe_domains()
+        self.servers[CONSTANTS.HFT_DOMAIN].status = 422
+
+        for _ in range(5):
+            with self.assertRaises(IOError):
+                self.async_run_with_timeout(self.router.execute(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS, self._request))
+
+        self.assertTrue(self.router.is_healthy(CONSTANTS.HFT_DOMAIN))
+        self.assertEqual(CONSTANTS.HFT_DOMAIN, self.router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+    def test_failover_retries_on_the_next_domain(self):
+        self._probe_domains()
+        self.servers[CONSTANTS.HFT_DOMAIN].status = 500
+
+        result = self.async_run_with_timeout(
+            self.router.execute(CONSTANTS.ORDER_CANCEL_ENDPOINT_CLASS, self._request, failover=True))
+
+        self.assertEqual({"status": 200}, result)
+        self.assertEqual(2, self.servers[CONSTANTS.HFT_DOMAIN].requests_count)
+        self.assertEqual(2, self.servers[CONSTANTS.DEFAULT_DOMAIN].requests_count)
+        self.assertTrue(any(record.levelname == "WARNING" and "Retrying with the api domain" in record.getMessage()
+                            for record in self.log_records))
+
+    def test_no_failover_without_domain_failure(self):
+        self._probe_domains()
+        self.servers[CONSTANTS.HFT_DOMAIN].status = 400
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(
+                self.router.execute(CONSTANTS.ORDER_CANCEL_ENDPOINT_CLASS, self._request, failover=True))
+
+        self.assertEqual(1, self.servers[CONSTANTS.DEFAULT_DOMAIN].requests_count)
+
+    def test_format_status(self):
+        self.assertEqual("", self.router.format_status())
+
+        self._probe_domains()
+        status = self.router.format_status()
+
+        self.assertIn("CoinDCX domains:", status)
+        self.assertIn(f"{CONSTANTS.HFT_DOMAIN:<10}{CONSTANTS.PROBE_ENDPOINT_CLASS:<15}{1:>8}", status)
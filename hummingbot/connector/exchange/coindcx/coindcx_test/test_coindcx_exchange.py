@@ -1,26 +1,37 @@
+import asyncio
 import json
 import os
 import re
+import tempfile
 from decimal import Decimal
-from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, patch
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aioresponses.core import RequestCall
 from bidict import bidict
 
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.api_throttler.data_types import RequestPriority
+from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import OrderBookMessageQueueStats
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.async_utils import safe_gather
 
 import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../"))  # isort: skip
 
 from coindcx_src import coindcx_constants as CONSTANTS, coindcx_web_utils as web_utils  # isort: skip
 from coindcx_src.coindcx_exchange import CoindcxExchange  # isort: skip
+from coindcx_src.coindcx_markets_cache import CoindcxMarkets  # isort: skip
 
 
 class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -32,10 +43,17 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
         cls.ex_trading_pair = f"{cls.base_asset}{cls.quote_asset}"
         cls.ecode_trading_pair = f"B-{cls.base_asset}_{cls.quote_asset}"
         cls.maxDiff = None
+        cls.markets_cache_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.markets_cache_dir.cleanup()
+        super().tearDownClass()
 
     def setUp(self) -> None:
         super().setUp()
         self.exchange._set_trading_pair_ecode_symbol_map(bidict({self.ecode_trading_pair: self.trading_pair}))
+        web_utils.clear_ticker_cache()
 
     @property
     def all_symbols_url(self):
@@ -45,6 +63,10 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
 
     @property
     def latest_prices_url(self):
+        return web_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_PATH_URL)
+
+    @property
+    def trade_history_url(self):
         url = web_utils.public_rest_url(path_url=CONSTANTS.TRADE_HISTORY_PATH_URL, domain=CONSTANTS.PUBLIC_DOMAIN)
         url = f"{url}?pair={self.ecode_trading_pair}"
         url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?") + ".*")
@@ -107,7 +129,24 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
     @property
     def latest_prices_request_mock_response(self):
         return [
-            {"p": self.expected_latest_price, "q": 0.023519, "s": self.trading_pair, "T": 1565163305770, "m": False}
+            {
+                "market": self.ex_trading_pair,
+                "change_24_hour": "-1.621",
+                "high": "11.2",
+                "low": "10.1",
+                "volume": "2.87",
+                "last_price": str(self.expected_latest_price),
+                "bid": "10.4",
+                "ask": "10.6",
+                "timestamp": 1565163305,
+            },
+            {
+                "market": "OTHERHBOT",
+                "last_price": "1.0",
+                "bid": "0.9",
+                "ask": "1.1",
+                "timestamp": 1565163305,
+            },
         ]
 
     @property
@@ -321,9 +360,16 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
     def exchange_symbol_for_tokens(self, base_token: str, quote_token: str) -> str:
         return f"{base_token}{quote_token}"
 
+    @property
+    def markets_cache_path(self) -> str:
+        return os.path.join(self.markets_cache_dir.name, f"{self.id()}.json")
+
     def create_exchange_instance(self):
         return CoindcxExchange(
-            coindcx_api_key=self.api_key, coindcx_secret_key=self.secret_key, trading_pairs=[self.trading_pair]
+            coindcx_api_key=self.api_key,
+            coindcx_secret_key=self.secret_key,
+            trading_pairs=[self.trading_pair],
+            markets_cache_path=self.markets_cache_path,
         )
 
     def validate_auth_credentials_present(self, request_call: RequestCall):
@@ -357,8 +403,8 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
     def validate_order_status_request(self, order: InFlightOrder, request_call: RequestCall):
         request_data = json.loads(request_call.kwargs["data"])
 
-        self.assertIn(order.client_order_id, request_data["client_order_id"])
-        self.assertEqual(order.client_order_id, request_data["client_order_id"])
+        self.assertIn("timestamp", request_data)
+        self.assertEqual([order.client_order_id], request_data["client_order_ids"])
 
     def validate_trades_request(self, order: InFlightOrder, request_call: RequestCall):
         request_data = json.loads(request_call.kwargs["data"])
@@ -388,6 +434,11 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
         self, successful_order: InFlightOrder, erroneous_order: InFlightOrder, mock_api: aioresponses
     ) -> List[str]:
         all_urls = []
+        # The batch is rejected because of the erroneous order, the orders are then cancelled one by one
+        url = web_utils.private_rest_url(path_url=CONSTANTS.CANCEL_ORDERS_BY_IDS_PATH_URL)
+        response = {"code": 422, "message": "Invalid Request", "status": "error"}
+        mock_api.post(url, status=422, body=json.dumps(response))
+        all_urls.append(url)
         url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
         all_urls.append(url)
         url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
@@ -397,7 +448,7 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
     def configure_completely_filled_order_status_response(
         self, order: InFlightOrder, mock_api: aioresponses, callback: Optional[Callable] = lambda *args, **kwargs: None
     ) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.ORDER_STATUS_PATH_URL)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
         response = {
             "id": order.exchange_order_id,
             "client_order_id": order.client_order_id,
@@ -414,14 +465,14 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             "created_at": 1654778004000,
             "updated_at": 1654778004000,
         }
-        mock_api.post(url, body=json.dumps(response), callback=callback)
+        mock_api.post(url, body=json.dumps([response]), callback=callback)
 
         return url
 
     def configure_canceled_order_status_response(
         self, order: InFlightOrder, mock_api: aioresponses, callback: Optional[Callable] = lambda *args, **kwargs: None
     ) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.ORDER_STATUS_PATH_URL)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
         response = {
             "id": order.exchange_order_id,
             "client_order_id": order.client_order_id,
@@ -438,14 +489,14 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             "created_at": 1654778004000,
             "updated_at": 1654778004000,
         }
-        mock_api.post(url, body=json.dumps(response), callback=callback)
+        mock_api.post(url, body=json.dumps([response]), callback=callback)
 
         return url
 
     def configure_open_order_status_response(
         self, order: InFlightOrder, mock_api: aioresponses, callback: Optional[Callable] = lambda *args, **kwargs: None
     ) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.ORDER_STATUS_PATH_URL)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
         response = {
             "id": order.exchange_order_id,
             "client_order_id": order.client_order_id,
@@ -463,14 +514,14 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             "updated_at": 1654778004000,
         }
 
-        mock_api.post(url, body=json.dumps(response), callback=callback)
+        mock_api.post(url, body=json.dumps([response]), callback=callback)
 
         return url
 
     def configure_http_error_order_status_response(
         self, order: InFlightOrder, mock_api: aioresponses, callback: Optional[Callable] = lambda *args, **kwargs: None
     ) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.ORDER_STATUS_PATH_URL)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
         response = {"code": 404, "message": "Order not found", "status": "error"}
         mock_api.post(url, status=400, body=json.dumps(response), callback=callback)
         return url
@@ -478,7 +529,7 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
     def configure_partially_filled_order_status_response(
         self, order: InFlightOrder, mock_api: aioresponses, callback: Optional[Callable] = lambda *args, **kwargs: None
     ) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.ORDER_STATUS_PATH_URL)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
         response = {
             "id": order.exchange_order_id,
             "client_order_id": order.client_order_id,
@@ -495,13 +546,13 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             "created_at": 1654778004000,
             "updated_at": 1654778004000,
         }
-        mock_api.post(url, body=json.dumps(response), callback=callback)
+        mock_api.post(url, body=json.dumps([response]), callback=callback)
         return url
 
     def configure_partial_cancelled_order_status_response(
         self, order: InFlightOrder, mock_api: aioresponses, callback: Optional[Callable] = lambda *args, **kwargs: None
     ) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.ORDER_STATUS_PATH_URL)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
         response = {
             "id": order.exchange_order_id,
             "client_order_id": order.client_order_id,
@@ -518,7 +569,7 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             "created_at": 1654778004000,
             "updated_at": 1654778004000,
         }
-        mock_api.post(url, body=json.dumps(response), callback=callback)
+        mock_api.post(url, body=json.dumps([response]), callback=callback)
         return url
 
     def configure_partial_fill_trade_response(
@@ -855,3 +906,720 @@ class CoindcxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
         self.assertNotIn(self.quote_asset, total_balances)
         self.assertEqual(Decimal("10"), available_balances[self.base_asset])
         self.assertEqual(Decimal("15"), total_balances[self.base_asset])
+
+    def _order_status_data(self, order: InFlightOrder, status: str):
+        return {
+            "id": order.exchange_order_id,
+            "client_order_id": order.client_order_id,
+            "market": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "order_type": CONSTANTS.ORDER_TYPE_MAPPING[order.order_type],
+            "side": order.trade_type.name.lower(),
+            "status": status,
+            "fee_amount": 0.0,
+            "fee": 0.0,
+            "total_quantity": str(order.amount),
+            "remaining_quantity": str(order.amount),
+            "avg_price": 0.0,
+            "price_per_unit": str(order.price),
+            "created_at": 1654778004000,
+            "updated_at": 1654778004000,
+        }
+
+    def _start_tracking_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    @aioresponses()
+    def test_update_order_status_requests_in_flight_orders_in_batches(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(CONSTANTS.MAX_ORDERS_PER_STATUS_REQUEST + 5)
+        first_batch = orders[:CONSTANTS.MAX_ORDERS_PER_STATUS_REQUEST]
+        second_batch = orders[CONSTANTS.MAX_ORDERS_PER_STATUS_REQUEST:]
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
+        mock_api.post(url, body=json.dumps([self._order_status_data(order, "open") for order in first_batch]))
+        mock_api.post(url, body=json.dumps([self._order_status_data(order, "cancelled") for order in second_batch]))
+        self.configure_empty_http_fill_trade_response(order=orders[0], mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        status_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(status_requests))
+        requested_ids = [json.loads(request.kwargs["data"])["client_order_ids"] for request in status_requests]
+        self.assertEqual([order.client_order_id for order in first_batch], requested_ids[0])
+        self.assertEqual([order.client_order_id for order in second_batch], requested_ids[1])
+
+        for order in first_batch:
+            self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
+        for order in second_batch:
+            self.assertNotIn(order.client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(len(second_batch), len(self.order_cancelled_logger.event_log))
+
+    @aioresponses()
+    def test_update_order_status_marks_orders_missing_from_batch_response_as_not_found(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        found_order, missing_order = self._start_tracking_orders(2)
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
+        mock_api.post(url, body=json.dumps([self._order_status_data(found_order, "open")]))
+        self.configure_empty_http_fill_trade_response(order=found_order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertTrue(found_order.is_open)
+        self.assertEqual(0, self.exchange._order_tracker._order_not_found_records[found_order.client_order_id])
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records[missing_order.client_order_id])
+
+    @aioresponses()
+    def test_update_order_status_logs_batch_request_errors(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
+        response = {"code": 429, "message": "Too many requests", "status": "error"}
+        mock_api.post(url, status=429, body=json.dumps(response))
+        self.configure_empty_http_fill_trade_response(order=order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertTrue(order.is_open)
+        self.assertEqual(0, self.exchange._order_tracker._order_not_found_records[order.client_order_id])
+        self.assertTrue(
+            self.is_logged(
+                "NETWORK",
+                f"Error fetching status update for a batch of orders. Error fetching the status of multiple orders. "
+                f"Response: {response}"
+            )
+        )
+
+    @aioresponses()
+    def test_update_order_status_without_batching_requests_each_order(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.BATCH_ORDER_STATUS_UPDATES = False
+        orders = self._start_tracking_orders(2)
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.ORDER_STATUS_PATH_URL)
+        for order in orders:
+            mock_api.post(url, body=json.dumps(self._order_status_data(order, "open")))
+        self.configure_empty_http_fill_trade_response(order=orders[0], mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        status_requests = [
+            request
+            for (method, request_url), requests in mock_api.requests.items()
+            if request_url.human_repr() == url
+            for request in requests
+        ]
+        self.assertEqual(2, len(status_requests))
+        self.assertTrue(all(order.is_open for order in orders))
+
+    def _trade_history_data(self, order: InFlightOrder, trade_id: str, timestamp: float):
+        return {
+            "id": trade_id,
+            "order_id": order.exchange_order_id,
+            "side": order.trade_type.name.lower(),
+            "fee_amount": "0.01",
+            "ecode": "B",
+            "quantity": "0.1",
+            "price": str(order.price),
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "timestamp": timestamp,
+        }
+
+    @aioresponses()
+    def test_trade_history_is_requested_from_cursor(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        self.exchange._last_trade_history_timestamp = 1640780000000 + 5000
+
+        url = self.configure_empty_http_fill_trade_response(order=order, mock_api=mock_api)
+        self.async_run_with_timeout(self.exchange._request_trade_history())
+
+        request_data = json.loads(self._all_executed_requests(mock_api, url)[0].kwargs["data"])
+        self.assertEqual(1640780000000 + 5000 - CONSTANTS.TRADE_HISTORY_CURSOR_OVERLAP_MS,
+                         request_data["from_timestamp"])
+        self.assertEqual(1640780000000, request_data["to_timestamp"])
+
+    @aioresponses()
+    def test_trade_history_starts_at_earliest_in_flight_order_when_cursor_is_older(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        self.exchange._last_trade_history_timestamp = 1640000000000
+
+        url = self.configure_empty_http_fill_trade_response(order=order, mock_api=mock_api)
+        self.async_run_with_timeout(self.exchange._request_trade_history())
+
+        request_data = json.loads(self._all_executed_requests(mock_api, url)[0].kwargs["data"])
+        self.assertEqual(int(order.creation_timestamp * 1e3), request_data["from_timestamp"])
+
+    @aioresponses()
+    def test_update_order_status_skips_already_applied_trades(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+
+        status_url = web_utils.private_rest_url(path_url=CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
+        trades_url = web_utils.private_rest_url(path_url=CONSTANTS.USER_TRADE_HISTORY_PATH_URL)
+        trades = [
+            self._trade_history_data(order, "T1", 1640780001000),
+            self._trade_history_data(order, "T2", 1640780002000),
+        ]
+        mock_api.post(status_url, body=json.dumps([self._order_status_data(order, "partially_filled")]), repeat=True)
+        mock_api.post(trades_url, body=json.dumps(trades[:1]))
+        mock_api.post(trades_url, body=json.dumps(trades))
+
+        with patch.object(
+            self.exchange._order_tracker, "process_trade_update", wraps=self.exchange._order_tracker.process_trade_update
+        ) as process_trade_update_mock:
+            self.async_run_with_timeout(self.exchange._update_order_status())
+            self.assertEqual(1640780001000, self.exchange._last_trade_history_timestamp)
+            self.assertEqual("T1", self.exchange._last_trade_history_id)
+
+            self.async_run_with_timeout(self.exchange._update_order_status())
+
+        processed_trade_ids = [call.args[0].trade_id for call in process_trade_update_mock.call_args_list]
+        self.assertEqual(["T1", "T2"], processed_trade_ids)
+        self.assertEqual(1640780002000, self.exchange._last_trade_history_timestamp)
+        self.assertEqual(Decimal("0.2"), order.executed_amount_base)
+
+        second_trades_request = self._all_executed_requests(mock_api, trades_url)[1]
+        request_data = json.loads(second_trades_request.kwargs["data"])
+        self.assertEqual(1640780001000 - CONSTANTS.TRADE_HISTORY_CURSOR_OVERLAP_MS, request_data["from_timestamp"])
+
+    @aioresponses()
+    def test_trade_history_cursor_does_not_pass_orders_without_exchange_order_id(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        self.exchange._set_current_timestamp(1640780003)
+        self.exchange.start_tracking_order(
+            order_id="OID_PENDING",
+            exchange_order_id=None,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+
+        trades_url = web_utils.private_rest_url(path_url=CONSTANTS.USER_TRADE_HISTORY_PATH_URL)
+        mock_api.post(trades_url, body=json.dumps([self._trade_history_data(order, "T1", 1640780005000)]))
+        self.async_run_with_timeout(self.exchange._request_trade_history())
+
+        self.assertEqual(1640780003000, self.exchange._last_trade_history_timestamp)
+
+    def test_trade_history_cursor_is_saved_and_restored_with_tracking_states(self):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        self.exchange._last_trade_history_timestamp = 1640780001000
+        self.exchange._last_trade_history_id = "T1"
+
+        tracking_states = self.exchange.tracking_states
+
+        self.assertEqual(
+            {"timestamp": 1640780001000, "trade_id": "T1"},
+            tracking_states[CONSTANTS.TRADE_HISTORY_CURSOR_STATE_KEY])
+        self.assertIn(order.client_order_id, tracking_states)
+
+        new_exchange = self.create_exchange_instance()
+        new_exchange.restore_tracking_states(tracking_states)
+
+        self.assertEqual(1640780001000, new_exchange._last_trade_history_timestamp)
+        self.assertEqual("T1", new_exchange._last_trade_history_id)
+        self.assertIn(order.client_order_id, new_exchange.in_flight_orders)
+        self.assertEqual(1, len(new_exchange.in_flight_orders))
+
+    def test_throttler_reserves_capacity_for_background_requests(self):
+        self.assertEqual(CONSTANTS.BACKGROUND_REQUESTS_RESERVED_PCT, self.exchange._throttler._background_reserved_pct)
+
+    @aioresponses()
+    def test_requests_are_tagged_with_their_priority(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        self.configure_successful_cancelation_response(order, mock_api)
+        mock_api.post(web_utils.private_rest_url(CONSTANTS.BALANCE_PATH_URL), body=json.dumps([]))
+
+        with patch.object(self.exchange._throttler, "execute_task", wraps=self.exchange._throttler.execute_task) as execute_task:
+            self.async_run_with_timeout(self.exchange._place_cancel(order.client_order_id, order))
+            self.async_run_with_timeout(self.exchange._update_balances())
+
+        self.assertEqual(RequestPriority.CRITICAL, execute_task.call_args_list[0].kwargs["priority"])
+        self.assertEqual(RequestPriority.BACKGROUND, execute_task.call_args_list[1].kwargs["priority"])
+
+    def test_order_book_and_user_stream_data_sources_share_the_stream_hub(self):
+        self.assertIs(self.exchange._stream_hub, self.exchange._orderbook_ds._stream_hub)
+        self.assertIs(self.exchange._stream_hub, self.exchange._user_stream_tracker.data_source._stream_hub)
+
+    def test_depth_updates_are_applied_as_deltas(self):
+        self.assertTrue(self.exchange.order_book_tracker.apply_snapshots_as_deltas)
+
+    def test_order_books_are_initialized_concurrently(self):
+        self.assertTrue(self.exchange.order_book_tracker._concurrent_init)
+
+    def test_order_book_messages_are_recorded_when_a_recording_path_is_set(self):
+        self.assertIsNone(self.exchange.order_book_tracker.recorder)
+        with tempfile.TemporaryDirectory() as directory:
+            exchange = CoindcxExchange(coindcx_api_key="", coindcx_secret_key="", trading_pairs=[self.trading_pair],
+                                       trading_required=False, order_book_recording_path=directory)
+
+            self.assertEqual(directory, exchange.order_book_tracker.recorder.directory)
+
+    def test_market_data_latency_is_tracked_and_reported(self):
+        latency_tracker = self.exchange.order_book_tracker.latency_tracker
+        self.assertNotIn("Market data latency", self.exchange.format_status())
+
+        latency_tracker.record_applied(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 1, "bids": [], "asks": []},
+            1640780000.0),
+            applied_at=1640780000.1)
+
+        self.assertIn("Market data latency", self.exchange.format_status())
+
+    def test_queued_order_book_messages_are_coalesced(self):
+        tracker = self.exchange.order_book_tracker
+        self.assertNotIn("CoinDCX order book queues:", self.exchange.format_status())
+
+        for update_id in (1, 2):
+            tracker._order_book_snapshot_stream.put_nowait(OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT,
+                {"trading_pair": self.trading_pair, "update_id": update_id, "bids": [], "asks": []},
+                update_id))
+
+        self.assertEqual(OrderBookMessageQueueStats(depth=1, dropped=1, merged=0),
+                         tracker.message_queue_stats[self.trading_pair])
+        self.assertIn("CoinDCX order book queues:", self.exchange.format_status())
+
+    def test_order_book_depth_cap_and_memory_are_reported(self):
+        self.assertEqual(0, self.exchange.order_book_tracker.depth_cap)
+        self.assertNotIn("CoinDCX order book memory", self.exchange.format_status())
+
+        exchange = CoindcxExchange(coindcx_api_key="", coindcx_secret_key="", trading_pairs=[self.trading_pair],
+                                   trading_required=False, order_book_depth_cap=20)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(50)], [], 1)
+        exchange.order_book_tracker._init_start_timestamp = 0
+        exchange.order_book_tracker._start_tracking_book(self.trading_pair, order_book)
+        exchange.order_book_tracker._depth_resyncs[self.trading_pair] = 2
+
+        self.assertEqual(20, exchange.order_book_tracker.depth_cap)
+        self.assertEqual(30, len(list(order_book.bid_entries())))
+        status = exchange.format_status()
+        self.assertIn("CoinDCX order book memory (depth cap: 20):", status)
+        self.assertRegex(status, rf"{self.trading_pair}\s+1\.9\s+0\.0\s+2")
+        self.assertRegex(status, r"Total\s+1\.9\s+0\.0\s+2")
+        exchange.order_book_tracker.stop()
+
+    @aioresponses()
+    def test_last_traded_prices_share_a_single_ticker_request(self, mock_api):
+        mock_api.get(self.latest_prices_url, body=json.dumps(self.latest_prices_request_mock_response))
+        other_exchange = CoindcxExchange(
+            coindcx_api_key="", coindcx_secret_key="", trading_pairs=[self.trading_pair], trading_required=False)
+        other_exchange._set_trading_pair_symbol_map(bidict({self.ex_trading_pair: self.trading_pair}))
+
+        prices, other_prices = self.async_run_with_timeout(safe_gather(
+            self.exchange.get_last_traded_prices(trading_pairs=[self.trading_pair]),
+            other_exchange.get_last_traded_prices(trading_pairs=[self.trading_pair]),
+        ))
+        cached_prices = self.async_run_with_timeout(
+            self.exchange.get_last_traded_prices(trading_pairs=[self.trading_pair]))
+
+        self.assertEqual({self.trading_pair: self.expected_latest_price}, prices)
+        self.assertEqual(prices, other_prices)
+        self.assertEqual(prices, cached_prices)
+        ticker_requests = [key for key in mock_api.requests if str(key[1]) == self.latest_prices_url]
+        self.assertEqual(1, len(mock_api.requests[ticker_requests[0]]))
+
+    @aioresponses()
+    def test_last_traded_prices_fall_back_to_trade_history_for_pairs_missing_from_ticker(self, mock_api):
+        mock_api.get(self.latest_prices_url, body=json.dumps([]))
+        mock_api.get(self.trade_history_url, body=json.dumps([
+            {"p": self.expected_latest_price, "q": 0.023519, "s": self.ex_trading_pair, "T": 1565163305770, "m": False}
+        ]))
+
+        prices = self.async_run_with_timeout(self.exchange.get_last_traded_prices(trading_pairs=[self.trading_pair]))
+
+        self.assertEqual({self.trading_pair: self.expected_latest_price}, prices)
+
+    @aioresponses()
+    def test_updated_trading_rules_are_saved_to_the_markets_cache(self, mock_api):
+        self.exchange._set_current_timestamp(1000)
+        mock_api.get(self.trading_rules_url, body=json.dumps(self.trading_rules_request_mock_response))
+
+        with patch.object(self.exchange, "_save_markets_cache", new_callable=AsyncMock) as save_markets_cache:
+            self.async_run_with_timeout(self.exchange._update_trading_rules())
+
+        save_markets_cache.assert_awaited_once()
+
+    def _save_markets_cache(self):
+        self.exchange._trading_rules[self.trading_pair] = self.expected_trading_rule
+        self.async_run_with_timeout(self.exchange._save_markets_cache())
+
+    def test_cached_trading_rules_and_symbol_maps_are_loaded_on_the_next_start(self):
+        self._save_markets_cache()
+
+        restarted_exchange = self.create_exchange_instance()
+
+        self.assertTrue(restarted_exchange._load_markets_cache())
+        self.assertEqual({self.ex_trading_pair: self.trading_pair},
+                         dict(self.async_run_with_timeout(restarted_exchange.trading_pair_symbol_map())))
+        self.assertEqual({self.ecode_trading_pair: self.trading_pair},
+                         dict(self.async_run_with_timeout(restarted_exchange.trading_pair_ecode_symbol_map())))
+        self.assertEqual(repr(self.expected_trading_rule), repr(restarted_exchange.trading_rules[self.trading_pair]))
+
+    @aioresponses()
+    def test_symbol_map_initialization_uses_markets_cache(self, mock_api):
+        self._save_markets_cache()
+
+        restarted_exchange = self.create_exchange_instance()
+        # No markets details request is mocked
+        symbol_map = self.async_run_with_timeout(restarted_exchange.trading_pair_symbol_map())
+
+        self.assertEqual({self.ex_trading_pair: self.trading_pair}, dict(symbol_map))
+        self.assertIn(self.trading_pair, restarted_exchange.trading_rules)
+        self.assertEqual(0, len(mock_api.requests))
+
+    def test_inconsistent_markets_cache_is_ignored(self):
+        self.exchange._markets_cache.save(
+            CoindcxMarkets(symbol_map={"COINBETAHBOT": "COINBETA-HBOT"},
+                           ecode_symbol_map={"B-COINBETA_HBOT": "COINBETA-HBOT"},
+                           trading_rules=[]),
+            now=self.exchange._time())
+
+        self.assertFalse(self.exchange._load_markets_cache())
+
+    def _measure_domain_probes(self, api_round_trip: float, hft_round_trip: float):
+        router = self.exchange.domain_router
+        router.record_round_trip(CONSTANTS.DEFAULT_DOMAIN, CONSTANTS.PROBE_ENDPOINT_CLASS, api_round_trip)
+        router.record_round_trip(CONSTANTS.HFT_DOMAIN, CONSTANTS.PROBE_ENDPOINT_CLASS, hft_round_trip)
+
+    @aioresponses()
+    def test_order_creation_is_sent_to_the_fastest_domain(self, mock_api):
+        self._measure_domain_probes(api_round_trip=0.2, hft_round_trip=0.02)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.PLACE_ORDER_PATH_URL, domain=CONSTANTS.HFT_DOMAIN)
+        mock_api.post(url, body=json.dumps(self.order_creation_request_successful_mock_response))
+
+        response = self.async_run_with_timeout(self.exchange._api_post(
+            path_url=CONSTANTS.PLACE_ORDER_PATH_URL,
+            data={"client_order_id": "OID1"},
+            is_auth_required=True,
+            limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+        ))
+
+        self.assertEqual(self.order_creation_request_successful_mock_response, response)
+        self.assertIsNotNone(self._all_executed_requests(mock_api, url))
+        stats = {(stat.domain, stat.endpoint_class): stat for stat in self.exchange.domain_router.stats()}
+        self.assertEqual(1, stats[(CONSTANTS.HFT_DOMAIN, CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS)].samples)
+
+    @aioresponses()
+    def test_throttler_wait_is_not_measured_as_domain_latency(self, mock_api):
+        self._measure_domain_probes(api_round_trip=0.1, hft_round_trip=0.02)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.PLACE_ORDER_PATH_URL, domain=CONSTANTS.HFT_DOMAIN)
+        throttler_acquire = self.exchange._throttler.acquire
+
+        async def slow_acquire(*args, **kwargs):
+            # Every request waits for rate limit capacity longer than the round trip of the slower domain
+            await asyncio.sleep(0.15)
+            await throttler_acquire(*args, **kwargs)
+
+        with patch.object(self.exchange._throttler, "acquire", side_effect=slow_acquire):
+            for _ in range(CONSTANTS.DOMAIN_MIN_SAMPLES):
+                mock_api.post(url, body=json.dumps(self.order_creation_request_successful_mock_response))
+                self.async_run_with_timeout(self.exchange._api_post(
+                    path_url=CONSTANTS.PLACE_ORDER_PATH_URL,
+                    data={"client_order_id": "OID1"},
+                    is_auth_required=True,
+                    limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+                ))
+
+        stats = {(stat.domain, stat.endpoint_class): stat for stat in self.exchange.domain_router.stats()}
+        self.assertEqual(CONSTANTS.DOMAIN_MIN_SAMPLES,
+                         stats[(CONSTANTS.HFT_DOMAIN, CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS)].samples)
+        self.assertLess(stats[(CONSTANTS.HFT_DOMAIN, CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS)].median, 0.1)
+        self.assertEqual(CONSTANTS.HFT_DOMAIN,
+                         self.exchange.domain_router.domain_for(CONSTANTS.ORDER_CREATE_ENDPOINT_CLASS))
+
+    @aioresponses()
+    def test_order_cancelation_fails_over_to_the_other_domain(self, mock_api):
+        self._measure_domain_probes(api_round_trip=0.2, hft_round_trip=0.02)
+        hft_url = web_utils.private_rest_url(path_url=CONSTANTS.CANCEL_ORDER_PATH_URL, domain=CONSTANTS.HFT_DOMAIN)
+        mock_api.post(hft_url, status=503, body="Service Unavailable")
+        api_url = web_utils.private_rest_url(path_url=CONSTANTS.CANCEL_ORDER_PATH_URL, domain=CONSTANTS.DEFAULT_DOMAIN)
+        mock_api.post(api_url, body=json.dumps({"message": "success", "status": 200, "code": 200}))
+        order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+            creation_timestamp=1640780000,
+        )
+
+        self.assertTrue(self.async_run_with_timeout(self.exchange._place_cancel("OID1", order)))
+
+        stats = {(stat.domain, stat.endpoint_class): stat for stat in self.exchange.domain_router.stats()}
+        self.assertEqual(1, stats[(CONSTANTS.HFT_DOMAIN, CONSTANTS.ORDER_CANCEL_ENDPOINT_CLASS)].failures)
+        self.assertEqual(1, stats[(CONSTANTS.DEFAULT_DOMAIN, CONSTANTS.ORDER_CANCEL_ENDPOINT_CLASS)].samples)
+
+    @aioresponses()
+    def test_order_creation_is_not_retried_on_another_domain(self, mock_api):
+        self._measure_domain_probes(api_round_trip=0.2, hft_round_trip=0.02)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.PLACE_ORDER_PATH_URL, domain=CONSTANTS.HFT_DOMAIN)
+        mock_api.post(url, status=503, body="Service Unavailable")
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._api_post(
+                path_url=CONSTANTS.PLACE_ORDER_PATH_URL,
+                data={"client_order_id": "OID1"},
+                is_auth_required=True,
+                limit_id=CONSTANTS.COINDCX_GLOBAL_RATE_LIMIT,
+            ))
+
+        self.assertEqual(1, len(mock_api.requests))
+
+    @aioresponses()
+    @patch("coindcx_src.coindcx_exchange.CoindcxExchange._sleep")
+    def test_domain_probe_loop_measures_every_domain(self, mock_api, sleep_mock):
+        sleep_mock.side_effect = asyncio.CancelledError
+        for domain in CONSTANTS.ROUTED_DOMAINS:
+            mock_api.get(web_utils.public_rest_url(path_url=CONSTANTS.CHECK_NETWORK_REQUEST_PATH_URL, domain=domain),
+                         body=json.dumps({}))
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(self.exchange._domain_probe_loop())
+
+        probed_domains = [stat.domain for stat in self.exchange.domain_router.stats()
+                          if stat.endpoint_class == CONSTANTS.PROBE_ENDPOINT_CLASS and stat.samples == 1]
+        self.assertEqual(sorted(CONSTANTS.ROUTED_DOMAINS), probed_domains)
+        self.assertIn("CoinDCX domains:", self.exchange.format_status())
+
+    def _limit_orders(self, count: int, amount: Decimal = Decimal("1")) -> List[LimitOrder]:
+        return [
+            LimitOrder(f"OID{i}", self.trading_pair, i % 2 == 0, self.base_asset, self.quote_asset,
+                       Decimal("10000") + i, amount)
+            for i in range(count)
+        ]
+
+    def _mock_batch_order_creation(self, mock_api: aioresponses, rejected_ids: Tuple[str, ...] = (),
+                                   missing_ids: Tuple[str, ...] = (), repeat: bool = True) -> str:
+        url = web_utils.private_rest_url(path_url=CONSTANTS.CREATE_MULTIPLE_ORDERS_PATH_URL)
+
+        def create_orders(url, **kwargs):
+            orders = [order for order in json.loads(kwargs["data"])["orders"]
+                      if order["client_order_id"] not in missing_ids]
+            return CallbackResult(payload={"orders": [
+                {
+                    "id": f"E{order['client_order_id']}",
+                    "client_order_id": order["client_order_id"],
+                    "status": "rejected" if order["client_order_id"] in rejected_ids else "open",
+                }
+                for order in orders
+            ]})
+
+        mock_api.post(url, callback=create_orders, repeat=repeat)
+        return url
+
+    def _execute_batch_order_create(self, orders: List[LimitOrder]):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._trading_rules[self.trading_pair] = self.expected_trading_rule
+        with patch.object(self.exchange, "exchange_symbol_associated_to_pair",
+                          AsyncMock(return_value=self.ex_trading_pair)):
+            self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders))
+
+    @patch("coindcx_src.coindcx_exchange.CoindcxExchange._execute_batch_order_create")
+    def test_batch_order_create_assigns_client_order_ids(self, execute_mock):
+        orders = self.exchange.batch_order_create(self._limit_orders(2))
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(2, len(orders))
+        self.assertTrue(all(order.client_order_id.startswith(CONSTANTS.CLIENT_ID_PREFIX) for order in orders))
+        self.assertNotEqual(orders[0].client_order_id, orders[1].client_order_id)
+        self.assertEqual([True, False], [order.is_buy for order in orders])
+        execute_mock.assert_called_once_with(orders, OrderType.LIMIT)
+
+    @aioresponses()
+    def test_batch_order_create_sends_orders_in_chunks(self, mock_api):
+        orders = self._limit_orders(CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST + 2)
+        url = self._mock_batch_order_creation(mock_api)
+
+        self._execute_batch_order_create(orders)
+
+        requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(requests))
+        requested_ids = [[order["client_order_id"] for order in json.loads(request.kwargs["data"])["orders"]]
+                         for request in requests]
+        self.assertEqual(sorted([[order.client_order_id for order in orders[:CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST]],
+                                 [order.client_order_id for order in orders[CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST:]]]),
+                         sorted(requested_ids))
+        self.validate_auth_credentials_present(requests[0])
+        request_order = json.loads(requests[0].kwargs["data"])["orders"][0]
+        self.assertEqual(self.ex_trading_pair, request_order["market"])
+        self.assertEqual("limit_order", request_order["order_type"])
+
+        for order in orders:
+            in_flight_order = self.exchange.in_flight_orders[order.client_order_id]
+            self.assertTrue(in_flight_order.is_open)
+            self.assertEqual(f"E{order.client_order_id}", in_flight_order.exchange_order_id)
+        self.assertEqual(len(orders) // 2, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(len(orders) // 2, len(self.sell_order_created_logger.event_log))
+
+    @aioresponses()
+    def test_batch_order_create_maps_partial_failures_to_their_orders(self, mock_api):
+        created_order, rejected_order, missing_order = self._limit_orders(3)
+        self._mock_batch_order_creation(mock_api, rejected_ids=(rejected_order.client_order_id,),
+                                        missing_ids=(missing_order.client_order_id,))
+
+        self._execute_batch_order_create([created_order, rejected_order, missing_order])
+
+        self.assertTrue(self.exchange.in_flight_orders[created_order.client_order_id].is_open)
+        self.assertNotIn(rejected_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertNotIn(missing_order.client_order_id, self.exchange.in_flight_orders)
+        failed_ids = [event.order_id for event in self.order_failure_logger.event_log]
+        self.assertEqual([rejected_order.client_order_id, missing_order.client_order_id], failed_ids)
+        self.assertTrue(any(record.levelname == "NETWORK" and "Error submitting sell LIMIT order" in record.getMessage()
+                            for record in self.log_records))
+
+    @aioresponses()
+    def test_batch_order_create_fails_every_order_of_a_rejected_request(self, mock_api):
+        orders = self._limit_orders(2)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.CREATE_MULTIPLE_ORDERS_PATH_URL)
+        mock_api.post(url, status=400, body=json.dumps({"code": 400, "message": "Invalid Request", "status": "error"}))
+
+        self._execute_batch_order_create(orders)
+
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+        self.assertEqual(2, len(self.order_failure_logger.event_log))
+
+    @aioresponses()
+    def test_batch_order_create_does_not_send_orders_breaking_trading_rules(self, mock_api):
+        valid_order = self._limit_orders(1)[0]
+        too_small_order = LimitOrder("OID-SMALL", self.trading_pair, True, self.base_asset, self.quote_asset,
+                                     Decimal("10000"), Decimal("1e-6"))
+        url = self._mock_batch_order_creation(mock_api)
+
+        self._execute_batch_order_create([valid_order, too_small_order])
+
+        request = self._all_executed_requests(mock_api, url)[0]
+        self.assertEqual([valid_order.client_order_id],
+                         [order["client_order_id"] for order in json.loads(request.kwargs["data"])["orders"]])
+        self.assertTrue(self.exchange.in_flight_orders[valid_order.client_order_id].is_open)
+        self.assertEqual([too_small_order.client_order_id],
+                         [event.order_id for event in self.order_failure_logger.event_log])
+
+    @aioresponses()
+    def test_batch_order_cancel_uses_cancel_by_ids(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(2)
+        self.exchange.start_tracking_order(
+            order_id="OID-PENDING",
+            exchange_order_id=None,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            price=Decimal("11000"),
+            amount=Decimal("1"),
+        )
+        pending_order = self.exchange.in_flight_orders["OID-PENDING"]
+        batch_url = web_utils.private_rest_url(path_url=CONSTANTS.CANCEL_ORDERS_BY_IDS_PATH_URL)
+        mock_api.post(batch_url, body=json.dumps({"message": "success", "status": 200, "code": 200}))
+        single_url = self.configure_successful_cancelation_response(order=pending_order, mock_api=mock_api)
+
+        cancelled_ids = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+            [order.client_order_id for order in orders + [pending_order]]))
+
+        self.assertEqual(["OID0", "OID1", "OID-PENDING"], cancelled_ids)
+        batch_request = self._all_executed_requests(mock_api, batch_url)[0]
+        self.validate_auth_credentials_present(batch_request)
+        self.assertEqual(["EOID0", "EOID1"], json.loads(batch_request.kwargs["data"])["ids"])
+        # the single cancel url is a prefix of the batch one
+        single_requests_data = [json.loads(request.kwargs["data"])
+                                for request in self._all_executed_requests(mock_api, single_url)]
+        self.assertIn("OID-PENDING", [data.get("client_order_id") for data in single_requests_data])
+        for order in orders + [pending_order]:
+            self.assertTrue(order.is_pending_cancel_confirmation)
+
+    @aioresponses()
+    def test_cancel_all_sends_one_request_per_batch(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST + 1)
+        batch_url = web_utils.private_rest_url(path_url=CONSTANTS.CANCEL_ORDERS_BY_IDS_PATH_URL)
+        mock_api.post(batch_url, body=json.dumps({"message": "success", "status": 200, "code": 200}), repeat=True)
+
+        cancellation_results = self.async_run_with_timeout(self.exchange.cancel_all(10))
+
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, batch_url)))
+        self.assertEqual([CancellationResult(order.client_order_id, True) for order in orders], cancellation_results)
+
+    def _process_user_stream_events(self, events: List[Dict[str, Any]]):
+        mock_queue = AsyncMock()
+        mock_queue.get.side_effect = events + [asyncio.CancelledError]
+        self.exchange._user_stream_tracker._user_stream = mock_queue
+        try:
+            self.async_run_with_timeout(self.exchange._user_stream_event_listener())
+        except asyncio.CancelledError:
+            pass
+
+    @aioresponses()
+    def test_fill_applied_from_trade_history_is_skipped_on_the_user_stream(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        trades_url = web_utils.private_rest_url(path_url=CONSTANTS.USER_TRADE_HISTORY_PATH_URL)
+        mock_api.post(trades_url, body=json.dumps([self._trade_history_data(order, "T1", 1640780001000)]))
+        self.configure_open_order_status_response(order=order, mock_api=mock_api)
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        trade_event = self.trade_event_for_partial_fill_websocket_update(order)
+        trade_event["data"][0]["t"] = "T1"
+        with patch("coindcx_src.coindcx_exchange.TradeFeeBase.new_spot_fee") as new_spot_fee_mock:
+            self._process_user_stream_events([trade_event])
+
+        new_spot_fee_mock.assert_not_called()
+        self.assertEqual(Decimal("0.1"), order.executed_amount_base)
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        self.assertEqual((1, 1, 1), tuple(self.exchange.applied_trade_ids.stats()))
+
+    @aioresponses()
+    def test_fill_applied_from_the_user_stream_is_skipped_in_trade_history(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        trade_event = self.trade_event_for_partial_fill_websocket_update(order)
+        self._process_user_stream_events([trade_event])
+
+        trades_url = web_utils.private_rest_url(path_url=CONSTANTS.USER_TRADE_HISTORY_PATH_URL)
+        mock_api.post(trades_url, body=json.dumps([
+            self._trade_history_data(order, self.expected_fill_trade_id, 1640780001000),
+            self._trade_history_data(order, "T2", 1640780002000),
+        ]))
+        self.configure_open_order_status_response(order=order, mock_api=mock_api)
+        with patch.object(
+            self.exchange._order_tracker, "process_trade_update", wraps=self.exchange._order_tracker.process_trade_update
+        ) as process_trade_update_mock:
+            self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(["T2"], [call.args[0].trade_id for call in process_trade_update_mock.call_args_list])
+        self.assertEqual(1, self.exchange.applied_trade_ids.hits)
+        self.assertEqual(2, self.exchange.applied_trade_ids.misses)
+        self.assertIn("1 duplicates skipped", self.exchange.format_status())
+
+    def test_fills_of_restored_orders_are_indexed(self):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders(1)[0]
+        trade_event = self.trade_event_for_partial_fill_websocket_update(order)
+        trade_event["data"][0]["q"] = "0.1"
+        self._process_user_stream_events([trade_event])
+        tracking_states = self.exchange.tracking_states
+
+        restarted_exchange = self.create_exchange_instance()
+        restarted_exchange.restore_tracking_states(tracking_states)
+
+        self.assertIn(str(self.expected_fill_trade_id), restarted_exchange.applied_trade_ids)
@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.connector.trading_rule import TradingRule
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../"))  # isort: skip
+
+from coindcx_src import coindcx_constants as CONSTANTS  # isort: skip
+from coindcx_src.coindcx_markets_cache import CoindcxMarkets, CoindcxMarketsCache  # isort: skip
+
+
+class CoindcxMarketsCacheTests(unittest.TestCase):
+    # the level is required to receive logs from the cache logger
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.cache_dir.name, "markets.json")
+        self.cache = CoindcxMarketsCache(file_path=self.cache_path, ttl=60)
+        self.cache.logger().setLevel(1)
+        self.cache.logger().addHandler(self)
+        self.markets = CoindcxMarkets(
+            symbol_map={"COINALPHAHBOT": "COINALPHA-HBOT"},
+            ecode_symbol_map={"B-COINALPHA_HBOT": "COINALPHA-HBOT"},
+            trading_rules=[TradingRule(
+                trading_pair="COINALPHA-HBOT",
+                min_order_size=Decimal("1e-05"),
+                max_order_size=Decimal("9000"),
+                min_price_increment=Decimal("1e-2"),
+                min_base_amount_increment=Decimal("1e-05"),
+                min_notional_size=Decimal("10"),
+            )],
+        )
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def test_saved_markets_are_loaded_back(self):
+        self.cache.save(self.markets, now=1000)
+
+        markets = self.cache.load(now=1030)
+
+        self.assertEqual(self.markets.symbol_map, markets.symbol_map)
+        self.assertEqual(self.markets.ecode_symbol_map, markets.ecode_symbol_map)
+        self.assertEqual([repr(rule) for rule in self.markets.trading_rules],
+                         [repr(rule) for rule in markets.trading_rules])
+        self.assertEqual(["markets.json"], os.listdir(self.cache_dir.name))
+
+    def test_saves_use_their_own_temporary_file(self):
+        other_cache = CoindcxMarketsCache(file_path=self.cache_path, ttl=60)
+        temporary_paths = []
+        original_replace = os.replace
+
+        def record_replace(source, destination):
+            temporary_paths.append(source)
+            original_replace(source, destination)
+
+        with patch("coindcx_src.coindcx_markets_cache.os.replace", side_effect=record_replace):
+            self.cache.save(self.markets, now=1000)
+            other_cache.save(self.markets, now=1001)
+
+        self.assertEqual(2, len(set(temporary_paths)))
+        self.assertTrue(all(os.path.dirname(path) == self.cache_dir.name for path in temporary_paths))
+        self.assertEqual(["markets.json"], os.listdir(self.cache_dir.name))
+        self.assertIsNotNone(self.cache.load(now=1001))
+
+    def test_missing_file_is_a_cache_miss(self):
+        self.assertIsNone(self.cache.load(now=1000))
+
+    def test_outdated_markets_are_ignored(self):
+        self.cache.save(self.markets, now=1000)
+
+        self.assertIsNone(self.cache.load(now=1061))
+
+    def test_markets_written_by_another_version_are_ignored(self):
+        self.cache.save(self.markets, now=1000)
+        with open(self.cache_path, "r") as cache_file:
+            content = json.load(cache_file)
+        content["version"] = CONSTANTS.MARKETS_CACHE_VERSION + 1
+        with open(self.cache_path, "w") as cache_file:
+            json.dump(content, cache_file)
+
+        self.assertIsNone(self.cache.load(now=1000))
+
+    def test_corrupted_file_is_ignored(self):
+        with open(self.cache_path, "w") as cache_file:
+            cache_file.write("{\"version\": ")
+
+        self.assertIsNone(self.cache.load(now=1000))
+        self.assertTrue(any(record.levelname == "WARNING" for record in self.log_records))
+
+    def test_consistency_check(self):
+        self.assertTrue(self.markets.is_consistent(["COINALPHA-HBOT"]))
+        self.assertFalse(self.markets.is_consistent(["COINBETA-HBOT"]))
+        self.assertFalse(self.markets._replace(ecode_symbol_map={}).is_consistent([]))
+        self.assertFalse(self.markets._replace(
+            trading_rules=[TradingRule(trading_pair="COINBETA-HBOT")]).is_consistent([]))
@@ -0,0 +1,191 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from decimal import Decimal
+from typing import Any, Awaitable, Dict, List
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../"))  # isort: skip
+
+from coindcx_src import coindcx_constants as CONSTANTS  # isort: skip
+from coindcx_src.coindcx_exchange import CoindcxExchange  # isort: skip
+from coindcx_src.coindcx_stream_hub import CoindcxStreamHub  # isort: skip
+from coindcx_test.coindcx_simulator import CoindcxSimulator, SimulatedMarket  # isort: skip
+
+
+class CoindcxSimulatorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.market = SimulatedMarket(base="COINALPHA", quote="HBOT", mid_price=100.0)
+        cls.trading_pair = "COINALPHA-HBOT"
+        cls.markets_cache_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.markets_cache_dir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = self.new_simulator()
+        self.exchange = CoindcxExchange(
+            coindcx_api_key="someKey",
+            coindcx_secret_key="someSecretKey",
+            trading_pairs=[self.trading_pair],
+            markets_cache_path=os.path.join(self.markets_cache_dir.name, CONSTANTS.MARKETS_CACHE_FILE_NAME))
+        self.listening_tasks: List[asyncio.Task] = []
+
+    def tearDown(self) -> None:
+        for task in self.listening_tasks:
+            task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.async_run_with_timeout(self.simulator.stop())
+        super().tearDown()
+
+    def new_simulator(self, **kwargs) -> CoindcxSimulator:
+        kwargs = {"markets": [self.market], "balances": {"COINALPHA": 10, "HBOT": 10000},
+                  "depth": 10, "depth_update_rate": 0, "trade_rate": 0, "seed": 1, **kwargs}
+        return CoindcxSimulator(**kwargs)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def start_simulator(self):
+        self.async_run_with_timeout(self.simulator.start())
+        url_patch = self.simulator.patch_urls()
+        url_patch.__enter__()
+        self.addCleanup(url_patch.__exit__, None, None, None)
+
+    def place_order(self, order_id: str, trade_type: TradeType, amount: str, price: str):
+        with patch.object(self.exchange, "exchange_symbol_associated_to_pair", AsyncMock(return_value="COINALPHAHBOT")):
+            return self.async_run_with_timeout(self.exchange._place_order(
+                order_id=order_id,
+                trading_pair=self.trading_pair,
+                amount=Decimal(amount),
+                trade_type=trade_type,
+                order_type=OrderType.LIMIT,
+                price=Decimal(price)))
+
+    def listen_to_stream(self, channel_name: str, events: List[str]) -> List[Dict[str, Any]]:
+        hub = CoindcxStreamHub()
+        received = []
+
+        async def join():
+            await hub.emit("join", {"channelName": channel_name, "authSignature": "signature", "apiKey": "someKey"})
+
+        async def handler(event, response):
+            received.append((event, json.loads(response["data"])))
+
+        handlers = {event: (lambda response, event=event: handler(event, response)) for event in events}
+        self.listening_tasks.append(self.ev_loop.create_task(hub.listen(join=join, event_handlers=handlers)))
+        return received
+
+    def run_until(self, condition, timeout: float = 5):
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+        self.async_run_with_timeout(wait(), timeout)
+
+    def test_exchange_loads_markets_and_balances_from_simulator(self):
+        self.start_simulator()
+
+        self.async_run_with_timeout(self.exchange._initialize_trading_pair_symbol_map())
+        self.async_run_with_timeout(self.exchange._update_balances())
+
+        symbol_map = self.async_run_with_timeout(self.exchange.trading_pair_symbol_map())
+        self.assertEqual(self.trading_pair, symbol_map[self.market.symbol])
+        self.assertEqual(Decimal("10"), self.exchange.available_balances["COINALPHA"])
+        self.assertEqual(Decimal("10000"), self.exchange.get_balance("HBOT"))
+
+    def test_crossing_order_is_filled_against_book_and_updates_balances(self):
+        self.start_simulator()
+        best_ask = min(self.simulator._books[self.market.symbol]["asks"])
+
+        exchange_order_id, _ = self.place_order("OID1", TradeType.BUY, "0.1", str(best_ask))
+
+        order = next(order for order in self.simulator.orders if order["id"] == exchange_order_id)
+        self.assertEqual("filled", order["status"])
+        self.assertEqual(1, len(self.simulator.user_trades))
+        available_base, locked_base = self.simulator.balance("COINALPHA")
+        self.assertEqual(Decimal("10.1"), available_base)
+        available_quote, locked_quote = self.simulator.balance("HBOT")
+        self.assertEqual(Decimal("0"), locked_quote)
+        self.assertEqual(Decimal("10000") - Decimal(str(best_ask)) * Decimal("0.1") * Decimal("1.002"),
+                         available_quote)
+
+    def test_resting_order_locks_balance_until_cancelled(self):
+        self.start_simulator()
+
+        self.place_order("OID1", TradeType.SELL, "2", "1000")
+        self.assertEqual((Decimal("8"), Decimal("2")), self.simulator.balance("COINALPHA"))
+
+        tracked_order = AsyncMock(client_order_id="OID1")
+        cancelled = self.async_run_with_timeout(self.exchange._place_cancel("OID1", tracked_order))
+
+        self.assertTrue(cancelled)
+        self.assertEqual((Decimal("10"), Decimal("0")), self.simulator.balance("COINALPHA"))
+        self.assertEqual("cancelled", self.simulator.orders[0]["status"])
+
+    def test_latency_is_injected_per_domain(self):
+        self.simulator = self.new_simulator(domain_latency={CONSTANTS.PUBLIC_DOMAIN: 0.2})
+        self.start_simulator()
+
+        start = time.perf_counter()
+        self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.MARKETS_PATH_URL))
+        default_domain_time = time.perf_counter() - start
+        start = time.perf_counter()
+        self.async_run_with_timeout(self.exchange._api_get(
+            path_url=CONSTANTS.ORDER_BOOK_PATH_URL, params={"pair": self.market.pair}, domain=CONSTANTS.PUBLIC_DOMAIN))
+        public_domain_time = time.perf_counter() - start
+
+        self.assertLess(default_domain_time, 0.2)
+        self.assertGreaterEqual(public_domain_time, 0.2)
+
+    def test_injected_errors_are_raised_by_connector(self):
+        self.start_simulator()
+        self.simulator.inject_errors(CONSTANTS.BALANCE_PATH_URL, status=503)
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._update_balances())
+        self.async_run_with_timeout(self.exchange._update_balances())
+
+        self.assertEqual(2, self.simulator.requests[CONSTANTS.BALANCE_PATH_URL])
+        self.assertEqual(Decimal("10"), self.exchange.available_balances["COINALPHA"])
+
+    def test_depth_updates_are_emitted_to_joined_pairs(self):
+        self.simulator = self.new_simulator(depth_update_rate=50)
+        self.start_simulator()
+
+        received = self.listen_to_stream(self.market.pair, [CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE])
+        self.run_until(lambda: len(received) > 0)
+
+        event, depth_update = received[0]
+        self.assertEqual(self.market.pair, depth_update["channel"])
+        self.assertEqual(10, len(depth_update["b"]))
+        self.assertEqual(10, len(depth_update["a"]))
+        self.assertLess(float(depth_update["b"][0][0]), float(depth_update["a"][0][0]))
+
+    def test_user_events_are_emitted_for_filled_orders(self):
+        self.start_simulator()
+        received = self.listen_to_stream("coindcx", [CONSTANTS.USER_TRADE_EVENT_TYPE,
+                                                     CONSTANTS.USER_ORDER_EVENT_TYPE,
+                                                     CONSTANTS.USER_BALANCE_EVENT_TYPE])
+        self.run_until(lambda: len(self.simulator._sio.manager.rooms.get("/", {}).get("coindcx", {})) > 0)
+
+        best_bid = max(self.simulator._books[self.market.symbol]["bids"])
+        self.place_order("OID1", TradeType.SELL, "0.1", str(best_bid))
+        self.run_until(lambda: len(received) >= 3)
+
+        events = {event: data for event, data in received}
+        self.assertEqual("OID1", events[CONSTANTS.USER_TRADE_EVENT_TYPE][0]["c"])
+        self.assertEqual("0.1", events[CONSTANTS.USER_TRADE_EVENT_TYPE][0]["q"])
+        self.assertEqual("filled", events[CONSTANTS.USER_ORDER_EVENT_TYPE][0]["status"])
+        balances = {balance["currency"]["short_name"]: balance for balance in events[CONSTANTS.USER_BALANCE_EVENT_TYPE]}
+        self.assertEqual("9.9", balances["COINALPHA"]["balance"])
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import unittest
+from typing import Any, Awaitable, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../"))  # isort: skip
+
+from coindcx_src import coindcx_constants as CONSTANTS  # isort: skip
+from coindcx_src.coindcx_stream_hub import CoindcxStreamHub  # isort: skip
+
+
+class CoindcxStreamHubTests(unittest.TestCase):
+    # the level is required to receive logs from the stream hub logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.listening_tasks: List[asyncio.Task] = []
+        self.hub = CoindcxStreamHub()
+        self.hub.logger().setLevel(1)
+        self.hub.logger().addHandler(self)
+
+        self.clients: List[MagicMock] = []
+        self.joined: List[str] = []
+        self.received: List[Any] = []
+
+    def tearDown(self) -> None:
+        for task in self.listening_tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _create_client(self) -> MagicMock:
+        """
+        Creates a SocketIO client mock that triggers the connect event when connecting and stays connected until
+        disconnected.
+        """
+        handlers: Dict[str, Any] = {}
+        closed = asyncio.Event()
+        client = MagicMock()
+        client.handlers = handlers
+        client.on.side_effect = lambda event, handler: handlers.update({event: handler})
+
+        async def connect(url, **kwargs):
+            client.url = url
+            await handlers["connect"]()
+
+        async def disconnect():
+            closed.set()
+
+        client.connect = AsyncMock(side_effect=connect)
+        client.wait = AsyncMock(side_effect=closed.wait)
+        client.disconnect = AsyncMock(side_effect=disconnect)
+        client.emit = AsyncMock()
+        self.clients.append(client)
+        return client
+
+    def _listen(self, name: str, event: str):
+        async def join():
+            self.joined.append(name)
+
+        async def handler(data):
+            self.received.append((name, data))
+
+        task = self.ev_loop.create_task(self.hub.listen(join=join, event_handlers={event: handler}))
+        self.listening_tasks.append(task)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        return task
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
+    def test_listeners_share_a_single_connection(self, mock_client_creation):
+        mock_client_creation.side_effect = self._create_client
+
+        self._listen("public", CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE)
+        self._listen("private", CONSTANTS.USER_ORDER_EVENT_TYPE)
+
+        self.assertEqual(1, len(self.clients))
+        self.assertEqual(CONSTANTS.WSS_URL, self.clients[0].url)
+        self.assertEqual(["public", "private"], self.joined)
+        self.assertTrue(self.hub.is_connected)
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
+    def test_events_are_dispatched_to_their_listeners(self, mock_client_creation):
+        mock_client_creation.side_effect = self._create_client
+
+        self._listen("public", CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE)
+        self._listen("private", CONSTANTS.USER_ORDER_EVENT_TYPE)
+        handlers = self.clients[0].handlers
+
+        self.async_run_with_timeout(handlers[CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE]({"data": "depth"}))
+        self.async_run_with_timeout(handlers[CONSTANTS.USER_ORDER_EVENT_TYPE]({"data": "order"}))
+
+        self.assertEqual([("public", {"data": "depth"}), ("private", {"data": "order"})], self.received)
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
+    def test_failing_handler_is_logged_and_does_not_stop_the_dispatch(self, mock_client_creation):
+        mock_client_creation.side_effect = self._create_client
+
+        async def failing_handler(data):
+            raise ValueError("Test Error")
+
+        self.listening_tasks.append(self.ev_loop.create_task(self.hub.listen(
+            join=AsyncMock(), event_handlers={CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE: failing_handler})))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self._listen("public", CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE)
+
+        self.async_run_with_timeout(
+            self.clients[0].handlers[CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE]({"data": "depth"}))
+
+        self.assertEqual([("public", {"data": "depth"})], self.received)
+        self.assertTrue(self._is_logged(
+            "ERROR", f"Unexpected error handling the CoinDCX stream {CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE} event."))
+        self.assertTrue(any(record.exc_info is not None for record in self.log_records))
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
+    def test_failing_join_is_logged_and_the_other_listeners_join(self, mock_client_creation):
+        mock_client_creation.side_effect = self._create_client
+
+        self.listening_tasks.append(self.ev_loop.create_task(self.hub.listen(
+            join=AsyncMock(side_effect=ValueError("Test Error")),
+            event_handlers={CONSTANTS.USER_ORDER_EVENT_TYPE: AsyncMock()})))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self._listen("public", CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE)
+
+        self.assertEqual(["public"], self.joined)
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error joining the CoinDCX stream channels."))
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
+    def test_connection_is_closed_when_the_last_listener_stops(self, mock_client_creation):
+        mock_client_creation.side_effect = self._create_client
+
+        public_task = self._listen("public", CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE)
+        private_task = self._listen("private", CONSTANTS.USER_ORDER_EVENT_TYPE)
+
+        public_task.cancel()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(1, self.hub.subscribers_count)
+        self.clients[0].disconnect.assert_not_awaited()
+
+        private_task.cancel()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(0, self.hub.subscribers_count)
+        self.clients[0].disconnect.assert_awaited()
+        self.assertFalse(self.hub.is_connected)
+
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._sleep", new_callable=AsyncMock)
+    @patch("coindcx_src.coindcx_stream_hub.CoindcxStreamHub._create_async_client")
+    def test_connection_errors_are_logged_and_all_listeners_rejoin(self, mock_client_creation, _):
+        mock_client_creation.side_effect = [Exception("Test Error"), self._create_client()]
+
+        self._listen("public", CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE)
+        self._listen("private", CONSTANTS.USER_ORDER_EVENT_TYPE)
+
+        self.assertTrue(self._is_logged(
+            "ERROR",
+            "Unexpected error occurred on the CoinDCX stream connection. Retrying in 5 seconds... Error: Test Error"))
+        self.assertEqual(["public", "private"], self.joined)
+
+    def test_emit_requires_connection(self):
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(self.hub.emit("join", {"channelName": "coindcx"}))
@@ -0,0 +1,57 @@
+import os
+import unittest
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../"))  # isort: skip
+
+from coindcx_src.coindcx_trade_id_index import CoindcxTradeIdIndex, TradeIdIndexStats  # isort: skip
+
+
+class CoindcxTradeIdIndexTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1000.0
+        self.index = CoindcxTradeIdIndex(maxsize=3, ttl=60, timer=lambda: self.now)
+
+    def test_lookups_are_counted_as_hits_and_misses(self):
+        self.assertFalse(self.index.is_applied("T1"))
+        self.index.add("T1")
+
+        self.assertTrue(self.index.is_applied("T1"))
+        self.assertTrue(self.index.is_applied("T1"))
+        self.assertFalse(self.index.is_applied("T2"))
+
+        self.assertEqual(TradeIdIndexStats(size=1, hits=2, misses=2), self.index.stats())
+
+    def test_membership_check_is_not_counted(self):
+        self.index.add("T1")
+
+        self.assertIn("T1", self.index)
+        self.assertEqual(0, self.index.hits)
+        self.assertEqual(0, self.index.misses)
+
+    def test_trade_ids_are_evicted_after_the_ttl(self):
+        self.index.add("T1")
+        self.now += 30
+        self.index.add("T2")
+
+        self.now += 31
+        self.assertNotIn("T1", self.index)
+        self.assertIn("T2", self.index)
+        self.assertEqual(1, len(self.index))
+
+    def test_index_is_bounded(self):
+        for trade_id in ("T1", "T2", "T3", "T4"):
+            self.index.add(trade_id)
+
+        self.assertEqual(3, len(self.index))
+        self.assertIn("T4", self.index)
+
+    def test_format_status(self):
+        self.assertEqual("", self.index.format_status())
+
+        self.index.is_applied("T1")
+        self.index.add("T1")
+        self.index.is_applied("T1")
+
+        self.assertEqual("  CoinDCX fills: 1 new, 1 duplicates skipped (1 trade ids indexed)", self.index.format_status())
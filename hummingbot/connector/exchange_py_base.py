@@ -14,7 +14,7 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
@@ -57,7 +57,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_fees_polling_task = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(self.rate_limits_rules)
+        self._throttler = self._create_throttler()
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -66,10 +66,7 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
-        self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
-            trading_pairs=self.trading_pairs,
-            domain=self.domain))
+        self._set_order_book_tracker(self._create_order_book_tracker())
 
         # init UserStream Data Source and Tracker
         self._userstream_ds = self._create_user_stream_data_source()
@@ -148,6 +145,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order book is already tracked, usable while the other books are still initializing.
+        """
+        return self.order_book_tracker.ready_trading_pairs
+
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrder]:
         return self._order_tracker.active_orders
@@ -377,29 +381,64 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, order_id))
         return order_id
 
+    def batch_order_create(self,
+                           orders_to_create: List[LimitOrder],
+                           order_type: OrderType = OrderType.LIMIT) -> List[LimitOrder]:
+        """
+        Creates a promise to create a batch of limit orders. The orders are sent with as few requests as the exchange
+        allows (see _place_orders)
+
+        :param orders_to_create: the orders to create, their client ids are ignored
+        :param order_type: the limit order type of the orders (LIMIT or LIMIT_MAKER)
+
+        :return: the orders with the ids assigned by the connector to them (the client ids)
+        """
+        orders_with_ids = []
+        for order in orders_to_create:
+            order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length
+            )
+            orders_with_ids.append(LimitOrder(
+                order_id,
+                order.trading_pair,
+                order.is_buy,
+                order.base_currency,
+                order.quote_currency,
+                order.price,
+                order.quantity))
+        safe_ensure_future(self._execute_batch_order_create(orders_with_ids, order_type))
+        return orders_with_ids
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel a batch of orders. The cancellations are sent with as few requests as the exchange
+        allows (see _place_cancels)
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        safe_ensure_future(self._execute_batch_cancel([order.client_order_id for order in orders_to_cancel]))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
-        Cancels all currently active orders. The cancellations are performed in parallel tasks.
+        Cancels all currently active orders. The cancellations are sent as one batch (see _place_cancels).
 
         :param timeout_seconds: the maximum time (in seconds) the cancel logic should run
 
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
-                for cr in cancellation_results:
-                    if isinstance(cr, Exception):
-                        continue
-                    client_order_id = cr
-                    if client_order_id is not None:
-                        order_id_set.remove(client_order_id)
-                        successful_cancellations.append(CancellationResult(client_order_id, True))
+                cancelled_order_ids = await self._execute_batch_cancel([o.client_order_id for o in incomplete_orders])
+                for client_order_id in cancelled_order_ids:
+                    order_id_set.remove(client_order_id)
+                    successful_cancellations.append(CancellationResult(client_order_id, True))
         except Exception:
             self.logger().network(
                 "Unexpected error cancelling orders.",
@@ -427,6 +466,112 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param price: the order price
         """
         exchange_order_id = ""
+        tracked_order = self._start_tracking_new_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price)
+        if tracked_order is None:
+            return
+
+        try:
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=tracked_order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=tracked_order.price)
+
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=trading_pair,
+                update_timestamp=update_timestamp,
+                new_state=OrderState.OPEN,
+            )
+            self._order_tracker.process_order_update(order_update)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
+                f"{tracked_order.amount} {trading_pair} {tracked_order.price}.",
+                exc_info=True,
+                app_warning_msg=f"Failed to submit buy order to {self.name_cap}. Check API key and network connection."
+            )
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+        return order_id, exchange_order_id
+
+    async def _execute_batch_order_create(self,
+                                          orders_to_create: List[LimitOrder],
+                                          order_type: OrderType = OrderType.LIMIT):
+        """
+        Creates a batch of limit orders in the exchange. The orders complying with the trading rules are sent together
+        with _place_orders, and the result of each of them is applied to its own in-flight order
+
+        :param orders_to_create: the orders to create, with the client ids already assigned
+        :param order_type: the limit order type of the orders (LIMIT or LIMIT_MAKER)
+        """
+        orders_to_place = []
+        for order in orders_to_create:
+            tracked_order = self._start_tracking_new_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order_type,
+                price=order.price)
+            if tracked_order is not None:
+                orders_to_place.append(tracked_order)
+        if len(orders_to_place) == 0:
+            return
+
+        try:
+            placement_results = await self._place_orders(orders_to_place)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            placement_results = [exception] * len(orders_to_place)
+
+        for tracked_order, placement_result in zip(orders_to_place, placement_results):
+            if isinstance(placement_result, Exception):
+                self.logger().network(
+                    f"Error submitting {tracked_order.trade_type.name.lower()} "
+                    f"{tracked_order.order_type.name.upper()} order to {self.name_cap} for "
+                    f"{tracked_order.amount} {tracked_order.trading_pair} {tracked_order.price}.",
+                    exc_info=placement_result,
+                    app_warning_msg=f"Failed to submit order to {self.name_cap}. "
+                                    "Check API key and network connection."
+                )
+                self._update_order_after_failure(order_id=tracked_order.client_order_id,
+                                                 trading_pair=tracked_order.trading_pair)
+            else:
+                exchange_order_id, update_timestamp = placement_result
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=tracked_order.client_order_id,
+                    exchange_order_id=exchange_order_id,
+                    trading_pair=tracked_order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    def _start_tracking_new_order(self,
+                                  trade_type: TradeType,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  order_type: OrderType,
+                                  price: Optional[Decimal] = None) -> Optional[InFlightOrder]:
+        """
+        Quantizes the order amount and price, starts tracking the order and checks it against the trading rules
+
+        :return: the tracked order, or None if the order can't be created (it is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -449,48 +594,21 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         if amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order"
                                   f" size {trading_rule.min_order_size}. The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
         if price is not None and amount * price < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {amount * price} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. "
                                   "The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return None
 
-        try:
-            exchange_order_id, update_timestamp = await self._place_order(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price)
-
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order_id,
-                exchange_order_id=exchange_order_id,
-                trading_pair=trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=OrderState.OPEN,
-            )
-            self._order_tracker.process_order_update(order_update)
-
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            self.logger().network(
-                f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
-                f"{amount} {trading_pair} {price}.",
-                exc_info=True,
-                app_warning_msg=f"Failed to submit buy order to {self.name_cap}. Check API key and network connection."
-            )
-            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-        return order_id, exchange_order_id
+        return self._order_tracker.fetch_tracked_order(order_id)
 
     def _update_order_after_failure(self, order_id: str, trading_pair: str):
         order_update: OrderUpdate = OrderUpdate(
@@ -515,28 +633,75 @@ class ExchangePyBase(ExchangeBase, ABC):
             else:
                 try:
                     cancelled = await self._place_cancel(order_id, tracked_order)
-                    if cancelled:
-                        order_update: OrderUpdate = OrderUpdate(
-                            client_order_id=order_id,
-                            trading_pair=tracked_order.trading_pair,
-                            update_timestamp=self.current_timestamp,
-                            new_state=(OrderState.CANCELED
-                                       if self.is_cancel_request_in_exchange_synchronous
-                                       else OrderState.PENDING_CANCEL),
-                        )
-                        self._order_tracker.process_order_update(order_update)
-                        return order_id
                 except asyncio.CancelledError:
                     raise
-                except asyncio.TimeoutError:
-                    # some exchanges do not allow cancels with the client/user order id
-                    # so log a warning and wait for the creation of the order to complete
-                    self.logger().warning(
-                        f"Failed to cancel the order {order_id} because it does not have an exchange order id yet")
-                    await self._order_tracker.process_order_not_found(order_id)
-                except Exception:
-                    self.logger().error(
-                        f"Failed to cancel order {order_id}", exc_info=True)
+                except Exception as exception:
+                    cancelled = exception
+                return await self._process_cancel_result(tracked_order, cancelled)
+        return None
+
+    async def _execute_batch_cancel(self, order_ids: List[str]) -> List[str]:
+        """
+        Requests the exchange to cancel a batch of active orders with _place_cancels
+
+        :param order_ids: the client ids of the orders to cancel
+
+        :return: the client ids of the orders successfully cancelled
+        """
+        orders_to_cancel = []
+        for order_id in order_ids:
+            tracked_order = self._order_tracker.fetch_tracked_order(order_id)
+            if tracked_order is None:
+                continue
+            if not tracked_order.is_open:
+                self.logger().info(f"The order {order_id} can't be canceled because it is not open anymore.")
+            else:
+                orders_to_cancel.append(tracked_order)
+        if len(orders_to_cancel) == 0:
+            return []
+
+        try:
+            cancel_results = await self._place_cancels(orders_to_cancel)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            cancel_results = [exception] * len(orders_to_cancel)
+
+        cancelled_order_ids = await safe_gather(*[
+            self._process_cancel_result(tracked_order, cancelled)
+            for tracked_order, cancelled in zip(orders_to_cancel, cancel_results)
+        ])
+        return [order_id for order_id in cancelled_order_ids if order_id is not None]
+
+    async def _process_cancel_result(self, tracked_order: InFlightOrder, cancelled: Any) -> Optional[str]:
+        """
+        Applies the result of a cancel request to the order
+
+        :param tracked_order: the order the cancel request was sent for
+        :param cancelled: the result of the request, or the exception it raised
+
+        :return: the client id of the order if it was cancelled, None otherwise
+        """
+        order_id = tracked_order.client_order_id
+        if isinstance(cancelled, asyncio.TimeoutError):
+            # some exchanges do not allow cancels with the client/user order id
+            # so log a warning and wait for the creation of the order to complete
+            self.logger().warning(
+                f"Failed to cancel the order {order_id} because it does not have an exchange order id yet")
+            await self._order_tracker.process_order_not_found(order_id)
+        elif isinstance(cancelled, Exception):
+            self.logger().error(f"Failed to cancel order {order_id}", exc_info=cancelled)
+        elif cancelled:
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=order_id,
+                trading_pair=tracked_order.trading_pair,
+                update_timestamp=self.current_timestamp,
+                new_state=(OrderState.CANCELED
+                           if self.is_cancel_request_in_exchange_synchronous
+                           else OrderState.PENDING_CANCEL),
+            )
+            self._order_tracker.process_order_update(order_update)
+            return order_id
         return None
 
     # === Order Tracking ===
@@ -610,6 +775,45 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders(self, orders_to_create: List[InFlightOrder]) -> List[Any]:
+        """
+        Sends a batch of orders to the exchange. Connectors supporting batch order requests override it, by default
+        each order is sent on its own with _place_order.
+
+        :param orders_to_create: the tracked orders to send
+
+        :return: for each order, in the same order, either the (exchange_order_id, update_timestamp) tuple of the
+            created order or the exception that prevented its creation
+        """
+        return await safe_gather(
+            *[
+                self._place_order(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price)
+                for order in orders_to_create
+            ],
+            return_exceptions=True,
+        )
+
+    async def _place_cancels(self, orders_to_cancel: List[InFlightOrder]) -> List[Any]:
+        """
+        Sends the cancellation of a batch of orders to the exchange. Connectors supporting batch cancel requests
+        override it, by default each order is cancelled on its own with _place_cancel.
+
+        :param orders_to_cancel: the tracked orders to cancel
+
+        :return: for each order, in the same order, either the result of its cancellation (True if it was cancelled)
+            or the exception raised while cancelling it
+        """
+        return await safe_gather(
+            *[self._place_cancel(order.client_order_id, order) for order in orders_to_cancel],
+            return_exceptions=True,
+        )
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -818,7 +1022,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                            data: Optional[Dict[str, Any]] = None,
                            is_auth_required: bool = False,
                            return_err: bool = False,
-                           limit_id: Optional[str] = None) -> Dict[str, Any]:
+                           limit_id: Optional[str] = None,
+                           priority: RequestPriority = RequestPriority.TRADING) -> Dict[str, Any]:
 
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
         if is_auth_required:
@@ -834,6 +1039,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             is_auth_required=is_auth_required,
             return_err=return_err,
             throttler_limit_id=limit_id if limit_id else path_url,
+            priority=priority,
         )
 
     async def _status_polling_loop_fetch_updates(self):
@@ -874,6 +1080,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _update_balances(self):
         raise NotImplementedError
 
+    def _create_throttler(self) -> AsyncThrottler:
+        return AsyncThrottler(self.rate_limits_rules)
+
+    def _create_order_book_tracker(self) -> OrderBookTracker:
+        return OrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain)
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
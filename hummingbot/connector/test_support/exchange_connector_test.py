@@ -814,6 +814,56 @@ class AbstractExchangeConnectorTests:
                 )
             )
 
+        @aioresponses()
+        def test_create_order_below_min_notional_is_not_sent(self, mock_api):
+            self.exchange._trading_rules = {
+                self.trading_pair: TradingRule(
+                    trading_pair=self.trading_pair,
+                    min_order_size=Decimal(str(0.01)),
+                    min_price_increment=Decimal(str(0.0001)),
+                    min_base_amount_increment=Decimal(str(0.000001)),
+                    min_notional_size=Decimal("1000"),
+                )
+            }
+            request_sent_event = asyncio.Event()
+            self.exchange._set_current_timestamp(1640780000)
+
+            url = self.order_creation_url
+            mock_api.post(url,
+                          status=400,
+                          callback=lambda *args, **kwargs: request_sent_event.set())
+
+            order_id_for_invalid_order = self.exchange.buy(
+                trading_pair=self.trading_pair,
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+                price=Decimal("10"))
+            # The second order is used only to have the event triggered and avoid using timeouts for tests
+            order_id = self.exchange.buy(
+                trading_pair=self.trading_pair,
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+                price=Decimal("10000"))
+            self.async_run_with_timeout(request_sent_event.wait())
+
+            # The only request sent is the one of the second order
+            order_requests = self._all_executed_requests(mock_api, url)
+            self.assertEqual(1, len(order_requests))
+            self.validate_order_creation_request(
+                order=InFlightOrder(
+                    client_order_id=order_id,
+                    trading_pair=self.trading_pair,
+                    order_type=OrderType.LIMIT,
+                    trade_type=TradeType.BUY,
+                    amount=Decimal("100"),
+                    creation_timestamp=self.exchange.current_timestamp,
+                    price=Decimal("10000")),
+                request_call=order_requests[0])
+
+            self.assertNotIn(order_id_for_invalid_order, self.exchange.in_flight_orders)
+            failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+            self.assertEqual(order_id_for_invalid_order, failure_event.order_id)
+
         @aioresponses()
         def test_cancel_order_successfully(self, mock_api):
             request_sent_event = asyncio.Event()
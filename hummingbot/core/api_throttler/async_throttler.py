@@ -1,16 +1,25 @@
+import asyncio
+import math
 import time
+from collections import Counter, deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     AsyncRequestContextBase,
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
     """
     An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
     It uses async lock to prevent other instances of this class from running acquire fn before it finishes with it.
+    This is the polling implementation working over a shared list of TaskLog. AsyncThrottler uses
+    ScheduledRequestContext instead.
     """
 
     def within_capacity(self) -> bool:
@@ -39,6 +48,57 @@ class AsyncRequestContext(AsyncRequestContextBase):
         return True
 
 
+class ScheduledRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until all the rate limits of the task have capacity.
+    Instead of polling, the context registers with its AsyncThrottler, which resumes it at the exact time the
+    capacity it needs is freed.
+    """
+
+    def __init__(self,
+                 throttler: "AsyncThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 priority: RequestPriority = RequestPriority.TRADING,
+                 ):
+        """
+        :param throttler: The AsyncThrottler that owns the rate limit windows
+        :param rate_limit: The RateLimit associated with this API Request
+        :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
+        :param priority: The priority class of this API Request
+        """
+        self._throttler: AsyncThrottler = throttler
+        self._rate_limit: Optional[RateLimit] = rate_limit
+        self._related_limits: List[Tuple[RateLimit, int]] = related_limits
+        self._priority: RequestPriority = priority
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task fits within the defined RateLimit(s) without consuming any capacity.
+        :return: True if it is within capacity to add a new task
+        """
+        return self._throttler.within_capacity(self._related_limits)
+
+    async def acquire(self):
+        await self._throttler.acquire(self._related_limits, self._priority)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class _PendingTask:
+    __slots__ = ("windows", "limit_ids", "priority", "future")
+
+    def __init__(self, windows: List[Tuple[RateLimitWindow, int]], priority: RequestPriority, future: asyncio.Future):
+        self.windows: List[Tuple[RateLimitWindow, int]] = windows
+        self.limit_ids: Set[str] = {window.rate_limit.limit_id for window, _ in windows}
+        self.priority: RequestPriority = priority
+        self.future: asyncio.Future = future
+
+
 class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
@@ -49,21 +109,201 @@ class AsyncThrottler(AsyncThrottlerBase):
         Pool 1 - rate limit is 10 calls per second
         Task A which consumes capacity from both Pool 0 and Pool 1 can be called at 10 calls per second, any calls after
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
+    Capacity is tracked in a sliding window per rate limit. Tasks that have to wait are queued and resumed at the exact
+    time the capacity they need is freed. A waiting task blocks later tasks sharing any of its rate limits (FIFO), while
+    tasks on unrelated rate limits keep flowing.
+    Each task belongs to a RequestPriority class. Waiting tasks of a higher priority class are served before (and are
+    not queued behind) the ones of lower classes. To prevent background tasks from starving, a share of each rate limit
+    can be reserved for them: while background tasks wait, the other classes can not use the part of the reserved share
+    that background tasks are not using.
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    _last_max_cap_warning_ts: float = 0.0
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 background_reserved_pct: Optional[float] = None,
+                 ):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param retry_interval: Time between every capacity check of the polling request contexts.
+        :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity.
+        :param background_reserved_pct: Optional share (0 to 1) of each rate limit reserved for background tasks.
+        """
+        super().__init__(rate_limits=rate_limits, retry_interval=retry_interval, safety_margin_pct=safety_margin_pct)
+        self._background_reserved_pct: float = background_reserved_pct or 0
+        self._windows: Dict[str, RateLimitWindow] = {
+            limit.limit_id: RateLimitWindow(rate_limit=limit, safety_margin_pct=self._safety_margin_pct)
+            for limit in self._rate_limits
+        }
+        # The reserved capacity is rounded up to whole units, a reserve smaller than a single request would hold back
+        # the other classes without ever fitting the waiting background tasks
+        self._background_reserved_capacity: Dict[str, int] = {
+            limit.limit_id: math.ceil(Decimal(str(limit.limit)) * Decimal(str(self._background_reserved_pct)))
+            for limit in self._rate_limits
+        }
+        self._pending_tasks: Dict[RequestPriority, Deque[_PendingTask]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._pending_tasks_per_limit: Dict[RequestPriority, Counter] = {
+            priority: Counter() for priority in RequestPriority
+        }
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+
+    def execute_task(self, limit_id: str, priority: RequestPriority = RequestPriority.TRADING) -> ScheduledRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the API request
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
-        return AsyncRequestContext(
-            task_logs=self._task_logs,
+        return ScheduledRequestContext(
+            throttler=self,
             rate_limit=rate_limit,
             related_limits=related_rate_limits,
-            lock=self._lock,
-            safety_margin_pct=self._safety_margin_pct,
-            retry_interval=self._retry_interval,
+            priority=priority,
         )
+
+    def within_capacity(self, related_limits: List[Tuple[RateLimit, int]]) -> bool:
+        now: float = time.time()
+        return all(self._windows[rate_limit.limit_id].has_capacity(weight, now)
+                   for rate_limit, weight in related_limits)
+
+    async def acquire(self, related_limits: List[Tuple[RateLimit, int]], priority: RequestPriority = RequestPriority.TRADING):
+        """
+        Waits until all the related limits have capacity for the task and then consumes it.
+        :param related_limits: the rate limits, with their corresponding weight, consumed by the task
+        :param priority: the priority class of the task
+        """
+        if len(related_limits) == 0:
+            return
+        windows: List[Tuple[RateLimitWindow, int]] = [
+            (self._windows[rate_limit.limit_id], weight) for rate_limit, weight in related_limits
+        ]
+        now: float = time.time()
+        is_queued_behind = any(
+            self._pending_tasks_per_limit[queued_priority][window.rate_limit.limit_id] > 0
+            for queued_priority in RequestPriority if queued_priority <= priority
+            for window, _ in windows
+        )
+        if not is_queued_behind and self._time_until_capacity(windows, priority, now) <= 0:
+            self._consume(windows, priority, now)
+            return
+
+        if not is_queued_behind:
+            self._warn_capacity_reached(windows, now)
+        pending_task = _PendingTask(windows=windows, priority=priority, future=asyncio.get_event_loop().create_future())
+        self._pending_tasks[priority].append(pending_task)
+        self._pending_tasks_per_limit[priority].update(pending_task.limit_ids)
+        self._schedule_pending_tasks()
+        try:
+            await pending_task.future
+        except asyncio.CancelledError:
+            if not pending_task.future.done() or pending_task.future.cancelled():
+                # The task gave up waiting, the tasks queued behind it might be able to run now
+                self._remove_pending_task(pending_task)
+                self._schedule_pending_tasks()
+            raise
+
+    def _held_back_capacity(self, window: RateLimitWindow, priority: RequestPriority) -> int:
+        """
+        Returns the capacity of the window that tasks of the given priority can not use because it is reserved for
+        waiting background tasks.
+        """
+        if (priority == RequestPriority.BACKGROUND
+                or self._background_reserved_pct == 0
+                or self._pending_tasks_per_limit[RequestPriority.BACKGROUND][window.rate_limit.limit_id] == 0):
+            return 0
+        reserved = self._background_reserved_capacity[window.rate_limit.limit_id]
+        return max(0, reserved - window.capacity_used_by(RequestPriority.BACKGROUND))
+
+    def _time_until_capacity(self, windows: List[Tuple[RateLimitWindow, int]], priority: RequestPriority, now: float) -> float:
+        return max(window.time_until_capacity(weight + self._held_back_capacity(window, priority), now)
+                   for window, weight in windows)
+
+    def _within_background_reserve(self, windows: List[Tuple[RateLimitWindow, int]], now: float) -> bool:
+        return all(
+            window.has_capacity(weight, now)
+            and (window.capacity_used_by(RequestPriority.BACKGROUND) + weight
+                 <= self._background_reserved_capacity[window.rate_limit.limit_id])
+            for window, weight in windows
+        )
+
+    def _consume(self, windows: List[Tuple[RateLimitWindow, int]], priority: RequestPriority, now: float):
+        for window, weight in windows:
+            window.add(weight, now, priority)
+
+    def _remove_pending_task(self, pending_task: _PendingTask):
+        try:
+            self._pending_tasks[pending_task.priority].remove(pending_task)
+        except ValueError:
+            return
+        self._pending_tasks_per_limit[pending_task.priority].subtract(pending_task.limit_ids)
+
+    def _resume(self, pending_task: _PendingTask, now: float):
+        self._consume(pending_task.windows, pending_task.priority, now)
+        self._remove_pending_task(pending_task)
+        pending_task.future.set_result(None)
+
+    def _schedule_pending_tasks(self):
+        """
+        Resumes the pending tasks that fit in their rate limits, in priority order and FIFO within each priority class,
+        and schedules the next wake up at the earliest time one of the remaining tasks at the front of its rate limits
+        queue will have capacity.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+
+        now: float = time.time()
+        next_wake_up: float = float("inf")
+
+        if self._background_reserved_pct > 0:
+            # Background tasks within the reserved share go first
+            blocked_limit_ids: Set[str] = set()
+            for pending_task in list(self._pending_tasks[RequestPriority.BACKGROUND]):
+                if pending_task.future.done():
+                    self._remove_pending_task(pending_task)
+                    continue
+                if blocked_limit_ids.isdisjoint(pending_task.limit_ids):
+                    if self._within_background_reserve(pending_task.windows, now):
+                        self._resume(pending_task, now)
+                        continue
+                    next_wake_up = min(
+                        next_wake_up,
+                        max(window.time_until_capacity(weight, now) for window, weight in pending_task.windows))
+                blocked_limit_ids.update(pending_task.limit_ids)
+
+        blocked_limit_ids: Set[str] = set()
+        for priority in RequestPriority:
+            for pending_task in list(self._pending_tasks[priority]):
+                if pending_task.future.done():
+                    self._remove_pending_task(pending_task)
+                    continue
+                if blocked_limit_ids.isdisjoint(pending_task.limit_ids):
+                    wait_time = self._time_until_capacity(pending_task.windows, priority, now)
+                    if wait_time <= 0:
+                        self._resume(pending_task, now)
+                        continue
+                    next_wake_up = min(next_wake_up, wait_time)
+                blocked_limit_ids.update(pending_task.limit_ids)
+
+        if next_wake_up != float("inf"):
+            self._wake_up_handle = asyncio.get_event_loop().call_later(next_wake_up, self._schedule_pending_tasks)
+
+    def _warn_capacity_reached(self, windows: List[Tuple[RateLimitWindow, int]], now: float):
+        if AsyncThrottler._last_max_cap_warning_ts >= now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            return
+        for window, weight in windows:
+            if not window.has_capacity(weight, now):
+                rate_limit = window.rate_limit
+                self.logger().notify(f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per "
+                                     f"{rate_limit.time_interval}s) has almost reached. Limits used "
+                                     f"is {window.capacity_used} in the last "
+                                     f"{rate_limit.time_interval} seconds")
+                AsyncThrottler._last_max_cap_warning_ts = now
+                break
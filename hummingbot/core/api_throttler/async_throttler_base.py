@@ -4,10 +4,9 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncContextManager, Dict, List, Optional, Tuple
 
-from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -32,7 +31,7 @@ class AsyncThrottlerBase(ABC):
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Time between every capacity check of the polling request contexts (AsyncRequestContextBase).
         :param safety_margin: Percentage of limit to be added as a safety margin when calculating capacity to ensure calls are within the limit.
         """
         from hummingbot.client.config.global_config_map import global_config_map  # avoids chance of circular import
@@ -53,14 +52,16 @@ class AsyncThrottlerBase(ABC):
             for limit in self._rate_limits
         }
 
-        # List of TaskLog used to determine the API requests within a set time window.
+        # Legacy-only: list of TaskLog used by the polling AsyncRequestContext to determine the API requests within a
+        # set time window. AsyncThrottler tracks its capacity in RateLimitWindow(s) and does not use it.
         self._task_logs: List[TaskLog] = []
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
-        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
+        # Legacy-only: shared asyncio.Lock instance to prevent multiple AsyncRequestContext from accessing the
+        # _task_logs variable
         self._lock = asyncio.Lock()
 
     def get_related_limits(self, limit_id: str) -> Tuple[RateLimit, List[Tuple[RateLimit, int]]]:
@@ -77,5 +78,8 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: RequestPriority = RequestPriority.TRADING) -> AsyncContextManager[None]:
+        """
+        Returns the async context ('async with' syntax) entered once the task fits within the rate limits of limit_id.
+        """
         raise NotImplementedError
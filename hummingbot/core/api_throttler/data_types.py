@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,15 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority classes of the API requests. When capacity is scarce, tasks waiting with a lower value are served first.
+    """
+    CRITICAL = 0  # e.g. order cancellations
+    TRADING = 1  # e.g. order creations
+    BACKGROUND = 2  # e.g. order status and balance polling, order book snapshots, trade history
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -0,0 +1,71 @@
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the capacity consumed on a single RateLimit.
+    Each entry keeps the time at which its weight stops counting against the limit, so flushing and computing the time
+    until capacity frees are proportional to the number of expired entries only.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        """
+        :param rate_limit: The RateLimit tracked by this window
+        :param safety_margin_pct: Percentage of the time interval added to the window to ensure calls are within the limit
+        """
+        self.rate_limit: RateLimit = rate_limit
+        # The limit can be Decimal once scaled by the configured share of rate limits
+        self._limit: float = float(rate_limit.limit)
+        self._period: float = rate_limit.time_interval * (1 + safety_margin_pct)
+        self._entries: Deque[Tuple[float, int, RequestPriority]] = deque()  # (expiration timestamp, weight, priority)
+        self._capacity_used: int = 0
+        self._capacity_used_per_priority: Dict[RequestPriority, int] = {priority: 0 for priority in RequestPriority}
+
+    @property
+    def capacity_used(self) -> int:
+        return self._capacity_used
+
+    def capacity_used_by(self, priority: RequestPriority) -> int:
+        return self._capacity_used_per_priority[priority]
+
+    def flush(self, now: float):
+        """
+        Removes the entries that have passed the rate limit period
+        :param now: current timestamp in seconds
+        """
+        entries = self._entries
+        while entries and entries[0][0] <= now:
+            _, weight, priority = entries.popleft()
+            self._capacity_used -= weight
+            self._capacity_used_per_priority[priority] -= weight
+
+    def has_capacity(self, weight: int, now: float) -> bool:
+        self.flush(now)
+        return self._capacity_used + weight <= self._limit
+
+    def time_until_capacity(self, weight: int, now: float) -> float:
+        """
+        Computes how long a task with the given weight has to wait until it fits in the window.
+        :param weight: the weight the task consumes on this limit
+        :param now: current timestamp in seconds
+        :return: the waiting time in seconds, 0 if the task fits now, infinity if it can never fit
+        """
+        self.flush(now)
+        excess = self._capacity_used + weight - self._limit
+        if excess <= 0:
+            return 0.0
+        if weight > self._limit:
+            return float("inf")
+        for expiration_timestamp, entry_weight, _ in self._entries:
+            excess -= entry_weight
+            if excess <= 0:
+                return expiration_timestamp - now
+        return float("inf")
+
+    def add(self, weight: int, now: float, priority: RequestPriority = RequestPriority.TRADING):
+        self._entries.append((now + self._period, weight, priority))
+        self._capacity_used += weight
+        self._capacity_used_per_priority[priority] += weight
@@ -1,8 +1,16 @@
 # distutils: language=c++
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        # The levels of the book net of the traded amounts, kept up to date with the book and the recorded fills
+        set[OrderBookEntry] _composite_bid_book
+        set[OrderBookEntry] _composite_ask_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef c_update_composite_entry(self, bint is_bid, double price)
+    cdef c_prune_composite_entries(self)
+    cdef c_rebuild_composite_book(self)
@@ -1,9 +1,13 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from itertools import islice
+from typing import Iterator, Tuple
+
+import numpy as np
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
+from libc.stdint cimport int64_t
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
 from libcpp.vector cimport vector
@@ -16,6 +20,11 @@ cdef class CompositeOrderBook(OrderBook):
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
     Override the order book bid_entries, ask_entries methods to return the composite order book entries
+
+    The composite levels, the book levels net of the traded amounts, are kept in their own sets and updated at the
+    prices of the applied diffs and of the recorded fills, so that querying the composite book costs the same as
+    querying the book. A traded amount is trimmed to the amount of its level, and forgotten when the book no longer
+    has a level at its price.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
@@ -25,52 +34,175 @@ cdef class CompositeOrderBook(OrderBook):
     def traded_order_book(self) -> OrderBook:
         return self._traded_order_book
 
+    def set_depth_index_levels(self, levels: int):
+        # The index covers the book only, the queries of the composite book go through its composite entries
+        raise NotImplementedError("The depth index is not supported by CompositeOrderBook.")
+
+    @property
+    def version(self) -> int:
+        return self._version + self._traded_order_book._version
+
+    def snapshot_arrays(self, depth: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same as OrderBook.snapshot_arrays, with the composite entries. The arrays are built on every call.
+        """
+        bids = [(row.price, row.amount) for row in islice(self.bid_entries(), depth or None)]
+        asks = [(row.price, row.amount) for row in islice(self.ask_entries(), depth or None)]
+        return np.array(bids, dtype=np.float64).reshape(-1, 2), np.array(asks, dtype=np.float64).reshape(-1, 2)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_diffs(self, bids, asks, update_id)
+        for bid in bids:
+            self.c_update_composite_entry(True, bid.getPrice())
+        for ask in asks:
+            self.c_update_composite_entry(False, ask.getPrice())
+        self.c_prune_composite_entries()
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+        self.c_rebuild_composite_book()
+
+    cdef c_prune_depth(self):
+        OrderBook.c_prune_depth(self)
+        self.c_prune_composite_entries()
+
+    cdef c_update_composite_entry(self, bint is_bid, double price):
+        """
+        Brings the composite level at the price up to date with the book and the traded amount at the price.
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._bid_book) if is_bid
+                                                else ref(self._traded_order_book._ask_book))
+            set[OrderBookEntry] *composite_book = (ref(self._composite_bid_book) if is_bid
+                                                   else ref(self._composite_ask_book))
+            OrderBookEntry key = OrderBookEntry(price, 0, 0)
+            set[OrderBookEntry].iterator order_it = deref(book).find(key)
+            set[OrderBookEntry].iterator traded_order_it = deref(traded_book).find(key)
+            OrderBookEntry original_order_entry
+            OrderBookEntry traded_order_entry
+            double composite_amount
+
+        deref(composite_book).erase(key)
+        if traded_order_it == deref(traded_book).end():
+            if order_it != deref(book).end():
+                deref(composite_book).insert(deref(order_it))
+            return
+
+        traded_order_entry = deref(traded_order_it)
+        # The level of the recorded filled order is gone, remove the recorded entry
+        if order_it == deref(book).end():
+            deref(traded_book).erase(traded_order_it)
+            self._traded_order_book._version += 1
+            return
+
+        original_order_entry = deref(order_it)
+        composite_amount = original_order_entry.getAmount() - traded_order_entry.getAmount()
+        if composite_amount > 0:
+            deref(composite_book).insert(OrderBookEntry(price, composite_amount, original_order_entry.getUpdateId()))
+        elif composite_amount < 0:
+            # The level is consumed, the recorded amount cannot be larger than the level
+            deref(traded_book).erase(traded_order_it)
+            deref(traded_book).insert(OrderBookEntry(price, original_order_entry.getAmount(),
+                                                     traded_order_entry.getUpdateId()))
+            self._traded_order_book._version += 1
+
+    cdef c_prune_composite_entries(self):
+        """
+        Removes the composite levels and the recorded entries better than the best levels of the book, left behind
+        when applying diffs truncates the overlapping levels of the book, or worse than its worst levels, left behind
+        when the depth cap prunes the book.
+        """
+        while (not self._composite_bid_book.empty() and
+               (self._bid_book.empty() or
+                deref(self._composite_bid_book.rbegin()).getPrice() > deref(self._bid_book.rbegin()).getPrice())):
+            self.c_update_composite_entry(True, deref(self._composite_bid_book.rbegin()).getPrice())
+        while (not self._traded_order_book._bid_book.empty() and
+               (self._bid_book.empty() or
+                deref(self._traded_order_book._bid_book.rbegin()).getPrice() >
+                deref(self._bid_book.rbegin()).getPrice())):
+            self.c_update_composite_entry(True, deref(self._traded_order_book._bid_book.rbegin()).getPrice())
+        while (not self._composite_ask_book.empty() and
+               (self._ask_book.empty() or
+                deref(self._composite_ask_book.begin()).getPrice() < deref(self._ask_book.begin()).getPrice())):
+            self.c_update_composite_entry(False, deref(self._composite_ask_book.begin()).getPrice())
+        while (not self._traded_order_book._ask_book.empty() and
+               (self._ask_book.empty() or
+                deref(self._traded_order_book._ask_book.begin()).getPrice() <
+                deref(self._ask_book.begin()).getPrice())):
+            self.c_update_composite_entry(False, deref(self._traded_order_book._ask_book.begin()).getPrice())
+        while (not self._composite_bid_book.empty() and
+               (self._bid_book.empty() or
+                deref(self._composite_bid_book.begin()).getPrice() < deref(self._bid_book.begin()).getPrice())):
+            self.c_update_composite_entry(True, deref(self._composite_bid_book.begin()).getPrice())
+        while (not self._traded_order_book._bid_book.empty() and
+               (self._bid_book.empty() or
+                deref(self._traded_order_book._bid_book.begin()).getPrice() <
+                deref(self._bid_book.begin()).getPrice())):
+            self.c_update_composite_entry(True, deref(self._traded_order_book._bid_book.begin()).getPrice())
+        while (not self._composite_ask_book.empty() and
+               (self._ask_book.empty() or
+                deref(self._composite_ask_book.rbegin()).getPrice() > deref(self._ask_book.rbegin()).getPrice())):
+            self.c_update_composite_entry(False, deref(self._composite_ask_book.rbegin()).getPrice())
+        while (not self._traded_order_book._ask_book.empty() and
+               (self._ask_book.empty() or
+                deref(self._traded_order_book._ask_book.rbegin()).getPrice() >
+                deref(self._ask_book.rbegin()).getPrice())):
+            self.c_update_composite_entry(False, deref(self._traded_order_book._ask_book.rbegin()).getPrice())
+
+    cdef c_rebuild_composite_book(self):
+        cdef:
+            vector[double] traded_bid_prices
+            vector[double] traded_ask_prices
+
+        self._composite_bid_book = self._bid_book
+        self._composite_ask_book = self._ask_book
+        # The updates remove recorded entries, the prices are collected first
+        for entry in self._traded_order_book._bid_book:
+            traded_bid_prices.push_back(entry.getPrice())
+        for entry in self._traded_order_book._ask_book:
+            traded_ask_prices.push_back(entry.getPrice())
+        for price in traded_bid_prices:
+            self.c_update_composite_entry(True, price)
+        for price in traded_ask_prices:
+            self.c_update_composite_entry(False, price)
+
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book._version += 1
+        self._composite_bid_book = self._bid_book
+        self._composite_ask_book = self._ask_book
 
     def record_filled_order(self, order_fill_event):
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            set[OrderBookEntry].reverse_iterator bid_order_it = self._traded_order_book._bid_book.rbegin()
-            set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry entry
+            set[OrderBookEntry] *traded_book
+            set[OrderBookEntry].iterator traded_order_it
+            OrderBookEntry key
+            bint is_bid
+
+        if order_fill_event.trade_type is TradeType.BUY:
+            is_bid = False
+        elif order_fill_event.trade_type is TradeType.SELL:
+            is_bid = True
+        else:
+            return
 
         price = order_fill_event.price
         amount = float(order_fill_event.amount)
         timestamp = order_fill_event.timestamp
-
-        if order_fill_event.trade_type is TradeType.BUY:
-            while ask_order_it != self._traded_order_book._ask_book.end():
-                entry = deref(ask_order_it)
-                # price is in the order book, sum the amount
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is outside of the ask price range, break and insert the new filled ask order into the ask book
-                elif entry.getPrice() > price:
-                    break
-                # price is further up the ask price range, continue searching
-                elif entry.getPrice() < price:
-                    inc(ask_order_it)
-            cpp_asks.push_back(OrderBookEntry(price, amount, timestamp))
-
-        elif order_fill_event.trade_type is TradeType.SELL:
-            while bid_order_it != self._traded_order_book._bid_book.rend():
-                entry = deref(bid_order_it)
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is further down the bid price range, continue searching
-                elif entry.getPrice() > price:
-                    inc(bid_order_it)
-                # price is outside of the bid price range, break and insert the new filled order into the bid book
-                elif entry.getPrice() < price:
-                    break
-            cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
-
-        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        traded_book = (ref(self._traded_order_book._bid_book) if is_bid
+                       else ref(self._traded_order_book._ask_book))
+        key = OrderBookEntry(price, 0, 0)
+
+        # price is in the traded order book, sum the amount
+        traded_order_it = deref(traded_book).find(key)
+        if traded_order_it != deref(traded_book).end():
+            amount += deref(traded_order_it).getAmount()
+            deref(traded_book).erase(traded_order_it)
+        deref(traded_book).insert(OrderBookEntry(price, amount, timestamp))
+        self._traded_order_book._version += 1
+        self.c_update_composite_entry(is_bid, price)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -80,115 +212,31 @@ cdef class CompositeOrderBook(OrderBook):
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+            set[OrderBookEntry].reverse_iterator it = self._composite_bid_book.rbegin()
+            OrderBookEntry entry
+        while it != self._composite_bid_book.rend():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+            set[OrderBookEntry].iterator it = self._composite_ask_book.begin()
+            OrderBookEntry entry
+        while it != self._composite_ask_book.end():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
         if deref(book).size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
-
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
-            else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+        if is_buy:
+            if self._composite_ask_book.empty():
+                raise EnvironmentError("Composite order book is empty - no price quote is possible.")
+            return deref(self._composite_ask_book.begin()).getPrice()
+        if self._composite_bid_book.empty():
+            raise EnvironmentError("Composite order book is empty - no price quote is possible.")
+        return deref(self._composite_bid_book.rbegin()).getPrice()
@@ -0,0 +1,179 @@
+import bisect
+import math
+import time
+from enum import Enum
+from typing import Dict, List, NamedTuple, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+
+# Keys of the order book message content holding the local times the message went through the pipeline, in seconds
+RECEIVED_AT_KEY = "received_at"
+ROUTED_AT_KEY = "routed_at"
+
+
+class MarketDataHop(Enum):
+    # From the exchange timestamp of the message to its reception by the data source, clock offset included
+    NETWORK = "network"
+    # From the reception to the routing of the message to the queue of its order book
+    ROUTE = "route"
+    # From the routing to the application of the message to the order book
+    APPLY = "apply"
+    # From the exchange timestamp to the application of the message
+    TOTAL = "total"
+
+
+class LatencyStats(NamedTuple):
+    count: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class RollingLatencyHistogram:
+    """
+    Histogram of the latencies recorded during the last `window` seconds, in buckets growing geometrically from 10
+    microseconds to 100 seconds. The window is made of `slots` histograms, the oldest one being cleared as the window
+    moves, so recording a latency costs a bisection and does not allocate.
+
+    The percentiles are the upper bounds of their buckets, capped by the maximum. Negative latencies, an exchange clock
+    ahead of the local one, count in the first bucket.
+    """
+    BUCKET_BOUNDS: List[float] = [1e-5 * 10 ** (i / 8) for i in range(57)]
+
+    def __init__(self, window: float = 60.0, slots: int = 6):
+        self._slot_duration = window / slots
+        self._counts: List[List[int]] = [[0] * (len(self.BUCKET_BOUNDS) + 1) for _ in range(slots)]
+        self._totals: List[int] = [0] * slots
+        self._sums: List[float] = [0.0] * slots
+        self._maxima: List[float] = [-math.inf] * slots
+        self._slot_numbers: List[int] = [-1] * slots
+
+    def add(self, latency: float, now: float):
+        index = self._slot(now)
+        self._counts[index][bisect.bisect_left(self.BUCKET_BOUNDS, latency)] += 1
+        self._totals[index] += 1
+        self._sums[index] += latency
+        if latency > self._maxima[index]:
+            self._maxima[index] = latency
+
+    def stats(self, now: float) -> Optional[LatencyStats]:
+        """
+        The statistics of the latencies of the window, None when there are none
+        """
+        current_slot_number = int(now // self._slot_duration)
+        live_slots = [index for index, slot_number in enumerate(self._slot_numbers)
+                      if current_slot_number - len(self._slot_numbers) < slot_number <= current_slot_number]
+        count = sum(self._totals[index] for index in live_slots)
+        if count == 0:
+            return None
+        counts = [sum(self._counts[index][bucket] for index in live_slots) for bucket in range(len(self._counts[0]))]
+        maximum = max(self._maxima[index] for index in live_slots)
+        return LatencyStats(
+            count=count,
+            mean=sum(self._sums[index] for index in live_slots) / count,
+            p50=self._percentile(counts, count, 0.5, maximum),
+            p90=self._percentile(counts, count, 0.9, maximum),
+            p99=self._percentile(counts, count, 0.99, maximum),
+            max=maximum,
+        )
+
+    def _slot(self, now: float) -> int:
+        slot_number = int(now // self._slot_duration)
+        index = slot_number % len(self._slot_numbers)
+        if self._slot_numbers[index] != slot_number:
+            counts = self._counts[index]
+            for bucket in range(len(counts)):
+                counts[bucket] = 0
+            self._totals[index] = 0
+            self._sums[index] = 0.0
+            self._maxima[index] = -math.inf
+            self._slot_numbers[index] = slot_number
+        return index
+
+    def _percentile(self, counts: List[int], count: int, fraction: float, maximum: float) -> float:
+        rank = math.ceil(count * fraction)
+        cumulated = 0
+        for bucket, bucket_count in enumerate(counts):
+            cumulated += bucket_count
+            if cumulated >= rank:
+                return min(self.BUCKET_BOUNDS[bucket], maximum) if bucket < len(self.BUCKET_BOUNDS) else maximum
+        return maximum
+
+
+class MarketDataLatencyTracker:
+    """
+    Rolling histograms, per trading pair, of the time the order book messages spend in each hop of the market data
+    pipeline (see MarketDataHop), from the times stamped in their content along the way.
+    """
+
+    def __init__(self, window: float = 60.0):
+        """
+        :param window: seconds of history the statistics are computed over
+        """
+        self._window = window
+        self._histograms: Dict[str, Dict[MarketDataHop, RollingLatencyHistogram]] = {}
+        self._last_applied_at: Dict[str, float] = {}
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    def record_applied(self, message: OrderBookMessage, applied_at: Optional[float] = None):
+        """
+        Records the latencies of a message applied to its order book.
+
+        :param message: the message, stamped with the RECEIVED_AT_KEY and ROUTED_AT_KEY times when known
+        :param applied_at: the time the message was applied, now by default
+        """
+        applied_at = time.time() if applied_at is None else applied_at
+        trading_pair = message.trading_pair
+        histograms = self._histograms.get(trading_pair)
+        if histograms is None:
+            histograms = self._histograms[trading_pair] = {
+                hop: RollingLatencyHistogram(self._window) for hop in MarketDataHop}
+        self._last_applied_at[trading_pair] = applied_at
+        content = message.content
+        exchange_time = message.timestamp
+        received_at = content.get(RECEIVED_AT_KEY)
+        routed_at = content.get(ROUTED_AT_KEY)
+        if exchange_time is not None:
+            histograms[MarketDataHop.TOTAL].add(applied_at - exchange_time, applied_at)
+            if received_at is not None:
+                histograms[MarketDataHop.NETWORK].add(received_at - exchange_time, applied_at)
+        if routed_at is not None:
+            histograms[MarketDataHop.APPLY].add(applied_at - routed_at, applied_at)
+            if received_at is not None:
+                histograms[MarketDataHop.ROUTE].add(routed_at - received_at, applied_at)
+
+    def last_applied_at(self, trading_pair: str) -> Optional[float]:
+        return self._last_applied_at.get(trading_pair)
+
+    def latency_stats(self, now: Optional[float] = None) -> Dict[str, Dict[MarketDataHop, Optional[LatencyStats]]]:
+        """
+        Per trading pair and hop, the statistics of the latencies of the window, None for a hop without any
+        """
+        now = time.time() if now is None else now
+        return {trading_pair: {hop: histogram.stats(now) for hop, histogram in histograms.items()}
+                for trading_pair, histograms in self._histograms.items()}
+
+    def format_status(self, now: Optional[float] = None) -> str:
+        """
+        A table of the p50/p99 milliseconds of each hop per trading pair, with the age of the last applied message
+        """
+        now = time.time() if now is None else now
+        if len(self._histograms) == 0:
+            return ""
+        lines = [f"  Market data latency, last {self._window:.0f}s (p50/p99 ms):",
+                 f"    {'Pair':<16}{'Msgs':>7}" + "".join(f"{hop.value.capitalize():>14}" for hop in MarketDataHop)
+                 + f"{'Age (s)':>9}"]
+        for trading_pair, hops_stats in sorted(self.latency_stats(now).items()):
+            total_stats = hops_stats[MarketDataHop.TOTAL] or hops_stats[MarketDataHop.APPLY]
+            cells = "".join(
+                f"{f'{stats.p50 * 1e3:.1f}/{stats.p99 * 1e3:.1f}' if stats is not None else '-':>14}"
+                for stats in hops_stats.values())
+            age = now - self._last_applied_at[trading_pair]
+            lines.append(f"    {trading_pair:<16}{total_stats.count if total_stats is not None else 0:>7}{cells}"
+                         f"{age:>9.1f}")
+        return "\n".join(lines)
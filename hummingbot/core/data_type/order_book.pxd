@@ -9,6 +9,27 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef class OrderBookDepthIndex:
+    cdef:
+        # Levels of one side from the best one: the sort key (price for asks, -price for bids), the price and the
+        # cumulative base and quote volumes up to and including the level
+        vector[double] _keys
+        vector[double] _prices
+        vector[double] _cumulative_base
+        vector[double] _cumulative_quote
+        size_t _levels
+        size_t _valid
+        bint _stale
+        bint _complete
+
+    cdef c_invalidate(self)
+    cdef c_invalidate_from(self, double key)
+    cdef c_truncate(self)
+    cdef c_append(self, double key, double price, double amount)
+    cdef Py_ssize_t c_position_for_cumulative(self, vector[double] &cumulative, double value)
+    cdef size_t c_levels_up_to(self, double key)
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,16 +41,36 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
+    cdef int64_t _version
+    cdef object _bid_snapshot_buffer
+    cdef object _ask_snapshot_buffer
+    cdef object _snapshot_arrays
+    cdef int64_t _snapshot_arrays_version
+    cdef Py_ssize_t _snapshot_arrays_depth
+    cdef size_t _change_notification_levels
+    cdef double _change_notification_tolerance
+    cdef vector[OrderBookEntry] _notified_bids
+    cdef vector[OrderBookEntry] _notified_asks
+    cdef size_t _depth_cap_levels
+    cdef size_t _depth_cap_margin
+    cdef bint _bid_depth_capped
+    cdef bint _ask_depth_capped
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_depth_update(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_notify_change(self)
+    cdef c_prune_depth(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef OrderBookDepthIndex c_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -21,12 +21,17 @@ from cython.operator cimport(
     postincrement as inc,
 )
 
+# libcpp.algorithm does not declare stable_sort
+cdef extern from "<algorithm>" namespace "std" nogil:
+    void std_stable_sort "std::stable_sort"[Iter](Iter first, Iter last)
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookChangeEvent,
     OrderBookEvent,
     OrderBookTradeEvent
 )
@@ -35,10 +40,189 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# Estimated bytes of a level in a std::set node, the price, amount and update ID with the tree links and allocator
+# overhead, and of a level of a depth index, its 4 doubles
+ORDER_BOOK_LEVEL_BYTES = 64
+DEPTH_INDEX_LEVEL_BYTES = 32
+
+
+cdef vector[OrderBookEntry] c_numpy_levels_to_entries(np.ndarray[np.float64_t, ndim=2] levels):
+    """
+    Converts an array of 3 columns, [price, amount, update_id], into order book entries, reading the array buffer
+    directly instead of going through a Python object per row.
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t index
+    entries.reserve(levels.shape[0])
+    for index in range(levels.shape[0]):
+        entries.push_back(OrderBookEntry(levels[index, 0], levels[index, 1], <int64_t>levels[index, 2]))
+    return entries
+
+
+cdef int64_t c_numpy_levels_last_update_id(np.ndarray[np.float64_t, ndim=2] levels):
+    cdef:
+        int64_t last_update_id = 0
+        Py_ssize_t index
+    for index in range(levels.shape[0]):
+        last_update_id = max(last_update_id, <int64_t>levels[index, 2])
+    return last_update_id
+
+
+cdef vector[OrderBookEntry] c_depth_update_diffs(set[OrderBookEntry] &book,
+                                                 vector[OrderBookEntry] &levels,
+                                                 int64_t update_id):
+    """
+    Computes the diffs turning one side of the book into the levels of a full depth payload. Levels that are new or
+    whose amount changed are kept as they are, levels of the book missing from the payload get a zero amount.
+    Both sides are walked in price order, so the cost is the sort of the payload plus a single merge pass.
+    """
+    cdef:
+        vector[OrderBookEntry] diffs
+        set[OrderBookEntry].iterator book_iterator = book.begin()
+        set[OrderBookEntry].iterator book_end = book.end()
+        size_t index = 0
+        size_t levels_count = levels.size()
+        double level_price
+        double book_price
+
+    # The sort is stable for the first occurrence of a price in the payload to come first
+    std_stable_sort(levels.begin(), levels.end())
+    while index < levels_count or book_iterator != book_end:
+        if book_iterator == book_end:
+            level_price = levels[index].getPrice()
+            diffs.push_back(levels[index])
+        elif index == levels_count or deref(book_iterator).getPrice() < levels[index].getPrice():
+            diffs.push_back(OrderBookEntry(deref(book_iterator).getPrice(), 0, update_id))
+            inc(book_iterator)
+            continue
+        else:
+            level_price = levels[index].getPrice()
+            book_price = deref(book_iterator).getPrice()
+            if level_price < book_price:
+                diffs.push_back(levels[index])
+            else:
+                if levels[index].getAmount() != deref(book_iterator).getAmount():
+                    diffs.push_back(levels[index])
+                inc(book_iterator)
+        # Only the first occurrence of a price in the payload is taken, as c_apply_snapshot does
+        index += 1
+        while index < levels_count and levels[index].getPrice() == level_price:
+            index += 1
+    return diffs
+
+
+cdef class OrderBookDepthIndex:
+    """
+    Cumulative base and quote volumes of the top levels of one side of an order book, so that the volume and VWAP
+    queries are answered by a binary search instead of a walk from the best level.
+
+    A diff only changes the cumulative volumes of its level and of the levels behind it: the index keeps the levels in
+    front of the changed ones and recomputes the others from the book when it is next queried.
+    """
+
+    def __init__(self, levels: int):
+        self._levels = levels
+        self._valid = 0
+        self._stale = True
+        self._complete = False
+
+    @property
+    def levels(self) -> int:
+        return self._levels
+
+    cdef c_invalidate(self):
+        self._valid = 0
+        self._stale = True
+
+    cdef c_invalidate_from(self, double key):
+        cdef:
+            size_t low = 0
+            size_t high = self._valid
+            size_t middle
+        while low < high:
+            middle = (low + high) // 2
+            if self._keys[middle] < key:
+                low = middle + 1
+            else:
+                high = middle
+        # Levels behind the indexed ones do not change the indexed volumes, but a complete index no longer covers the
+        # whole side once a level is added behind it
+        if low < self._levels:
+            self._valid = low
+            self._stale = True
+        else:
+            self._complete = False
+
+    cdef c_truncate(self):
+        self._keys.resize(self._valid)
+        self._prices.resize(self._valid)
+        self._cumulative_base.resize(self._valid)
+        self._cumulative_quote.resize(self._valid)
+
+    cdef c_append(self, double key, double price, double amount):
+        cdef:
+            size_t size = self._prices.size()
+            double previous_base = self._cumulative_base[size - 1] if size > 0 else 0
+            double previous_quote = self._cumulative_quote[size - 1] if size > 0 else 0
+        self._keys.push_back(key)
+        self._prices.push_back(price)
+        self._cumulative_base.push_back(previous_base + amount)
+        self._cumulative_quote.push_back(previous_quote + amount * price)
+
+    cdef Py_ssize_t c_position_for_cumulative(self, vector[double] &cumulative, double value):
+        """
+        Position of the first level whose cumulative volume reaches the value, -1 if no indexed level does.
+        """
+        cdef:
+            size_t low = 0
+            size_t high = cumulative.size()
+            size_t middle
+        while low < high:
+            middle = (low + high) // 2
+            if cumulative[middle] < value:
+                low = middle + 1
+            else:
+                high = middle
+        if low < cumulative.size() and cumulative[low] >= value:
+            return low
+        return -1
+
+    cdef size_t c_levels_up_to(self, double key):
+        """
+        Number of indexed levels whose key is lower than or equal to the key.
+        """
+        cdef:
+            size_t low = 0
+            size_t high = self._keys.size()
+            size_t middle
+        while low < high:
+            middle = (low + high) // 2
+            if self._keys[middle] <= key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+cdef bint c_levels_changed(vector[OrderBookEntry] &notified, vector[OrderBookEntry] &current, double tolerance):
+    """
+    Whether a level appeared or disappeared, or moved its price or its amount by more than the tolerance, a fraction of
+    the notified price or amount.
+    """
+    cdef size_t index
+    if notified.size() != current.size():
+        return True
+    for index in range(current.size()):
+        if (abs(current[index].getPrice() - notified[index].getPrice()) > tolerance * notified[index].getPrice() or
+                abs(current[index].getAmount() - notified[index].getAmount()) > tolerance * notified[index].getAmount()):
+            return True
+    return False
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_CHANGE_EVENT_TAG = OrderBookEvent.ChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -56,6 +240,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._version = 0
+        self._snapshot_arrays_version = -1
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,15 +252,21 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
+            if self._bid_depth_index is not None:
+                self._bid_depth_index.c_invalidate_from(-bid.getPrice())
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
         for ask in asks:
+            if self._ask_depth_index is not None:
+                self._ask_depth_index.c_invalidate_from(ask.getPrice())
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
@@ -82,7 +274,15 @@ cdef class OrderBook(PubSub):
                 self._ask_book.insert(ask)
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        # The truncated entries are the best levels of their side
+        if self._bid_depth_index is not None and self._bid_book.size() != bid_book_size:
+            self._bid_depth_index.c_invalidate()
+        if self._ask_depth_index is not None and self._ask_book.size() != ask_book_size:
+            self._ask_depth_index.c_invalidate()
+        self.c_prune_depth()
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -96,6 +296,10 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        if bids.size() > 0 or asks.size() > 0:
+            self._version += 1
+            if self._change_notification_levels > 0:
+                self.c_notify_change()
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -109,6 +313,10 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._bid_depth_capped = self._ask_depth_capped = False
+        if self._bid_depth_index is not None:
+            self._bid_depth_index.c_invalidate()
+            self._ask_depth_index.c_invalidate()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -129,6 +337,7 @@ cdef class OrderBook(PubSub):
             if ask_iterator != self._ask_book.end():
                 top_ask = deref(ask_iterator)
                 best_ask_price = top_ask.getPrice()
+        self.c_prune_depth()
 
         # Record the current best prices, for faster c_get_price() calls.
         self._best_bid = best_bid_price
@@ -136,12 +345,160 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+        if self._change_notification_levels > 0:
+            self.c_notify_change()
+
+    cdef c_apply_depth_update(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] bid_diffs = c_depth_update_diffs(self._bid_book, bids, update_id)
+            vector[OrderBookEntry] ask_diffs = c_depth_update_diffs(self._ask_book, asks, update_id)
+
+        # The payload is the full depth the exchange publishes, as a snapshot. The levels it has beyond the depth cap
+        # are pruned again by c_apply_diffs.
+        self._bid_depth_capped = self._ask_depth_capped = False
+        self.c_apply_diffs(bid_diffs, ask_diffs, update_id)
+
+        # c_apply_diffs keeps the previous best prices when a side is emptied, a snapshot resets them.
+        if self._bid_book.empty():
+            self._best_bid = NaN
+        if self._ask_book.empty():
+            self._best_ask = NaN
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_notify_change(self):
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+
+        while bid_iterator != self._bid_book.rend() and bids.size() < self._change_notification_levels:
+            bids.push_back(deref(bid_iterator))
+            inc(bid_iterator)
+        while ask_iterator != self._ask_book.end() and asks.size() < self._change_notification_levels:
+            asks.push_back(deref(ask_iterator))
+            inc(ask_iterator)
+
+        # The levels are compared with the last notified ones, not the previous ones, for changes smaller than the
+        # tolerance not to add up unnoticed
+        if (c_levels_changed(self._notified_bids, bids, self._change_notification_tolerance) or
+                c_levels_changed(self._notified_asks, asks, self._change_notification_tolerance)):
+            self._notified_bids = bids
+            self._notified_asks = asks
+            self.c_trigger_event(self.ORDER_BOOK_CHANGE_EVENT_TAG,
+                                 OrderBookChangeEvent(version=self._version,
+                                                      best_bid=bids[0].getPrice() if bids.size() > 0 else NaN,
+                                                      best_ask=asks[0].getPrice() if asks.size() > 0 else NaN))
+
+    cdef c_prune_depth(self):
+        """
+        Removes the levels behind the capped depth of each side, remembering the sides whose levels are no longer all
+        known.
+        """
+        cdef:
+            size_t kept_levels = self._depth_cap_levels + self._depth_cap_margin
+            size_t pruned_levels
+            set[OrderBookEntry].iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
+            double best_pruned_price = NaN
+
+        if self._depth_cap_levels == 0:
+            return
+        if self._bid_book.size() > kept_levels:
+            # The bids are sorted by increasing price, the worst ones come first
+            bid_iterator = self._bid_book.begin()
+            for pruned_levels in range(self._bid_book.size() - kept_levels):
+                best_pruned_price = deref(bid_iterator).getPrice()
+                inc(bid_iterator)
+            self._bid_book.erase(self._bid_book.begin(), bid_iterator)
+            self._bid_depth_capped = True
+            if self._bid_depth_index is not None:
+                self._bid_depth_index.c_invalidate_from(-best_pruned_price)
+        if self._ask_book.size() > kept_levels:
+            ask_iterator = self._ask_book.begin()
+            for pruned_levels in range(kept_levels):
+                inc(ask_iterator)
+            best_pruned_price = deref(ask_iterator).getPrice()
+            self._ask_book.erase(ask_iterator, self._ask_book.end())
+            self._ask_depth_capped = True
+            if self._ask_depth_index is not None:
+                self._ask_depth_index.c_invalidate_from(best_pruned_price)
+
+    @property
+    def change_notification_levels(self) -> int:
+        return self._change_notification_levels
+
+    @property
+    def change_notification_tolerance(self) -> float:
+        return self._change_notification_tolerance
+
+    def set_change_notification(self, levels: int, tolerance: float = 0):
+        """
+        Makes the book trigger an OrderBookEvent.ChangeEvent when its best levels change: a level of the levels compared
+        appears or disappears, or its price or amount moves by more than the tolerance since the last notification.
+
+        :param levels: number of levels compared per side, 1 for the top of the book, 0 to stop the notifications
+        :param tolerance: fraction of the price or the amount of a level it has to move by to be notified, 0 to notify
+        every change
+        """
+        if levels < 0 or tolerance < 0:
+            raise ValueError(f"Invalid change notification settings: {levels} levels, {tolerance} tolerance.")
+        self._change_notification_levels = levels
+        self._change_notification_tolerance = tolerance
+        self._notified_bids.clear()
+        self._notified_asks.clear()
+
+    @property
+    def depth_cap_levels(self) -> int:
+        return self._depth_cap_levels
+
+    @property
+    def depth_cap_margin(self) -> int:
+        return self._depth_cap_margin
+
+    def set_depth_cap(self, levels: int, margin: int = 0):
+        """
+        Keeps only the best levels + margin levels of each side, the levels behind them being pruned whenever diffs or
+        a snapshot are applied. The margin levels replace the visible levels removed by later diffs, until the book has
+        fewer than the visible levels left on a pruned side: the book is then thinned (see depth_thinned) and needs a
+        new snapshot.
+
+        :param levels: number of visible levels per side, 0 to keep every level
+        :param margin: number of levels kept per side behind the visible ones
+        """
+        if levels < 0 or margin < 0:
+            raise ValueError(f"Invalid depth cap: {levels} levels, {margin} margin.")
+        self._depth_cap_levels = levels
+        self._depth_cap_margin = margin
+        self.c_prune_depth()
+
+    @property
+    def depth_thinned(self) -> bool:
+        """
+        Whether a side whose levels were pruned by the depth cap has fewer than the visible levels left, the levels
+        behind them being unknown until the next snapshot.
+        """
+        return ((self._bid_depth_capped and self._bid_book.size() < self._depth_cap_levels) or
+                (self._ask_depth_capped and self._ask_book.size() < self._depth_cap_levels))
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Estimated bytes used by the levels of the book, its depth index and its snapshot buffers.
+        """
+        cdef size_t memory = (self._bid_book.size() + self._ask_book.size()) * ORDER_BOOK_LEVEL_BYTES
+        if self._bid_depth_index is not None:
+            memory += 2 * self._bid_depth_index.levels * DEPTH_INDEX_LEVEL_BYTES
+        for buffer in (self._bid_snapshot_buffer, self._ask_snapshot_buffer):
+            if buffer is not None:
+                memory += buffer.nbytes
+        return memory
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -170,6 +527,79 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def depth_index_levels(self) -> int:
+        return self._bid_depth_index.levels if self._bid_depth_index is not None else 0
+
+    def set_depth_index_levels(self, levels: int):
+        """
+        Indexes the cumulative volumes of the top levels of each side, answering get_price_for_volume,
+        get_vwap_for_volume, get_price_for_quote_volume, get_quote_volume_for_base_amount, get_volume_for_price and
+        get_quote_volume_for_price by a binary search. Queries going beyond the indexed levels walk the book as
+        without the index.
+
+        :param levels: number of levels indexed per side, 0 removes the index
+        """
+        if levels > 0:
+            self._bid_depth_index = OrderBookDepthIndex(levels)
+            self._ask_depth_index = OrderBookDepthIndex(levels)
+        else:
+            self._bid_depth_index = None
+            self._ask_depth_index = None
+
+    @property
+    def version(self) -> int:
+        """
+        Counter increased every time diffs or a snapshot are applied to the book, telling the callers of snapshot and
+        snapshot_arrays whether the levels may have changed since their previous call.
+        """
+        return self._version
+
+    def snapshot_arrays(self, depth: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The bid and ask levels, best first, as arrays of 2 columns, [price, amount], filled from the book without
+        building a row object per level.
+
+        The arrays are views of buffers owned by the order book: they are returned again as long as the version is
+        unchanged, and overwritten by the first call after the book changed. Copy them to keep them longer.
+
+        :param depth: maximum number of levels per side, 0 for all of them
+        """
+        cdef:
+            Py_ssize_t bids_count = self._bid_book.size()
+            Py_ssize_t asks_count = self._ask_book.size()
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            double[:, :] bids_view
+            double[:, :] asks_view
+            Py_ssize_t index
+
+        if self._snapshot_arrays_version == self._version and self._snapshot_arrays_depth == depth:
+            return self._snapshot_arrays
+        if depth > 0:
+            bids_count = min(bids_count, depth)
+            asks_count = min(asks_count, depth)
+        if self._bid_snapshot_buffer is None or self._bid_snapshot_buffer.shape[0] < bids_count:
+            self._bid_snapshot_buffer = np.empty((bids_count, 2), dtype=np.float64)
+        if self._ask_snapshot_buffer is None or self._ask_snapshot_buffer.shape[0] < asks_count:
+            self._ask_snapshot_buffer = np.empty((asks_count, 2), dtype=np.float64)
+
+        bids_view = self._bid_snapshot_buffer
+        asks_view = self._ask_snapshot_buffer
+        for index in range(bids_count):
+            bids_view[index, 0] = deref(bid_iterator).getPrice()
+            bids_view[index, 1] = deref(bid_iterator).getAmount()
+            inc(bid_iterator)
+        for index in range(asks_count):
+            asks_view[index, 0] = deref(ask_iterator).getPrice()
+            asks_view[index, 1] = deref(ask_iterator).getAmount()
+            inc(ask_iterator)
+
+        self._snapshot_arrays = (self._bid_snapshot_buffer[:bids_count], self._ask_snapshot_buffer[:asks_count])
+        self._snapshot_arrays_version = self._version
+        self._snapshot_arrays_depth = depth
+        return self._snapshot_arrays
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         bids_rows = list(self.bid_entries())
@@ -198,6 +628,33 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_depth_update(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
+        """
+        Applies a full depth payload (every level the exchange publishes, as a snapshot does) as the level-wise delta
+        against the current book. Only the levels that changed are written to the book, instead of rebuilding it.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        for row in bids:
+            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        for row in asks:
+            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        self.c_apply_depth_update(cpp_bids, cpp_asks, update_id)
+
+    def apply_numpy_depth_update(self,
+                                 np.ndarray[np.float64_t, ndim=2] bids_array,
+                                 np.ndarray[np.float64_t, ndim=2] asks_array,
+                                 int64_t update_id):
+        """
+        Same as apply_depth_update, with the levels of each side given as an array of 3 columns,
+        [price, amount, update_id]. All columns are of double type.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids = c_numpy_levels_to_entries(bids_array)
+            vector[OrderBookEntry] cpp_asks = c_numpy_levels_to_entries(asks_array)
+        self.c_apply_depth_update(cpp_bids, cpp_asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -224,16 +681,11 @@ cdef class OrderBook(PubSub):
         All columns are of double type.
         """
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            vector[OrderBookEntry] cpp_bids = c_numpy_levels_to_entries(bids_array)
+            vector[OrderBookEntry] cpp_asks = c_numpy_levels_to_entries(asks_array)
+            int64_t last_update_id = max(c_numpy_levels_last_update_id(bids_array),
+                                         c_numpy_levels_last_update_id(asks_array))
+
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -251,16 +703,11 @@ cdef class OrderBook(PubSub):
         All columns are of double type.
         """
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            vector[OrderBookEntry] cpp_bids = c_numpy_levels_to_entries(bids_array)
+            vector[OrderBookEntry] cpp_asks = c_numpy_levels_to_entries(asks_array)
+            int64_t last_update_id = max(c_numpy_levels_last_update_id(bids_array),
+                                         c_numpy_levels_last_update_id(asks_array))
+
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -309,6 +756,42 @@ cdef class OrderBook(PubSub):
                 break
         return retval
 
+    cdef OrderBookDepthIndex c_depth_index(self, bint is_buy):
+        """
+        The depth index of the asks (is_buy) or of the bids, brought up to date with the book. None without index.
+        """
+        cdef:
+            OrderBookDepthIndex index = self._ask_depth_index if is_buy else self._bid_depth_index
+            set[OrderBookEntry].iterator ask_iterator
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            size_t skipped = 0
+        if index is None or not index._stale:
+            return index
+        index.c_truncate()
+        if is_buy:
+            ask_iterator = self._ask_book.begin()
+            while skipped < index._valid and ask_iterator != self._ask_book.end():
+                inc(ask_iterator)
+                skipped += 1
+            while index._keys.size() < index._levels and ask_iterator != self._ask_book.end():
+                index.c_append(deref(ask_iterator).getPrice(), deref(ask_iterator).getPrice(),
+                               deref(ask_iterator).getAmount())
+                inc(ask_iterator)
+            index._complete = ask_iterator == self._ask_book.end()
+        else:
+            bid_iterator = self._bid_book.rbegin()
+            while skipped < index._valid and bid_iterator != self._bid_book.rend():
+                inc(bid_iterator)
+                skipped += 1
+            while index._keys.size() < index._levels and bid_iterator != self._bid_book.rend():
+                index.c_append(-deref(bid_iterator).getPrice(), deref(bid_iterator).getPrice(),
+                               deref(bid_iterator).getAmount())
+                inc(bid_iterator)
+            index._complete = bid_iterator == self._bid_book.rend()
+        index._valid = index._keys.size()
+        index._stale = False
+        return index
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -323,6 +806,17 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookDepthIndex index = self.c_depth_index(is_buy)
+            Py_ssize_t position
+
+        if index is not None:
+            position = index.c_position_for_cumulative(index._cumulative_base, volume)
+            if position >= 0:
+                return OrderBookQueryResult(NaN, volume, index._prices[position],
+                                            min(index._cumulative_base[position], volume))
+            if index._complete:
+                cumulative_volume = index._cumulative_base.back() if index._valid > 0 else 0
+                return OrderBookQueryResult(NaN, volume, NaN, min(cumulative_volume, volume))
 
         if is_buy:
             for order_book_row in self.ask_entries():
@@ -344,6 +838,24 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+            OrderBookDepthIndex index = self.c_depth_index(is_buy)
+            Py_ssize_t position
+            double incremental_amount
+
+        if index is not None:
+            position = index.c_position_for_cumulative(index._cumulative_base, volume)
+            if position >= 0:
+                if position > 0:
+                    total_cost = index._cumulative_quote[position - 1]
+                    total_volume = index._cumulative_base[position - 1]
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * index._prices[position]
+                total_volume += incremental_amount
+                return OrderBookQueryResult(NaN, volume, total_cost / total_volume, min(total_volume, volume))
+            if index._complete:
+                total_volume = index._cumulative_base.back() if index._valid > 0 else 0
+                return OrderBookQueryResult(NaN, volume, NaN, min(total_volume, volume))
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
@@ -375,6 +887,17 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookDepthIndex index = self.c_depth_index(is_buy)
+            Py_ssize_t position
+
+        if index is not None:
+            position = index.c_position_for_cumulative(index._cumulative_quote, quote_volume)
+            if position >= 0:
+                return OrderBookQueryResult(NaN, quote_volume, index._prices[position],
+                                            min(index._cumulative_quote[position], quote_volume))
+            if index._complete:
+                cumulative_volume = index._cumulative_quote.back() if index._valid > 0 else 0
+                return OrderBookQueryResult(NaN, quote_volume, NaN, min(cumulative_volume, quote_volume))
 
         if is_buy:
             for order_book_row in self.ask_entries():
@@ -396,6 +919,20 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
+            OrderBookDepthIndex index = self.c_depth_index(is_buy)
+            Py_ssize_t position
+
+        if index is not None:
+            position = index.c_position_for_cumulative(index._cumulative_base, base_amount)
+            if position >= 0:
+                if position > 0:
+                    cumulative_volume = index._cumulative_quote[position - 1]
+                    cumulative_base_amount = index._cumulative_base[position - 1]
+                cumulative_volume += (base_amount - cumulative_base_amount) * index._prices[position]
+                return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+            if index._complete:
+                cumulative_volume = index._cumulative_quote.back() if index._valid > 0 else 0
+                return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
         if is_buy:
             for order_book_row in self.ask_entries():
@@ -422,6 +959,16 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookDepthIndex index = self.c_depth_index(is_buy)
+            size_t levels
+
+        if index is not None and price == price:
+            levels = index.c_levels_up_to(price if is_buy else -price)
+            if levels < index._valid or index._complete:
+                if levels > 0:
+                    result_price = index._prices[levels - 1]
+                    cumulative_volume = index._cumulative_base[levels - 1]
+                return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
         if is_buy:
             for order_book_row in self.ask_entries():
@@ -442,6 +989,16 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookDepthIndex index = self.c_depth_index(is_buy)
+            size_t levels
+
+        if index is not None and price == price:
+            levels = index.c_levels_up_to(price if is_buy else -price)
+            if levels < index._valid or index._complete:
+                if levels > 0:
+                    result_price = index._prices[levels - 1]
+                    cumulative_volume = index._cumulative_quote[levels - 1]
+                return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
         if is_buy:
             for order_book_row in self.ask_entries():
@@ -3,6 +3,8 @@ from enum import Enum
 from functools import total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -64,6 +66,14 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def has_numpy_levels(self) -> bool:
+        """
+        True when the bids and asks of the content are float64 arrays of 3 columns, [price, amount, update_id], that
+        can be applied to an order book without building an OrderBookRow per level.
+        """
+        return isinstance(self.content.get("bids"), np.ndarray)
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
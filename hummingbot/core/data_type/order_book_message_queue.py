@@ -0,0 +1,146 @@
+import asyncio
+from collections import defaultdict, deque
+from typing import Any, Dict, List, NamedTuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class OrderBookMessageQueueStats(NamedTuple):
+    depth: int
+    dropped: int
+    merged: int
+
+
+class CoalescingOrderBookMessageQueue(asyncio.Queue):
+    """
+    Queue of order book messages that keeps its backlog short when the consumer falls behind, instead of replaying
+    every message received meanwhile:
+    - a snapshot drops the pending snapshots and diffs of its trading pair it supersedes, i.e. whose update id is not
+      greater than its own
+    - a diff is merged level-wise with the pending diff of its trading pair, when that diff is the last pending message
+      of the pair, the newest amount of every price level winning
+
+    Only plain OrderBookMessage diffs are merged, the subclasses parsing their own content are queued as they are.
+    The order of the messages of a trading pair is preserved.
+    """
+
+    def _init(self, maxsize: int):
+        super()._init(maxsize)
+        self._depths: Dict[str, int] = defaultdict(int)
+        self._dropped: Dict[str, int] = defaultdict(int)
+        self._merged: Dict[str, int] = defaultdict(int)
+
+    def _put(self, message: OrderBookMessage):
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            self._drop_superseded_messages(message)
+        elif message.type is OrderBookMessageType.DIFF:
+            message = self._merge_with_pending_diff(message)
+        self._queue.append(message)
+        self._depths[message.trading_pair] += 1
+
+    def _get(self) -> OrderBookMessage:
+        message = self._queue.popleft()
+        self._depths[message.trading_pair] -= 1
+        return message
+
+    def stats(self, trading_pair: str) -> OrderBookMessageQueueStats:
+        """
+        The number of messages of the trading pair waiting in the queue, and dropped and merged since its creation
+        """
+        return OrderBookMessageQueueStats(depth=self._depths.get(trading_pair, 0),
+                                          dropped=self._dropped.get(trading_pair, 0),
+                                          merged=self._merged.get(trading_pair, 0))
+
+    def _drop_superseded_messages(self, snapshot: OrderBookMessage):
+        trading_pair = snapshot.trading_pair
+        if self._depths.get(trading_pair, 0) == 0:
+            return
+        kept = deque()
+        dropped = 0
+        for pending in self._queue:
+            if pending.trading_pair == trading_pair and pending.update_id <= snapshot.update_id:
+                dropped += 1
+            else:
+                kept.append(pending)
+        if dropped > 0:
+            self._queue = kept
+            self._remove_pending(trading_pair, dropped)
+            self._dropped[trading_pair] += dropped
+
+    def _merge_with_pending_diff(self, diff: OrderBookMessage) -> OrderBookMessage:
+        trading_pair = diff.trading_pair
+        if self._depths.get(trading_pair, 0) == 0 or type(diff) is not OrderBookMessage:
+            return diff
+        index, pending = self._last_pending_message(trading_pair)
+        if (pending is None or type(pending) is not OrderBookMessage or pending.type is not OrderBookMessageType.DIFF
+                or pending.has_numpy_levels != diff.has_numpy_levels):
+            return diff
+        # The merged diff takes the place of the new one, after the messages of the other trading pairs queued meanwhile
+        del self._queue[index]
+        self._remove_pending(trading_pair, 1)
+        self._merged[trading_pair] += 1
+        content = dict(diff.content)
+        content["bids"] = merge_diff_levels(pending.content["bids"], diff.content["bids"])
+        content["asks"] = merge_diff_levels(pending.content["asks"], diff.content["asks"])
+        content["first_update_id"] = pending.first_update_id
+        return OrderBookMessage(OrderBookMessageType.DIFF, content, diff.timestamp)
+
+    def _last_pending_message(self, trading_pair: str):
+        for index in range(len(self._queue) - 1, -1, -1):
+            if self._queue[index].trading_pair == trading_pair:
+                return index, self._queue[index]
+        return None, None
+
+    def _remove_pending(self, trading_pair: str, count: int):
+        self._depths[trading_pair] -= count
+        # The removed messages will never be got, they are done for the callers joining the queue
+        for _ in range(count):
+            self.task_done()
+
+
+def merge_diff_levels(older: Any, newer: Any) -> Any:
+    """
+    Merges the levels of two consecutive diffs of a side of an order book, keeping the newest amount of every price.
+
+    :param older: the levels of the older diff, an array of [price, amount, update_id] rows or a list of levels
+    :param newer: the levels of the newer diff, in the same format as the older ones
+    """
+    if isinstance(newer, np.ndarray):
+        levels: np.ndarray = np.concatenate((older, newer))[::-1]
+        _, newest = np.unique(levels[:, 0], return_index=True)
+        return levels[newest]
+    merged: Dict[float, Any] = {float(level[0]): level for level in older}
+    merged.update((float(level[0]), level) for level in newer)
+    return list(merged.values())
+
+
+def trim_diff_levels(levels: Any, is_bid: bool, depth: int) -> Any:
+    """
+    Removes the levels of a side of a diff that can not be among the first `depth` levels of the order book once the
+    diff is applied, i.e. the levels worse than the `depth` best levels the diff sets. The order of the kept levels is
+    preserved.
+
+    :param levels: the levels of the diff, an array of [price, amount, update_id] rows or a list of levels
+    :param is_bid: True for the bid levels
+    :param depth: the number of levels of the order book
+    """
+    if len(levels) <= depth:
+        return levels
+    if isinstance(levels, np.ndarray):
+        prices: np.ndarray = levels[levels[:, 1] > 0, 0]
+        if len(prices) <= depth:
+            return levels
+        if is_bid:
+            cutoff = np.partition(prices, len(prices) - depth)[len(prices) - depth]
+            return levels[levels[:, 0] >= cutoff]
+        cutoff = np.partition(prices, depth - 1)[depth - 1]
+        return levels[levels[:, 0] <= cutoff]
+    set_prices: List[float] = sorted((float(level[0]) for level in levels if float(level[1]) > 0), reverse=is_bid)
+    if len(set_prices) <= depth:
+        return levels
+    cutoff = set_prices[depth - 1]
+    if is_bid:
+        return [level for level in levels if float(level[0]) >= cutoff]
+    return [level for level in levels if float(level[0]) <= cutoff]
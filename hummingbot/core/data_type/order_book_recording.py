@@ -0,0 +1,355 @@
+import asyncio
+import logging
+import math
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import CoalescingOrderBookMessageQueue
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+RECORDING_FILE_EXTENSION = ".obrec"
+RECORDING_MAGIC = b"HBOB"
+RECORDING_VERSION = 1
+# magic, version, length of the trading pair that follows
+FILE_HEADER = struct.Struct("<4sHH")
+# message type, flags, recording time, message timestamp, update id, first update id, bid levels, ask levels,
+# length of the trade id that follows the levels
+RECORD_HEADER = struct.Struct("<BBddqqIIH")
+LEVEL_COLUMNS = 3
+LEVEL_SIZE = LEVEL_COLUMNS * 8
+
+# The message is the order book the tracker started from, not a message of the data source
+FLAG_INITIAL_ORDER_BOOK = 1
+# The trade id was an integer
+FLAG_INTEGER_TRADE_ID = 2
+
+
+class OrderBookRecord(NamedTuple):
+    recorded_at: float
+    message: OrderBookMessage
+    is_initial_order_book: bool
+
+
+def recording_file_path(directory: str, trading_pair: str) -> str:
+    return os.path.join(directory, f"{trading_pair}{RECORDING_FILE_EXTENSION}")
+
+
+def write_file_header(file, trading_pair: str):
+    encoded_trading_pair = trading_pair.encode("utf-8")
+    file.write(FILE_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, len(encoded_trading_pair)))
+    file.write(encoded_trading_pair)
+
+
+def encode_record(message: OrderBookMessage, recorded_at: float, flags: int = 0) -> bytes:
+    """
+    Encodes an order book message as a record of a recording file. The levels are stored as float64 rows of
+    [price, amount, update_id] and a trade as a single row of [price, amount, trade_type]; the content keys other than
+    the ones OrderBookTracker reads are not kept.
+    """
+    content = message.content
+    trade_id = b""
+    if message.type is OrderBookMessageType.TRADE:
+        bids = np.array([[content["price"], content["amount"], content["trade_type"]]], dtype=np.float64)
+        asks = np.empty((0, LEVEL_COLUMNS), dtype=np.float64)
+        if isinstance(message.trade_id, int):
+            flags |= FLAG_INTEGER_TRADE_ID
+        trade_id = str(message.trade_id).encode("utf-8")
+        update_id = first_update_id = -1
+    else:
+        update_id = message.update_id
+        first_update_id = message.first_update_id if message.type is OrderBookMessageType.DIFF else update_id
+        bids = _levels_array(content["bids"], update_id)
+        asks = _levels_array(content["asks"], update_id)
+    timestamp = message.timestamp if message.timestamp is not None else math.nan
+    header = RECORD_HEADER.pack(message.type.value, flags, recorded_at, timestamp, update_id, first_update_id,
+                                len(bids), len(asks), len(trade_id))
+    return b"".join((header, bids.tobytes(), asks.tobytes(), trade_id))
+
+
+def _levels_array(levels, update_id: int) -> np.ndarray:
+    if isinstance(levels, np.ndarray):
+        return np.ascontiguousarray(levels, dtype=np.float64)
+    levels_array = np.empty((len(levels), LEVEL_COLUMNS), dtype=np.float64)
+    for index, level in enumerate(levels):
+        levels_array[index, 0] = float(level[0])
+        levels_array[index, 1] = float(level[1])
+        levels_array[index, 2] = float(level[2]) if len(level) > 2 else update_id
+    return levels_array
+
+
+class OrderBookRecorder:
+    """
+    Records the order book messages of a tracker in an append-only binary file per trading pair, to replay them later
+    (see OrderBookRecordingReader and ReplayOrderBookTrackerDataSource).
+
+    record() only queues the message with its recording time, the messages are encoded and written by a thread.
+    stop() does not wait for the thread to write the remaining messages, wait_stopped() does.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, directory: str, flush_interval: float = 1.0):
+        """
+        :param directory: the directory of the recording files, created if missing
+        :param flush_interval: maximum seconds a written message stays in the file buffers
+        """
+        self._directory = directory
+        self._flush_interval = flush_interval
+        self._messages: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stopping_writer_thread: Optional[threading.Thread] = None
+        self._files = {}
+        self._recorded_messages: Dict[str, int] = {}
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def recorded_messages(self) -> Dict[str, int]:
+        """
+        Number of messages written per trading pair
+        """
+        return dict(self._recorded_messages)
+
+    @property
+    def is_recording(self) -> bool:
+        return self._writer_thread is not None
+
+    def file_path(self, trading_pair: str) -> str:
+        return recording_file_path(self._directory, trading_pair)
+
+    def start(self):
+        if self._writer_thread is not None:
+            return
+        os.makedirs(self._directory, exist_ok=True)
+        self._writer_thread = threading.Thread(target=self._write_messages,
+                                               args=(self._stopping_writer_thread,),
+                                               name="OrderBookRecorder",
+                                               daemon=True)
+        self._writer_thread.start()
+
+    def stop(self):
+        """
+        Signals the writer thread to write the messages recorded so far and close the files, without blocking
+        """
+        if self._writer_thread is None:
+            return
+        self._messages.put(None)
+        self._stopping_writer_thread = self._writer_thread
+        self._writer_thread = None
+
+    async def wait_stopped(self):
+        """
+        Waits, off the event loop, until the writer thread of the last stop has closed the files
+        """
+        if self._stopping_writer_thread is not None:
+            await asyncio.get_event_loop().run_in_executor(None, self._stopping_writer_thread.join)
+
+    def record(self, message: OrderBookMessage, flags: int = 0):
+        if self._writer_thread is not None:
+            self._messages.put((time.time(), message, flags))
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook):
+        """
+        Records the levels of an order book as the snapshot the replay starts the order book from
+        """
+        update_id = order_book.snapshot_uid
+        bids, asks = order_book.snapshot_arrays()
+        message = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": self._with_update_id_column(bids, update_id),
+            "asks": self._with_update_id_column(asks, update_id),
+        }, time.time())
+        self.record(message, FLAG_INITIAL_ORDER_BOOK)
+
+    @staticmethod
+    def _with_update_id_column(levels: np.ndarray, update_id: int) -> np.ndarray:
+        # The snapshot arrays are buffers of the order book, the copy is the one queued
+        levels_array = np.empty((len(levels), LEVEL_COLUMNS), dtype=np.float64)
+        levels_array[:, :2] = levels
+        levels_array[:, 2] = update_id
+        return levels_array
+
+    def _write_messages(self, stopping_writer_thread: Optional[threading.Thread]):
+        # The files are appended to once the thread of the previous recording has closed them
+        if stopping_writer_thread is not None:
+            stopping_writer_thread.join()
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item: Optional[Tuple[float, OrderBookMessage, int]] = self._messages.get(timeout=self._flush_interval)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                break
+            if item:
+                recorded_at, message, flags = item
+                try:
+                    self._file(message.trading_pair).write(encode_record(message, recorded_at, flags))
+                    self._recorded_messages[message.trading_pair] = (
+                        self._recorded_messages.get(message.trading_pair, 0) + 1)
+                except Exception:
+                    self.logger().error(f"Error recording order book message {message}.", exc_info=True)
+            if time.monotonic() - last_flush >= self._flush_interval:
+                self._flush_files()
+                last_flush = time.monotonic()
+        self._flush_files()
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+
+    def _file(self, trading_pair: str):
+        file = self._files.get(trading_pair)
+        if file is None:
+            file = open(self.file_path(trading_pair), "ab")
+            if file.tell() == 0:
+                write_file_header(file, trading_pair)
+            self._files[trading_pair] = file
+        return file
+
+    def _flush_files(self):
+        for file in self._files.values():
+            try:
+                file.flush()
+            except Exception:
+                self.logger().error(f"Error flushing order book recording {file.name}.", exc_info=True)
+
+
+class RecordingOrderBookMessageQueue(asyncio.Queue):
+    """
+    Queue recording the messages put in it, as the data source puts them
+    """
+
+    def __init__(self, recorder: OrderBookRecorder, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._recorder: OrderBookRecorder = recorder
+
+    def _put(self, message: OrderBookMessage):
+        self._recorder.record(message)
+        super()._put(message)
+
+
+class RecordingCoalescingOrderBookMessageQueue(RecordingOrderBookMessageQueue, CoalescingOrderBookMessageQueue):
+    """
+    CoalescingOrderBookMessageQueue recording the messages put in it before they are merged with or dropped by the
+    pending ones
+    """
+
+
+class OrderBookRecordingReader:
+    """
+    Reads the records of a recording file through a memory map, without loading the file.
+    A record cut by the end of the file, as written by a recorder that did not stop, ends the recording.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        with open(file_path, "rb") as file:
+            header = file.read(FILE_HEADER.size)
+            if len(header) < FILE_HEADER.size:
+                raise ValueError(f"{file_path} is not an order book recording.")
+            magic, version, trading_pair_length = FILE_HEADER.unpack(header)
+            if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+                raise ValueError(f"{file_path} is not an order book recording of version {RECORDING_VERSION}.")
+            self._trading_pair: str = file.read(trading_pair_length).decode("utf-8")
+        self._records_offset: int = FILE_HEADER.size + trading_pair_length
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    def __iter__(self) -> Iterator[OrderBookRecord]:
+        with open(self._file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size <= self._records_offset:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                offset = self._records_offset
+                while offset + RECORD_HEADER.size <= len(mapped_file):
+                    (message_type, flags, recorded_at, timestamp, update_id, first_update_id, bids_count, asks_count,
+                     trade_id_length) = RECORD_HEADER.unpack_from(mapped_file, offset)
+                    levels_offset = offset + RECORD_HEADER.size
+                    trade_id_offset = levels_offset + (bids_count + asks_count) * LEVEL_SIZE
+                    end = trade_id_offset + trade_id_length
+                    if end > len(mapped_file):
+                        break
+                    # The levels are copied out of the map, that is closed when the iteration ends
+                    bids = np.frombuffer(mapped_file, np.float64, bids_count * LEVEL_COLUMNS, levels_offset).reshape(
+                        bids_count, LEVEL_COLUMNS).copy()
+                    asks = np.frombuffer(mapped_file, np.float64, asks_count * LEVEL_COLUMNS,
+                                         levels_offset + bids_count * LEVEL_SIZE).reshape(
+                        asks_count, LEVEL_COLUMNS).copy()
+                    trade_id = mapped_file[trade_id_offset:end].decode("utf-8")
+                    message = self._message(OrderBookMessageType(message_type), flags,
+                                            None if math.isnan(timestamp) else timestamp, update_id,
+                                            first_update_id, bids, asks, trade_id)
+                    yield OrderBookRecord(recorded_at, message, bool(flags & FLAG_INITIAL_ORDER_BOOK))
+                    offset = end
+
+    def _message(self, message_type: OrderBookMessageType, flags: int, timestamp: Optional[float], update_id: int,
+                 first_update_id: int, bids: np.ndarray, asks: np.ndarray, trade_id: str) -> OrderBookMessage:
+        if message_type is OrderBookMessageType.TRADE:
+            price, amount, trade_type = bids[0]
+            content = {
+                "trading_pair": self._trading_pair,
+                "trade_id": int(trade_id) if flags & FLAG_INTEGER_TRADE_ID else trade_id,
+                "trade_type": trade_type,
+                "price": price,
+                "amount": amount,
+            }
+        else:
+            content = {"trading_pair": self._trading_pair, "update_id": update_id, "bids": bids, "asks": asks}
+            if message_type is OrderBookMessageType.DIFF:
+                content["first_update_id"] = first_update_id
+        return OrderBookMessage(message_type, content, timestamp)
+
+    def replay_into(self, order_book: OrderBook, apply_snapshots_as_deltas: bool = False) -> int:
+        """
+        Applies the recorded messages to an order book the way OrderBookTracker does, as fast as possible.
+
+        :param order_book: the order book the messages are applied to
+        :param apply_snapshots_as_deltas: as the tracker the recording was made from
+        :return: the number of messages applied
+        """
+        applied = 0
+        for record in self:
+            message = record.message
+            if message.type is OrderBookMessageType.DIFF:
+                order_book.apply_numpy_diffs(message.content["bids"], message.content["asks"])
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                if apply_snapshots_as_deltas and not record.is_initial_order_book:
+                    order_book.apply_numpy_depth_update(
+                        message.content["bids"], message.content["asks"], message.update_id)
+                else:
+                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+            else:
+                order_book.apply_trade(OrderBookTradeEvent(
+                    trading_pair=message.trading_pair,
+                    timestamp=message.timestamp,
+                    price=message.content["price"],
+                    amount=message.content["amount"],
+                    type=TradeType.SELL if message.content["trade_type"] == float(TradeType.SELL.value)
+                    else TradeType.BUY))
+            applied += 1
+        return applied
@@ -1,18 +1,31 @@
 import asyncio
 import logging
+import sys
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_latency import ROUTED_AT_KEY, MarketDataLatencyTracker
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import (
+    CoalescingOrderBookMessageQueue,
+    OrderBookMessageQueueStats,
+    trim_diff_levels,
+)
+from hummingbot.core.data_type.order_book_recording import (
+    OrderBookRecorder,
+    RecordingCoalescingOrderBookMessageQueue,
+    RecordingOrderBookMessageQueue,
+)
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +34,22 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookMemoryUsage(NamedTuple):
+    # Estimated bytes used by the order book (see OrderBook.memory_usage)
+    order_book: int
+    # Estimated bytes used by the messages kept by the tracker: the past diffs window and the messages saved before
+    # the order book is ready
+    messages: int
+
+    @property
+    def total(self) -> int:
+        return self.order_book + self.messages
+
+
 class OrderBookTracker():
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Minimum seconds between two snapshot requests for an order book thinned by the depth cap
+    DEPTH_RESYNC_INTERVAL: float = 5.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,8 +58,48 @@ class OrderBookTracker():
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 apply_snapshots_as_deltas: bool = False,
+                 concurrent_init: bool = False,
+                 coalesce_messages: bool = False,
+                 recorder: Optional[OrderBookRecorder] = None,
+                 track_latency: bool = False,
+                 depth_cap: int = 0,
+                 depth_cap_margin: int = 10):
+        """
+        :param apply_snapshots_as_deltas: when True, snapshot messages are applied as the level-wise delta against the
+            current book instead of rebuilding it. Meant for exchanges streaming full depth payloads and no diffs.
+        :param concurrent_init: when True, the initial snapshots of all trading pairs are requested at once and each
+            book is tracked as soon as its own snapshot arrives. The request rate is left to the connector's throttler.
+        :param coalesce_messages: when True, the diff and snapshot messages waiting to be applied are coalesced per
+            trading pair (see CoalescingOrderBookMessageQueue), so a consumer falling behind applies the latest snapshot
+            and merged diffs instead of every message received meanwhile.
+        :param recorder: when set, records the initial order books and every message the data source puts in the
+            tracker streams, before any coalescing, to be replayed later (see ReplayOrderBookTrackerDataSource). It is
+            started and stopped with the tracker.
+        :param track_latency: when True, the order book messages are stamped with the time they are routed to their
+            order book, and the latencies of each hop, from the exchange to the order book, are kept per trading pair
+            (see MarketDataLatencyTracker).
+        :param depth_cap: when set, the order books only keep this number of visible levels per side, plus the
+            depth_cap_margin levels behind them (see OrderBook.set_depth_cap). A new snapshot is requested for an order
+            book whose visible depth thins out.
+        :param depth_cap_margin: levels kept per side behind the visible ones, replacing the visible levels removed by
+            the diffs
+        """
         self._domain: Optional[str] = domain
+        self._apply_snapshots_as_deltas: bool = apply_snapshots_as_deltas
+        self._concurrent_init: bool = concurrent_init
+        self._coalesce_messages: bool = coalesce_messages
+        self._recorder: Optional[OrderBookRecorder] = recorder
+        self._latency_tracker: Optional[MarketDataLatencyTracker] = MarketDataLatencyTracker() if track_latency else None
+        self._depth_cap: int = depth_cap
+        self._depth_cap_margin: int = depth_cap_margin
+        self._depth_resync_tasks: Dict[str, asyncio.Task] = {}
+        self._last_depth_resync_timestamps: Dict[str, float] = {}
+        self._depth_resyncs: Dict[str, int] = defaultdict(int)
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -40,11 +107,13 @@ class OrderBookTracker():
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
+        self._order_book_diff_stream: asyncio.Queue = self._new_message_stream(self._coalesce_messages)
+        self._order_book_snapshot_stream: asyncio.Queue = self._new_message_stream(self._coalesce_messages)
+        self._order_book_trade_stream: asyncio.Queue = self._new_message_stream(False)
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._init_start_timestamp: Optional[float] = None
+        self._init_durations: Dict[str, float] = {}
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -64,10 +133,81 @@ class OrderBookTracker():
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def apply_snapshots_as_deltas(self) -> bool:
+        return self._apply_snapshots_as_deltas
+
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    @property
+    def latency_tracker(self) -> Optional[MarketDataLatencyTracker]:
+        return self._latency_tracker
+
+    @property
+    def depth_cap(self) -> int:
+        return self._depth_cap
+
+    @property
+    def depth_resyncs(self) -> Dict[str, int]:
+        """
+        Per trading pair, the snapshots requested since the start because the depth cap thinned the order book out.
+        """
+        return dict(self._depth_resyncs)
+
+    @property
+    def memory_usage(self) -> Dict[str, OrderBookMemoryUsage]:
+        """
+        Per tracked trading pair, the estimated bytes used by the order book and the messages kept for it.
+        """
+        return {
+            trading_pair: OrderBookMemoryUsage(
+                order_book=order_book.memory_usage,
+                messages=(_messages_memory_usage(self._past_diffs_windows.get(trading_pair, ())) +
+                          _messages_memory_usage(self._saved_message_queues.get(trading_pair, ()))))
+            for trading_pair, order_book in self._order_books.items()
+        }
+
     @property
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order book is initialized and tracked, before all of them are ready.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if trading_pair in self._tracking_tasks]
+
+    @property
+    def order_book_init_durations(self) -> Dict[str, float]:
+        """
+        Seconds elapsed between the start of the initialization and the moment each order book became ready.
+        """
+        return dict(self._init_durations)
+
+    @property
+    def message_queue_stats(self) -> Dict[str, OrderBookMessageQueueStats]:
+        """
+        Per trading pair, the diff and snapshot messages waiting to be applied to the order book, and the messages
+        dropped and merged when the messages are coalesced.
+        """
+        stats = {}
+        for trading_pair in self._trading_pairs:
+            tracking_queue: Optional[asyncio.Queue] = self._tracking_message_queues.get(trading_pair)
+            queues_stats = [
+                queue.stats(trading_pair)
+                for queue in (self._order_book_diff_stream, self._order_book_snapshot_stream, tracking_queue)
+                if isinstance(queue, CoalescingOrderBookMessageQueue)
+            ]
+            if len(queues_stats) > 0:
+                stats[trading_pair] = OrderBookMessageQueueStats(*[sum(values) for values in zip(*queues_stats)])
+            else:
+                stats[trading_pair] = OrderBookMessageQueueStats(
+                    depth=tracking_queue.qsize() if tracking_queue is not None else 0, dropped=0, merged=0)
+        return stats
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -77,6 +217,8 @@ class OrderBookTracker():
 
     def start(self):
         self.stop()
+        if self._recorder is not None:
+            self._recorder.start()
         self._init_order_books_task = safe_ensure_future(
             self._init_order_books()
         )
@@ -137,7 +279,12 @@ class OrderBookTracker():
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._depth_resync_tasks.values():
+            task.cancel()
+        self._depth_resync_tasks.clear()
         self._order_books_initialized.clear()
+        if self._recorder is not None:
+            self._recorder.stop()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -173,15 +320,60 @@ class OrderBookTracker():
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        self._init_start_timestamp = time.perf_counter()
+        self._init_durations.clear()
+        if self._concurrent_init:
+            await safe_gather(*[self._init_order_book(trading_pair) for trading_pair in self._trading_pairs])
+        else:
+            for trading_pair in self._trading_pairs:
+                self._start_tracking_book(trading_pair, await self._initial_order_book_for_trading_pair(trading_pair))
+                await asyncio.sleep(1)
+        self.logger().info(f"Initialized {len(self._trading_pairs)} order books in "
+                           f"{time.perf_counter() - self._init_start_timestamp:.2f} seconds.")
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        while True:
+            try:
+                order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+        self._start_tracking_book(trading_pair, order_book)
+
+    def _new_message_queue(self) -> asyncio.Queue:
+        return CoalescingOrderBookMessageQueue() if self._coalesce_messages else asyncio.Queue()
+
+    def _new_message_stream(self, coalesce_messages: bool) -> asyncio.Queue:
+        """
+        Creates a queue the data source puts its messages in. With a recorder, the messages are recorded as they are
+        put, before they are coalesced.
+        """
+        if self._recorder is not None:
+            return (RecordingCoalescingOrderBookMessageQueue(self._recorder) if coalesce_messages
+                    else RecordingOrderBookMessageQueue(self._recorder))
+        return CoalescingOrderBookMessageQueue() if coalesce_messages else asyncio.Queue()
+
+    def _start_tracking_book(self, trading_pair: str, order_book: OrderBook):
+        if self._depth_cap > 0:
+            order_book.set_depth_cap(self._depth_cap, self._depth_cap_margin)
+        self._order_books[trading_pair] = order_book
+        if self._recorder is not None:
+            self._recorder.record_order_book(trading_pair, order_book)
+        self._tracking_message_queues[trading_pair] = self._new_message_queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._init_durations[trading_pair] = time.perf_counter() - self._init_start_timestamp
+        self.logger().info(f"Initialized order book for {trading_pair} in {self._init_durations[trading_pair]:.2f} "
+                           f"seconds. {len(self._init_durations)}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -199,7 +391,7 @@ class OrderBookTracker():
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
+                    self._saved_message_queues[trading_pair].append(self._buffered_message(ob_message))
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -208,6 +400,8 @@ class OrderBookTracker():
                 if order_book.snapshot_uid > ob_message.update_id:
                     messages_rejected += 1
                     continue
+                if self._latency_tracker is not None:
+                    ob_message.content[ROUTED_AT_KEY] = time.time()
                 await message_queue.put(ob_message)
                 messages_accepted += 1
 
@@ -243,6 +437,8 @@ class OrderBookTracker():
                 if trading_pair not in self._tracking_message_queues:
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+                if self._latency_tracker is not None:
+                    ob_message.content[ROUTED_AT_KEY] = time.time()
                 await message_queue.put(ob_message)
             except asyncio.CancelledError:
                 raise
@@ -269,8 +465,11 @@ class OrderBookTracker():
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                    if message.has_numpy_levels:
+                        order_book.apply_numpy_diffs(message.content["bids"], message.content["asks"])
+                    else:
+                        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    past_diffs_window.append(self._buffered_message(message))
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -280,9 +479,19 @@ class OrderBookTracker():
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self._apply_snapshots_as_deltas and message.has_numpy_levels:
+                        order_book.apply_numpy_depth_update(
+                            message.content["bids"], message.content["asks"], message.update_id)
+                    elif self._apply_snapshots_as_deltas:
+                        order_book.apply_depth_update(message.bids, message.asks, message.update_id)
+                    else:
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                if self._latency_tracker is not None:
+                    self._latency_tracker.record_applied(message)
+                if self._depth_cap > 0 and order_book.depth_thinned:
+                    self._request_depth_resync(trading_pair)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -293,6 +502,54 @@ class OrderBookTracker():
                 )
                 await asyncio.sleep(5.0)
 
+    def _buffered_message(self, message: OrderBookMessage) -> OrderBookMessage:
+        """
+        Returns the message kept in the buffers of diffs. With a depth cap, the levels of a diff the capped order book
+        can not keep are trimmed. As for coalescing, only plain OrderBookMessage diffs are trimmed.
+        """
+        if self._depth_cap == 0 or type(message) is not OrderBookMessage or message.type is not OrderBookMessageType.DIFF:
+            return message
+        depth: int = self._depth_cap + self._depth_cap_margin
+        bids = trim_diff_levels(message.content["bids"], True, depth)
+        asks = trim_diff_levels(message.content["asks"], False, depth)
+        if bids is message.content["bids"] and asks is message.content["asks"]:
+            return message
+        content = dict(message.content)
+        content["bids"] = bids
+        content["asks"] = asks
+        return OrderBookMessage(message.type, content, message.timestamp)
+
+    def _request_depth_resync(self, trading_pair: str):
+        """
+        Requests a new snapshot of an order book thinned out by the depth cap, unless one is being requested or the
+        previous request is too recent.
+        """
+        resync_task: Optional[asyncio.Task] = self._depth_resync_tasks.get(trading_pair)
+        if resync_task is not None and not resync_task.done():
+            return
+        now: float = time.perf_counter()
+        last_resync_timestamp: Optional[float] = self._last_depth_resync_timestamps.get(trading_pair)
+        if last_resync_timestamp is not None and now - last_resync_timestamp < self.DEPTH_RESYNC_INTERVAL:
+            return
+        self._last_depth_resync_timestamps[trading_pair] = now
+        self._depth_resyncs[trading_pair] += 1
+        self._depth_resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        try:
+            # The snapshot is applied by the tracking loop, as the periodic snapshots
+            snapshot_message: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair)
+            await self._order_book_snapshot_stream.put(snapshot_message)
+            self.logger().debug(f"Requested a new order book snapshot for {trading_pair}, its depth thinned out.")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Unexpected error fetching the order book snapshot of {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Unexpected error fetching the order book snapshot of {trading_pair}."
+            )
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -336,3 +593,19 @@ class OrderBookTracker():
                     app_warning_msg="Unexpected error routing order book messages. Retrying after 5 seconds."
                 )
                 await asyncio.sleep(5.0)
+
+
+def _messages_memory_usage(messages: Iterable[OrderBookMessage]) -> int:
+    """
+    Estimated bytes held by the contents of the messages and their levels
+    """
+    memory = 0
+    for message in messages:
+        memory += sys.getsizeof(message.content)
+        for levels in (message.content.get("bids"), message.content.get("asks")):
+            if isinstance(levels, np.ndarray):
+                memory += levels.nbytes
+            elif levels is not None:
+                memory += sys.getsizeof(levels) + sum(
+                    sys.getsizeof(level) + sum(sys.getsizeof(value) for value in level) for level in levels)
+    return memory
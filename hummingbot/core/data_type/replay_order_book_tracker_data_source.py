@@ -0,0 +1,123 @@
+import asyncio
+import heapq
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recording import OrderBookRecord, OrderBookRecordingReader
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source replaying order book recordings (see OrderBookRecorder) into an OrderBookTracker, instead of
+    connecting to an exchange.
+
+    The order book of each trading pair starts from its recorded initial order book, then the other messages of all
+    the recordings are handed to the tracker in the order they were recorded, at the recorded pace divided by the
+    speed.
+    """
+
+    def __init__(self, file_paths: List[str], speed: float = 1.0):
+        """
+        :param file_paths: the recording files, one per trading pair
+        :param speed: how many times faster than recorded the messages are replayed, 0 to replay them without waiting
+        """
+        self._readers: Dict[str, OrderBookRecordingReader] = {}
+        for file_path in file_paths:
+            reader = OrderBookRecordingReader(file_path)
+            self._readers[reader.trading_pair] = reader
+        super().__init__(trading_pairs=list(self._readers))
+        self._snapshot_messages_queue_key = "order_book_snapshot"
+        self._speed = speed
+        self._initial_records: Dict[str, Tuple[int, OrderBookRecord]] = {}
+        self._last_trade_prices: Dict[str, float] = {}
+        self._replayed_messages = 0
+        self._replay_done = asyncio.Event()
+
+    @property
+    def replayed_messages(self) -> int:
+        return self._replayed_messages
+
+    @property
+    def replay_done(self) -> asyncio.Event:
+        """
+        Set once every recorded message was handed to the tracker
+        """
+        return self._replay_done
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        _, initial_record = self._initial_record(trading_pair)
+        snapshot_msg: OrderBookMessage = initial_record.message
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return order_book
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_trade_prices.get(trading_pair, math.nan) for trading_pair in trading_pairs}
+
+    async def listen_for_subscriptions(self):
+        """
+        Replays the recorded messages, each one into the queue of its type.
+        """
+        records = heapq.merge(*[self._replayed_records(trading_pair) for trading_pair in self._trading_pairs],
+                              key=lambda record: record.recorded_at)
+        replay_start: Optional[float] = None
+        first_recorded_at: Optional[float] = None
+        for record in records:
+            if self._speed > 0:
+                if replay_start is None:
+                    replay_start, first_recorded_at = self._time(), record.recorded_at
+                delay = replay_start + (record.recorded_at - first_recorded_at) / self._speed - self._time()
+                if delay > 0:
+                    await self._sleep(delay)
+            message = record.message
+            if message.type is OrderBookMessageType.TRADE:
+                self._last_trade_prices[message.trading_pair] = message.content["price"]
+                self._message_queue[self._trade_messages_queue_key].put_nowait(message)
+            elif message.type is OrderBookMessageType.DIFF:
+                self._message_queue[self._diff_messages_queue_key].put_nowait(message)
+            else:
+                self._message_queue[self._snapshot_messages_queue_key].put_nowait(message)
+            self._replayed_messages += 1
+            if self._speed <= 0:
+                # Lets the tracker apply the messages as they are replayed
+                await self._sleep(0)
+        self._replay_done.set()
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        message_queue = self._message_queue[self._snapshot_messages_queue_key]
+        while True:
+            output.put_nowait(await message_queue.get())
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    def _initial_record(self, trading_pair: str) -> Tuple[int, OrderBookRecord]:
+        """
+        The recorded initial order book of the trading pair, or its first snapshot for a recording without one, with
+        its position in the recording
+        """
+        if trading_pair not in self._initial_records:
+            reader = self._readers[trading_pair]
+            initial: Optional[Tuple[int, OrderBookRecord]] = None
+            for position, record in enumerate(reader):
+                if record.is_initial_order_book:
+                    initial = (position, record)
+                    break
+                if initial is None and record.message.type is OrderBookMessageType.SNAPSHOT:
+                    initial = (position, record)
+            if initial is None:
+                raise ValueError(f"The recording {reader.file_path} has no order book snapshot to start from.")
+            self._initial_records[trading_pair] = initial
+        return self._initial_records[trading_pair]
+
+    def _replayed_records(self, trading_pair: str) -> Iterator[OrderBookRecord]:
+        initial_position, _ = self._initial_record(trading_pair)
+        for position, record in enumerate(self._readers[trading_pair]):
+            if position != initial_position:
+                yield record
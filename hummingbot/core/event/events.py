@@ -31,6 +31,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    ChangeEvent = 902
 
 
 class TokenApprovalEvent(Enum):
@@ -141,6 +142,12 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookChangeEvent(NamedTuple):
+    version: int
+    best_bid: float
+    best_ask: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -55,7 +55,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         str _debug_csv_path
         object _avg_vol
         object _trading_intensity
+        int64_t _trading_intensity_order_book_version
         bint _should_wait_order_cancel_confirmation
+        object _idle_tick_tracker
 
     cdef object c_get_mid_price(self)
     cdef object c_get_order_book_snapshot(self)
@@ -81,6 +83,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef bint c_is_algorithm_changed(self)
     cdef c_measure_order_book_liquidity(self)
     cdef c_calculate_reservation_price_and_optimal_spread(self)
+    cdef object c_get_time_left_fraction(self)
+    cdef bint c_is_idle_tick(self)
+    cdef tuple c_get_proposal_inputs(self)
     cdef object c_calculate_target_inventory(self)
     cdef object c_calculate_inventory(self)
     cdef c_did_complete_order(self, object order_completed_event)
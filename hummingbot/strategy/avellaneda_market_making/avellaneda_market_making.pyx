@@ -4,7 +4,7 @@ import os
 import time
 from decimal import Decimal
 from math import ceil, floor, isnan
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -28,6 +28,7 @@ from hummingbot.strategy.hanging_orders_tracker import (
     CreatedPairOfOrders,
     HangingOrdersTracker,
 )
+from hummingbot.strategy.idle_tick_tracker import IdleTickTracker
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_tracker cimport OrderTracker
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -84,6 +85,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                     trading_intensity_price_levels: Tuple[float] = tuple(np.geomspace(1, 2, 10) - 1),
                     should_wait_order_cancel_confirmation = True,
                     is_debug: bool = False,
+                    skip_unchanged_ticks: bool = False,
+                    order_book_change_tolerance: Decimal = s_decimal_zero,
                     ):
         self._sb_order_tracker = OrderTracker()
         self._market_info = market_info
@@ -118,6 +121,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self._ticks_to_be_ready = max(volatility_buffer_size, trading_intensity_buffer_size)
         self._avg_vol = InstantVolatilityIndicator(sampling_length=volatility_buffer_size)
         self._trading_intensity = TradingIntensityIndicator(trading_intensity_buffer_size)
+        self._trading_intensity_order_book_version = -1
         self._last_sampling_timestamp = 0
         self._alpha = None
         self._kappa = None
@@ -133,6 +137,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self._optimal_ask = s_decimal_zero
         self._optimal_bid = s_decimal_zero
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
+        self._idle_tick_tracker = None
+        if skip_unchanged_ticks:
+            self._idle_tick_tracker = IdleTickTracker(tolerance=float(order_book_change_tolerance))
         self._debug_csv_path = debug_csv_path
         self._is_debug = is_debug
         try:
@@ -167,6 +174,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     @trading_intensity.setter
     def trading_intensity(self, indicator: TradingIntensityIndicator):
         self._trading_intensity = indicator
+        self._trading_intensity_order_book_version = -1
 
     @property
     def market_info(self) -> MarketTradingPairTuple:
@@ -409,6 +417,10 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     def hanging_orders_tracker(self):
         return self._hanging_orders_tracker
 
+    @property
+    def idle_tick_tracker(self) -> Optional[IdleTickTracker]:
+        return self._idle_tick_tracker
+
     def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self._market_info.get_mid_price()
@@ -529,6 +541,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
         warning_lines.extend(self.balance_warning([self._market_info]))
 
+        if self._idle_tick_tracker is not None:
+            lines.extend(["", f"  Ticks skipped with unchanged market: {self._idle_tick_tracker.skipped_ticks}"])
+
         if len(warning_lines) > 0:
             lines.extend(["", "*** WARNINGS ***"] + warning_lines)
 
@@ -545,6 +560,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self._last_timestamp = timestamp
 
         self._hanging_orders_tracker.register_events(self.active_markets)
+        if self._idle_tick_tracker is not None:
+            self._idle_tick_tracker.start_tracking(self._market_info.order_book)
 
         if self._hanging_orders_enabled:
             # start tracking any restored limit order
@@ -561,6 +578,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
     cdef c_stop(self, Clock clock):
         self._hanging_orders_tracker.unregister_events(self.active_markets)
+        if self._idle_tick_tracker is not None:
+            self._idle_tick_tracker.stop_tracking()
         StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
@@ -617,6 +636,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         if self._create_timestamp <= self._current_timestamp:
             # 1. Calculate reservation price and optimal spread from gamma, alpha, kappa and volatility
             self.c_calculate_reservation_price_and_optimal_spread()
+            if self.c_is_idle_tick():
+                # The proposal and the orders cancelled or created from it would be those of the previous tick
+                return
             # 2. Check if calculated prices make sense
             if self._optimal_bid > 0 and self._optimal_ask > 0:
                 # 3. Create base order proposals
@@ -636,14 +658,64 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         if self._is_debug:
             self.dump_debug_variables()
 
+    cdef bint c_is_idle_tick(self):
+        if self._idle_tick_tracker is None:
+            return False
+        return self._idle_tick_tracker.is_unchanged(self.c_get_proposal_inputs())
+
+    cdef tuple c_get_proposal_inputs(self):
+        """
+        The inputs of the proposal, and of the decision to cancel the active orders and create new ones from it, that
+        are not levels of the market order book.
+        The optimal bid and ask are recomputed every tick from the volatility and the time left, so the inputs of the
+        reservation price and optimal spread are compared instead. Their price terms are rounded to the price quantum
+        of the proposal orders: a change too small to move an order price does not make the tick run.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object price_quantum = market.c_get_order_price_quantum(self.trading_pair, self.get_price())
+            object volatility_term = self._gamma * self.get_volatility() * self.c_get_time_left_fraction()
+            object liquidity_term = None
+            list inputs
+            object own_buy_size = s_decimal_zero
+            object own_sell_size = s_decimal_zero
+
+        if all((self._gamma, self._kappa)) and self._kappa > 0:
+            liquidity_term = (2 * Decimal(1 + self._gamma / self._kappa).ln() / self._gamma) // price_quantum
+        inputs = [volatility_term // price_quantum,
+                  liquidity_term,
+                  market.get_balance(self.base_asset),
+                  market.get_balance(self.quote_asset),
+                  market.get_available_balance(self.base_asset),
+                  market.get_available_balance(self.quote_asset),
+                  tuple(order.client_order_id for order in self.active_orders),
+                  len(self._hanging_orders_tracker.strategy_current_hanging_orders),
+                  len(self._sb_order_tracker.in_flight_cancels),
+                  self._create_timestamp < self._current_timestamp,
+                  self._cancel_timestamp > self._current_timestamp]
+
+        if self._order_optimization_enabled:
+            # The optimization looks deeper in the book than the levels notified
+            for order in self.active_orders:
+                if order.is_buy:
+                    own_buy_size = order.quantity
+                else:
+                    own_sell_size = order.quantity
+            inputs.append(self._market_info.get_price_for_volume(False, own_buy_size).result_price)
+            inputs.append(self._market_info.get_price_for_volume(True, own_sell_size).result_price)
+        return tuple(inputs)
+
     cdef c_collect_market_variables(self, double timestamp):
         market, trading_pair, base_asset, quote_asset = self._market_info
         self._last_sampling_timestamp = timestamp
 
         price = self.get_price()
-        snapshot = self.get_order_book_snapshot()
         self._avg_vol.add_sample(price)
-        self._trading_intensity.add_sample(snapshot)
+        # The indicator skips the snapshots of an unchanged order book, they are not built at all
+        order_book_version = self._market_info.order_book.version
+        if order_book_version != self._trading_intensity_order_book_version:
+            self._trading_intensity_order_book_version = order_book_version
+            self._trading_intensity.add_sample(self.get_order_book_snapshot())
         # Calculate adjustment factor to have 0.01% of inventory resolution
         base_balance = market.get_balance(base_asset)
         quote_balance = market.get_balance(quote_asset)
@@ -703,18 +775,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         # order book liquidity - kappa and alpha have to represent absolute values because the second member of the optimal spread equation has to be an absolute price
         # and from the reservation price calculation we know that gamma's unit is not absolute price
         if all((self._gamma, self._kappa)) and self._alpha != 0 and self._kappa > 0 and vol != 0:
-            if self._execution_state.time_left is not None and self._execution_state.closing_time is not None:
-                # Avellaneda-Stoikov for a fixed timespan
-                time_left_fraction = Decimal(str(self._execution_state.time_left / self._execution_state.closing_time))
-            else:
-                # Avellaneda-Stoikov for an infinite timespan
-                # The equations in the paper for this contain a few mistakes
-                # - the units don't align with the rest of the paper
-                # - volatility cancels itself out completely
-                # - the risk factor gets partially canceled
-                # The proposed solution is to use the same equation as for the constrained timespan but with
-                # a fixed time left
-                time_left_fraction = 1
+            time_left_fraction = self.c_get_time_left_fraction()
 
             # Here seems to be another mistake in the paper
             # It doesn't make sense to use mid_price_variance because its units would be absolute price units ^2, yet that side of the equation is subtracted
@@ -750,6 +811,19 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     def calculate_reservation_price_and_optimal_spread(self):
         return self.c_calculate_reservation_price_and_optimal_spread()
 
+    cdef object c_get_time_left_fraction(self):
+        if self._execution_state.time_left is not None and self._execution_state.closing_time is not None:
+            # Avellaneda-Stoikov for a fixed timespan
+            return Decimal(str(self._execution_state.time_left / self._execution_state.closing_time))
+        # Avellaneda-Stoikov for an infinite timespan
+        # The equations in the paper for this contain a few mistakes
+        # - the units don't align with the rest of the paper
+        # - volatility cancels itself out completely
+        # - the risk factor gets partially canceled
+        # The proposed solution is to use the same equation as for the constrained timespan but with
+        # a fixed time left
+        return 1
+
     cdef object c_calculate_target_inventory(self):
         cdef:
             ExchangeBase market = self._market_info.market
@@ -66,6 +66,9 @@ def start(self):
         volatility_buffer_size = c_map.get("volatility_buffer_size").value
         trading_intensity_buffer_size = c_map.get("trading_intensity_buffer_size").value
         should_wait_order_cancel_confirmation = c_map.get("should_wait_order_cancel_confirmation")
+        skip_unchanged_ticks = c_map.get("skip_unchanged_ticks").value
+        order_book_change_tolerance = 0 if c_map.get("order_book_change_tolerance_pct").value is None else \
+            c_map.get("order_book_change_tolerance_pct").value / Decimal('100')
         debug_csv_path = os.path.join(data_path(),
                                       HummingbotApplication.main_application().strategy_file_name.rsplit('.', 1)[0] +
                                       f"_{pd.Timestamp.now().strftime('%Y-%m-%d_%H-%M-%S')}.csv")
@@ -99,7 +102,9 @@ def start(self):
             volatility_buffer_size=volatility_buffer_size,
             trading_intensity_buffer_size=trading_intensity_buffer_size,
             should_wait_order_cancel_confirmation=should_wait_order_cancel_confirmation,
-            is_debug=False
+            is_debug=False,
+            skip_unchanged_ticks=skip_unchanged_ticks,
+            order_book_change_tolerance=order_book_change_tolerance
         )
     except Exception as e:
         self.notify(str(e))
@@ -0,0 +1,81 @@
+from typing import Any, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookChangeEvent, OrderBookEvent
+
+
+class IdleTickTracker:
+    """
+    Tells a strategy whether the inputs of its proposal are the same as in its previous tick, so the tick can skip
+    building a proposal that would be the same as the previous one.
+    The order books the proposal is built from notify their changes (see OrderBook.set_change_notification), the other
+    inputs (balances, active orders, timers...) are given by the strategy every tick as a tuple compared with the
+    previous one.
+    """
+
+    def __init__(self, levels: int = 1, tolerance: float = 0):
+        """
+        :param levels: number of levels per side of the order books the proposal depends on
+        :param tolerance: fraction of the price or the amount of a level it has to move by for the order book to be
+        considered changed
+        """
+        self._levels = levels
+        self._tolerance = tolerance
+        self._order_books: List[OrderBook] = []
+        self._change_forwarder: EventForwarder = EventForwarder(self._did_change_order_book)
+        self._order_books_changed = True
+        self._state: Optional[Tuple[Any, ...]] = None
+        self._skipped_ticks = 0
+
+    @property
+    def skipped_ticks(self) -> int:
+        """
+        Number of ticks whose inputs were found unchanged
+        """
+        return self._skipped_ticks
+
+    def start_tracking(self, order_book: OrderBook):
+        """
+        Listens to the changes of an order book. An order book shared with another tracker notifies the changes of the
+        most levels and of the lowest tolerance the trackers asked for.
+
+        :param order_book: an order book the proposal is built from
+        """
+        if order_book.change_notification_levels == 0:
+            order_book.set_change_notification(self._levels, self._tolerance)
+        else:
+            order_book.set_change_notification(max(self._levels, order_book.change_notification_levels),
+                                               min(self._tolerance, order_book.change_notification_tolerance))
+        order_book.add_listener(OrderBookEvent.ChangeEvent, self._change_forwarder)
+        self._order_books.append(order_book)
+        self._order_books_changed = True
+
+    def stop_tracking(self):
+        for order_book in self._order_books:
+            order_book.remove_listener(OrderBookEvent.ChangeEvent, self._change_forwarder)
+        self._order_books.clear()
+        self._order_books_changed = True
+
+    def is_unchanged(self, state: Tuple[Any, ...]) -> bool:
+        """
+        Checks if no order book notified a change and the state is equal to the one of the previous call, and makes the
+        state the one the next call compares with.
+
+        :param state: the proposal inputs that are not order book levels
+        """
+        unchanged = not self._order_books_changed and state == self._state
+        self._order_books_changed = False
+        self._state = state
+        if unchanged:
+            self._skipped_ticks += 1
+        return unchanged
+
+    def invalidate(self):
+        """
+        Makes the next tick build its proposal, for an input change the state does not cover
+        """
+        self._order_books_changed = True
+
+    def _did_change_order_book(self, event: OrderBookChangeEvent):
+        self._order_books_changed = True
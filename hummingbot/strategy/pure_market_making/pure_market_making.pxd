@@ -58,6 +58,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        object _idle_tick_tracker
 
     cdef object c_get_mid_price(self)
     cdef object c_create_base_proposal(self)
@@ -81,3 +82,5 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_execute_orders_proposal(self, object proposal)
     cdef set_timers(self)
     cdef c_apply_moving_price_band(self, object proposal)
+    cdef bint c_is_idle_tick(self)
+    cdef tuple c_get_proposal_inputs(self)
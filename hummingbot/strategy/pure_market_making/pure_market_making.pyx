@@ -19,6 +19,7 @@ from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.asset_price_delegate cimport AssetPriceDelegate
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.hanging_orders_tracker import CreatedPairOfOrders, HangingOrdersTracker
+from hummingbot.strategy.idle_tick_tracker import IdleTickTracker
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -87,7 +88,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    skip_unchanged_ticks: bool = False,
+                    order_book_change_tolerance: Decimal = s_decimal_zero
                     ):
         if order_override is None:
             order_override = {}
@@ -146,6 +149,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._idle_tick_tracker = None
+        if skip_unchanged_ticks:
+            self._idle_tick_tracker = IdleTickTracker(tolerance=float(order_book_change_tolerance))
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -486,6 +492,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def hanging_orders_tracker(self):
         return self._hanging_orders_tracker
 
+    @property
+    def idle_tick_tracker(self) -> Optional[IdleTickTracker]:
+        return self._idle_tick_tracker
+
     @property
     def asset_price_delegate(self) -> AssetPriceDelegate:
         return self._asset_price_delegate
@@ -690,6 +700,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         warning_lines.extend(self.balance_warning([self._market_info]))
 
+        if self._idle_tick_tracker is not None:
+            lines.extend(["", f"  Ticks skipped with unchanged market: {self._idle_tick_tracker.skipped_ticks}"])
+
         if len(warning_lines) > 0:
             lines.extend(["", "*** WARNINGS ***"] + warning_lines)
 
@@ -710,6 +723,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_timestamp = timestamp
 
         self._hanging_orders_tracker.register_events(self.active_markets)
+        if self._idle_tick_tracker is not None:
+            self._idle_tick_tracker.start_tracking(self._market_info.order_book)
 
         if self._hanging_orders_enabled:
             # start tracking any restored limit order
@@ -722,6 +737,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_stop(self, Clock clock):
         self._hanging_orders_tracker.unregister_events(self.active_markets)
+        if self._idle_tick_tracker is not None:
+            self._idle_tick_tracker.stop_tracking()
         StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
@@ -749,6 +766,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
                                           f"making may be dangerous when markets or networks are unstable.")
 
+            if self.c_is_idle_tick():
+                # The proposal and the orders cancelled or created from it would be those of the previous tick
+                self._hanging_orders_tracker.process_tick()
+                self.c_cancel_active_orders_on_max_age_limit()
+                return
+
             proposal = None
             if self._create_timestamp <= self._current_timestamp:
                 # 1. Create base order proposals
@@ -775,6 +798,48 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
+    cdef bint c_is_idle_tick(self):
+        # The moving price band is refreshed on a timer the proposal inputs do not cover
+        if self._idle_tick_tracker is None or self._moving_price_band.enabled:
+            return False
+        return self._idle_tick_tracker.is_unchanged(self.c_get_proposal_inputs())
+
+    cdef tuple c_get_proposal_inputs(self):
+        """
+        The inputs of the proposal, and of the decision to cancel the active orders and create new ones from it, that
+        are not levels of the market order book
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            list inputs = [market.get_available_balance(self.base_asset),
+                           market.get_available_balance(self.quote_asset),
+                           tuple(order.client_order_id for order in self.active_orders),
+                           len(self._hanging_orders_tracker.strategy_current_hanging_orders),
+                           len(self._sb_order_tracker.in_flight_cancels),
+                           self._create_timestamp <= self._current_timestamp,
+                           self._create_timestamp < self._current_timestamp,
+                           self._cancel_timestamp > self._current_timestamp,
+                           self._filled_buys_balance,
+                           self._filled_sells_balance]
+            object own_buy_size = s_decimal_zero
+            object own_sell_size = s_decimal_zero
+
+        if (self._asset_price_delegate is not None or
+                self._price_type not in (PriceType.MidPrice, PriceType.BestBid, PriceType.BestAsk)):
+            inputs.append(self.get_price())
+        if self._order_optimization_enabled:
+            # The optimization looks deeper in the book than the levels notified
+            for order in self.active_orders:
+                if order.is_buy:
+                    own_buy_size = order.quantity
+                else:
+                    own_sell_size = order.quantity
+            inputs.append(self._market_info.get_price_for_volume(
+                False, self._bid_order_optimization_depth + own_buy_size).result_price)
+            inputs.append(self._market_info.get_price_for_volume(
+                True, self._ask_order_optimization_depth + own_sell_size).result_price)
+        return tuple(inputs)
+
     cdef object c_create_base_proposal(self):
         cdef:
             ExchangeBase market = self._market_info.market
@@ -1194,8 +1259,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o, self._current_timestamp) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.c_batch_order_cancel(self._market_info, active_orders)
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1225,10 +1289,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.c_batch_order_cancel(self._market_info,
+                                      [order for order in self.active_non_hanging_orders
+                                       if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
@@ -1239,13 +1303,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             object price = self.get_price()
         active_orders = [order for order in active_orders
                          if order.client_order_id not in self.hanging_order_ids]
+        orders_to_cancel = []
         for order in active_orders:
             negation = -1 if order.is_buy else 1
             if (negation * (order.price - price) / price) < self._minimum_spread:
                 self.logger().info(f"Order is below minimum spread ({self._minimum_spread})."
                                    f" Canceling Order: ({'Buy' if order.is_buy else 'Sell'}) "
                                    f"ID - {order.client_order_id}")
-                self.c_cancel_order(self._market_info, order.client_order_id)
+                orders_to_cancel.append(order)
+        self.c_batch_order_cancel(self._market_info, orders_to_cancel)
 
     cdef bint c_to_create_orders(self, object proposal):
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
@@ -1258,9 +1324,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
-            double expiration_seconds = NaN
-            str bid_order_id, ask_order_id
-            bint orders_created = False
+            list orders_to_create = []
+            list created_orders
+            list created_buys
+            list created_sells
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
@@ -1273,20 +1340,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
+            orders_to_create.extend(
+                LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset, buy.price, buy.size)
+                for buy in proposal.buys)
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1296,21 +1352,30 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
-        if orders_created:
-            self.set_timers()
+            orders_to_create.extend(
+                LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset, sell.price, sell.size)
+                for sell in proposal.sells)
+        if len(orders_to_create) == 0:
+            return
+
+        # All the orders of the proposal are sent together, with as few requests as the market allows
+        created_orders = self.c_batch_order_create_with_specific_market(self._market_info,
+                                                                        orders_to_create,
+                                                                        order_type=self._limit_order_type)
+        created_buys = [order for order in created_orders if order.is_buy]
+        created_sells = [order for order in created_orders if not order.is_buy]
+        for idx in range(number_of_pairs):
+            bid_order_id = created_buys[idx].client_order_id
+            order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
+            if order:
+                self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                    CreatedPairOfOrders(order, None))
+        for idx in range(number_of_pairs):
+            ask_order_id = created_sells[idx].client_order_id
+            order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
+            if order:
+                self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
+        self.set_timers()
 
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
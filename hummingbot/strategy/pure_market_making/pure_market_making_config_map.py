@@ -491,4 +491,19 @@ pure_market_making_config_map = {
                       "split_order_levels_enabled").value,
                   type_str="str",
                   validator=validate_decimal_list),
+    "skip_unchanged_ticks":
+        ConfigVar(key="skip_unchanged_ticks",
+                  prompt="Do you want to skip building the orders proposal while the order book, balances and orders "
+                         "are unchanged? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
+    "order_book_change_tolerance_pct":
+        ConfigVar(key="order_book_change_tolerance_pct",
+                  prompt="Enter the percent change in price or amount of the best order book levels needed to build "
+                         "the orders proposal again (Enter 1 to indicate 1%) >>> ",
+                  type_str="decimal",
+                  default=Decimal("0"),
+                  required_if=lambda: pure_market_making_config_map.get("skip_unchanged_ticks").value,
+                  validator=lambda v: validate_decimal(v, 0, 100, inclusive=True)),
 }
@@ -121,6 +121,9 @@ def start(self):
         take_if_crossed = c_map.get("take_if_crossed").value
 
         should_wait_order_cancel_confirmation = c_map.get("should_wait_order_cancel_confirmation")
+        skip_unchanged_ticks = c_map.get("skip_unchanged_ticks").value
+        order_book_change_tolerance = 0 if c_map.get("order_book_change_tolerance_pct").value is None else \
+            c_map.get("order_book_change_tolerance_pct").value / Decimal('100')
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
         self.strategy = PureMarketMakingStrategy()
@@ -160,7 +163,9 @@ def start(self):
             bid_order_level_spreads=bid_order_level_spreads,
             ask_order_level_spreads=ask_order_level_spreads,
             should_wait_order_cancel_confirmation=should_wait_order_cancel_confirmation,
-            moving_price_band=moving_price_band
+            moving_price_band=moving_price_band,
+            skip_unchanged_ticks=skip_unchanged_ticks,
+            order_book_change_tolerance=order_book_change_tolerance
         )
     except Exception as e:
         self.notify(str(e))
@@ -539,6 +539,70 @@ cdef class StrategyBase(TimeIterator):
 
         return order_id
 
+    def batch_order_create_with_specific_market(self, market_trading_pair_tuple, orders_to_create,
+                                                order_type=OrderType.LIMIT):
+        return self.c_batch_order_create_with_specific_market(market_trading_pair_tuple, orders_to_create, order_type)
+
+    cdef list c_batch_order_create_with_specific_market(self, object market_trading_pair_tuple, list orders_to_create,
+                                                        object order_type=OrderType.LIMIT):
+        """
+        Creates a batch of limit orders with as few requests as the market allows (see
+        ConnectorBase.batch_order_create) and tracks each of them as a limit order created on its own.
+        :param orders_to_create: The orders to create, their client order ids are ignored
+        :returns The orders with the client order ids assigned to them by the market
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not order_type.is_limit_type():
+            raise ValueError(f"Only limit orders can be created in batches, got {order_type}.")
+
+        if not all(isinstance(order.quantity, Decimal) and isinstance(order.price, Decimal)
+                   for order in orders_to_create):
+            raise TypeError("price and amount must be Decimal objects.")
+
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for batch order is not in the whitelisted markets set.")
+
+        cdef:
+            list created_orders = market.batch_order_create(orders_to_create, order_type=order_type)
+
+        # Start order tracking
+        for order in created_orders:
+            self.c_start_tracking_limit_order(market_trading_pair_tuple,
+                                              order.client_order_id,
+                                              order.is_buy,
+                                              order.price,
+                                              order.quantity)
+
+        return created_orders
+
+    cdef c_batch_order_cancel(self, object market_trading_pair_tuple, list orders_to_cancel):
+        """
+        Cancels a batch of limit orders with as few requests as the market allows (see
+        ConnectorBase.batch_order_cancel). The orders with a cancellation already in flight are skipped, as in
+        c_cancel_order, and the tracking of each order stops when its cancellation event arrives.
+        """
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            list orders_to_send = []
+
+        for order in orders_to_cancel:
+            if self._sb_order_tracker.c_check_and_track_cancel(order.client_order_id):
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_trading_pair_tuple.trading_pair}) Canceling the limit order {order.client_order_id}."
+                )
+                orders_to_send.append(order)
+        if len(orders_to_send) > 0:
+            market.batch_order_cancel(orders_to_send)
+
+    def batch_order_cancel(self, market_trading_pair_tuple: MarketTradingPairTuple, orders_to_cancel: List):
+        self.c_batch_order_cancel(market_trading_pair_tuple, orders_to_cancel)
+
     cdef c_cancel_order(self, object market_trading_pair_tuple, str order_id):
         cdef:
             ConnectorBase market = market_trading_pair_tuple.market
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Compares the acquire latency of AsyncThrottler against the previous polling implementation (AsyncRequestContext over
+a shared TaskLog list, retrying every retry_interval) for bursts of requests on linked rate limits.
+The latency of a request is the time between entering `execute_task` and being allowed to run; the excess latency
+subtracts the earliest time the rate limit allows the request to run.
+
+Usage (from the hummingbot root): PYTHONPATH=. python test/debug/benchmark_async_throttler.py
+"""
+import asyncio
+import math
+import time
+from typing import List, Tuple
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.logger import HummingbotLogger
+
+POOL_ID = "POOL"
+ENDPOINT_ID = "/endpoint"
+
+
+class PollingAsyncThrottler(AsyncThrottler):
+    """
+    AsyncThrottler as it was before the scheduled request contexts were introduced.
+    """
+
+    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return AsyncRequestContext(
+            task_logs=self._task_logs,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+        )
+
+
+def build_rate_limits(limit: int, time_interval: float) -> List[RateLimit]:
+    return [
+        RateLimit(limit_id=POOL_ID, limit=limit, time_interval=time_interval),
+        RateLimit(limit_id=ENDPOINT_ID, limit=limit, time_interval=time_interval,
+                  linked_limits=[LinkedLimitWeightPair(POOL_ID)]),
+    ]
+
+
+async def run_burst(throttler: AsyncThrottler, requests: int, limit: int, period: float) -> Tuple[np.ndarray, np.ndarray, float]:
+    latencies: List[float] = [0.0] * requests
+
+    async def request(i: int):
+        start = time.perf_counter()
+        async with throttler.execute_task(limit_id=ENDPOINT_ID):
+            latencies[i] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*[request(i) for i in range(requests)])
+    elapsed = time.perf_counter() - start
+
+    latencies_array = np.array(latencies)
+    earliest = np.array([math.floor(i / limit) * period for i in range(requests)])
+    return latencies_array, np.maximum(latencies_array - earliest, 0), elapsed
+
+
+async def main():
+    scenarios = [
+        # (requests, limit, time interval)
+        (100, 10, 0.1),
+        (300, 15, 0.1),
+        (5000, 5000, 1.0),
+    ]
+    print(f"{'scenario':>22} {'engine':>10} {'p50 (ms)':>9} {'p99 (ms)':>9} {'excess p50':>11} {'excess p99':>11} "
+          f"{'total (s)':>10}")
+    for requests, limit, time_interval in scenarios:
+        for name, throttler_class in (("polling", PollingAsyncThrottler), ("scheduled", AsyncThrottler)):
+            throttler = throttler_class(rate_limits=build_rate_limits(limit, time_interval), safety_margin_pct=0.05)
+            period = time_interval * 1.05
+            latencies, excess, elapsed = await run_burst(throttler, requests, limit, period)
+            print(f"{f'{requests} @ {limit}/{time_interval}s':>22} {name:>10} "
+                  f"{np.percentile(latencies, 50) * 1e3:>9.1f} {np.percentile(latencies, 99) * 1e3:>9.1f} "
+                  f"{np.percentile(excess, 50) * 1e3:>11.1f} {np.percentile(excess, 99) * 1e3:>11.1f} "
+                  f"{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    # Keeps throttler notifications in the log instead of routing them to the (absent) client application
+    with patch.object(HummingbotLogger, "is_testing_mode", return_value=True):
+        asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Measures ClientOrderTracker.fetch_order lookups by exchange order id as the number of tracked orders grows, next to
+the linear scan over all_orders the tracker used before the exchange order id index was introduced.
+
+Usage (from the hummingbot root): PYTHONPATH=. python test/debug/benchmark_client_order_tracker.py [orders ...]
+"""
+import sys
+import timeit
+from decimal import Decimal
+from typing import List, Optional
+
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+LOOKUPS = 2000
+
+
+class MockConnector:
+    current_timestamp = 1640001112.0
+
+
+def build_tracker(number_of_orders: int) -> ClientOrderTracker:
+    tracker = ClientOrderTracker(connector=MockConnector())
+    for i in range(number_of_orders):
+        tracker.start_tracking_order(InFlightOrder(
+            client_order_id=f"OID{i}",
+            exchange_order_id=f"EOID{i}",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1"),
+        ))
+    # Half of the orders are done and only kept in the cache
+    for i in range(0, number_of_orders, 2):
+        tracker.stop_tracking_order(f"OID{i}")
+    return tracker
+
+
+def linear_scan(tracker: ClientOrderTracker, exchange_order_id: str) -> Optional[InFlightOrder]:
+    return next(
+        (order for order in tracker.all_orders.values() if order.exchange_order_id == exchange_order_id),
+        None)
+
+
+def main(order_counts: List[int]):
+    print(f"{'orders':>8} {'scan (us/lookup)':>17} {'index (us/lookup)':>18}")
+    for number_of_orders in order_counts:
+        tracker = build_tracker(number_of_orders)
+        # Worst case for the scan: the most recently created order
+        exchange_order_id = f"EOID{number_of_orders - 1}"
+        assert tracker.fetch_order(exchange_order_id=exchange_order_id) is linear_scan(tracker, exchange_order_id)
+
+        scan = timeit.timeit(lambda: linear_scan(tracker, exchange_order_id), number=LOOKUPS)
+        index = timeit.timeit(lambda: tracker.fetch_order(exchange_order_id=exchange_order_id), number=LOOKUPS)
+        print(f"{number_of_orders:>8} {scan / LOOKUPS * 1e6:>17.2f} {index / LOOKUPS * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000, 2000])
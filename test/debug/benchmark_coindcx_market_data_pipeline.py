@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+"""
+Measures how many CoinDCX market data messages per second the whole order book pipeline absorbs: the SocketIO payload
+handed to the data source (_on_depth_update, _on_new_trade), its parsing into an OrderBookMessage, the OrderBookTracker
+routers, _track_single_book and the OrderBook update. The tracker and the data source are the ones CoindcxExchange
+creates, only the SocketIO connection is replaced by the injected stream.
+
+For each combination of pair count and depth, the stream is injected as fast as possible (or at --rate messages per
+second) and the run reports:
+- the throughput, from the first injected message to the last applied one
+- the latency percentiles of each stage of the depth updates: parse (payload to parsed message), route (parsed message
+  to the queue of its pair), wait (time spent in the queue of the pair), apply (OrderBook update) and end to end
+- the mean and maximum sizes of the queues between the stages, sampled at every injected batch
+- the memory of the process (maximum RSS), and with --trace-memory the peak of the memory allocated during the run
+  (tracing slows the run down, the other figures are then not comparable to untraced runs)
+
+The stream is either synthetic (--messages depth updates spread over the pairs, --trade-ratio of them followed by a
+trade) or recorded (--input, JSON lines of {"event": <SocketIO event>, "data": <payload data>}). --record writes the
+synthetic stream in the same format. --json writes the results (with the commit and the parameters of the run) so
+that they can be compared across commits.
+
+Usage (from the hummingbot root):
+    PYTHONPATH=. python test/debug/benchmark_coindcx_market_data_pipeline.py [--pairs 1 10 50] [--depths 10 50 200] [--json out.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from bidict import bidict
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../../hummingbot/connector/exchange/coindcx/"))  # isort: skip
+
+from coindcx_src import coindcx_constants as CONSTANTS  # isort: skip
+from coindcx_src.coindcx_api_order_book_data_source import CoindcxAPIOrderBookDataSource  # isort: skip
+from coindcx_src.coindcx_exchange import CoindcxExchange  # isort: skip
+
+MESSAGES = 20000
+TRADE_RATIO = 0.2
+BATCH_SIZE = 100
+TICK = 0.01
+MID_PRICE = 100.0
+# Fraction of the levels of a side changed from one depth update of a pair to the next
+CHANGED_LEVELS_PCT = 0.1
+STAGES = ("parse", "route", "wait", "apply", "end_to_end")
+PERCENTILES = (50, 90, 99)
+
+
+def trading_pairs(pairs: int) -> List[str]:
+    return [f"COIN{i}-HBOT" for i in range(pairs)]
+
+
+def channel(trading_pair: str) -> str:
+    base, quote = trading_pair.split("-")
+    return f"B-{base}_{quote}"
+
+
+def synthetic_stream(pairs: int, depth: int, messages: int, trade_ratio: float) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Depth updates of the pairs in turn, each publishing the full depth of its pair with CHANGED_LEVELS_PCT of the
+    levels changed, interleaved with trades.
+    """
+    rng = random.Random(42)
+    channels = [channel(trading_pair) for trading_pair in trading_pairs(pairs)]
+    books = []
+    for _ in range(pairs):
+        bids = {round(MID_PRICE - TICK * (level + 1), 2): rng.uniform(0.1, 10) for level in range(depth)}
+        asks = {round(MID_PRICE + TICK * (level + 1), 2): rng.uniform(0.1, 10) for level in range(depth)}
+        books.append((bids, asks))
+    stream = []
+    for i in range(messages):
+        pair_channel = channels[i % pairs]
+        bids, asks = books[i % pairs]
+        for side, direction in ((bids, -1), (asks, 1)):
+            for _ in range(max(1, int(depth * CHANGED_LEVELS_PCT))):
+                price = rng.choice(list(side))
+                if rng.random() < 0.6:
+                    side[price] = rng.uniform(0.1, 10)
+                else:
+                    del side[price]
+                    deepest = max(side) if direction > 0 else min(side)
+                    side[round(deepest + direction * TICK, 2)] = rng.uniform(0.1, 10)
+        timestamp = 1650000000000 + i
+        stream.append((CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE, {"data": json.dumps({
+            "E": timestamp,
+            "channel": pair_channel,
+            "b": [[f"{price:.2f}", f"{amount:.8f}"] for price, amount in sorted(bids.items(), reverse=True)],
+            "a": [[f"{price:.2f}", f"{amount:.8f}"] for price, amount in sorted(asks.items())],
+        })}))
+        if rng.random() < trade_ratio:
+            stream.append((CONSTANTS.ORDER_BOOK_TRADE_EVENT_TYPE, {"data": json.dumps({
+                "T": timestamp,
+                "channel": pair_channel,
+                "m": rng.random() < 0.5,
+                "p": f"{MID_PRICE:.2f}",
+                "q": f"{rng.uniform(0.1, 1):.8f}",
+            })}))
+    return stream
+
+
+def read_stream(path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    with open(path) as stream_file:
+        return [(record["event"], {"data": record["data"]}) for record in map(json.loads, stream_file)]
+
+
+def write_stream(path: str, stream: List[Tuple[str, Dict[str, Any]]]):
+    with open(path, "w") as stream_file:
+        for event, payload in stream:
+            stream_file.write(json.dumps({"event": event, "data": payload["data"]}) + "\n")
+
+
+def stream_trading_pairs(stream: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    channels = sorted({json.loads(payload["data"])["channel"] for _, payload in stream})
+    return [channel_name[2:].replace("_", "-") for channel_name in channels]
+
+
+class StageClock:
+    """
+    Timestamps of each depth update (keyed by its update id) at the boundaries of the stages.
+    """
+
+    def __init__(self):
+        self.received: Dict[int, float] = {}
+        self.parsed: Dict[int, float] = {}
+        self.routed: Dict[int, float] = {}
+        self.apply_started: Dict[int, float] = {}
+        self.applied: Dict[int, float] = {}
+        self.trades_applied = 0
+
+    def latencies(self) -> Dict[str, np.ndarray]:
+        update_ids = list(self.applied)
+        columns = [np.array([stage[update_id] for update_id in update_ids])
+                   for stage in (self.received, self.parsed, self.routed, self.apply_started, self.applied)]
+        received, parsed, routed, apply_started, applied = columns
+        return {
+            "parse": parsed - received,
+            "route": routed - parsed,
+            "wait": apply_started - routed,
+            "apply": applied - apply_started,
+            "end_to_end": applied - received,
+        }
+
+
+class TimedQueue(asyncio.Queue):
+    """
+    Queue of depth updates recording when each of them is put in it.
+    """
+
+    def __init__(self, timestamps: Dict[int, float]):
+        super().__init__()
+        self._timestamps = timestamps
+
+    def put_nowait(self, item):
+        self._timestamps[item.update_id] = time.perf_counter()
+        super().put_nowait(item)
+
+
+class TimedOrderBook(OrderBook):
+    """
+    Order book recording when each depth update starts and ends being applied.
+    """
+
+    def __init__(self, clock: StageClock):
+        super().__init__()
+        self._clock = clock
+
+    def apply_numpy_depth_update(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int):
+        self._clock.apply_started[update_id] = time.perf_counter()
+        super().apply_numpy_depth_update(bids_array, asks_array, update_id)
+        self._clock.applied[update_id] = time.perf_counter()
+
+    def apply_trade(self, trade: OrderBookTradeEvent):
+        super().apply_trade(trade)
+        self._clock.trades_applied += 1
+
+
+def create_pipeline(pairs: List[str]) -> Tuple[CoindcxAPIOrderBookDataSource, OrderBookTracker]:
+    connector = CoindcxExchange(coindcx_api_key="key", coindcx_secret_key="secret", trading_pairs=pairs,
+                                trading_required=False)
+    connector._set_trading_pair_symbol_map(bidict({pair.replace("-", ""): pair for pair in pairs}))
+    connector._set_trading_pair_ecode_symbol_map(bidict({channel(pair): pair for pair in pairs}))
+    tracker = connector.order_book_tracker
+    data_source = tracker.data_source
+    for pair in pairs:
+        # Channels are resolved when joined, which the injected stream skips
+        data_source._trading_pairs_by_channel[channel(pair)] = pair
+    return data_source, tracker
+
+
+class QueueSampler:
+    def __init__(self, data_source: CoindcxAPIOrderBookDataSource, tracker: OrderBookTracker):
+        self._queues = {
+            "raw_depth_updates": data_source._message_queue[data_source._diff_messages_queue_key],
+            "raw_trades": data_source._message_queue[data_source._trade_messages_queue_key],
+            "tracker_diff_stream": tracker._order_book_diff_stream,
+            "tracker_trade_stream": tracker._order_book_trade_stream,
+        }
+        self._tracker = tracker
+        self.samples: Dict[str, List[int]] = defaultdict(list)
+
+    def sample(self):
+        for name, queue in self._queues.items():
+            self.samples[name].append(queue.qsize())
+        pair_queue_sizes = [queue.qsize() for queue in self._tracker._tracking_message_queues.values()]
+        self.samples["pair_queues_total"].append(sum(pair_queue_sizes))
+        self.samples["pair_queue_max"].append(max(pair_queue_sizes))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {name: {"mean": float(np.mean(sizes)), "max": int(np.max(sizes))} for name, sizes in self.samples.items()}
+
+
+async def run_pipeline(stream: List[Tuple[str, Dict[str, Any]]], rate: float, batch_size: int) -> Dict[str, Any]:
+    pairs = stream_trading_pairs(stream)
+    data_source, tracker = create_pipeline(pairs)
+    clock = StageClock()
+    depth_updates = sum(1 for event, _ in stream if event == CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE)
+    trades = len(stream) - depth_updates
+
+    tracker._order_book_diff_stream = TimedQueue(clock.parsed)
+    tracker._init_start_timestamp = time.perf_counter()
+    for pair in pairs:
+        tracker._start_tracking_book(pair, TimedOrderBook(clock))
+        # Replaced before the tracking task starts reading the queue
+        tracker._tracking_message_queues[pair] = TimedQueue(clock.routed)
+    tracker._order_books_initialized.set()
+    ev_loop = asyncio.get_event_loop()
+    tasks = [
+        asyncio.ensure_future(data_source.listen_for_order_book_diffs(ev_loop, tracker._order_book_diff_stream)),
+        asyncio.ensure_future(data_source.listen_for_trades(ev_loop, tracker._order_book_trade_stream)),
+        asyncio.ensure_future(tracker._order_book_diff_router()),
+        asyncio.ensure_future(tracker._emit_trade_event_loop()),
+    ]
+    # Update id of each depth update, read before the run so that the injection only calls the handlers
+    update_ids = [int(json.loads(payload["data"])["E"]) if event == CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE else None
+                  for event, payload in stream]
+    handlers = {
+        CONSTANTS.ORDER_BOOK_DEPTH_EVENT_TYPE: data_source._on_depth_update,
+        CONSTANTS.ORDER_BOOK_TRADE_EVENT_TYPE: data_source._on_new_trade,
+    }
+    sampler = QueueSampler(data_source, tracker)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    try:
+        start = time.perf_counter()
+        for batch_start in range(0, len(stream), batch_size):
+            for index in range(batch_start, min(batch_start + batch_size, len(stream))):
+                event, payload = stream[index]
+                if update_ids[index] is not None:
+                    clock.received[update_ids[index]] = time.perf_counter()
+                await handlers[event](payload)
+            sampler.sample()
+            if rate > 0:
+                await asyncio.sleep(max(0.0, start + (batch_start + batch_size) / rate - time.perf_counter()))
+            else:
+                await asyncio.sleep(0)
+        while len(clock.applied) < depth_updates or clock.trades_applied < trades:
+            await asyncio.sleep(0)
+        duration = time.perf_counter() - start
+    finally:
+        for task in tasks + list(tracker._tracking_tasks.values()):
+            task.cancel()
+        await asyncio.sleep(0)
+
+    latencies = clock.latencies()
+    return {
+        "messages": len(stream),
+        "depth_updates": depth_updates,
+        "trades": trades,
+        "duration_s": duration,
+        "throughput_msg_s": len(stream) / duration,
+        "latency_us": {
+            stage: {
+                **{f"p{percentile}": float(np.percentile(latencies[stage], percentile) * 1e6)
+                   for percentile in PERCENTILES},
+                "max": float(np.max(latencies[stage]) * 1e6),
+            }
+            for stage in STAGES
+        },
+        "queue_sizes": sampler.summary(),
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "max_rss_growth_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024,
+    }
+
+
+def run(stream: List[Tuple[str, Dict[str, Any]]], rate: float, batch_size: int, trace_memory: bool) -> Dict[str, Any]:
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        result = asyncio.get_event_loop().run_until_complete(run_pipeline(stream, rate, batch_size))
+        if trace_memory:
+            result["traced_memory_peak_mb"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return result
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_result(label: str, result: Dict[str, Any]):
+    latency = result["latency_us"]
+    print(f"{label}: {result['messages']} messages ({result['trades']} trades) in {result['duration_s']:.2f} s, "
+          f"{result['throughput_msg_s']:.0f} msg/s, max RSS {result['max_rss_mb']:.0f} MB"
+          + (f", traced peak {result['traced_memory_peak_mb']:.1f} MB" if "traced_memory_peak_mb" in result else ""))
+    print(f"    {'stage (us)':<12}" + "".join(f"{f'p{percentile}':>10}" for percentile in PERCENTILES) + f"{'max':>10}")
+    for stage in STAGES:
+        print(f"    {stage:<12}" + "".join(f"{latency[stage][f'p{percentile}']:>10.1f}" for percentile in PERCENTILES)
+              + f"{latency[stage]['max']:>10.1f}")
+    print(f"    {'queue':<22}{'mean':>8}{'max':>8}")
+    for name, sizes in result["queue_sizes"].items():
+        print(f"    {name:<22}{sizes['mean']:>8.1f}{sizes['max']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CoinDCX market data pipeline benchmark")
+    parser.add_argument("--pairs", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--depths", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--messages", type=int, default=MESSAGES, help="depth updates of the synthetic stream")
+    parser.add_argument("--trade-ratio", type=float, default=TRADE_RATIO)
+    parser.add_argument("--rate", type=float, default=0.0, help="messages injected per second, 0 for no limit")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="messages injected before yielding to the pipeline")
+    parser.add_argument("--input", help="recorded stream replacing the synthetic ones")
+    parser.add_argument("--record", help="file the synthetic stream is written to (single pair count and depth)")
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--json", help="file the results are written to, - for the standard output")
+    args = parser.parse_args()
+
+    if args.input is not None:
+        streams = [({"input": args.input}, read_stream(args.input))]
+    else:
+        streams = [({"pairs": pairs, "depth": depth},
+                    synthetic_stream(pairs, depth, args.messages, args.trade_ratio))
+                   for pairs in args.pairs for depth in args.depths]
+    if args.record is not None:
+        write_stream(args.record, streams[0][1])
+
+    runs = []
+    for stream_parameters, stream in streams:
+        result = run(stream, args.rate, args.batch_size, args.trace_memory)
+        runs.append({**stream_parameters, **result})
+        if args.json != "-":
+            print_result(", ".join(f"{key} {value}" for key, value in stream_parameters.items()), result)
+
+    if args.json is not None:
+        report = {
+            "benchmark": "coindcx_market_data_pipeline",
+            "commit": current_commit(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": {key: value for key, value in vars(args).items() if key not in ("json", "record")},
+            "runs": runs,
+        }
+        if args.json == "-":
+            print(json.dumps(report, indent=2))
+        else:
+            with open(args.json, "w") as report_file:
+                json.dump(report, report_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Compares the cost of applying a stream of CoinDCX depth-update messages to an OrderBook by rebuilding it
+(restore_from_snapshot_and_diffs, as OrderBookTracker does for snapshot messages) and by applying the level-wise
+delta against the current book (apply_depth_update). Each message of the stream publishes the full depth of the pair
+and changes a fraction of its levels, as consecutive depth updates of a busy pair do.
+
+Usage (from the hummingbot root): PYTHONPATH=. python test/debug/benchmark_coindcx_order_book_depth_updates.py [depth ...]
+"""
+import random
+import sys
+import time
+from typing import List, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+TRADING_PAIR = "COINALPHA-HBOT"
+MESSAGES = 2000
+# Fraction of the levels of a side changed (amount updated, level removed or added) from one message to the next
+CHANGED_LEVELS_PCT = 0.1
+TICK = 0.01
+MID_PRICE = 100.0
+
+
+def depth_update_stream(depth: int, messages: int) -> List[OrderBookMessage]:
+    rng = random.Random(42)
+    bids = {round(MID_PRICE - TICK * (i + 1), 2): rng.uniform(0.1, 10) for i in range(depth)}
+    asks = {round(MID_PRICE + TICK * (i + 1), 2): rng.uniform(0.1, 10) for i in range(depth)}
+    stream = []
+    for update_id in range(1, messages + 1):
+        for side, direction in ((bids, -1), (asks, 1)):
+            for _ in range(max(1, int(depth * CHANGED_LEVELS_PCT))):
+                price = rng.choice(list(side))
+                action = rng.random()
+                if action < 0.6:
+                    side[price] = rng.uniform(0.1, 10)
+                else:
+                    # Replace the level with one right behind the deepest one, keeping the published depth stable
+                    del side[price]
+                    deepest = max(side) if direction > 0 else min(side)
+                    side[round(deepest + direction * TICK, 2)] = rng.uniform(0.1, 10)
+        stream.append(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": TRADING_PAIR,
+                "update_id": update_id,
+                "bids": [(str(price), str(amount)) for price, amount in bids.items()],
+                "asks": [(str(price), str(amount)) for price, amount in asks.items()],
+            },
+            update_id * 1e-3,
+        ))
+    return stream
+
+
+def run(depth: int) -> Tuple[float, float, float, float]:
+    stream = depth_update_stream(depth, MESSAGES)
+    rows = [(message.bids, message.asks, message.update_id) for message in stream]
+
+    rebuilt_book = OrderBook()
+    start = time.perf_counter()
+    for message in stream:
+        rebuilt_book.restore_from_snapshot_and_diffs(message, [])
+    rebuild_message = time.perf_counter() - start
+
+    delta_book = OrderBook()
+    start = time.perf_counter()
+    for message in stream:
+        delta_book.apply_depth_update(message.bids, message.asks, message.update_id)
+    delta_message = time.perf_counter() - start
+
+    assert [row[:2] for row in rebuilt_book.bid_entries()] == [row[:2] for row in delta_book.bid_entries()]
+    assert [row[:2] for row in rebuilt_book.ask_entries()] == [row[:2] for row in delta_book.ask_entries()]
+
+    # Same comparison without the cost of converting the message content into OrderBookRows
+    rebuilt_book = OrderBook()
+    start = time.perf_counter()
+    for bids, asks, update_id in rows:
+        rebuilt_book.apply_snapshot(bids, asks, update_id)
+    rebuild_book = time.perf_counter() - start
+
+    delta_book = OrderBook()
+    start = time.perf_counter()
+    for bids, asks, update_id in rows:
+        delta_book.apply_depth_update(bids, asks, update_id)
+    delta_book_time = time.perf_counter() - start
+
+    return rebuild_message, delta_message, rebuild_book, delta_book_time
+
+
+def main(depths: List[int]):
+    print(f"{MESSAGES} depth updates per run, {CHANGED_LEVELS_PCT:.0%} of the levels of each side changed per update")
+    print(f"{'depth':>6} {'rebuild (us/msg)':>17} {'delta (us/msg)':>15} "
+          f"{'rebuild, rows (us/msg)':>23} {'delta, rows (us/msg)':>21}")
+    for depth in depths:
+        rebuild_message, delta_message, rebuild_book, delta_book = run(depth)
+        print(f"{depth:>6} {rebuild_message / MESSAGES * 1e6:>17.1f} {delta_message / MESSAGES * 1e6:>15.1f} "
+              f"{rebuild_book / MESSAGES * 1e6:>23.1f} {delta_book / MESSAGES * 1e6:>21.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [20, 50, 200, 500])
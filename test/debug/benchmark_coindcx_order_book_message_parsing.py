@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Measures how many CoinDCX depth-update messages per second go from the raw SocketIO payload to the order book, with
+the previous parsing (symbol resolved by awaiting the connector for each message, levels kept as string tuples and
+converted one OrderBookRow at a time) and with the vectorized parsing of CoindcxAPIOrderBookDataSource (symbol read
+from the channels dict, levels converted in bulk into NumPy arrays applied with OrderBook.apply_numpy_depth_update).
+
+Usage (from the hummingbot root): PYTHONPATH=. python test/debug/benchmark_coindcx_order_book_message_parsing.py [depth ...]
+"""
+import asyncio
+import json
+import os
+import random
+import time
+from typing import Any, Dict, List
+
+from bidict import bidict
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../../hummingbot/connector/exchange/coindcx/"))  # isort: skip
+
+from coindcx_src.coindcx_api_order_book_data_source import CoindcxAPIOrderBookDataSource  # isort: skip
+from coindcx_src.coindcx_exchange import CoindcxExchange  # isort: skip
+
+TRADING_PAIRS = [f"COIN{i}-HBOT" for i in range(10)]
+MESSAGES = 5000
+TICK = 0.01
+MID_PRICE = 100.0
+
+
+def depth_update_payloads(depth: int, messages: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    payloads = []
+    for i in range(messages):
+        trading_pair = TRADING_PAIRS[i % len(TRADING_PAIRS)]
+        base, quote = trading_pair.split("-")
+        payloads.append({"data": json.dumps({
+            "E": 1650000000000 + i,
+            "channel": f"B-{base}_{quote}",
+            "b": [[f"{MID_PRICE - TICK * (level + 1):.2f}", f"{rng.uniform(0.1, 10):.8f}"] for level in range(depth)],
+            "a": [[f"{MID_PRICE + TICK * (level + 1):.2f}", f"{rng.uniform(0.1, 10):.8f}"] for level in range(depth)],
+        })})
+    return payloads
+
+
+def create_data_source() -> CoindcxAPIOrderBookDataSource:
+    connector = CoindcxExchange(coindcx_api_key="key", coindcx_secret_key="secret", trading_pairs=TRADING_PAIRS,
+                                trading_required=False)
+    connector._set_trading_pair_symbol_map(bidict({pair.replace("-", ""): pair for pair in TRADING_PAIRS}))
+    connector._set_trading_pair_ecode_symbol_map(bidict({
+        f"B-{pair.replace('-', '_')}": pair for pair in TRADING_PAIRS}))
+    return CoindcxAPIOrderBookDataSource(trading_pairs=TRADING_PAIRS, connector=connector)
+
+
+async def previous_parsing(data_source: CoindcxAPIOrderBookDataSource, payload: Dict[str, Any]) -> OrderBookMessage:
+    raw_message = json.loads(payload["data"])
+    timestamp = float(raw_message["E"])
+    trading_pair = await data_source._connector.trading_pair_associated_to_exchange_ecode_symbol(
+        symbol=raw_message["channel"])
+    return OrderBookMessage(
+        OrderBookMessageType.SNAPSHOT,
+        {
+            "trading_pair": trading_pair,
+            "update_id": int(timestamp),
+            "bids": [(price, amt) for price, amt in raw_message["b"]],
+            "asks": [(price, amt) for price, amt in raw_message["a"]],
+        },
+        timestamp * 1e-3)
+
+
+async def run_previous(payloads: List[Dict[str, Any]]) -> float:
+    data_source = create_data_source()
+    order_books = {trading_pair: OrderBook() for trading_pair in TRADING_PAIRS}
+    start = time.perf_counter()
+    for payload in payloads:
+        message = await previous_parsing(data_source, payload)
+        order_books[message.trading_pair].apply_depth_update(message.bids, message.asks, message.update_id)
+    return time.perf_counter() - start
+
+
+async def run_vectorized(payloads: List[Dict[str, Any]]) -> float:
+    data_source = create_data_source()
+    order_books = {trading_pair: OrderBook() for trading_pair in TRADING_PAIRS}
+    raw_messages = data_source._message_queue[data_source._diff_messages_queue_key]
+    parsed_messages = asyncio.Queue()
+    start = time.perf_counter()
+    for payload in payloads:
+        await data_source._on_depth_update(payload)
+        await data_source._parse_order_book_diff_message(raw_messages.get_nowait(), parsed_messages)
+        message = parsed_messages.get_nowait()
+        order_books[message.trading_pair].apply_numpy_depth_update(
+            message.content["bids"], message.content["asks"], message.update_id)
+    return time.perf_counter() - start
+
+
+def main(depths: List[int]):
+    ev_loop = asyncio.get_event_loop()
+    print(f"{MESSAGES} depth-update messages per run over {len(TRADING_PAIRS)} pairs")
+    print(f"{'depth':>6} {'previous (msg/s)':>17} {'vectorized (msg/s)':>19} {'speedup':>8}")
+    for depth in depths:
+        payloads = depth_update_payloads(depth, MESSAGES)
+        previous = ev_loop.run_until_complete(run_previous(payloads))
+        vectorized = ev_loop.run_until_complete(run_vectorized(payloads))
+        print(f"{depth:>6} {MESSAGES / previous:>17.0f} {MESSAGES / vectorized:>19.0f} {previous / vectorized:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 50, 200])
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Counts the REST requests issued by one CoindcxExchange order status poll cycle, with and without batching through the
+status_multiple endpoint. All requests are served by a local aioresponses mock.
+
+Usage (from the hummingbot root): PYTHONPATH=. python test/debug/benchmark_coindcx_order_status_polling.py [orders ...]
+"""
+import asyncio
+import json
+import os
+import re
+import time
+from decimal import Decimal
+from typing import Dict, List
+from unittest.mock import patch
+
+from aioresponses import CallbackResult, aioresponses
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.logger import HummingbotLogger
+
+import sys; sys.path.insert(0, os.path.abspath(f"{os.path.dirname(__file__)}/../../hummingbot/connector/exchange/coindcx/"))  # isort: skip
+
+from coindcx_src import coindcx_constants as CONSTANTS, coindcx_web_utils as web_utils  # isort: skip
+from coindcx_src.coindcx_exchange import CoindcxExchange  # isort: skip
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def order_status(client_order_id: str) -> Dict[str, any]:
+    return {
+        "id": f"E{client_order_id}",
+        "client_order_id": client_order_id,
+        "status": "open",
+        "updated_at": 1654778004000,
+    }
+
+
+def status_multiple_callback(url, **kwargs):
+    client_order_ids = json.loads(kwargs["data"])["client_order_ids"]
+    return CallbackResult(body=json.dumps([order_status(client_order_id) for client_order_id in client_order_ids]))
+
+
+def status_callback(url, **kwargs):
+    return CallbackResult(body=json.dumps(order_status(json.loads(kwargs["data"])["client_order_id"])))
+
+
+async def poll_once(number_of_orders: int, batched: bool) -> Dict[str, float]:
+    exchange = CoindcxExchange(coindcx_api_key="key", coindcx_secret_key="secret", trading_pairs=[TRADING_PAIR])
+    exchange.BATCH_ORDER_STATUS_UPDATES = batched
+    exchange._set_current_timestamp(1640780000)
+    for i in range(number_of_orders):
+        exchange.start_tracking_order(
+            order_id=f"OID{i}",
+            exchange_order_id=f"EOID{i}",
+            trading_pair=TRADING_PAIR,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10"),
+            amount=Decimal("1"),
+        )
+
+    with aioresponses() as mock_api:
+        status_url = web_utils.private_rest_url(CONSTANTS.ORDER_STATUS_PATH_URL)
+        multiple_status_url = web_utils.private_rest_url(CONSTANTS.MULTIPLE_ORDER_STATUS_PATH_URL)
+        trades_url = web_utils.private_rest_url(CONSTANTS.USER_TRADE_HISTORY_PATH_URL)
+        mock_api.post(re.compile(f"^{re.escape(multiple_status_url)}$"), callback=status_multiple_callback,
+                      repeat=True)
+        mock_api.post(re.compile(f"^{re.escape(status_url)}$"), callback=status_callback, repeat=True)
+        mock_api.post(trades_url, body=json.dumps([]), repeat=True)
+
+        start = time.perf_counter()
+        await exchange._update_order_status()
+        elapsed = time.perf_counter() - start
+
+        request_count: List[int] = [len(calls) for calls in mock_api.requests.values()]
+
+    return {"requests": sum(request_count), "elapsed_ms": elapsed * 1e3}
+
+
+async def main(order_counts: List[int]):
+    print(f"{'orders':>8} {'mode':>10} {'requests/poll':>14} {'elapsed (ms)':>13}")
+    for number_of_orders in order_counts:
+        for batched in (False, True):
+            result = await poll_once(number_of_orders, batched)
+            print(f"{number_of_orders:>8} {'batched' if batched else 'single':>10} "
+                  f"{result['requests']:>14} {result['elapsed_ms']:>13.1f}")
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [1, 10, 40, 100]
+    # Keeps throttler notifications in the log instead of routing them to the (absent) client application
+    with patch.object(HummingbotLogger, "is_testing_mode", return_value=True):
+        asyncio.get_event_loop().run_until_complete(main(counts))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Compares the cost of the price and volume queries of the CompositeOrderBook used by the paper trade exchange with the
+same queries on a plain OrderBook holding the same levels, and the cost the composite book adds to the updates. The
+composite book has a fill recorded on a fifth of the levels of each side, as a paper trading strategy taking liquidity
+would, and every UPDATES_PER_ROUND queries are preceded by a diff changing a level in the middle of each side and by
+a new fill on the best levels.
+
+Usage (from the hummingbot root): PYTHONPATH=. python test/debug/benchmark_composite_order_book.py [levels ...]
+"""
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+QUERIES = 2000
+UPDATES_PER_ROUND = 4
+TICK = 0.01
+MID_PRICE = 100.0
+
+
+def fill(trade_type: TradeType, price: float, amount: float, timestamp: float) -> OrderFilledEvent:
+    return OrderFilledEvent(timestamp, "order", "COINALPHA-HBOT", trade_type, OrderType.MARKET, Decimal(price),
+                            Decimal(amount), AddedToCostTradeFee())
+
+
+def build_book(levels: int, composite: bool) -> OrderBook:
+    rng = random.Random(42)
+    order_book = CompositeOrderBook() if composite else OrderBook()
+    bids = np.array([[MID_PRICE - TICK * (i + 1), rng.uniform(0.1, 10), 1] for i in range(levels)], dtype=np.float64)
+    asks = np.array([[MID_PRICE + TICK * (i + 1), rng.uniform(0.1, 10), 1] for i in range(levels)], dtype=np.float64)
+    order_book.apply_numpy_snapshot(bids, asks)
+    if composite:
+        for i in range(0, levels, 5):
+            order_book.record_filled_order(fill(TradeType.SELL, bids[i][0], 0.05, 1))
+            order_book.record_filled_order(fill(TradeType.BUY, asks[i][0], 0.05, 1))
+    return order_book
+
+
+def run(levels: int, composite: bool) -> Tuple[float, float]:
+    """
+    :return: the seconds spent in the queries and in the updates
+    """
+    order_book = build_book(levels, composite)
+    rng = random.Random(7)
+    volume = levels * 5.05 / 2
+    price_depth = TICK * levels / 2
+    diffs = [
+        (np.array([[MID_PRICE - TICK * rng.randint(levels // 4, levels // 2), rng.uniform(0.1, 10), 2 + i]]),
+         np.array([[MID_PRICE + TICK * rng.randint(levels // 4, levels // 2), rng.uniform(0.1, 10), 2 + i]]))
+        for i in range(QUERIES // UPDATES_PER_ROUND)
+    ]
+    query_time = update_time = 0.0
+    for i in range(QUERIES):
+        if i % UPDATES_PER_ROUND == 0:
+            bids, asks = diffs[i // UPDATES_PER_ROUND]
+            start = time.perf_counter()
+            order_book.apply_numpy_diffs(bids, asks)
+            if composite:
+                order_book.record_filled_order(fill(TradeType.SELL, MID_PRICE - TICK, 0.001, 2 + i))
+                order_book.record_filled_order(fill(TradeType.BUY, MID_PRICE + TICK, 0.001, 2 + i))
+            update_time += time.perf_counter() - start
+        is_buy = i % 2 == 0
+        start = time.perf_counter()
+        order_book.get_price(is_buy)
+        order_book.get_price_for_volume(is_buy, volume)
+        order_book.get_vwap_for_volume(is_buy, volume)
+        order_book.get_volume_for_price(is_buy, MID_PRICE + price_depth if is_buy else MID_PRICE - price_depth)
+        query_time += time.perf_counter() - start
+    return query_time, update_time
+
+
+def main(level_counts: List[int]):
+    print(f"{QUERIES} rounds of 4 queries, one diff per side and one fill per side every {UPDATES_PER_ROUND} rounds")
+    print(f"{'levels':>7} {'plain (us/query)':>17} {'composite (us/query)':>21} {'ratio':>6} "
+          f"{'update (us)':>12} {'update, composite (us)':>23}")
+    for levels in level_counts:
+        plain_queries, plain_updates = run(levels, False)
+        composite_queries, composite_updates = run(levels, True)
+        updates = QUERIES // UPDATES_PER_ROUND
+        print(f"{levels:>7} {plain_queries / QUERIES / 4 * 1e6:>17.2f} "
+              f"{composite_queries / QUERIES / 4 * 1e6:>21.2f} {composite_queries / plain_queries:>5.1f}x "
+              f"{plain_updates / updates * 1e6:>12.2f} {composite_updates / updates * 1e6:>23.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 500, 5000])
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Compares the cost of the OrderBook volume and VWAP queries walking the book from the best level with the same queries
+answered by the cumulative depth index (OrderBook.set_depth_index_levels), and the cost the index adds to the updates.
+Each query asks for the volume of half of the side, as a strategy sizing its orders against the book would, and every
+UPDATES_PER_ROUND queries are preceded by a diff changing a level in the middle of each side.
+
+Usage (from the hummingbot root): PYTHONPATH=. python test/debug/benchmark_order_book_depth_index.py [levels ...]
+"""
+import random
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+QUERIES = 2000
+UPDATES_PER_ROUND = 4
+TICK = 0.01
+MID_PRICE = 100.0
+
+
+def build_book(levels: int, index_levels: int) -> OrderBook:
+    rng = random.Random(42)
+    order_book = OrderBook()
+    order_book.set_depth_index_levels(index_levels)
+    bids = np.array([[MID_PRICE - TICK * (i + 1), rng.uniform(0.1, 10), 1] for i in range(levels)], dtype=np.float64)
+    asks = np.array([[MID_PRICE + TICK * (i + 1), rng.uniform(0.1, 10), 1] for i in range(levels)], dtype=np.float64)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def run(levels: int, index_levels: int) -> Tuple[float, float]:
+    """
+    :return: the seconds spent in the queries and in the updates
+    """
+    order_book = build_book(levels, index_levels)
+    rng = random.Random(7)
+    volume = levels * 5.05 / 2
+    price_depth = TICK * levels / 2
+    diffs = [
+        (np.array([[MID_PRICE - TICK * rng.randint(levels // 4, levels // 2), rng.uniform(0.1, 10), 2 + i]]),
+         np.array([[MID_PRICE + TICK * rng.randint(levels // 4, levels // 2), rng.uniform(0.1, 10), 2 + i]]))
+        for i in range(QUERIES // UPDATES_PER_ROUND)
+    ]
+    query_time = update_time = 0.0
+    for i in range(QUERIES):
+        if i % UPDATES_PER_ROUND == 0:
+            bids, asks = diffs[i // UPDATES_PER_ROUND]
+            start = time.perf_counter()
+            order_book.apply_numpy_diffs(bids, asks)
+            update_time += time.perf_counter() - start
+        is_buy = i % 2 == 0
+        start = time.perf_counter()
+        order_book.get_price_for_volume(is_buy, volume)
+        order_book.get_vwap_for_volume(is_buy, volume)
+        order_book.get_price_for_quote_volume(is_buy, volume * MID_PRICE)
+        order_book.get_volume_for_price(is_buy, MID_PRICE + price_depth if is_buy else MID_PRICE - price_depth)
+        query_time += time.perf_counter() - start
+    return query_time, update_time
+
+
+def main(level_counts: List[int]):
+    print(f"{QUERIES} rounds of 4 queries, one diff per side every {UPDATES_PER_ROUND} rounds")
+    print(f"{'levels':>7} {'walk (us/query)':>16} {'index (us/query)':>17} {'speedup':>8} "
+          f"{'update (us)':>12} {'update, index (us)':>19}")
+    for levels in level_counts:
+        walk_queries, walk_updates = run(levels, 0)
+        index_queries, index_updates = run(levels, levels)
+        updates = QUERIES // UPDATES_PER_ROUND
+        print(f"{levels:>7} {walk_queries / QUERIES / 4 * 1e6:>16.2f} {index_queries / QUERIES / 4 * 1e6:>17.2f} "
+              f"{walk_queries / index_queries:>7.1f}x {walk_updates / updates * 1e6:>12.2f} "
+              f"{index_updates / updates * 1e6:>19.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 500, 5000])
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from collections import Awaitable
+from copy import deepcopy
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.config_helpers import read_system_configs_from_yml
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.market_data_latency import RECEIVED_AT_KEY, ROUTED_AT_KEY, MarketDataLatencyTracker
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class LatencyCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+
+        self.app = HummingbotApplication()
+        self.global_config_backup = deepcopy(global_config_map)
+
+    def tearDown(self) -> None:
+        self.reset_global_config()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def reset_global_config(self):
+        for key, value in self.global_config_backup.items():
+            global_config_map[key] = value
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    @patch("hummingbot.core.data_type.market_data_latency.time.time")
+    def test_show_latency(self, time_mock, notify_mock):
+        global_config_map["tables_format"].value = "psql"
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        time_mock.return_value = 1000.1
+        latency_tracker = MarketDataLatencyTracker()
+        latency_tracker.record_applied(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "BTC-USDT", "update_id": 1, "bids": [], "asks": [],
+             RECEIVED_AT_KEY: 1000.05, ROUTED_AT_KEY: 1000.06},
+            1000.0))
+        exchange = MagicMock()
+        exchange.order_book_tracker.latency_tracker = latency_tracker
+        self.app.markets["coindcx"] = exchange
+        self.app.markets["paper"] = MockPaperExchange()
+
+        self.async_run_with_timeout(self.app.show_latency())
+
+        self.assertEqual(1, len(captures))
+        df_str_expected = (
+            "   Exchange: coindcx, last 60 seconds"
+            "\n+----------+---------+------------+-------------+------------+------------+------------+------------+"
+            "\n| Market   | Hop     |   Messages |   Mean (ms) |   p50 (ms) |   p90 (ms) |   p99 (ms) |   Max (ms) |"
+            "\n|----------+---------+------------+-------------+------------+------------+------------+------------|"
+            "\n| BTC-USDT | network |          1 |          50 |         50 |         50 |         50 |         50 |"
+            "\n| BTC-USDT | route   |          1 |          10 |         10 |         10 |         10 |         10 |"
+            "\n| BTC-USDT | apply   |          1 |          40 |         40 |         40 |         40 |         40 |"
+            "\n| BTC-USDT | total   |          1 |         100 |        100 |        100 |        100 |        100 |"
+            "\n+----------+---------+------------+-------------+------------+------------+------------+------------+"
+        )
+        self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_latency_without_tracked_exchange(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        self.app.markets["paper"] = MockPaperExchange()
+
+        self.async_run_with_timeout(self.app.show_latency())
+
+        self.assertEqual(["\n No market data latency was recorded by the running exchanges"], captures)
@@ -265,6 +265,89 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertIsNone(fetched_order)
 
+    def test_fetch_order_by_exchange_order_id_for_cached_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        fetched_order: InFlightOrder = self.tracker.fetch_order(exchange_order_id=order.exchange_order_id)
+
+        self.assertTrue(fetched_order == order)
+
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking_started(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        fetched_order: InFlightOrder = self.tracker.fetch_order(exchange_order_id="someExchangeOrderId")
+
+        self.assertTrue(fetched_order == order)
+        self.assertEqual({"someExchangeOrderId": order.client_order_id}, self.tracker._exchange_order_id_index)
+
+    def test_process_order_update_indexes_assigned_exchange_order_id(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order_creation_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker._process_order_update(order_creation_update))
+
+        self.assertEqual({"someExchangeOrderId": order.client_order_id}, self.tracker._exchange_order_id_index)
+        self.assertEqual(0, len(self.tracker._unindexed_order_ids))
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_fetch_order_by_exchange_order_id_drops_expired_cached_order(self):
+        tracker = ClientOrderTracker(self.connector)
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertIsNone(tracker.fetch_order(exchange_order_id=order.exchange_order_id))
+        self.assertNotIn(order.exchange_order_id, tracker._exchange_order_id_index)
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
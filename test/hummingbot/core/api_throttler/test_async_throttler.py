@@ -7,8 +7,8 @@ from decimal import Decimal
 from typing import Dict, List
 
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler, ScheduledRequestContext
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -223,3 +223,169 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         throttler = AsyncThrottler(rate_limits=[])
         context = throttler.execute_task(limit_id="test_limit_id")
         self.assertTrue(context.within_capacity())
+
+    def test_execute_task_returns_scheduled_context(self):
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.assertIsInstance(context, ScheduledRequestContext)
+        self.assertTrue(context.within_capacity())
+
+    def test_acquire_consumes_capacity_of_linked_limits(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_PATH_URL, self.throttler))
+
+        self.assertEqual(1, self.throttler._windows[TEST_PATH_URL].capacity_used)
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].capacity_used)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_acquire_consumes_weighted_capacity(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_2_ID, self.throttler))
+
+        self.assertEqual(6, self.throttler._windows[TEST_WEIGHTED_POOL_ID].capacity_used)
+        # Another Task 1(weight=5) will exceed the capacity(11/10), but Task 2(weight=1) will not (7/10)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_scheduled_acquire_awaits_when_exceed_capacity(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, self.throttler))
+
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire(), 0.5)
+            )
+        # The cancelled task does not stay queued
+        self.assertEqual(0, sum(len(pending_tasks) for pending_tasks in self.throttler._pending_tasks.values()))
+
+    def test_scheduled_acquire_resumes_when_capacity_is_freed(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2)],
+                                   safety_margin_pct=0)
+        completion_times: List[float] = []
+
+        async def request():
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                completion_times.append(time.time())
+
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.gather(*[request() for _ in range(4)]))
+
+        self.assertLess(completion_times[1] - start, 0.05)
+        self.assertGreaterEqual(completion_times[2] - start, 0.2)
+        # Woken up at the time the capacity is freed instead of the next polling interval
+        self.assertLess(completion_times[3] - start, 0.3)
+
+    def test_scheduled_acquire_serves_waiting_tasks_in_fifo_order(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits[2:], safety_margin_pct=0)
+        throttler._windows[TEST_WEIGHTED_POOL_ID].add(weight=6, now=time.time() - 4.9)
+        served: List[str] = []
+
+        async def request(limit_id: str):
+            async with throttler.execute_task(limit_id=limit_id):
+                served.append(limit_id)
+
+        tasks = [request(TEST_WEIGHTED_TASK_1_ID), request(TEST_WEIGHTED_TASK_2_ID)]
+        self.async_run_with_timeout(asyncio.gather(*tasks), timeout=1)
+
+        # Task 2(weight=1) would fit right away (7/10), but it has to wait for the Task 1 queued before it
+        self.assertEqual([TEST_WEIGHTED_TASK_1_ID, TEST_WEIGHTED_TASK_2_ID], served)
+
+    def test_waiting_task_does_not_block_unrelated_limits(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, self.throttler))
+        waiting_task = self.ev_loop.create_task(self.execute_requests(1, TEST_POOL_ID, self.throttler))
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+
+        self.async_run_with_timeout(self.execute_requests(1, TEST_WEIGHTED_TASK_2_ID, self.throttler))
+
+        self.assertEqual(1, self._req_counters[TEST_WEIGHTED_TASK_2_ID])
+        self.assertFalse(waiting_task.done())
+        waiting_task.cancel()
+
+    def test_waiting_tasks_are_served_by_priority(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)],
+                                   safety_margin_pct=0)
+        served: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID, priority=priority):
+                served.append(priority)
+
+        tasks = [request(RequestPriority.BACKGROUND),
+                 request(RequestPriority.BACKGROUND),
+                 request(RequestPriority.TRADING),
+                 request(RequestPriority.CRITICAL)]
+        self.async_run_with_timeout(asyncio.gather(*tasks), timeout=1)
+
+        self.assertEqual(
+            [RequestPriority.BACKGROUND, RequestPriority.CRITICAL, RequestPriority.TRADING, RequestPriority.BACKGROUND],
+            served)
+
+    def test_higher_priority_task_is_not_queued_behind_lower_priority_tasks(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5)])
+        throttler._windows[TEST_POOL_ID].add(weight=1, now=time.time(), priority=RequestPriority.BACKGROUND)
+        # A background task waiting for more capacity than available
+        throttler._pending_tasks_per_limit[RequestPriority.BACKGROUND][TEST_POOL_ID] += 1
+
+        self.async_run_with_timeout(throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.CRITICAL).acquire())
+
+        self.assertEqual(1, throttler._windows[TEST_POOL_ID].capacity_used_by(RequestPriority.CRITICAL))
+
+    def test_background_reserved_share_is_served_before_higher_priorities(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=0.1)],
+                                   safety_margin_pct=0,
+                                   background_reserved_pct=0.2)
+        served: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID, priority=priority):
+                served.append(priority)
+
+        async def burst():
+            await asyncio.gather(*[request(RequestPriority.TRADING) for _ in range(20)],
+                                 *[request(RequestPriority.BACKGROUND) for _ in range(4)])
+
+        self.async_run_with_timeout(burst(), timeout=1)
+
+        # Trading tasks use the whole limit in the first window, then they leave 2 slots per window to background tasks
+        self.assertEqual([RequestPriority.TRADING] * 10, served[:10])
+        self.assertEqual(2, served[10:20].count(RequestPriority.BACKGROUND))
+        self.assertEqual(2, served[20:].count(RequestPriority.BACKGROUND))
+
+    def test_background_reserved_share_of_limit_scaled_to_minimum(self):
+        global_config_map["rate_limits_share_pct"].value = Decimal("50")
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)],
+                                   safety_margin_pct=0,
+                                   background_reserved_pct=0.5)
+        served: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID, priority=priority):
+                served.append(priority)
+
+        async def burst():
+            await asyncio.gather(request(RequestPriority.TRADING),
+                                 request(RequestPriority.BACKGROUND),
+                                 request(RequestPriority.TRADING))
+
+        self.async_run_with_timeout(burst(), timeout=1)
+
+        self.assertEqual(Decimal("1"), throttler._rate_limits[0].limit)
+        # The reserved half of the single request is rounded up, the background task is served before the trading one
+        self.assertEqual([RequestPriority.TRADING, RequestPriority.BACKGROUND, RequestPriority.TRADING], served)
+
+    def test_background_tasks_wait_for_higher_priorities_without_reserved_share(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=0.1)],
+                                   safety_margin_pct=0)
+        served: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID, priority=priority):
+                served.append(priority)
+
+        async def burst():
+            await asyncio.gather(*[request(RequestPriority.TRADING) for _ in range(20)],
+                                 *[request(RequestPriority.BACKGROUND) for _ in range(4)])
+
+        self.async_run_with_timeout(burst(), timeout=1)
+
+        self.assertEqual([RequestPriority.TRADING] * 20 + [RequestPriority.BACKGROUND] * 4, served)
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
@@ -0,0 +1,52 @@
+import unittest
+
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
+
+
+class RateLimitWindowTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.window = RateLimitWindow(rate_limit=RateLimit(limit_id="TEST", limit=10, time_interval=1.0),
+                                      safety_margin_pct=0.1)
+
+    def test_add_consumes_capacity(self):
+        self.window.add(weight=4, now=100)
+        self.window.add(weight=5, now=100.5)
+
+        self.assertEqual(9, self.window.capacity_used)
+        self.assertTrue(self.window.has_capacity(weight=1, now=100.5))
+        self.assertFalse(self.window.has_capacity(weight=2, now=100.5))
+
+    def test_flush_removes_entries_after_the_period_and_safety_margin(self):
+        self.window.add(weight=4, now=100)
+        self.window.add(weight=5, now=100.5)
+
+        self.window.flush(now=101.05)
+        self.assertEqual(9, self.window.capacity_used)
+
+        self.window.flush(now=101.1)
+        self.assertEqual(5, self.window.capacity_used)
+
+    def test_time_until_capacity(self):
+        self.window.add(weight=4, now=100)
+        self.window.add(weight=5, now=100.5)
+
+        self.assertEqual(0, self.window.time_until_capacity(weight=1, now=100.5))
+        self.assertAlmostEqual(0.6, self.window.time_until_capacity(weight=2, now=100.5))
+        self.assertAlmostEqual(1.1, self.window.time_until_capacity(weight=6, now=100.5))
+
+    def test_time_until_capacity_for_weight_above_limit(self):
+        self.assertEqual(float("inf"), self.window.time_until_capacity(weight=11, now=100))
+
+    def test_capacity_used_by_priority(self):
+        self.window.add(weight=4, now=100, priority=RequestPriority.BACKGROUND)
+        self.window.add(weight=5, now=100.5, priority=RequestPriority.CRITICAL)
+
+        self.assertEqual(4, self.window.capacity_used_by(RequestPriority.BACKGROUND))
+        self.assertEqual(5, self.window.capacity_used_by(RequestPriority.CRITICAL))
+        self.assertEqual(0, self.window.capacity_used_by(RequestPriority.TRADING))
+
+        self.window.flush(now=101.1)
+        self.assertEqual(0, self.window.capacity_used_by(RequestPriority.BACKGROUND))
@@ -0,0 +1,103 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class CompositeOrderBookTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_snapshot(
+            [OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1)],
+            [OrderBookRow(101, 1, 1), OrderBookRow(102, 2, 1), OrderBookRow(103, 3, 1)],
+            1)
+
+    def fill(self, trade_type: TradeType, price: float, amount: float, timestamp: float = 10):
+        self.order_book.record_filled_order(OrderFilledEvent(
+            timestamp, "order", "COINALPHA-HBOT", trade_type, OrderType.MARKET, Decimal(str(price)),
+            Decimal(str(amount)), AddedToCostTradeFee()))
+
+    def test_fills_are_subtracted_from_the_levels(self):
+        self.fill(TradeType.BUY, 101, 1)
+        self.fill(TradeType.BUY, 102, 0.5)
+        self.fill(TradeType.SELL, 99, 0.25)
+
+        self.assertEqual([OrderBookRow(102, 1.5, 1), OrderBookRow(103, 3, 1)], list(self.order_book.ask_entries()))
+        self.assertEqual([OrderBookRow(99, 0.75, 1), OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1)],
+                         list(self.order_book.bid_entries()))
+        self.assertEqual(102, self.order_book.get_price(True))
+        self.assertEqual(99, self.order_book.get_price(False))
+        self.assertEqual(103, self.order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual([OrderBookRow(101, 1, 1), OrderBookRow(102, 2, 1), OrderBookRow(103, 3, 1)],
+                         list(self.order_book.original_ask_entries()))
+
+    def test_fills_at_same_price_are_summed_and_trimmed_to_the_level(self):
+        self.fill(TradeType.BUY, 102, 1.5)
+        self.fill(TradeType.BUY, 102, 1.5, timestamp=11)
+
+        self.assertEqual([OrderBookRow(101, 1, 1), OrderBookRow(103, 3, 1)], list(self.order_book.ask_entries()))
+        self.assertEqual([OrderBookRow(102, 2, 11)], list(self.order_book.traded_order_book.ask_entries()))
+
+    def test_diffs_update_the_composite_levels(self):
+        self.fill(TradeType.SELL, 98, 1)
+        self.fill(TradeType.SELL, 97, 1)
+        version = self.order_book.version
+
+        self.order_book.apply_diffs([OrderBookRow(98, 4, 2), OrderBookRow(97, 0, 2), OrderBookRow(96, 1, 2)], [], 2)
+
+        self.assertEqual([OrderBookRow(99, 1, 1), OrderBookRow(98, 3, 2), OrderBookRow(96, 1, 2)],
+                         list(self.order_book.bid_entries()))
+        # The fill at the removed level is forgotten
+        self.assertEqual([OrderBookRow(98, 1, 10)], list(self.order_book.traded_order_book.bid_entries()))
+        self.assertGreater(self.order_book.version, version)
+
+    def test_levels_truncated_by_diffs_are_removed(self):
+        self.fill(TradeType.SELL, 99, 0.5)
+
+        self.order_book.apply_diffs([], [OrderBookRow(98.5, 1, 2)], 2)
+
+        self.assertEqual([OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1)], list(self.order_book.bid_entries()))
+        self.assertEqual([98.5, 101, 102, 103], [row.price for row in self.order_book.ask_entries()])
+        self.assertEqual([], list(self.order_book.traded_order_book.bid_entries()))
+
+    def test_snapshot_keeps_the_fills_of_the_remaining_levels(self):
+        self.fill(TradeType.BUY, 101, 0.5)
+        self.fill(TradeType.BUY, 102, 1)
+
+        self.order_book.apply_snapshot([OrderBookRow(99, 1, 2)], [OrderBookRow(102, 5, 2)], 2)
+
+        self.assertEqual([OrderBookRow(102, 4, 2)], list(self.order_book.ask_entries()))
+        self.assertEqual([OrderBookRow(102, 1, 10)], list(self.order_book.traded_order_book.ask_entries()))
+
+    def test_clear_traded_order_book(self):
+        self.fill(TradeType.BUY, 101, 1)
+
+        self.order_book.clear_traded_order_book()
+
+        self.assertEqual(list(self.order_book.original_ask_entries()), list(self.order_book.ask_entries()))
+        self.assertEqual(101, self.order_book.get_price(True))
+
+    def test_fully_consumed_side_has_no_price(self):
+        self.order_book.apply_snapshot([OrderBookRow(99, 1, 2)], [OrderBookRow(101, 1, 2)], 2)
+        self.fill(TradeType.SELL, 99, 1)
+
+        self.assertEqual([], list(self.order_book.bid_entries()))
+        with self.assertRaises(EnvironmentError):
+            self.order_book.get_price(False)
+
+    def test_levels_pruned_by_depth_cap_are_removed(self):
+        self.fill(TradeType.SELL, 97, 1)
+        self.fill(TradeType.BUY, 103, 1)
+
+        self.order_book.set_depth_cap(2)
+
+        self.assertEqual([99, 98], [row.price for row in self.order_book.bid_entries()])
+        self.assertEqual([101, 102], [row.price for row in self.order_book.ask_entries()])
+        self.assertEqual([], list(self.order_book.traded_order_book.bid_entries()))
+        self.assertEqual([], list(self.order_book.traded_order_book.ask_entries()))
@@ -0,0 +1,99 @@
+import unittest
+
+from hummingbot.core.data_type.market_data_latency import (
+    RECEIVED_AT_KEY,
+    ROUTED_AT_KEY,
+    LatencyStats,
+    MarketDataHop,
+    MarketDataLatencyTracker,
+    RollingLatencyHistogram,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class RollingLatencyHistogramTests(unittest.TestCase):
+
+    def test_stats_of_empty_histogram(self):
+        self.assertIsNone(RollingLatencyHistogram().stats(1000))
+
+    def test_percentiles_are_bucket_bounds(self):
+        histogram = RollingLatencyHistogram()
+        for latency in [0.001] * 90 + [0.1] * 9 + [2.0]:
+            histogram.add(latency, 1000)
+
+        stats = histogram.stats(1000)
+
+        self.assertEqual(100, stats.count)
+        self.assertAlmostEqual((0.09 + 0.9 + 2.0) / 100, stats.mean)
+        self.assertAlmostEqual(0.001, stats.p50)
+        self.assertAlmostEqual(0.001, stats.p90)
+        self.assertAlmostEqual(0.1, stats.p99)
+        self.assertEqual(2.0, stats.max)
+
+    def test_percentile_is_capped_by_maximum(self):
+        histogram = RollingLatencyHistogram()
+        histogram.add(0.0012, 1000)
+
+        self.assertEqual(LatencyStats(count=1, mean=0.0012, p50=0.0012, p90=0.0012, p99=0.0012, max=0.0012),
+                         histogram.stats(1000))
+
+    def test_latencies_leave_the_window(self):
+        histogram = RollingLatencyHistogram(window=60, slots=6)
+        histogram.add(0.5, 1000)
+        histogram.add(0.001, 1035)
+
+        self.assertEqual(2, histogram.stats(1035).count)
+        self.assertEqual(1, histogram.stats(1065).count)
+        self.assertEqual(0.001, histogram.stats(1065).max)
+        self.assertIsNone(histogram.stats(1100))
+
+        # The slot of the oldest latencies is reused
+        histogram.add(0.002, 1200)
+        self.assertEqual(1, histogram.stats(1200).count)
+
+    def test_negative_latencies_count_in_first_bucket(self):
+        histogram = RollingLatencyHistogram()
+        histogram.add(-0.01, 1000)
+
+        self.assertEqual(-0.01, histogram.stats(1000).p50)
+
+
+class MarketDataLatencyTrackerTests(unittest.TestCase):
+
+    def message(self, timestamp: float, content):
+        content = dict({"trading_pair": "COINALPHA-HBOT", "update_id": 1, "bids": [], "asks": []}, **content)
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, content, timestamp)
+
+    def test_hops_of_stamped_message(self):
+        tracker = MarketDataLatencyTracker()
+        tracker.record_applied(self.message(1000.0, {RECEIVED_AT_KEY: 1000.05, ROUTED_AT_KEY: 1000.06}), 1000.1)
+
+        stats = tracker.latency_stats(1000.1)["COINALPHA-HBOT"]
+
+        self.assertAlmostEqual(0.05, stats[MarketDataHop.NETWORK].max)
+        self.assertAlmostEqual(0.01, stats[MarketDataHop.ROUTE].max)
+        self.assertAlmostEqual(0.04, stats[MarketDataHop.APPLY].max)
+        self.assertAlmostEqual(0.1, stats[MarketDataHop.TOTAL].max)
+        self.assertEqual(1000.1, tracker.last_applied_at("COINALPHA-HBOT"))
+
+    def test_hops_of_message_without_stamps(self):
+        tracker = MarketDataLatencyTracker()
+        tracker.record_applied(self.message(1000.0, {}), 1000.1)
+
+        stats = tracker.latency_stats(1000.1)["COINALPHA-HBOT"]
+
+        self.assertIsNone(stats[MarketDataHop.NETWORK])
+        self.assertIsNone(stats[MarketDataHop.ROUTE])
+        self.assertIsNone(stats[MarketDataHop.APPLY])
+        self.assertEqual(1, stats[MarketDataHop.TOTAL].count)
+
+    def test_format_status(self):
+        tracker = MarketDataLatencyTracker()
+        self.assertEqual("", tracker.format_status(1000))
+
+        tracker.record_applied(self.message(1000.0, {RECEIVED_AT_KEY: 1000.05, ROUTED_AT_KEY: 1000.06}), 1000.1)
+
+        status = tracker.format_status(1002.1)
+        self.assertIn("Market data latency, last 60s (p50/p99 ms):", status)
+        self.assertIn("Network", status)
+        self.assertRegex(status, r"COINALPHA-HBOT\s+1\s+50\.0/50\.0\s+10\.0/10\.0\s+40\.0/40\.0\s+100\.0/100\.0\s+2\.0")
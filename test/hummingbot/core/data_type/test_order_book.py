@@ -3,6 +3,9 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +53,333 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_depth_update_writes_level_wise_delta(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1), OrderBookRow(3, 1, 1)],
+            [OrderBookRow(4, 1, 1), OrderBookRow(5, 1, 1)],
+            1)
+
+        order_book.apply_depth_update(
+            [OrderBookRow(3, 2, 2), OrderBookRow(1, 1, 2), OrderBookRow(2.5, 1, 2)],
+            [OrderBookRow(5, 1, 2)],
+            2)
+
+        # Unchanged levels keep their update id, removed levels are gone
+        self.assertEqual([OrderBookRow(3, 2, 2), OrderBookRow(2.5, 1, 2), OrderBookRow(1, 1, 1)],
+                         list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(5, 1, 1)], list(order_book.ask_entries()))
+        self.assertEqual(3, order_book.get_price(False))
+        self.assertEqual(5, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_apply_depth_update_matches_snapshot(self):
+        rng = np.random.default_rng(42)
+        delta_book = OrderBook()
+        snapshot_book = OrderBook()
+        for update_id in range(1, 50):
+            bid_prices = np.unique(rng.integers(900, 1000, 60))
+            ask_prices = np.unique(rng.integers(1001, 1100, 60))
+            bids = [OrderBookRow(float(price), float(rng.integers(1, 3)), update_id) for price in bid_prices]
+            asks = [OrderBookRow(float(price), float(rng.integers(1, 3)), update_id) for price in ask_prices]
+
+            delta_book.apply_depth_update(bids, asks, update_id)
+            snapshot_book.apply_snapshot(bids, asks, update_id)
+
+            self.assertEqual([row[:2] for row in snapshot_book.bid_entries()],
+                             [row[:2] for row in delta_book.bid_entries()])
+            self.assertEqual([row[:2] for row in snapshot_book.ask_entries()],
+                             [row[:2] for row in delta_book.ask_entries()])
+            self.assertEqual(snapshot_book.get_price(False), delta_book.get_price(False))
+            self.assertEqual(snapshot_book.get_price(True), delta_book.get_price(True))
+
+    def test_apply_depth_update_takes_first_occurrence_of_duplicated_prices(self):
+        rng = np.random.default_rng(7)
+        delta_book = OrderBook()
+        snapshot_book = OrderBook()
+        delta_book.apply_snapshot([OrderBookRow(950, 1, 1)], [OrderBookRow(1050, 1, 1)], 1)
+        # Enough levels for the payload not to be sorted by insertion only, every price is repeated
+        bids = [OrderBookRow(float(price), float(amount), 2)
+                for amount, price in enumerate(rng.integers(900, 920, 100), start=1)]
+        asks = [OrderBookRow(float(price), float(amount), 2)
+                for amount, price in enumerate(rng.integers(1001, 1021, 100), start=1)]
+
+        delta_book.apply_depth_update(bids, asks, 2)
+        snapshot_book.apply_snapshot(bids, asks, 2)
+
+        self.assertEqual([row[:2] for row in snapshot_book.bid_entries()],
+                         [row[:2] for row in delta_book.bid_entries()])
+        self.assertEqual([row[:2] for row in snapshot_book.ask_entries()],
+                         [row[:2] for row in delta_book.ask_entries()])
+
+    def test_apply_depth_update_empties_missing_side(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1)], [OrderBookRow(2, 1, 1)], 1)
+
+        order_book.apply_depth_update([], [OrderBookRow(2, 1, 2)], 2)
+
+        self.assertEqual([], list(order_book.bid_entries()))
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(False)
+        self.assertEqual(2, order_book.get_price(True))
+
+    def test_apply_numpy_depth_update_matches_rows(self):
+        rows_book = OrderBook()
+        numpy_book = OrderBook()
+        bids = [OrderBookRow(3, 2, 2), OrderBookRow(1, 1, 2), OrderBookRow(2.5, 1, 2)]
+        asks = [OrderBookRow(5, 1, 2)]
+
+        rows_book.apply_depth_update(bids, asks, 2)
+        numpy_book.apply_numpy_depth_update(np.array([list(row) for row in bids], dtype=np.float64),
+                                            np.array([list(row) for row in asks], dtype=np.float64),
+                                            2)
+        numpy_book.apply_numpy_depth_update(np.empty((0, 3), dtype=np.float64),
+                                            np.array([[5, 1, 3]], dtype=np.float64),
+                                            3)
+        rows_book.apply_depth_update([], [OrderBookRow(5, 1, 3)], 3)
+
+        self.assertEqual(list(rows_book.bid_entries()), list(numpy_book.bid_entries()))
+        self.assertEqual(list(rows_book.ask_entries()), list(numpy_book.ask_entries()))
+        self.assertEqual(3, numpy_book.last_diff_uid)
+
+    def assert_same_query_results(self, indexed_book: OrderBook, order_book: OrderBook, volume: float, price: float):
+        for is_buy in (True, False):
+            queries = [
+                (OrderBook.get_price_for_volume, volume),
+                (OrderBook.get_vwap_for_volume, volume),
+                (OrderBook.get_price_for_quote_volume, volume * price),
+                (OrderBook.get_quote_volume_for_base_amount, volume),
+                (OrderBook.get_volume_for_price, price),
+                (OrderBook.get_quote_volume_for_price, price),
+            ]
+            for query, argument in queries:
+                expected = query(order_book, is_buy, argument)
+                result = query(indexed_book, is_buy, argument)
+                for field in ("query_price", "query_volume", "result_price", "result_volume"):
+                    expected_value, value = getattr(expected, field), getattr(result, field)
+                    if np.isnan(expected_value):
+                        self.assertTrue(np.isnan(value), f"{query.__name__}({is_buy}, {argument})")
+                    else:
+                        self.assertAlmostEqual(expected_value, value, places=6,
+                                               msg=f"{query.__name__}({is_buy}, {argument})")
+
+    def test_depth_index_answers_queries_as_book_walk(self):
+        rng = np.random.default_rng(42)
+        order_book = OrderBook()
+        # The index covers all the levels of the first book, and only the top of the second one
+        indexed_books = [OrderBook(), OrderBook()]
+        indexed_books[0].set_depth_index_levels(1000)
+        indexed_books[1].set_depth_index_levels(10)
+        bids = np.array([[1000 - i, rng.uniform(0.1, 2), 1] for i in range(1, 51)], dtype=np.float64)
+        asks = np.array([[1000 + i, rng.uniform(0.1, 2), 1] for i in range(1, 51)], dtype=np.float64)
+        for book in [order_book] + indexed_books:
+            book.apply_numpy_snapshot(bids, asks)
+
+        for update_id in range(2, 60):
+            bid_diffs = np.array([[rng.integers(940, 1000), rng.choice([0, 0.5, 1.5]), update_id] for _ in range(5)],
+                                 dtype=np.float64)
+            ask_diffs = np.array([[rng.integers(1001, 1060), rng.choice([0, 0.5, 1.5]), update_id] for _ in range(5)],
+                                 dtype=np.float64)
+            for book in [order_book] + indexed_books:
+                book.apply_numpy_diffs(bid_diffs, ask_diffs)
+            for indexed_book in indexed_books:
+                for volume, price in ((0.3, 1000), (5, 1010), (30, 990), (500, 1060), (500, 940)):
+                    self.assert_same_query_results(indexed_book, order_book, volume, price)
+
+    def test_depth_index_follows_snapshots_and_overlaps(self):
+        order_book = OrderBook()
+        indexed_book = OrderBook()
+        indexed_book.set_depth_index_levels(2)
+        for book in (order_book, indexed_book):
+            book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1), OrderBookRow(3, 1, 1)],
+                                [OrderBookRow(4, 1, 1), OrderBookRow(5, 1, 1)],
+                                1)
+        self.assertEqual(2, indexed_book.get_price_for_volume(False, 2).result_price)
+
+        for book in (order_book, indexed_book):
+            # The new bid crosses the asks, which are truncated
+            book.apply_diffs([OrderBookRow(4.5, 1, 2)], [], 2)
+        self.assert_same_query_results(indexed_book, order_book, 1.5, 4.5)
+        self.assertEqual(5, indexed_book.get_price_for_volume(True, 1).result_price)
+
+        for book in (order_book, indexed_book):
+            book.apply_snapshot([OrderBookRow(10, 2, 3)], [OrderBookRow(11, 3, 3), OrderBookRow(12, 1, 3)], 3)
+        self.assert_same_query_results(indexed_book, order_book, 3.5, 11.5)
+        self.assertEqual(11, indexed_book.get_volume_for_price(True, 11.5).result_price)
+        self.assertEqual(3, indexed_book.get_volume_for_price(True, 11.5).result_volume)
+
+    def test_complete_depth_index_follows_levels_added_behind_it(self):
+        order_book = OrderBook()
+        indexed_book = OrderBook()
+        indexed_book.set_depth_index_levels(3)
+        for book in (order_book, indexed_book):
+            book.apply_snapshot([], [OrderBookRow(101, 1, 1), OrderBookRow(102, 2, 1), OrderBookRow(103, 3, 1)], 1)
+        self.assertTrue(np.isnan(indexed_book.get_price_for_volume(True, 7).result_price))
+
+        for book in (order_book, indexed_book):
+            book.apply_diffs([], [OrderBookRow(104, 1, 2)], 2)
+
+        self.assertEqual(104, indexed_book.get_price_for_volume(True, 7).result_price)
+        self.assertAlmostEqual(718 / 7, indexed_book.get_vwap_for_volume(True, 7).result_price)
+        self.assert_same_query_results(indexed_book, order_book, 7, 104)
+
+    def test_depth_index_can_be_removed(self):
+        order_book = OrderBook()
+        order_book.set_depth_index_levels(5)
+        self.assertEqual(5, order_book.depth_index_levels)
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1)], [OrderBookRow(2, 1, 1)], 1)
+
+        order_book.set_depth_index_levels(0)
+
+        self.assertEqual(0, order_book.depth_index_levels)
+        self.assertEqual(1, order_book.get_price_for_volume(False, 1).result_price)
+
+    def test_snapshot_arrays_match_entries(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 2, 1), OrderBookRow(3, 3, 1)],
+                                  [OrderBookRow(4, 4, 1), OrderBookRow(5, 5, 1)],
+                                  1)
+
+        bids, asks = order_book.snapshot_arrays()
+
+        np.testing.assert_array_equal(np.array([[3, 3], [2, 2], [1, 1]]), bids)
+        np.testing.assert_array_equal(np.array([[4, 4], [5, 5]]), asks)
+
+        bids, asks = order_book.snapshot_arrays(depth=2)
+
+        np.testing.assert_array_equal(np.array([[3, 3], [2, 2]]), bids)
+        np.testing.assert_array_equal(np.array([[4, 4], [5, 5]]), asks)
+
+    def test_snapshot_arrays_are_reused_until_book_changes(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1)], [OrderBookRow(2, 1, 1)], 1)
+        version = order_book.version
+        bids, asks = order_book.snapshot_arrays()
+
+        self.assertIs(bids, order_book.snapshot_arrays()[0])
+        self.assertEqual(version, order_book.version)
+
+        order_book.apply_diffs([OrderBookRow(1, 5, 2)], [], 2)
+
+        self.assertGreater(order_book.version, version)
+        new_bids, _ = order_book.snapshot_arrays()
+        np.testing.assert_array_equal(np.array([[1, 5]]), new_bids)
+
+    def test_version_increases_on_every_applied_change(self):
+        order_book = OrderBook()
+        versions = [order_book.version]
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1)], [OrderBookRow(2, 1, 1)], 1)
+        versions.append(order_book.version)
+        order_book.apply_numpy_diffs(np.array([[1, 2, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        versions.append(order_book.version)
+        order_book.apply_depth_update([OrderBookRow(1, 3, 3)], [OrderBookRow(2, 1, 3)], 3)
+        versions.append(order_book.version)
+
+        self.assertEqual(sorted(set(versions)), versions)
+
+        # A depth update publishing the current levels changes nothing
+        order_book.apply_depth_update([OrderBookRow(1, 3, 4)], [OrderBookRow(2, 1, 4)], 4)
+        self.assertEqual(versions[-1], order_book.version)
+
+    def test_change_notification_of_top_levels(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(9, 1, 1), OrderBookRow(8, 1, 1)],
+                                  [OrderBookRow(10, 1, 1), OrderBookRow(11, 1, 1)],
+                                  1)
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.ChangeEvent, event_logger)
+        order_book.set_change_notification(levels=1, tolerance=0.1)
+
+        order_book.apply_diffs([OrderBookRow(8, 2, 2)], [], 2)
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual((9, 10), (event_logger.event_log[0].best_bid, event_logger.event_log[0].best_ask))
+        self.assertEqual(order_book.version, event_logger.event_log[0].version)
+
+        # The levels below the notified ones and the changes within the tolerance are not notified
+        order_book.apply_diffs([OrderBookRow(8, 3, 3)], [], 3)
+        order_book.apply_diffs([OrderBookRow(9, 1.05, 4)], [], 4)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        # Changes add up until they exceed the tolerance
+        order_book.apply_diffs([OrderBookRow(9, 1.15, 5)], [], 5)
+        self.assertEqual(2, len(event_logger.event_log))
+
+        order_book.apply_diffs([], [OrderBookRow(10, 0.5, 6)], 6)
+        self.assertEqual(3, len(event_logger.event_log))
+        self.assertEqual(10, event_logger.event_log[-1].best_ask)
+
+        order_book.set_change_notification(levels=0)
+        order_book.apply_diffs([OrderBookRow(9, 0, 7)], [], 7)
+        self.assertEqual(3, len(event_logger.event_log))
+
+    def test_change_notification_settings_are_validated(self):
+        order_book = OrderBook()
+
+        with self.assertRaises(ValueError):
+            order_book.set_change_notification(levels=-1)
+        with self.assertRaises(ValueError):
+            order_book.set_change_notification(levels=1, tolerance=-0.1)
+
+    def test_depth_cap_prunes_levels_behind_the_margin(self):
+        order_book = OrderBook()
+        order_book.set_depth_index_levels(10)
+        bids = [OrderBookRow(100 - i, 1, 1) for i in range(10)]
+        asks = [OrderBookRow(101 + i, 1, 1) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+        memory = order_book.memory_usage
+
+        order_book.set_depth_cap(2, 1)
+
+        self.assertEqual(bids[:3], list(order_book.bid_entries()))
+        self.assertEqual(asks[:3], list(order_book.ask_entries()))
+        self.assertLess(order_book.memory_usage, memory)
+        self.assertFalse(order_book.depth_thinned)
+        self.assertEqual(3, order_book.get_volume_for_price(True, 110).result_volume)
+
+        order_book.apply_diffs([OrderBookRow(99.5, 1, 2)], [OrderBookRow(110, 1, 2)], 2)
+        self.assertEqual([100, 99.5, 99], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([101, 102, 103], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(3, order_book.get_volume_for_price(True, 110).result_volume)
+
+    def test_depth_cap_thins_out_until_next_snapshot(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(5)],
+                                  [OrderBookRow(101, 1, 1)], 1)
+        order_book.set_depth_cap(2, 1)
+
+        order_book.apply_diffs([OrderBookRow(100, 0, 2)], [], 2)
+        self.assertFalse(order_book.depth_thinned)
+        order_book.apply_diffs([OrderBookRow(99, 0, 3)], [], 3)
+        self.assertTrue(order_book.depth_thinned)
+
+        order_book.apply_snapshot([OrderBookRow(98, 1, 4)], [OrderBookRow(101, 1, 4)], 4)
+        # The snapshot has all the levels of the book, however few
+        self.assertFalse(order_book.depth_thinned)
+
+    def test_depth_update_resets_thinned_depth(self):
+        order_book = OrderBook()
+        order_book.set_depth_cap(3, 1)
+
+        order_book.apply_depth_update([OrderBookRow(100 - i, 1, 1) for i in range(10)], [OrderBookRow(101, 1, 1)], 1)
+        self.assertEqual(4, len(list(order_book.bid_entries())))
+        self.assertFalse(order_book.depth_thinned)
+
+        # The depth update is the full depth of the exchange, the book is thin but has every level
+        order_book.apply_depth_update([OrderBookRow(100, 1, 2), OrderBookRow(99, 1, 2)], [OrderBookRow(101, 1, 2)], 2)
+        self.assertFalse(order_book.depth_thinned)
+
+        order_book.apply_depth_update([OrderBookRow(100 - i, 1, 3) for i in range(10)], [OrderBookRow(101, 1, 3)], 3)
+        order_book.apply_diffs([OrderBookRow(100, 0, 4), OrderBookRow(99, 0, 4)], [], 4)
+        self.assertTrue(order_book.depth_thinned)
+
+    def test_depth_cap_settings_are_validated(self):
+        order_book = OrderBook()
+
+        with self.assertRaises(ValueError):
+            order_book.set_depth_cap(-1)
+        with self.assertRaises(ValueError):
+            order_book.set_depth_cap(10, -1)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
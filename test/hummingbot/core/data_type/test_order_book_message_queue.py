@@ -0,0 +1,129 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import (
+    CoalescingOrderBookMessageQueue,
+    OrderBookMessageQueueStats,
+    trim_diff_levels,
+)
+
+
+class CoalescingOrderBookMessageQueueTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+        cls.other_trading_pair = "COINBETA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.queue = CoalescingOrderBookMessageQueue()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def message(self, message_type: OrderBookMessageType, update_id: int, bids, asks, trading_pair: str = None):
+        return OrderBookMessage(
+            message_type,
+            {"trading_pair": trading_pair or self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            update_id * 1e-3)
+
+    def pending_messages(self):
+        messages = []
+        while not self.queue.empty():
+            messages.append(self.queue.get_nowait())
+            self.queue.task_done()
+        return messages
+
+    def test_snapshot_drops_superseded_messages_of_its_trading_pair(self):
+        self.queue.put_nowait(self.message(OrderBookMessageType.SNAPSHOT, 1, [], []))
+        self.queue.put_nowait(self.message(OrderBookMessageType.SNAPSHOT, 1, [], [], self.other_trading_pair))
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF, 2, [], []))
+        self.queue.put_nowait(self.message(OrderBookMessageType.SNAPSHOT, 3, [], []))
+
+        self.assertEqual(OrderBookMessageQueueStats(depth=1, dropped=2, merged=0), self.queue.stats(self.trading_pair))
+        self.assertEqual(OrderBookMessageQueueStats(depth=1, dropped=0, merged=0),
+                         self.queue.stats(self.other_trading_pair))
+        messages = self.pending_messages()
+        self.assertEqual([self.other_trading_pair, self.trading_pair], [message.trading_pair for message in messages])
+        self.assertEqual(3, messages[1].update_id)
+        self.async_run_with_timeout(self.queue.join())
+
+    def test_snapshot_keeps_newer_diffs(self):
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF, 5, [], []))
+        self.queue.put_nowait(self.message(OrderBookMessageType.SNAPSHOT, 4, [], []))
+
+        self.assertEqual([5, 4], [message.update_id for message in self.pending_messages()])
+
+    def test_consecutive_diffs_are_merged_level_wise(self):
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF, 1, [["99", "1"], ["98", "2"]], [["101", "1"]]))
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF, 1, [], [], self.other_trading_pair))
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF, 2, [["99", "0"]], [["102", "3"]]))
+
+        self.assertEqual(OrderBookMessageQueueStats(depth=1, dropped=0, merged=1), self.queue.stats(self.trading_pair))
+        other_diff, diff = self.pending_messages()
+        self.assertEqual(self.other_trading_pair, other_diff.trading_pair)
+        self.assertEqual(2, diff.update_id)
+        self.assertEqual(1, diff.first_update_id)
+        self.assertEqual([(99, 0), (98, 2)], [(row.price, row.amount) for row in diff.bids])
+        self.assertEqual([(101, 1), (102, 3)], [(row.price, row.amount) for row in diff.asks])
+        self.async_run_with_timeout(self.queue.join())
+
+    def test_numpy_diffs_are_merged_level_wise(self):
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF,
+                                           1,
+                                           np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                           np.empty((0, 3), dtype=np.float64)))
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF,
+                                           2,
+                                           np.array([[99, 0, 2]], dtype=np.float64),
+                                           np.array([[101, 1, 2]], dtype=np.float64)))
+
+        diff, = self.pending_messages()
+        self.assertTrue(diff.has_numpy_levels)
+        self.assertEqual([[98, 2, 1], [99, 0, 2]], sorted(diff.content["bids"].tolist()))
+        self.assertEqual([[101, 1, 2]], diff.content["asks"].tolist())
+
+    def test_diffs_are_not_merged_across_a_snapshot(self):
+        self.queue.put_nowait(self.message(OrderBookMessageType.SNAPSHOT, 1, [], []))
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF, 2, [["99", "1"]], []))
+
+        self.assertEqual(OrderBookMessageQueueStats(depth=2, dropped=0, merged=0), self.queue.stats(self.trading_pair))
+
+    def test_diffs_of_message_subclasses_are_not_merged(self):
+        class ExchangeOrderBookMessage(OrderBookMessage):
+            pass
+
+        self.queue.put_nowait(self.message(OrderBookMessageType.DIFF, 1, [["99", "1"]], []))
+        self.queue.put_nowait(ExchangeOrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": 2, "bids": [["99", "2"]], "asks": []}))
+
+        self.assertEqual(OrderBookMessageQueueStats(depth=2, dropped=0, merged=0), self.queue.stats(self.trading_pair))
+
+    def test_get_waits_for_next_message(self):
+        get_task = self.ev_loop.create_task(self.queue.get())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertFalse(get_task.done())
+
+        self.queue.put_nowait(self.message(OrderBookMessageType.SNAPSHOT, 1, [], []))
+        message = self.async_run_with_timeout(get_task)
+
+        self.assertEqual(1, message.update_id)
+        self.assertEqual(0, self.queue.stats(self.trading_pair).depth)
+
+    def test_diff_levels_are_trimmed_to_the_depth_they_can_reach(self):
+        bids = [["97", "1"], ["100", "0"], ["99", "1"], ["98", "1"]]
+        asks = np.array([[103, 1, 1], [101, 1, 1], [102, 0, 1], [104, 1, 1]], dtype=np.float64)
+
+        # The removed level does not take a place of the book
+        self.assertEqual([["100", "0"], ["99", "1"], ["98", "1"]], trim_diff_levels(bids, True, 2))
+        self.assertEqual([[103, 1, 1], [101, 1, 1], [102, 0, 1]], trim_diff_levels(asks, False, 2).tolist())
+        self.assertIs(bids, trim_diff_levels(bids, True, 3))
+        self.assertIs(asks, trim_diff_levels(asks, False, 4))
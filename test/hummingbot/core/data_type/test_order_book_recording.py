@@ -0,0 +1,163 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recording import (
+    RECORD_HEADER,
+    OrderBookRecorder,
+    OrderBookRecordingReader,
+    RecordingCoalescingOrderBookMessageQueue,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class OrderBookRecordingTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.recorder = OrderBookRecorder(self.directory.name, flush_interval=0.01)
+
+    def tearDown(self) -> None:
+        self.stop_recorder()
+        self.directory.cleanup()
+        super().tearDown()
+
+    def snapshot(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            update_id * 1e-3)
+
+    def stop_recorder(self):
+        self.recorder.stop()
+        asyncio.get_event_loop().run_until_complete(asyncio.wait_for(self.recorder.wait_stopped(), 1))
+
+    def test_messages_are_read_back_as_recorded(self):
+        initial_book = OrderBook()
+        initial_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.recorder.start()
+        self.recorder.record_order_book(self.trading_pair, initial_book)
+        self.recorder.record(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": 3, "first_update_id": 2, "bids": [["99", "2"]],
+             "asks": []},
+            0.003))
+        self.recorder.record(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair, "trade_id": 7, "trade_type": float(TradeType.SELL.value),
+             "price": 99.0, "amount": 0.5},
+            0.004))
+        self.recorder.record(self.snapshot(
+            5, np.array([[98, 3, 5]], dtype=np.float64), np.array([[102, 4, 5]], dtype=np.float64)))
+        self.stop_recorder()
+
+        self.assertEqual({self.trading_pair: 4}, self.recorder.recorded_messages)
+        reader = OrderBookRecordingReader(self.recorder.file_path(self.trading_pair))
+        self.assertEqual(self.trading_pair, reader.trading_pair)
+        initial, diff, trade, snapshot = list(reader)
+        self.assertTrue(initial.is_initial_order_book)
+        self.assertEqual([[99, 1, 1]], initial.message.content["bids"].tolist())
+        self.assertEqual([[101, 1, 1]], initial.message.content["asks"].tolist())
+        self.assertFalse(diff.is_initial_order_book)
+        self.assertEqual(OrderBookMessageType.DIFF, diff.message.type)
+        self.assertEqual((3, 2, 0.003), (diff.message.update_id, diff.message.first_update_id, diff.message.timestamp))
+        self.assertEqual([[99, 2, 3]], diff.message.content["bids"].tolist())
+        self.assertEqual((0, 3), diff.message.content["asks"].shape)
+        self.assertEqual(OrderBookMessageType.TRADE, trade.message.type)
+        self.assertEqual(7, trade.message.trade_id)
+        self.assertEqual((99, 0.5, float(TradeType.SELL.value)),
+                         (trade.message.content["price"], trade.message.content["amount"],
+                          trade.message.content["trade_type"]))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.message.type)
+        self.assertEqual([[98, 3, 5]], snapshot.message.content["bids"].tolist())
+        self.assertLessEqual(initial.recorded_at, snapshot.recorded_at)
+
+    def test_recordings_are_appended(self):
+        for update_id in (1, 2):
+            self.recorder.start()
+            self.recorder.record(self.snapshot(update_id, [], []))
+            # The recorder is restarted without waiting for the previous recording to be closed
+            self.recorder.stop()
+        self.stop_recorder()
+
+        reader = OrderBookRecordingReader(self.recorder.file_path(self.trading_pair))
+        self.assertEqual([1, 2], [record.message.update_id for record in reader])
+
+    def test_stop_does_not_wait_for_the_writer_thread(self):
+        self.recorder.start()
+        writer_thread = self.recorder._writer_thread
+        self.recorder.stop()
+
+        self.assertFalse(self.recorder.is_recording)
+        self.stop_recorder()
+        self.assertFalse(writer_thread.is_alive())
+
+    def test_queue_records_messages_before_they_are_coalesced(self):
+        queue = RecordingCoalescingOrderBookMessageQueue(self.recorder)
+        self.recorder.start()
+        for update_id in (1, 2):
+            queue.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": self.trading_pair, "update_id": update_id, "bids": [[99, update_id]], "asks": []},
+                update_id * 1e-3))
+        queue.put_nowait(self.snapshot(3, [[99, 3]], []))
+        self.stop_recorder()
+
+        self.assertEqual(1, queue.qsize())
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, queue.get_nowait().type)
+        self.assertEqual([(OrderBookMessageType.DIFF, 1), (OrderBookMessageType.DIFF, 2),
+                          (OrderBookMessageType.SNAPSHOT, 3)],
+                         [(record.message.type, record.message.update_id)
+                          for record in OrderBookRecordingReader(self.recorder.file_path(self.trading_pair))])
+
+    def test_messages_are_not_recorded_while_stopped(self):
+        self.recorder.record(self.snapshot(1, [], []))
+
+        self.assertFalse(os.path.exists(self.recorder.file_path(self.trading_pair)))
+        self.assertEqual({}, self.recorder.recorded_messages)
+
+    def test_record_cut_by_end_of_file_is_ignored(self):
+        self.recorder.start()
+        self.recorder.record(self.snapshot(1, [[99, 1]], []))
+        self.recorder.record(self.snapshot(2, [[99, 2]], []))
+        self.stop_recorder()
+        file_path = self.recorder.file_path(self.trading_pair)
+        with open(file_path, "r+b") as file:
+            file.truncate(os.path.getsize(file_path) - RECORD_HEADER.size // 2)
+
+        self.assertEqual([1], [record.message.update_id for record in OrderBookRecordingReader(file_path)])
+
+    def test_reading_other_file_fails(self):
+        file_path = os.path.join(self.directory.name, "other.obrec")
+        with open(file_path, "wb") as file:
+            file.write(b"not a recording")
+
+        with self.assertRaises(ValueError):
+            OrderBookRecordingReader(file_path)
+
+    def test_replay_into_order_book(self):
+        initial_book = OrderBook()
+        initial_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.recorder.start()
+        self.recorder.record_order_book(self.trading_pair, initial_book)
+        self.recorder.record(self.snapshot(2, [[99, 2], [98, 1]], [[101, 1]]))
+        self.recorder.record(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair, "trade_id": "a1", "trade_type": float(TradeType.BUY.value),
+             "price": 101.0, "amount": 0.5}))
+        self.stop_recorder()
+        reader = OrderBookRecordingReader(self.recorder.file_path(self.trading_pair))
+        order_book = OrderBook()
+
+        self.assertEqual(3, reader.replay_into(order_book, apply_snapshots_as_deltas=True))
+        self.assertEqual([OrderBookRow(99, 2, 2), OrderBookRow(98, 1, 2)], list(order_book.bid_entries()))
+        self.assertEqual(101, order_book.last_trade_price)
+        self.assertEqual("a1", list(reader)[-1].message.trade_id)
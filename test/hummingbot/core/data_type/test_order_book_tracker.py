@@ -0,0 +1,349 @@
+import asyncio
+import tempfile
+import time
+import unittest
+from typing import Awaitable, Dict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from hummingbot.core.data_type.market_data_latency import RECEIVED_AT_KEY, ROUTED_AT_KEY, MarketDataHop
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import OrderBookMessageQueueStats
+from hummingbot.core.data_type.order_book_recording import OrderBookRecorder, OrderBookRecordingReader
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    # the level is required to receive logs from the tracker logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.data_source = MagicMock()
+        self.snapshot_responses: Dict[str, asyncio.Future] = {
+            trading_pair: self.ev_loop.create_future() for trading_pair in self.trading_pairs
+        }
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return await self.snapshot_responses[trading_pair]
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_concurrent_init_tracks_each_book_as_soon_as_its_snapshot_arrives(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs,
+                                        concurrent_init=True)
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        # All snapshots are requested at once
+        self.assertEqual(3, self.data_source.get_new_order_book.call_count)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+        self.snapshot_responses["COINBETA-HBOT"].set_result(OrderBook())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(["COINBETA-HBOT"], self.tracker.ready_trading_pairs)
+        self.assertIn("COINBETA-HBOT", self.tracker.order_book_init_durations)
+        self.assertFalse(self.tracker.ready)
+
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(OrderBook())
+        self.snapshot_responses["COINGAMMA-HBOT"].set_result(OrderBook())
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_book_init_durations))
+        self.assertTrue(self._is_logged("INFO", "Initialized order book for COINBETA-HBOT in "
+                                                f"{self.tracker.order_book_init_durations['COINBETA-HBOT']:.2f} "
+                                                "seconds. 1/3 completed."))
+
+    @patch("hummingbot.core.data_type.order_book_tracker.asyncio.sleep", new_callable=AsyncMock)
+    def test_concurrent_init_retries_failed_snapshot_requests(self, _):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        concurrent_init=True)
+        self.data_source.get_new_order_book.side_effect = [Exception("Test Error"), OrderBook()]
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(2, self.data_source.get_new_order_book.call_count)
+        self.assertTrue(self._is_logged("NETWORK", "Unexpected error initializing order book for COINALPHA-HBOT."))
+
+    @patch("hummingbot.core.data_type.order_book_tracker.asyncio.sleep", new_callable=AsyncMock)
+    def test_sequential_init_reports_init_durations(self, _):
+        for response in self.snapshot_responses.values():
+            response.set_result(OrderBook())
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        durations = self.tracker.order_book_init_durations
+        self.assertTrue(durations["COINALPHA-HBOT"] <= durations["COINBETA-HBOT"] <= durations["COINGAMMA-HBOT"])
+
+    def test_snapshots_applied_as_deltas(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        apply_snapshots_as_deltas=True, concurrent_init=True)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1)], [OrderBookRow(3, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        message = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [(2, 3)], "asks": [(3, 1)]},
+            2e-3)
+        self.async_run_with_timeout(self.tracker._tracking_message_queues["COINALPHA-HBOT"].put(message))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([OrderBookRow(2, 3, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(3, 1, 1)], list(order_book.ask_entries()))
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_numpy_messages_are_applied_from_their_arrays(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        apply_snapshots_as_deltas=True, concurrent_init=True)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1)], [OrderBookRow(3, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        message_queue = self.tracker._tracking_message_queues["COINALPHA-HBOT"]
+
+        depth_update = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2,
+             "bids": np.array([[2, 3, 2]], dtype=np.float64), "asks": np.array([[3, 1, 2]], dtype=np.float64)},
+            2e-3)
+        diff = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 3,
+             "bids": np.empty((0, 3), dtype=np.float64), "asks": np.array([[4, 2, 3]], dtype=np.float64)},
+            3e-3)
+        self.assertTrue(depth_update.has_numpy_levels)
+        self.async_run_with_timeout(message_queue.put(depth_update))
+        self.async_run_with_timeout(message_queue.put(diff))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([OrderBookRow(2, 3, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(3, 1, 1), OrderBookRow(4, 2, 3)], list(order_book.ask_entries()))
+        self.assertEqual(3, order_book.last_diff_uid)
+
+    def test_coalesced_messages_apply_latest_snapshot_and_report_queue_stats(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        apply_snapshots_as_deltas=True, concurrent_init=True, coalesce_messages=True)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1)], [OrderBookRow(3, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        message_queue = self.tracker._tracking_message_queues["COINALPHA-HBOT"]
+
+        # The messages are queued while the tracking task is not running
+        for update_id in range(2, 5):
+            message_queue.put_nowait(OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT,
+                {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": [(1, update_id)], "asks": [(3, 1)]},
+                update_id * 1e-3))
+        self.assertEqual({"COINALPHA-HBOT": OrderBookMessageQueueStats(depth=1, dropped=2, merged=0)},
+                         self.tracker.message_queue_stats)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([OrderBookRow(1, 4, 4)], list(order_book.bid_entries()))
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual({"COINALPHA-HBOT": OrderBookMessageQueueStats(depth=0, dropped=2, merged=0)},
+                         self.tracker.message_queue_stats)
+
+    def test_recorder_records_initial_order_books_and_received_messages(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        recorder = OrderBookRecorder(directory.name)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        concurrent_init=True, coalesce_messages=True, recorder=recorder)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1)], [OrderBookRow(3, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        recorder.start()
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        # Both diffs are queued before the router runs, they are merged in the stream
+        for update_id in (2, 3):
+            self.tracker._order_book_diff_stream.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": [(1, update_id)], "asks": []},
+                update_id * 1e-3))
+        router_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        router_task.cancel()
+        self.tracker.stop()
+        self.async_run_with_timeout(recorder.wait_stopped())
+
+        self.assertFalse(recorder.is_recording)
+        self.assertEqual(1, self.tracker.message_queue_stats["COINALPHA-HBOT"].merged)
+        initial, first_diff, second_diff = OrderBookRecordingReader(recorder.file_path("COINALPHA-HBOT"))
+        self.assertTrue(initial.is_initial_order_book)
+        self.assertEqual([[1, 1, 1]], initial.message.content["bids"].tolist())
+        self.assertEqual(OrderBookMessageType.DIFF, first_diff.message.type)
+        self.assertEqual([[1, 2, 2]], first_diff.message.content["bids"].tolist())
+        self.assertEqual([[1, 3, 3]], second_diff.message.content["bids"].tolist())
+
+    def test_latency_of_routed_and_applied_messages(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        concurrent_init=True, track_latency=True)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1)], [OrderBookRow(3, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        router_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+        now = time.time()
+        message = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [(1, 2)], "asks": [], RECEIVED_AT_KEY: now},
+            now - 0.5)
+        self.tracker._order_book_diff_stream.put_nowait(message)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        router_task.cancel()
+
+        self.assertLessEqual(now, message.content[ROUTED_AT_KEY])
+        stats = self.tracker.latency_tracker.latency_stats()["COINALPHA-HBOT"]
+        self.assertEqual(1, stats[MarketDataHop.APPLY].count)
+        self.assertEqual(1, stats[MarketDataHop.ROUTE].count)
+        self.assertAlmostEqual(0.5, stats[MarketDataHop.NETWORK].max)
+        self.assertLessEqual(0.5, stats[MarketDataHop.TOTAL].max)
+
+    def test_latency_is_not_tracked_by_default(self):
+        self.assertIsNone(self.tracker.latency_tracker)
+
+    def test_depth_cap_prunes_books_and_resyncs_thinned_ones(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        concurrent_init=True, depth_cap=2, depth_cap_margin=1)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(5)], [OrderBookRow(101, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        snapshot_message = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 5, "bids": [(99, 1), (98, 1)], "asks": [(101, 1)]},
+            5e-3)
+        self.data_source.get_order_book_snapshot = AsyncMock(return_value=snapshot_message)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertEqual(2, self.tracker.depth_cap)
+        self.assertEqual([100, 99, 98], [row.price for row in order_book.bid_entries()])
+        message_queue = self.tracker._tracking_message_queues["COINALPHA-HBOT"]
+        for update_id, price in ((2, 100), (3, 99), (4, 98)):
+            self.async_run_with_timeout(message_queue.put(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": [(price, 0)], "asks": []},
+                update_id * 1e-3)))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        # The book thinned out twice, a single snapshot is requested
+        self.assertEqual({"COINALPHA-HBOT": 1}, self.tracker.depth_resyncs)
+        self.data_source.get_order_book_snapshot.assert_awaited_once_with("COINALPHA-HBOT")
+        self.assertIs(snapshot_message, self.tracker._order_book_snapshot_stream.get_nowait())
+
+        memory_usage = self.tracker.memory_usage["COINALPHA-HBOT"]
+        self.assertEqual(order_book.memory_usage, memory_usage.order_book)
+        self.assertLess(0, memory_usage.messages)
+        self.assertEqual(memory_usage.order_book + memory_usage.messages, memory_usage.total)
+
+    def test_depth_resync_applied_as_delta_clears_thinned_depth(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        concurrent_init=True, apply_snapshots_as_deltas=True,
+                                        depth_cap=2, depth_cap_margin=1)
+        # The resyncs are not spaced out, only the thinned depth requests them
+        self.tracker.DEPTH_RESYNC_INTERVAL = 0
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(5)], [OrderBookRow(101, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        # The exchange really has a single bid level left, fewer than the cap
+        self.data_source.get_order_book_snapshot = AsyncMock(return_value=OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 4,
+             "bids": np.array([[98, 1, 4]], dtype=np.float64),
+             "asks": np.array([[101, 1, 4]], dtype=np.float64)},
+            4e-3))
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        snapshot_router_task = self.ev_loop.create_task(self.tracker._order_book_snapshot_router())
+        message_queue = self.tracker._tracking_message_queues["COINALPHA-HBOT"]
+        for update_id, price in ((2, 100), (3, 99)):
+            message_queue.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": [(price, 0)], "asks": []},
+                update_id * 1e-3))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([98], [row.price for row in order_book.bid_entries()])
+        self.assertFalse(order_book.depth_thinned)
+
+        message_queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 5, "bids": [(98, 2)], "asks": []},
+            5e-3))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        snapshot_router_task.cancel()
+
+        self.assertEqual({"COINALPHA-HBOT": 1}, self.tracker.depth_resyncs)
+        self.data_source.get_order_book_snapshot.assert_awaited_once_with("COINALPHA-HBOT")
+
+    def test_depth_cap_trims_buffered_diffs(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        concurrent_init=True, depth_cap=2, depth_cap_margin=1)
+        router_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+        # The diff arrives before the initial order book, it is saved until the book is tracked
+        self.tracker._order_book_diff_stream.put_nowait(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [(100 - i, 2) for i in range(6)],
+             "asks": [(101, 2), (102, 0), (103, 2)]},
+            2e-3))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        router_task.cancel()
+
+        saved_diff, = self.tracker._saved_message_queues["COINALPHA-HBOT"]
+        self.assertEqual([(100, 2), (99, 2), (98, 2)], saved_diff.content["bids"])
+        self.assertEqual([(101, 2), (102, 0), (103, 2)], saved_diff.content["asks"])
+
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(5)], [OrderBookRow(101, 1, 1)], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        past_diff, = self.tracker._past_diffs_windows["COINALPHA-HBOT"]
+        self.assertEqual(3, len(past_diff.content["bids"]))
+        self.assertEqual([100, 99, 98], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([OrderBookRow(100, 2, 2)], list(order_book.bid_entries())[:1])
+
+    def test_depth_cap_is_not_set_by_default(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        concurrent_init=True)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(5)], [], 1)
+        self.snapshot_responses["COINALPHA-HBOT"].set_result(order_book)
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertEqual(0, order_book.depth_cap_levels)
+        self.assertEqual(5, len(list(order_book.bid_entries())))
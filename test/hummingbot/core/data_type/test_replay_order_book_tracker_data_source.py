@@ -0,0 +1,106 @@
+import asyncio
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recording import (
+    OrderBookRecord,
+    encode_record,
+    recording_file_path,
+    write_file_header,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+
+
+class ReplayOrderBookTrackerDataSourceTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.tracker = None
+
+    def tearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+        self.directory.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def write_recording(self, records):
+        file_path = recording_file_path(self.directory.name, self.trading_pair)
+        with open(file_path, "wb") as file:
+            write_file_header(file, self.trading_pair)
+            for record in records:
+                file.write(encode_record(record.message, record.recorded_at, int(record.is_initial_order_book)))
+        return file_path
+
+    def depth_update(self, update_id: int, bids, asks, recorded_at: float, is_initial: bool = False):
+        message = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            update_id * 1e-3)
+        return OrderBookRecord(recorded_at, message, is_initial)
+
+    def test_tracker_replays_recording(self):
+        file_path = self.write_recording([
+            self.depth_update(2, [[99, 1]], [[101, 1]], 1000.5),
+            self.depth_update(1, [[99, 5]], [[101, 5]], 1000.0, is_initial=True),
+            OrderBookRecord(1001.0, OrderBookMessage(
+                OrderBookMessageType.TRADE,
+                {"trading_pair": self.trading_pair, "trade_id": 1, "trade_type": float(TradeType.BUY.value),
+                 "price": 101.0, "amount": 1.0},
+                1.0), False),
+            self.depth_update(3, [[99, 2], [98, 1]], [[101, 1]], 1002.0),
+        ])
+        data_source = ReplayOrderBookTrackerDataSource([file_path], speed=0)
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=data_source._trading_pairs,
+                                        apply_snapshots_as_deltas=True, concurrent_init=True)
+
+        self.tracker.start()
+        self.async_run_with_timeout(data_source.replay_done.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        order_book: OrderBook = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(3, data_source.replayed_messages)
+        self.assertEqual([OrderBookRow(99, 2, 3), OrderBookRow(98, 1, 3)], list(order_book.bid_entries()))
+        self.assertEqual(101, order_book.last_trade_price)
+        prices = self.async_run_with_timeout(data_source.get_last_traded_prices([self.trading_pair]))
+        self.assertEqual({self.trading_pair: 101}, prices)
+
+    def test_recording_without_snapshot_cannot_be_replayed(self):
+        file_path = self.write_recording([])
+        data_source = ReplayOrderBookTrackerDataSource([file_path])
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(data_source.get_new_order_book(self.trading_pair))
+
+    @patch("hummingbot.core.data_type.replay_order_book_tracker_data_source.ReplayOrderBookTrackerDataSource._time")
+    @patch("hummingbot.core.data_type.replay_order_book_tracker_data_source.ReplayOrderBookTrackerDataSource._sleep")
+    def test_recorded_pace_is_accelerated(self, sleep_mock, time_mock):
+        file_path = self.write_recording([
+            self.depth_update(1, [[99, 1]], [], 1000.0, is_initial=True),
+            self.depth_update(2, [[99, 2]], [], 1000.0),
+            self.depth_update(3, [[99, 3]], [], 1004.0),
+            self.depth_update(4, [[99, 4]], [], 1010.0),
+        ])
+        time_mock.return_value = 50
+        data_source = ReplayOrderBookTrackerDataSource([file_path], speed=2)
+
+        self.async_run_with_timeout(data_source.listen_for_subscriptions())
+
+        self.assertEqual([2, 5], [call.args[0] for call in sleep_mock.call_args_list])
+        self.assertEqual(3, data_source._message_queue["order_book_snapshot"].qsize())
@@ -4,6 +4,7 @@ import unittest
 from copy import deepcopy
 from decimal import Decimal
 from typing import List, Tuple
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -29,6 +30,15 @@ s_decimal_nan = Decimal("NaN")
 s_decimal_neg_one = Decimal(-1)
 
 
+class FreezableTradingIntensityIndicator(TradingIntensityIndicator):
+    # TradingIntensityIndicator is a cdef class, so its methods can't be patched on instances
+    frozen = False
+
+    def add_sample(self, value: Tuple[pd.DataFrame, pd.DataFrame]):
+        if not self.frozen:
+            super().add_sample(value)
+
+
 class AvellanedaMarketMakingUnitTests(unittest.TestCase):
 
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
@@ -1448,6 +1458,47 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
         self.assertEqual(1, len(self.strategy.active_buys))
         self.assertEqual(1, len(self.strategy.active_sells))
 
+    def test_unchanged_ticks_are_skipped_until_balances_change(self):
+        self.simulate_low_volatility(self.strategy)
+
+        strategy = AvellanedaMarketMakingStrategy()
+        strategy.init_params(
+            market_info=self.market_info,
+            order_amount=self.order_amount,
+            order_refresh_time=4,
+            order_refresh_tolerance_pct=Decimal("0.01"),
+            min_spread=self.min_spread,
+            inventory_target_base_pct=self.inventory_target_base_pct,
+            risk_factor=self.risk_factor_finite,
+            skip_unchanged_ticks=True
+        )
+        strategy.avg_vol = self.strategy.avg_vol
+        strategy.trading_intensity = FreezableTradingIntensityIndicator(sampling_length=200)
+        self.simulate_high_liquidity(strategy)
+        self.clock.remove_iterator(self.strategy)
+        self.clock.add_iterator(strategy)
+
+        # The indicators keep the estimates of the simulated market, as they would with an unchanged order book
+        strategy.trading_intensity.frozen = True
+        with patch.object(strategy.avg_vol, "add_sample"):
+            self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+            self.assertEqual(1, len(strategy.active_buys))
+            self.assertEqual(1, len(strategy.active_sells))
+            old_bid = strategy.active_buys[0]
+            old_ask = strategy.active_sells[0]
+
+            self.clock.backtest_til(self.start_timestamp + 20 * self.clock_tick_size)
+            self.assertEqual([old_bid], strategy.active_buys)
+            self.assertEqual([old_ask], strategy.active_sells)
+            skipped_ticks = strategy.idle_tick_tracker.skipped_ticks
+            self.assertGreater(skipped_ticks, 0)
+
+            self.market.set_balance(self.base_asset, 2)
+            self.clock.backtest_til(self.start_timestamp + 21 * self.clock_tick_size)
+            self.assertEqual(skipped_ticks, strategy.idle_tick_tracker.skipped_ticks)
+
+        strategy.stop(self.clock)
+
     def test_adjusted_available_balance_considers_in_flight_cancel_orders(self):
         base_balance = self.market.get_available_balance(self.base_asset)
         quote_balance = self.market.get_available_balance(self.quote_asset)
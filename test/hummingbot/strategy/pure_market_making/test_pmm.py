@@ -9,7 +9,7 @@ from hummingbot.client.command.config_command import ConfigCommand
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock, ClockMode
-from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -41,6 +41,27 @@ def simulate_order_book_widening(order_book: OrderBook, top_bid: float, top_ask:
     order_book.apply_diffs(bid_diffs, ask_diffs, update_id)
 
 
+class BatchRecordingMockPaperExchange(MockPaperExchange):
+    """
+    Records the batches of orders the strategy creates and cancels
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.batch_order_create_calls: List[List[LimitOrder]] = []
+        self.batch_order_cancel_calls: List[List[LimitOrder]] = []
+
+    def batch_order_create(self,
+                           orders_to_create: List[LimitOrder],
+                           order_type: OrderType = OrderType.LIMIT) -> List[LimitOrder]:
+        self.batch_order_create_calls.append(orders_to_create)
+        return super().batch_order_create(orders_to_create, order_type)
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        self.batch_order_cancel_calls.append(orders_to_cancel)
+        super().batch_order_cancel(orders_to_cancel)
+
+
 class PMMUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
     end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
@@ -354,6 +375,54 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(3, len(strategy.active_buys))
         self.assertEqual(3, len(strategy.active_sells))
 
+    def test_multiple_levels_are_created_and_cancelled_in_one_batch_per_refresh(self):
+        market = BatchRecordingMockPaperExchange()
+        market.set_balanced_order_book(self.trading_pair,
+                                       mid_price=self.mid_price,
+                                       min_price=1,
+                                       max_price=200,
+                                       price_step_size=1,
+                                       volume_step_size=10)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        market_info = MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset)
+        self.clock.add_iterator(market)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=3,
+            order_level_spread=Decimal("0.01"),
+            order_level_amount=Decimal("1"),
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(strategy)
+
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.assertEqual(1, len(market.batch_order_create_calls))
+        self.assertEqual(6, len(market.batch_order_create_calls[0]))
+        self.assertEqual(0, len(market.batch_order_cancel_calls))
+        buys = strategy.active_buys
+        sells = strategy.active_sells
+        self.assertEqual(3, len(buys))
+        self.assertEqual(3, len(sells))
+
+        # After order_refresh_time, the orders are cancelled together and a new set of orders is created together
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual(2, len(market.batch_order_create_calls))
+        self.assertEqual(6, len(market.batch_order_create_calls[1]))
+        self.assertEqual(1, len(market.batch_order_cancel_calls))
+        self.assertEqual({order.client_order_id for order in buys + sells},
+                         {order.client_order_id for order in market.batch_order_cancel_calls[0]})
+        self.assertEqual(3, len(strategy.active_buys))
+        self.assertEqual(3, len(strategy.active_sells))
+
     def test_apply_budget_constraint_to_proposal(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
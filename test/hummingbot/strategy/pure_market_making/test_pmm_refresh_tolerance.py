@@ -152,6 +152,37 @@ class PMMRefreshToleranceUnitTest(unittest.TestCase):
         self.assertEqual(old_ask, new_ask)
         self.assertEqual(old_bid, new_bid)
 
+    def test_unchanged_ticks_are_skipped_until_mid_price_moves(self):
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=4,
+            filled_order_delay=8,
+            order_refresh_tolerance_pct=0,
+            skip_unchanged_ticks=True
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        old_bid = strategy.active_buys[0]
+        old_ask = strategy.active_sells[0]
+
+        self.clock.backtest_til(self.start_timestamp + 10 * self.clock_tick_size)
+        self.assertEqual(old_bid, strategy.active_buys[0])
+        self.assertEqual(old_ask, strategy.active_sells[0])
+        skipped_ticks = strategy.idle_tick_tracker.skipped_ticks
+        self.assertGreater(skipped_ticks, 0)
+
+        self.market.order_books[self.trading_pair].apply_diffs([OrderBookRow(99.5, 30, 2)],
+                                                               [OrderBookRow(100.1, 30, 2)], 2)
+        self.clock.backtest_til(self.start_timestamp + 12 * self.clock_tick_size)
+        self.assertEqual(1, len(strategy.active_buys))
+        self.assertEqual(1, len(strategy.active_sells))
+        self.assertNotEqual(old_bid, strategy.active_buys[0])
+        self.assertNotEqual(old_ask, strategy.active_sells[0])
+
     def test_multi_levels_active_orders_are_cancelled_when_mid_price_moves(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
@@ -0,0 +1,61 @@
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.strategy.idle_tick_tracker import IdleTickTracker
+
+
+class IdleTickTrackerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.tracker = IdleTickTracker(levels=1, tolerance=0.001)
+        self.tracker.start_tracking(self.order_book)
+
+    def test_first_tick_is_not_idle(self):
+        self.assertFalse(self.tracker.is_unchanged((10,)))
+        self.assertTrue(self.tracker.is_unchanged((10,)))
+        self.assertEqual(1, self.tracker.skipped_ticks)
+
+    def test_state_change_ends_idle_ticks(self):
+        self.tracker.is_unchanged((10,))
+
+        self.assertFalse(self.tracker.is_unchanged((11,)))
+        self.assertTrue(self.tracker.is_unchanged((11,)))
+
+    def test_order_book_change_beyond_tolerance_ends_idle_ticks(self):
+        # The first update after the notifications are enabled is always notified
+        self.order_book.apply_diffs([OrderBookRow(98, 1, 2)], [], 2)
+        self.tracker.is_unchanged((10,))
+
+        self.order_book.apply_diffs([OrderBookRow(99, 1.0005, 2)], [], 2)
+        self.assertTrue(self.tracker.is_unchanged((10,)))
+
+        self.order_book.apply_diffs([], [OrderBookRow(100, 1, 3)], 3)
+        self.assertFalse(self.tracker.is_unchanged((10,)))
+        self.assertTrue(self.tracker.is_unchanged((10,)))
+
+    def test_invalidate_ends_idle_ticks(self):
+        self.tracker.is_unchanged((10,))
+
+        self.tracker.invalidate()
+
+        self.assertFalse(self.tracker.is_unchanged((10,)))
+
+    def test_shared_order_book_notifies_most_levels_and_lowest_tolerance(self):
+        other_tracker = IdleTickTracker(levels=5, tolerance=0.05)
+        other_tracker.start_tracking(self.order_book)
+
+        self.assertEqual(5, self.order_book.change_notification_levels)
+        self.assertEqual(0.001, self.order_book.change_notification_tolerance)
+
+    def test_stop_tracking_removes_listener(self):
+        self.tracker.stop_tracking()
+        self.tracker.is_unchanged((10,))
+        self.tracker.is_unchanged((10,))
+
+        self.order_book.apply_diffs([], [OrderBookRow(100, 1, 2)], 2)
+
+        self.assertTrue(self.tracker.is_unchanged((10,)))
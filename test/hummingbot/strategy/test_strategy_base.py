@@ -277,6 +277,51 @@ class StrategyBaseUnitTests(unittest.TestCase):
         self.strategy.cancel_order(self.market_info, limit_order_id)
         self.assertEqual(0, len(self.strategy.order_tracker.in_flight_cancels))
 
+    def test_batch_order_create_with_specific_market(self):
+        base_asset, quote_asset = self.trading_pair.split("-")
+        orders_to_create = [
+            LimitOrder("", self.trading_pair, True, base_asset, quote_asset, Decimal("99"), Decimal("50")),
+            LimitOrder("", self.trading_pair, False, base_asset, quote_asset, Decimal("101"), Decimal("40")),
+        ]
+
+        created_orders: List[LimitOrder] = self.strategy.batch_order_create_with_specific_market(
+            market_trading_pair_tuple=self.market_info,
+            orders_to_create=orders_to_create,
+        )
+
+        self.assertEqual(2, len(created_orders))
+        for order_to_create, created_order in zip(orders_to_create, created_orders):
+            # Note: order_id generate here is random
+            self.assertNotEqual("", created_order.client_order_id)
+            tracked_limit_order: LimitOrder = self.strategy.order_tracker.get_limit_order(
+                self.market_info, created_order.client_order_id)
+            self.assertEqual(order_to_create.is_buy, tracked_limit_order.is_buy)
+            self.assertEqual(order_to_create.price, tracked_limit_order.price)
+            self.assertEqual(order_to_create.quantity, tracked_limit_order.quantity)
+
+        with self.assertRaises(ValueError):
+            self.strategy.batch_order_create_with_specific_market(
+                market_trading_pair_tuple=self.market_info,
+                orders_to_create=orders_to_create,
+                order_type=OrderType.MARKET,
+            )
+
+    def test_batch_order_cancel(self):
+        base_asset, quote_asset = self.trading_pair.split("-")
+        created_orders: List[LimitOrder] = self.strategy.batch_order_create_with_specific_market(
+            market_trading_pair_tuple=self.market_info,
+            orders_to_create=[
+                LimitOrder("", self.trading_pair, True, base_asset, quote_asset, Decimal("99"), Decimal("50")),
+                LimitOrder("", self.trading_pair, False, base_asset, quote_asset, Decimal("101"), Decimal("40")),
+            ],
+        )
+        self.assertEqual(2, len(self.strategy.order_tracker.tracked_limit_orders))
+
+        self.strategy.batch_order_cancel(self.market_info, created_orders)
+
+        self.assertEqual(0, len(self.strategy.order_tracker.in_flight_cancels))
+        self.assertEqual(0, len(self.strategy.order_tracker.tracked_limit_orders))
+
     def test_start_tracking_limit_order(self):
         self.assertEqual(0, len(self.strategy.order_tracker.tracked_limit_orders))
 